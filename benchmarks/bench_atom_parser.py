@@ -0,0 +1,217 @@
+#!/usr/bin/env python3
+"""
+Atom解析器基准测试
+
+对比旧的整体DOM解析（ET.fromstring + 逐字段 .// 后代搜索）
+与新的增量解析器（XMLPullParser + 直接子元素查找）在 1000 条目响应上的耗时和峰值内存。
+
+用法:
+    python benchmarks/bench_atom_parser.py [--entries 1000] [--repeat 20]
+"""
+
+import argparse
+import contextlib
+import os
+import sys
+import time
+import tracemalloc
+import xml.etree.ElementTree as ET
+from datetime import datetime
+from typing import Any
+
+# 添加项目根目录到Python路径
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from src.arxiv_follow.core.atom import AtomStreamParser  # noqa: E402
+
+NAMESPACES = {
+    "atom": "http://www.w3.org/2005/Atom",
+    "arxiv": "http://arxiv.org/schemas/atom",
+    "opensearch": "http://a9.com/-/spec/opensearch/1.1/",
+}
+
+# 与 ArXiv API 真实响应结构一致的条目模板
+ENTRY_TEMPLATE = """
+  <entry>
+    <id>http://arxiv.org/abs/2501.{num:05d}v1</id>
+    <updated>2025-01-15T10:00:00Z</updated>
+    <published>2025-01-14T09:00:00Z</published>
+    <title>A Study of Adversarial Robustness in Large Language Model Agents,
+  Part {num}</title>
+    <summary>  We investigate the robustness of autonomous agents built on large
+language models against prompt injection and tool misuse. Our evaluation
+covers {num} scenarios across web browsing, code execution and retrieval
+augmented generation, and we propose a defense that reduces attack success
+rate substantially while preserving task utility.
+</summary>
+    <author>
+      <name>Author One {num}</name>
+      <arxiv:affiliation>University A</arxiv:affiliation>
+    </author>
+    <author>
+      <name>Author Two {num}</name>
+    </author>
+    <author>
+      <name>Author Three {num}</name>
+    </author>
+    <arxiv:doi>10.1000/bench.{num}</arxiv:doi>
+    <link title="doi" href="http://dx.doi.org/10.1000/bench.{num}" rel="related"/>
+    <arxiv:comment>12 pages, 4 figures</arxiv:comment>
+    <arxiv:journal_ref>Proc. Bench {num}</arxiv:journal_ref>
+    <link href="http://arxiv.org/abs/2501.{num:05d}v1" rel="alternate" type="text/html"/>
+    <link title="pdf" href="http://arxiv.org/pdf/2501.{num:05d}v1" rel="related" type="application/pdf"/>
+    <arxiv:primary_category term="cs.CR" scheme="http://arxiv.org/schemas/atom"/>
+    <category term="cs.CR" scheme="http://arxiv.org/schemas/atom"/>
+    <category term="cs.AI" scheme="http://arxiv.org/schemas/atom"/>
+    <category term="cs.LG" scheme="http://arxiv.org/schemas/atom"/>
+  </entry>"""
+
+
+def build_fixture(num_entries: int) -> bytes:
+    """构建指定条目数的ArXiv API响应"""
+    entries = "".join(ENTRY_TEMPLATE.format(num=i) for i in range(num_entries))
+    return f"""<?xml version="1.0" encoding="UTF-8"?>
+<feed xmlns="http://www.w3.org/2005/Atom" xmlns:arxiv="http://arxiv.org/schemas/atom">
+  <link href="http://arxiv.org/api/query" rel="self" type="application/atom+xml"/>
+  <title type="html">ArXiv Query: search_query=cat:cs.CR</title>
+  <id>http://arxiv.org/api/benchmark</id>
+  <updated>2025-01-15T00:00:00-05:00</updated>
+  <opensearch:totalResults xmlns:opensearch="http://a9.com/-/spec/opensearch/1.1/">{num_entries}</opensearch:totalResults>
+  <opensearch:startIndex xmlns:opensearch="http://a9.com/-/spec/opensearch/1.1/">0</opensearch:startIndex>
+  <opensearch:itemsPerPage xmlns:opensearch="http://a9.com/-/spec/opensearch/1.1/">{num_entries}</opensearch:itemsPerPage>{entries}
+</feed>
+""".encode()
+
+
+def legacy_parse_entry(entry: ET.Element) -> dict[str, Any] | None:
+    """旧版条目解析（逐字段后代搜索）"""
+    title_elem = entry.find(".//atom:title", NAMESPACES)
+    title = title_elem.text.strip() if title_elem is not None else ""
+
+    summary_elem = entry.find(".//atom:summary", NAMESPACES)
+    abstract = summary_elem.text.strip() if summary_elem is not None else ""
+
+    id_elem = entry.find(".//atom:id", NAMESPACES)
+    if id_elem is None:
+        return None
+
+    arxiv_url = id_elem.text.strip()
+    arxiv_id = arxiv_url.split("/")[-1]
+
+    authors = []
+    for author_elem in entry.findall(".//atom:author", NAMESPACES):
+        name_elem = author_elem.find(".//atom:name", NAMESPACES)
+        if name_elem is not None:
+            authors.append(name_elem.text.strip())
+
+    published_elem = entry.find(".//atom:published", NAMESPACES)
+    submitted_date = None
+    if published_elem is not None:
+        with contextlib.suppress(ValueError):
+            submitted_date = datetime.fromisoformat(
+                published_elem.text.replace("Z", "+00:00")
+            )
+
+    updated_elem = entry.find(".//atom:updated", NAMESPACES)
+    updated_date = None
+    if updated_elem is not None:
+        with contextlib.suppress(ValueError):
+            updated_date = datetime.fromisoformat(
+                updated_elem.text.replace("Z", "+00:00")
+            )
+
+    categories = []
+    for cat_elem in entry.findall(".//atom:category", NAMESPACES):
+        term = cat_elem.get("term")
+        if term:
+            categories.append(term)
+
+    doi = None
+    journal_ref = None
+    arxiv_elems = entry.findall(".//arxiv:doi", NAMESPACES)
+    if arxiv_elems:
+        doi = arxiv_elems[0].text.strip()
+    journal_elems = entry.findall(".//arxiv:journal_ref", NAMESPACES)
+    if journal_elems:
+        journal_ref = journal_elems[0].text.strip()
+
+    return {
+        "arxiv_id": arxiv_id,
+        "title": title,
+        "authors": authors,
+        "abstract": abstract,
+        "primary_category": categories[0] if categories else None,
+        "categories": categories,
+        "submitted_date": submitted_date,
+        "updated_date": updated_date,
+        "doi": doi,
+        "journal_ref": journal_ref,
+        "arxiv_url": arxiv_url,
+        "pdf_url": f"https://arxiv.org/pdf/{arxiv_id}.pdf",
+    }
+
+
+def legacy_parse(content: bytes) -> dict[str, Any]:
+    """旧版响应解析（先解码为字符串再构建完整DOM）"""
+    root = ET.fromstring(content.decode("utf-8"))
+    total_results = root.find(".//opensearch:totalResults", NAMESPACES)
+    total = int(total_results.text) if total_results is not None else 0
+
+    papers = []
+    for entry in root.findall(".//atom:entry", NAMESPACES):
+        paper_data = legacy_parse_entry(entry)
+        if paper_data:
+            papers.append(paper_data)
+
+    return {"total_results": total, "papers": papers, "count": len(papers)}
+
+
+def streaming_parse(content: bytes, chunk_size: int = 64 * 1024) -> dict[str, Any]:
+    """新版增量解析（模拟按 aiter_bytes 数据块喂入）"""
+    parser = AtomStreamParser()
+    papers = []
+    for i in range(0, len(content), chunk_size):
+        papers.extend(parser.feed(content[i : i + chunk_size]))
+    papers.extend(parser.close())
+    return {"total_results": parser.total_results, "papers": papers}
+
+
+def measure(func, content: bytes, repeat: int) -> tuple[float, int]:
+    """返回 (最佳耗时ms, 峰值内存KB)"""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(content)
+        best = min(best, time.perf_counter() - start)
+
+    tracemalloc.start()
+    func(content)
+    _current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return best * 1000, peak // 1024
+
+
+def main() -> None:
+    """运行基准测试"""
+    parser = argparse.ArgumentParser(description="Atom解析器基准测试")
+    parser.add_argument("--entries", type=int, default=1000, help="条目数")
+    parser.add_argument("--repeat", type=int, default=20, help="重复次数")
+    args = parser.parse_args()
+
+    content = build_fixture(args.entries)
+
+    # 先确认两种解析结果一致
+    legacy = legacy_parse(content)
+    streaming = streaming_parse(content)
+    assert legacy["papers"] == streaming["papers"], "解析结果不一致"
+    assert legacy["total_results"] == streaming["total_results"]
+
+    print(f"响应大小: {len(content) / 1024:.0f} KB, 条目数: {args.entries}")
+    for name, func in (("legacy", legacy_parse), ("streaming", streaming_parse)):
+        elapsed, peak_kb = measure(func, content, args.repeat)
+        print(f"{name:>10}: {elapsed:8.2f} ms  峰值内存 {peak_kb:>7} KB")
+
+
+if __name__ == "__main__":
+    main()
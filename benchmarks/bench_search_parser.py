@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""
+搜索结果页解析器基准测试
+
+对比旧版 parse_arxiv_search_results（逐字段未编译正则）与当前实现
+在 50 条和 200 条结果页面上的耗时，并确认两者输出完全一致。
+
+用法:
+    python benchmarks/bench_search_parser.py [--repeat 50]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+# 添加项目根目录到Python路径
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from benchmarks.search_pages import (  # noqa: E402
+    build_search_page,
+    legacy_parse_arxiv_search_results,
+)
+from src.arxiv_follow.services.researcher import (  # noqa: E402
+    parse_arxiv_search_results,
+)
+
+
+def best_time_ms(func, html: str, repeat: int) -> float:
+    """返回多次运行中的最佳耗时(ms)"""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(html)
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def main() -> None:
+    """运行基准测试"""
+    parser = argparse.ArgumentParser(description="搜索结果页解析器基准测试")
+    parser.add_argument("--repeat", type=int, default=50, help="重复次数")
+    args = parser.parse_args()
+
+    for num_results in (50, 200):
+        html = build_search_page(num_results, total=1234)
+        assert legacy_parse_arxiv_search_results(html) == parse_arxiv_search_results(
+            html
+        ), "解析结果不一致"
+
+        legacy = best_time_ms(legacy_parse_arxiv_search_results, html, args.repeat)
+        current = best_time_ms(parse_arxiv_search_results, html, args.repeat)
+        print(
+            f"{num_results:>4} 条结果 ({len(html) / 1024:.0f} KB): "
+            f"legacy {legacy:7.2f} ms  current {current:7.2f} ms  "
+            f"({legacy / current:.1f}x)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,236 @@
+"""
+arXiv 网页搜索结果的基准数据
+
+提供与 arxiv.org/search 结果页结构一致的页面生成器，
+以及旧版 parse_arxiv_search_results 实现（用于基准对比和一致性测试）。
+"""
+
+import re
+from typing import Any
+
+SUBJECTS = [
+    ("cs.CR", "Cryptography and Security"),
+    ("cs.AI", "Artificial Intelligence"),
+    ("cs.LG", "Machine Learning"),
+    ("cs.CL", "Computation and Language"),
+]
+
+RESULT_TEMPLATE = """
+<li class="arxiv-result">
+  <div class="is-marginless">
+    <p class="list-title is-inline-block"><a href="https://arxiv.org/abs/{arxiv_id}">arXiv:{arxiv_id}</a>
+      <span>&nbsp;[<a href="https://arxiv.org/pdf/{arxiv_id}">pdf</a>, <a href="https://arxiv.org/format/{arxiv_id}">other</a>]&nbsp;</span>
+    </p>
+    <div class="tags is-inline-block">
+      {tags}
+    </div>
+  </div>
+  <p class="title is-5 mathjax">
+      {title}
+  </p>
+  <p class="authors">
+    <span class="has-text-black-bis has-text-weight-semibold">Authors:</span>
+    {authors}
+  </p>
+  <p class="abstract mathjax">
+    <span class="has-text-black-bis has-text-weight-semibold">Abstract</span>:
+    <span class="abstract-short has-text-grey-dark mathjax" id="{arxiv_id}v1-abstract-short" style="display: inline;">
+      {abstract_short} &hellip;
+      <a class="is-size-7" style="white-space: nowrap;" onclick="document.getElementById('{arxiv_id}v1-abstract-full').style.display = 'inline';">&#9661; More</a>
+    </span>
+    <span class="abstract-full has-text-grey-dark mathjax" id="{arxiv_id}v1-abstract-full" style="display: none;">
+      {abstract}
+      <a class="is-size-7" style="white-space: nowrap;" onclick="document.getElementById('{arxiv_id}v1-abstract-short').style.display = 'inline';">&#9651; Less</a>
+    </span>
+  </p>
+  <p class="is-size-7"><span class="has-text-black-bis has-text-weight-semibold">Submitted</span> {day} January, 2025;
+      <span class="has-text-black-bis has-text-weight-semibold">originally announced</span> January 2025.
+  </p>
+  {comments}
+</li>
+"""
+
+
+def build_result(index: int) -> str:
+    """构建单条搜索结果"""
+    arxiv_id = f"2501.{index:05d}"
+    tags = "\n      ".join(
+        f'<span class="tag is-small is-link tooltip is-tooltip-top" '
+        f'data-tooltip="{tooltip}">{code}</span>'
+        for code, tooltip in SUBJECTS[: 1 + index % len(SUBJECTS)]
+    )
+    authors = ", \n    ".join(
+        f'<a href="/search/?searchtype=author&amp;query=Author%2C+{i}">'
+        f"Author {index}-{i}</a>"
+        for i in range(1 + index % 6)
+    )
+    title = (
+        f'Robust <span class="search-hit mathjax">Agents</span> Study {index}: '
+        "Evaluating Large Language Models under Adversarial Prompts"
+    )
+    abstract = (
+        f"We study scenario {index} of prompt injection against tool-using agents. "
+        "Our evaluation spans web browsing, code execution and retrieval, "
+        "and we propose a defense that reduces attack success substantially. "
+    ) * (1 + index % 3)
+    comments = (
+        '<p class="comments is-size-7">\n'
+        '    <span class="has-text-black-bis has-text-weight-semibold">Comments:</span>\n'
+        f'    <span class="has-text-grey-dark mathjax">{10 + index % 20} pages</span>\n'
+        "  </p>"
+        if index % 2 == 0
+        else ""
+    )
+    return RESULT_TEMPLATE.format(
+        arxiv_id=arxiv_id,
+        tags=tags,
+        title=title,
+        authors=authors,
+        abstract_short=abstract[:120],
+        abstract=abstract,
+        day=1 + index % 28,
+        comments=comments,
+    )
+
+
+def build_search_page(num_results: int, total: int | None = None) -> str:
+    """构建包含指定结果数的搜索结果页"""
+    total = num_results if total is None else total
+    results = "".join(build_result(i) for i in range(num_results))
+    return f"""<!DOCTYPE html>
+<html lang="en">
+<head><title>Search | arXiv e-print repository</title></head>
+<body>
+<main>
+  <div class="level is-marginless">
+    <h1 class="title is-clearfix">
+      Showing 1&ndash;{num_results} of {total:,} results
+    </h1>
+  </div>
+  <p>Showing 1–{num_results} of {total:,} results for author: ...</p>
+  <ol class="breathe-horizontal" start="1">{results}
+  </ol>
+</main>
+</body>
+</html>
+"""
+
+
+def legacy_parse_arxiv_search_results(html_content: str) -> list[dict[str, Any]]:
+    """
+    旧版搜索结果解析（逐字段未编译正则），用于基准测试和一致性测试
+
+    Args:
+        html_content: HTML 内容
+
+    Returns:
+        论文列表
+    """
+    papers = []
+
+    # 检查是否有结果
+    if "Sorry, your query returned no results" in html_content:
+        return papers
+
+    # 提取结果总数
+    total_pattern = r"Showing 1–\d+ of ([\d,]+) results"
+    total_match = re.search(total_pattern, html_content)
+    total_count = 0
+    if total_match:
+        total_count = int(total_match.group(1).replace(",", ""))
+
+    # 查找论文条目 - 使用实际的HTML结构
+    paper_pattern = r'<li class="arxiv-result">(.*?)</li>'
+    paper_matches = re.findall(paper_pattern, html_content, re.DOTALL)
+
+    for match in paper_matches:
+        paper = {"total_results": total_count}
+
+        # 提取arXiv ID和URL
+        id_pattern = r'<a href="https://arxiv\.org/abs/(\d{4}\.\d{4,5})">arXiv:(\d{4}\.\d{4,5})</a>'
+        id_match = re.search(id_pattern, match)
+        if id_match:
+            paper["arxiv_id"] = id_match.group(1)
+            paper["url"] = f"https://arxiv.org/abs/{paper['arxiv_id']}"
+
+        # 提取标题
+        title_pattern = r'<p class="title is-5 mathjax"[^>]*>\s*(.*?)\s*</p>'
+        title_match = re.search(title_pattern, match, re.DOTALL)
+        if title_match:
+            title = title_match.group(1).strip()
+            # 清理HTML标签
+            title = re.sub(r"<[^>]+>", "", title)
+            title = re.sub(r"\s+", " ", title).strip()
+            if title:
+                paper["title"] = title
+
+        # 提取作者
+        authors_pattern = (
+            r'<p class="authors"[^>]*>.*?<span[^>]+>Authors:</span>(.*?)</p>'
+        )
+        authors_match = re.search(authors_pattern, match, re.DOTALL)
+        if authors_match:
+            authors_html = authors_match.group(1)
+            # 提取所有作者链接
+            author_links = re.findall(r"<a[^>]+>(.*?)</a>", authors_html)
+            if author_links:
+                authors = [
+                    re.sub(r"<[^>]+>", "", author).strip() for author in author_links
+                ]
+                authors = [author for author in authors if author]  # 过滤空字符串
+                if authors:
+                    paper["authors"] = authors
+
+        # 提取学科分类
+        subjects = []
+        subject_pattern = (
+            r'<span class="tag[^"]*"[^>]*data-tooltip="([^"]+)"[^>]*>([^<]+)</span>'
+        )
+        subject_matches = re.findall(subject_pattern, match)
+        for _tooltip, subject_code in subject_matches:
+            subjects.append(subject_code.strip())
+        if subjects:
+            paper["subjects"] = subjects
+
+        # 提取摘要 - 优先获取完整摘要
+        abstract_patterns = [
+            # 优先提取完整摘要
+            r'<span[^>]*class="[^"]*abstract-full[^"]*"[^>]*[^>]*>(.*?)</span>',
+            # 备选：普通摘要段落
+            r'<p[^>]*class="[^"]*abstract[^"]*"[^>]*>.*?<span[^>]+>Abstract[^<]*</span>:\s*(.*?)</p>',
+            # 备选：abstract-short（如果没有full版本）
+            r'<span[^>]*class="[^"]*abstract-short[^"]*"[^>]*[^>]*>(.*?)</span>',
+        ]
+
+        for pattern in abstract_patterns:
+            abstract_match = re.search(pattern, match, re.DOTALL | re.IGNORECASE)
+            if abstract_match:
+                abstract = abstract_match.group(1).strip()
+                # 清理HTML标签、链接和多余空白
+                abstract = re.sub(r"<a[^>]*>.*?</a>", "", abstract)  # 移除More/Less链接
+                abstract = re.sub(r"<[^>]+>", "", abstract)
+                abstract = re.sub(r"&hellip;.*", "", abstract)  # 移除省略号及后续内容
+                abstract = re.sub(r"\s+", " ", abstract).strip()
+                if len(abstract) > 20:  # 确保不是空的或太短的内容
+                    paper["abstract"] = abstract
+                    break
+
+        # 提取提交日期
+        submitted_pattern = r"<span[^>]+>Submitted</span>\s+([^;]+);"
+        submitted_match = re.search(submitted_pattern, match)
+        if submitted_match:
+            paper["submitted_date"] = submitted_match.group(1).strip()
+
+        # 提取评论信息
+        comments_pattern = r'<p class="comments[^"]*"[^>]*>.*?<span[^>]+>Comments:</span>\s*<span[^>]*>(.*?)</span>'
+        comments_match = re.search(comments_pattern, match, re.DOTALL)
+        if comments_match:
+            comments = re.sub(r"<[^>]+>", "", comments_match.group(1)).strip()
+            if comments:
+                paper["comments"] = comments
+
+        # 只添加至少有标题或arXiv ID的论文
+        if paper.get("title") or paper.get("arxiv_id"):
+            papers.append(paper)
+
+    return papers
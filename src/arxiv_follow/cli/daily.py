@@ -3,19 +3,21 @@
 每日研究者动态监控脚本 - 搜索特定研究者当天发布的论文
 """
 
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import Any
 
-import httpx
-
 # 导入滴答清单集成和配置
 try:
     from ..config.settings import DIDA_API_CONFIG
     from ..integrations.dida import create_arxiv_task
+    from ..models.config import load_config
     from ..services.researcher import (
-        build_arxiv_search_url,
+        fetch_papers_for_researchers_async,
+        fetch_papers_for_researchers_combined,
         fetch_researchers_from_tsv,
-        parse_arxiv_search_results,
+        get_researcher_name,
     )
 except ImportError:
     print("⚠️ 无法导入集成模块，相关功能将被禁用")
@@ -26,54 +28,21 @@ except ImportError:
     def fetch_researchers_from_tsv(*_args, **_kwargs):
         return []
 
-    def build_arxiv_search_url(*_args, **_kwargs):
-        return ""
-
-    def parse_arxiv_search_results(*_args, **_kwargs):
-        return []
-
-    DIDA_API_CONFIG = {"enable_bilingual": True}
-
-
-def fetch_papers_for_researcher(
-    author_name: str, date_from: str, date_to: str
-) -> list[dict[str, Any]]:
-    """
-    获取特定研究者在指定日期范围内的论文
-
-    Args:
-        author_name: 研究者姓名
-        date_from: 开始日期
-        date_to: 结束日期
-
-    Returns:
-        论文列表
-    """
-    try:
-        # 构建搜索URL
-        search_url = build_arxiv_search_url(author_name, date_from, date_to)
-        print(f"搜索 {author_name} 的论文: {search_url}")
-
-        # 获取搜索结果页面
-        with httpx.Client(follow_redirects=True, timeout=30.0) as client:
-            response = client.get(search_url)
-            response.raise_for_status()
+    async def fetch_papers_for_researchers_async(*_args, **_kwargs):
+        return {}
 
-        # 解析搜索结果
-        papers = parse_arxiv_search_results(response.text)
+    fetch_papers_for_researchers_combined = fetch_papers_for_researchers_async
 
-        # 为每篇论文添加查询的作者信息
-        for paper in papers:
-            paper["queried_author"] = author_name
+    def load_config():
+        return None
 
-        return papers
+    def get_researcher_name(researcher):
+        return researcher.get("name", "") if isinstance(researcher, dict) else ""
 
-    except Exception as e:
-        print(f"获取 {author_name} 的论文时出错: {e}")
-        return []
+    DIDA_API_CONFIG = {"enable_bilingual": True}
 
 
-def get_today_papers_for_all_researchers(
+async def get_today_papers_for_all_researchers_async(
     researchers: list[dict[str, Any]],
 ) -> dict[str, list[dict[str, Any]]]:
     """
@@ -92,34 +61,50 @@ def get_today_papers_for_all_researchers(
     print(f"\n🔍 正在搜索 {date_str} 当天发布的论文...")
     print("=" * 60)
 
-    all_papers = {}
+    author_names = [name for name in map(get_researcher_name, researchers) if name]
 
-    for researcher in researchers:
-        # 获取研究者姓名
-        if isinstance(researcher, dict):
-            if "name" in researcher:
-                author_name = researcher["name"]
-            else:
-                # 取第一个非空值作为姓名
-                author_name = next((v for v in researcher.values() if v.strip()), "")
+    config = load_config()
+    if config is not None and config.monitoring.combined_author_queries:
+        # 合并为少量 OR 查询，再按姓名分回各研究者
+        fetch = fetch_papers_for_researchers_combined
+    else:
+        # 逐个研究者并发检索（并发数、速率和超时由服务层控制）
+        fetch = fetch_papers_for_researchers_async
+    all_papers = await fetch(author_names, date_str, date_str)
+
+    for author_name in author_names:
+        papers = all_papers.get(author_name)
+        if papers:
+            print(f"  ✅ {author_name}: 找到 {len(papers)} 篇论文")
         else:
-            author_name = str(researcher)
+            print(f"  ❌ {author_name}: 未找到论文")
 
-        if not author_name or author_name.lower() in ["aaa", "test"]:  # 跳过测试数据
-            continue
+    return all_papers
 
-        print(f"\n正在搜索 {author_name} 的论文...")
 
-        # 获取该研究者的论文
-        papers = fetch_papers_for_researcher(author_name, date_str, date_str)
+def get_today_papers_for_all_researchers(
+    researchers: list[dict[str, Any]],
+) -> dict[str, list[dict[str, Any]]]:
+    """
+    获取所有研究者今天发布的论文（同步入口）
 
-        if papers:
-            all_papers[author_name] = papers
-            print(f"  ✅ 找到 {len(papers)} 篇论文")
-        else:
-            print("  ❌ 未找到论文")
+    已在事件循环中调用时（如 Jupyter 或异步调用方）改为在独立线程中运行，
+    异步代码应直接使用 get_today_papers_for_all_researchers_async。
 
-    return all_papers
+    Args:
+        researchers: 研究者列表
+
+    Returns:
+        按研究者分组的论文字典
+    """
+    coro = get_today_papers_for_all_researchers_async(researchers)
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coro)
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        return executor.submit(asyncio.run, coro).result()
 
 
 def display_papers(all_papers: dict[str, list[dict[str, Any]]]) -> None:
@@ -10,7 +10,12 @@ from datetime import datetime, timedelta
 from typing import Any
 from urllib.parse import urlencode
 
-import httpx
+from ..core.http import get_http_client
+from ..core.resilience import (
+    CircuitOpenError,
+    call_with_retry_sync,
+    raise_for_retryable,
+)
 
 # 导入滴答清单集成和配置
 try:
@@ -101,7 +106,7 @@ def fetch_papers_by_topic(
         topics: 主题列表
         date_from: 开始日期
         date_to: 结束日期
-        max_retries: 最大重试次数
+        max_retries: 单个搜索请求失败（429/5xx、网络错误）时的最大重试次数
 
     Returns:
         包含论文列表和搜索信息的字典
@@ -173,9 +178,13 @@ def fetch_papers_by_topic(
 
             print(f"🌐 搜索URL: {url}")
 
-            with httpx.Client(follow_redirects=True, timeout=30.0) as client:
-                response = client.get(url)
-                response.raise_for_status()
+            # 429/5xx 和网络错误先重试同一请求，仍失败才换下一个日期策略
+            response = call_with_retry_sync(
+                lambda url=url: raise_for_retryable(get_http_client().get(url)),
+                url,
+                max_retries,
+            )
+            response.raise_for_status()
 
             papers = parse_arxiv_search_results(response.text)
 
@@ -198,6 +207,13 @@ def fetch_papers_by_topic(
             else:
                 print("❌ 该策略未找到结果，尝试下一个策略...")
 
+        except CircuitOpenError as e:
+            # arXiv 熔断中，其余策略同样会失败，直接结束
+            print(f"❌ arXiv 暂不可用: {e}")
+            results["attempted_strategies"].append(
+                {"name": strategy["name"], "error": str(e), "url": url}
+            )
+            break
         except Exception as e:
             print(f"❌ 搜索策略 '{strategy['name']}' 失败: {e}")
             results["attempted_strategies"].append(
@@ -19,6 +19,21 @@ SUPPORTED_MODELS = {
     "llama-3.1": "meta-llama/llama-3.1-8b-instruct",
 }
 
+# 模型上下文窗口大小（令牌数），用于在发送前检查提示词是否超长
+MODEL_CONTEXT_TOKENS = {
+    "deepseek/deepseek-chat-v3-0324:free": 64000,
+    "google/gemini-2.0-flash-001": 1000000,
+    "google/gemini-2.0-flash-lite-001": 1000000,
+    "google/gemini-2.0-flash-exp": 1000000,
+    "google/gemini-2.0-flash-exp:free": 1000000,
+    "anthropic/claude-3-haiku": 200000,
+    "openai/gpt-4o-mini": 128000,
+    "meta-llama/llama-3.1-8b-instruct": 128000,
+}
+
+# 未知模型的保守上下文窗口大小
+DEFAULT_CONTEXT_TOKENS = 32000
+
 # 模型参数配置
 MODEL_CONFIG = {
     "temperature": 0.3,
@@ -64,6 +79,20 @@ def get_model_config(model_name: str = None) -> dict[str, Any]:
     return config
 
 
+def get_model_context_tokens(model_name: str) -> int:
+    """
+    获取模型的上下文窗口大小
+
+    Args:
+        model_name: 模型名称（支持简短别名）
+
+    Returns:
+        上下文窗口令牌数，未知模型返回 DEFAULT_CONTEXT_TOKENS
+    """
+    model_name = SUPPORTED_MODELS.get(model_name, model_name)
+    return MODEL_CONTEXT_TOKENS.get(model_name, DEFAULT_CONTEXT_TOKENS)
+
+
 def get_translation_config() -> dict[str, Any]:
     """获取翻译服务配置"""
     return {
@@ -5,7 +5,13 @@
 使用AI技术对论文进行深度分析、理解和报告生成。
 """
 
+import asyncio
+import json
 import logging
+import math
+import re
+import time
+from collections.abc import Awaitable, Callable
 from datetime import datetime
 from typing import Any
 
@@ -13,41 +19,378 @@ from typing import Any
 import httpx
 
 # 内部模块
+from ..config.models import get_model_context_tokens
 from ..models.config import AppConfig
+from ..models.paper import AnalysisType, PaperAnalysis
+from .http import create_async_client
+from .jsonparse import parse_json_response
+from .memo import AnalysisMemo
+from .ratelimit import get_rate_limiter
+from .resilience import call_with_retry, raise_for_retryable
+from .tokens import estimate_tokens, pack_by_budget, truncate_to_tokens
 
 logger = logging.getLogger(__name__)
 
+# 分析失败或超时时使用的默认重要性评分
+DEFAULT_IMPORTANCE_SCORE = 5.0
+# 重要性评分的有效范围（与提示词和结构化输出 Schema 一致）
+MIN_IMPORTANCE_SCORE = 1.0
+MAX_IMPORTANCE_SCORE = 10.0
+
+# 提示词模板（或结果解析方式）版本，修改时需递增以使已缓存的分析结果失效
+SIGNIFICANCE_PROMPT_VERSION = "3"
+TECHNICAL_PROMPT_VERSION = "1"
+MERGED_PROMPT_VERSION = "2"
+BATCH_SIGNIFICANCE_PROMPT_VERSION = "2"
+STRUCTURED_PROMPT_VERSION = "2"
+
+# 会产生重要性评分的分析模式（超时时使用默认评分）
+SCORING_MODES = frozenset({"significance", "significance_batch", "structured"})
+
+# 结构化分析输出的 JSON Schema
+STRUCTURED_ANALYSIS_SCHEMA: dict[str, Any] = {
+    "type": "object",
+    "properties": {
+        "importance_score": {
+            "type": "number",
+            "minimum": MIN_IMPORTANCE_SCORE,
+            "maximum": MAX_IMPORTANCE_SCORE,
+        },
+        "summary": {"type": "string"},
+        "key_points": {"type": "array", "items": {"type": "string"}},
+        "contributions": {"type": "array", "items": {"type": "string"}},
+        "limitations": {"type": "array", "items": {"type": "string"}},
+        "keywords": {"type": "array", "items": {"type": "string"}},
+    },
+    "required": [
+        "importance_score",
+        "summary",
+        "key_points",
+        "contributions",
+        "limitations",
+        "keywords",
+    ],
+    "additionalProperties": False,
+}
+
+# "重要性评分: 8.5"、"**评分**：7/10"、"评分为 6 分" 等形式
+_SCORE_RE = re.compile(
+    r"评分[*\s]*(?:[:：]|为|是)[*\s]*(\d+(?:\.\d+)?)\s*(?:/\s*10|分)?"
+)
+# 评分标题下一行单独给出数值，如 "## 重要性评分\n8.5"
+_SCORE_HEADING_RE = re.compile(
+    r"评分[*\s]*\n\s*(?:\*\*)?(\d+(?:\.\d+)?)\s*(?:/\s*10|分)?(?:\*\*)?\s*$",
+    re.MULTILINE,
+)
+
+# 提示词中单篇论文摘要的令牌上限，超出部分截断
+ABSTRACT_TOKEN_LIMIT = 3000
+# 提示词占满上下文后至少要留给输出的令牌数，不足时不发送请求
+MIN_OUTPUT_TOKENS = 256
+
+# 批量评分时每篇论文的输出（JSON条目）预留令牌数，决定每批最多容纳多少篇
+BATCH_ENTRY_OUTPUT_TOKENS = 80
+# 批量评分时每个请求中论文内容的输入令牌预算
+BATCH_INPUT_TOKEN_BUDGET = 12000
+
+# 综合报告包含的分析（结果键 -> 分析方法名），新增分析类型时在此登记即可并发执行
+COMPREHENSIVE_ANALYSES = {
+    "significance_analysis": "analyze_paper_significance",
+    "technical_analysis": "analyze_paper_technical_details",
+}
+
+
+def validate_importance_score(value: Any) -> float | None:
+    """
+    校验重要性评分
+
+    所有分析路径（自由文本、批量、合并、结构化输出）都用它判断评分是否有效。
+
+    Args:
+        value: 模型给出的评分
+
+    Returns:
+        1-10 之间的有限数值（转为 float），否则返回 None
+    """
+    if isinstance(value, bool) or not isinstance(value, int | float):
+        return None
+    score = float(value)
+    if not math.isfinite(score):
+        return None
+    if not MIN_IMPORTANCE_SCORE <= score <= MAX_IMPORTANCE_SCORE:
+        return None
+    return score
+
+
+def extract_importance_score(text: str) -> float | None:
+    """
+    从自由文本分析结果中提取重要性评分
+
+    只接受紧跟在"评分"标签后的数值（取最后一处，对应提示词要求的末行格式），
+    不会把列表序号等其他数字误认为评分。
+
+    Args:
+        text: LLM响应文本
+
+    Returns:
+        有效范围内的评分，找不到时返回 None
+    """
+    for pattern in (_SCORE_RE, _SCORE_HEADING_RE):
+        for match in reversed(list(pattern.finditer(text))):
+            score = validate_importance_score(float(match.group(1)))
+            if score is not None:
+                return score
+    return None
+
+
+def _paper_abstract(paper_data: dict[str, Any]) -> str:
+    """获取用于提示词的论文摘要（超出令牌上限时截断）"""
+    abstract = paper_data.get("summary", paper_data.get("abstract", "无摘要"))
+    return truncate_to_tokens(abstract, ABSTRACT_TOKEN_LIMIT)
+
+
+def _batch_entry_text(label: str, paper_data: dict[str, Any]) -> str:
+    """构建批量评分提示词中单篇论文的内容"""
+    title = paper_data.get("title", "未知标题")
+    abstract = _paper_abstract(paper_data)
+    categories = paper_data.get("categories", [])
+    return (
+        f"[{label}] 标题：{title}\n"
+        f"分类：{', '.join(categories) if categories else '未知'}\n"
+        f"摘要：{abstract}"
+    )
+
 
 class PaperAnalyzer:
     """现代化论文分析器 - 使用AI进行深度分析"""
 
-    def __init__(self, config: AppConfig):
+    # LLM采样温度（参与分析结果缓存键）
+    temperature = 0.3
+
+    def __init__(self, config: AppConfig, memo: AnalysisMemo | None = None):
         """
         初始化论文分析器
 
         Args:
             config: 应用程序配置
+            memo: 分析结果记忆，不提供时按存储配置在首次分析时创建
         """
         self.config = config
         self.api_key = config.get_llm_api_key()
         self.base_url = config.llm.api_base_url
         self.model = config.llm.default_model
+        self.context_tokens = get_model_context_tokens(self.model)
+
+        self._memo = memo
+        self._memo_resolved = memo is not None
+
+        # 综合报告是否默认合并为单次结构化输出调用；批量评分的输出令牌预算
+        self.merge_comprehensive = config.integrations.ai_merge_comprehensive
+        self.max_tokens = config.integrations.ai_max_tokens
+
+        # 长连接客户端（首次调用时创建，绑定到当时的事件循环）
+        self._client: httpx.AsyncClient | None = None
+        self._client_loop: asyncio.AbstractEventLoop | None = None
+
+        # LLM调用统计
+        self._llm_stats = {
+            "calls": 0,
+            "succeeded": 0,
+            "failed": 0,
+            "retries": 0,
+            "total_latency": 0.0,
+            "max_latency": 0.0,
+            "prompt_tokens": 0,
+            "completion_tokens": 0,
+            "oversized": 0,
+        }
 
         if not self.api_key:
             logger.warning("未找到LLM API密钥，分析功能将被禁用")
             logger.info("请在配置中设置LLM API密钥")
 
+    async def __aenter__(self):
+        """异步上下文管理器入口"""
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """异步上下文管理器出口"""
+        await self.close()
+
+    async def close(self):
+        """关闭HTTP客户端"""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+            self._client_loop = None
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """获取长连接客户端（事件循环变化时重新创建）"""
+        loop = asyncio.get_running_loop()
+        if (
+            self._client is None
+            or self._client.is_closed
+            or self._client_loop is not loop
+        ):
+            api = self.config.api
+            self._client = create_async_client(
+                self.config,
+                timeout=api.llm_timeout_seconds,
+                max_connections=api.llm_max_connections,
+            )
+            self._client_loop = loop
+        return self._client
+
+    def _record_llm_call(self, started: float, success: bool) -> None:
+        """记录一次LLM调用的耗时和结果"""
+        latency = time.monotonic() - started
+        stats = self._llm_stats
+        stats["succeeded" if success else "failed"] += 1
+        stats["total_latency"] += latency
+        stats["max_latency"] = max(stats["max_latency"], latency)
+
+    def _record_tokens(
+        self, result: dict[str, Any], prompt_tokens: int, content: str
+    ) -> tuple[int, int]:
+        """
+        记录一次调用的输入/输出令牌数
+
+        优先使用API返回的 usage，缺失时使用估算值。
+
+        Returns:
+            (输入令牌数, 输出令牌数)
+        """
+        usage = result.get("usage") or {}
+        tokens_in = usage.get("prompt_tokens") or prompt_tokens
+        tokens_out = usage.get("completion_tokens") or estimate_tokens(content)
+        self._llm_stats["prompt_tokens"] += tokens_in
+        self._llm_stats["completion_tokens"] += tokens_out
+        return tokens_in, tokens_out
+
+    def llm_stats(self) -> dict[str, Any]:
+        """获取LLM调用统计（调用数、重试数、耗时和令牌数）"""
+        stats = self._llm_stats
+        finished = stats["succeeded"] + stats["failed"]
+        return {
+            "calls": stats["calls"],
+            "succeeded": stats["succeeded"],
+            "failed": stats["failed"],
+            "retries": stats["retries"],
+            "avg_latency_ms": (
+                stats["total_latency"] * 1000 / finished if finished else 0.0
+            ),
+            "max_latency_ms": stats["max_latency"] * 1000,
+            "prompt_tokens": stats["prompt_tokens"],
+            "completion_tokens": stats["completion_tokens"],
+            "oversized": stats["oversized"],
+        }
+
     def is_enabled(self) -> bool:
         """检查分析器是否可用"""
         return bool(self.api_key)
 
-    async def _call_llm(self, prompt: str, max_tokens: int = 2000) -> str | None:
+    @property
+    def memo(self) -> AnalysisMemo | None:
+        """分析结果记忆（按需创建，缓存被禁用时为 None）"""
+        if not self._memo_resolved:
+            self._memo_resolved = True
+            try:
+                self._memo = AnalysisMemo.from_config(self.config.storage)
+            except Exception as e:
+                logger.warning(f"分析结果缓存不可用: {e}")
+        return self._memo
+
+    def memo_stats(self) -> dict[str, Any]:
+        """获取分析结果缓存的命中统计"""
+        if self.memo is None:
+            return {"hits": 0, "misses": 0, "hit_rate": 0.0}
+        return self.memo.stats()
+
+    async def _memoized(
+        self,
+        analysis_type: str,
+        prompt_version: str,
+        paper_data: dict[str, Any],
+        analyze: Callable[[], Awaitable[dict[str, Any]]],
+    ) -> dict[str, Any]:
+        """
+        带记忆的分析调用
+
+        命中时返回缓存结果（附带 cached=True），只缓存成功的分析结果。
+
+        Args:
+            analysis_type: 分析类型
+            prompt_version: 提示词模板版本
+            paper_data: 论文数据
+            analyze: 未命中时执行的分析函数
+
+        Returns:
+            分析结果
+        """
+        key = self._memo_key(analysis_type, prompt_version, paper_data)
+        if key is None:
+            return await analyze()
+
+        cached = self._memo_get(key, paper_data)
+        if cached is not None:
+            return cached
+
+        result = await analyze()
+        if result.get("success"):
+            self.memo.set(key, result)
+        return result
+
+    def _memo_key(
+        self, analysis_type: str, prompt_version: str, paper_data: dict[str, Any]
+    ) -> str | None:
+        """构建论文的记忆键，缓存被禁用时返回 None"""
+        if self.memo is None:
+            return None
+        return self.memo.make_key(
+            analysis_type,
+            prompt_version,
+            self.model,
+            self.temperature,
+            paper_data.get("title", ""),
+            paper_data.get("summary", paper_data.get("abstract", "")),
+        )
+
+    def _memo_get(self, key: str, paper_data: dict[str, Any]) -> dict[str, Any] | None:
+        """读取缓存的分析结果（附带 cached=True），未命中时返回 None"""
+        cached = self.memo.get(key)
+        if cached is None:
+            return None
+        logger.debug(f"分析结果缓存命中: {paper_data.get('title', '')[:50]}")
+        return {**cached, "cached": True}
+
+    @staticmethod
+    async def _post(
+        client: httpx.AsyncClient,
+        url: str,
+        headers: dict[str, str],
+        data: dict[str, Any],
+    ) -> httpx.Response:
+        """发送一次补全请求，429/5xx 响应抛出可重试错误"""
+        return raise_for_retryable(await client.post(url, headers=headers, json=data))
+
+    async def _call_llm(
+        self,
+        prompt: str,
+        max_tokens: int = 2000,
+        response_format: dict[str, Any] | None = None,
+    ) -> str | None:
         """
         异步调用LLM API
 
+        复用长连接客户端；遇到 429/5xx 或网络错误时按 http_retries 带抖动指数退避重试
+        （遵循 Retry-After），OpenRouter 熔断期间直接失败。
+        发送前估算提示词令牌数：输出预算按剩余上下文收缩，剩余不足时直接放弃，
+        避免为必然失败的超长请求付费。
+
         Args:
             prompt: 提示词
             max_tokens: 最大token数
+            response_format: 结构化输出约束（OpenAI 兼容的 response_format）
 
         Returns:
             LLM响应内容
@@ -55,37 +398,66 @@ class PaperAnalyzer:
         if not self.is_enabled():
             return None
 
-        try:
-            headers = {
-                "Authorization": f"Bearer {self.api_key}",
-                "Content-Type": "application/json",
-                "HTTP-Referer": "https://github.com/arxiv-follow",
-                "X-Title": "ArXiv Follow Paper Analysis Service",
-            }
+        prompt_tokens = estimate_tokens(prompt)
+        available = self.context_tokens - prompt_tokens
+        if available < MIN_OUTPUT_TOKENS:
+            self._llm_stats["oversized"] += 1
+            logger.error(
+                f"提示词约 {prompt_tokens} 令牌，超出模型上下文 {self.context_tokens}，跳过请求"
+            )
+            return None
+        max_tokens = min(max_tokens, available)
 
-            data = {
-                "model": self.model,
-                "messages": [{"role": "user", "content": prompt}],
-                "max_tokens": max_tokens,
-                "temperature": 0.3,
-                "top_p": 0.9,
-            }
+        headers = {
+            "Authorization": f"Bearer {self.api_key}",
+            "Content-Type": "application/json",
+            "HTTP-Referer": "https://github.com/arxiv-follow",
+            "X-Title": "ArXiv Follow Paper Analysis Service",
+        }
 
-            async with httpx.AsyncClient(timeout=60.0) as client:
-                response = await client.post(
-                    f"{self.base_url}/chat/completions", headers=headers, json=data
-                )
-                response.raise_for_status()
+        data = {
+            "model": self.model,
+            "messages": [{"role": "user", "content": prompt}],
+            "max_tokens": max_tokens,
+            "temperature": self.temperature,
+            "top_p": 0.9,
+        }
+        if response_format is not None:
+            data["response_format"] = response_format
 
-                result = response.json()
-                content = result["choices"][0]["message"]["content"]
+        url = f"{self.base_url}/chat/completions"
+        self._llm_stats["calls"] += 1
+        started = time.monotonic()
 
-                logger.info(f"LLM分析完成，响应长度: {len(content)}")
-                return content
+        def count_retry(_attempt: int, _error: BaseException, _delay: float) -> None:
+            self._llm_stats["retries"] += 1
+
+        try:
+            client = self._get_client()
+            response = await call_with_retry(
+                lambda: self._post(client, url, headers, data),
+                url,
+                self.config.api.http_retries,
+                rate_limiter=get_rate_limiter(self.config),
+                on_retry=count_retry,
+            )
+            response.raise_for_status()
+            result = response.json()
+            content = result["choices"][0]["message"]["content"]
+
+            self._record_llm_call(started, success=True)
+            tokens_in, tokens_out = self._record_tokens(result, prompt_tokens, content)
+            logger.info(
+                f"LLM分析完成，响应长度: {len(content)}，"
+                f"令牌: 输入 {tokens_in} / 输出 {tokens_out}"
+            )
+            return content
 
         except Exception as e:
             logger.error(f"LLM API调用失败: {e}")
-            return None
+
+        self._record_llm_call(started, success=False)
+        return None
 
     async def analyze_paper_significance(
         self, paper_data: dict[str, Any]
@@ -106,9 +478,18 @@ class PaperAnalyzer:
                 "importance_score": 5.0,  # 默认中等重要性
             }
 
+        return await self._memoized(
+            "significance",
+            SIGNIFICANCE_PROMPT_VERSION,
+            paper_data,
+            lambda: self._analyze_significance(paper_data),
+        )
+
+    async def _analyze_significance(self, paper_data: dict[str, Any]) -> dict[str, Any]:
+        """调用LLM分析论文重要性（不经过缓存）"""
         # 构建分析提示词
         title = paper_data.get("title", "未知标题")
-        abstract = paper_data.get("summary", paper_data.get("abstract", "无摘要"))
+        abstract = _paper_abstract(paper_data)
         authors = paper_data.get("authors", [])
         categories = paper_data.get("categories", [])
 
@@ -139,21 +520,10 @@ class PaperAnalyzer:
         response = await self._call_llm(prompt, max_tokens=1500)
 
         if response:
-            # 尝试提取重要性评分
-            importance_score = 5.0  # 默认评分
-            try:
-                # 查找评分模式
-                lines = response.split("\n")
-                for line in lines:
-                    if "重要性评分" in line or "评分" in line:
-                        import re
-
-                        score_match = re.search(r"(\d+\.?\d*)", line)
-                        if score_match:
-                            importance_score = float(score_match.group(1))
-                            break
-            except (ValueError, AttributeError):
-                pass
+            importance_score = extract_importance_score(response)
+            if importance_score is None:
+                logger.warning(f"未能从分析结果中提取重要性评分: {title[:50]}")
+                importance_score = DEFAULT_IMPORTANCE_SCORE
 
             return {
                 "analysis_type": "significance",
@@ -166,6 +536,300 @@ class PaperAnalyzer:
         else:
             return {"error": "LLM分析失败", "success": False, "importance_score": 5.0}
 
+    async def analyze_paper_structured(
+        self, paper_data: dict[str, Any]
+    ) -> dict[str, Any]:
+        """
+        以 JSON Schema 约束的结构化输出分析论文重要性
+
+        结果直接映射为 PaperAnalysis（评分、要点、贡献、局限性、关键词），
+        不再从自由文本中提取评分。
+
+        Args:
+            paper_data: 论文数据
+
+        Returns:
+            重要性分析结果，analysis 键为 PaperAnalysis 的字典形式
+        """
+        if not self.is_enabled():
+            return {
+                "error": "分析器未启用",
+                "success": False,
+                "importance_score": DEFAULT_IMPORTANCE_SCORE,
+            }
+
+        return await self._memoized(
+            "structured",
+            STRUCTURED_PROMPT_VERSION,
+            paper_data,
+            lambda: self._analyze_structured(paper_data),
+        )
+
+    async def _analyze_structured(self, paper_data: dict[str, Any]) -> dict[str, Any]:
+        """调用LLM进行结构化分析（不经过缓存）"""
+        title = paper_data.get("title", "未知标题")
+        abstract = _paper_abstract(paper_data)
+        authors = paper_data.get("authors", [])
+        categories = paper_data.get("categories", [])
+
+        prompt = f"""请分析以下学术论文的重要性和意义：
+
+论文标题：{title}
+
+作者：{", ".join(authors) if authors else "未知"}
+
+分类：{", ".join(categories) if categories else "未知"}
+
+摘要：
+{abstract}
+
+请用中文输出一个JSON对象，字段含义如下：
+- importance_score：1-10分的重要性评分（10分最高），综合研究意义、技术创新和应用价值
+- summary：一段话总结研究意义
+- key_points：3-5条关键要点
+- contributions：主要贡献
+- limitations：基于摘要能判断的局限性
+- keywords：5-8个关键技术词汇
+
+只输出JSON，不要输出其他内容。
+"""
+
+        response = await self._call_llm(
+            prompt,
+            max_tokens=1500,
+            response_format={
+                "type": "json_schema",
+                "json_schema": {
+                    "name": "paper_analysis",
+                    "strict": True,
+                    "schema": STRUCTURED_ANALYSIS_SCHEMA,
+                },
+            },
+        )
+        if not response:
+            return {
+                "error": "LLM分析失败",
+                "success": False,
+                "importance_score": DEFAULT_IMPORTANCE_SCORE,
+            }
+
+        try:
+            analysis = self._to_paper_analysis(paper_data, response)
+        except (ValueError, KeyError, TypeError) as e:
+            # 只在解析失败时发起一次修复请求
+            logger.warning(f"结构化分析结果解析失败，尝试修复: {e}")
+            repaired = await self._repair_json(response, str(e))
+            try:
+                analysis = self._to_paper_analysis(paper_data, repaired or "")
+            except (ValueError, KeyError, TypeError) as e:
+                logger.error(f"结构化分析结果修复失败: {e}")
+                return {
+                    "error": f"结构化分析结果解析失败: {e}",
+                    "success": False,
+                    "importance_score": DEFAULT_IMPORTANCE_SCORE,
+                }
+
+        return {
+            "analysis_type": "significance",
+            "content": analysis.summary,
+            "keywords": analysis.keywords,
+            "model": self.model,
+            "analysis_time": analysis.analysis_time.isoformat(),
+            "importance_score": analysis.score,
+            "analysis": analysis.model_dump(mode="json"),
+            "structured": True,
+            "success": True,
+        }
+
+    def _to_paper_analysis(
+        self, paper_data: dict[str, Any], response: str
+    ) -> PaperAnalysis:
+        """
+        把结构化输出映射为 PaperAnalysis
+
+        Raises:
+            ValueError: 响应不是合法JSON或字段不符合要求
+            KeyError: 缺少评分字段
+        """
+        parsed = parse_json_response(response)
+        score = validate_importance_score(parsed["importance_score"])
+        if score is None:
+            raise ValueError(f"无效的重要性评分: {parsed['importance_score']!r}")
+        return PaperAnalysis(
+            arxiv_id=str(paper_data.get("arxiv_id", paper_data.get("id", ""))),
+            analysis_type=AnalysisType.IMPORTANCE,
+            score=score,
+            summary=parsed.get("summary", ""),
+            key_points=parsed.get("key_points", []),
+            contributions=parsed.get("contributions", []),
+            limitations=parsed.get("limitations", []),
+            keywords=parsed.get("keywords", []),
+            model_used=self.model,
+        )
+
+    async def _repair_json(self, response: str, error: str) -> str | None:
+        """请求LLM把不合法的输出修复为符合 Schema 的JSON"""
+        prompt = f"""下面的内容应当是符合给定 JSON Schema 的JSON对象，但解析失败（{error}）。
+请修复它，保留原有内容，只输出修复后的JSON。
+
+JSON Schema：
+{json.dumps(STRUCTURED_ANALYSIS_SCHEMA, ensure_ascii=False)}
+
+待修复内容：
+{response}
+"""
+        return await self._call_llm(prompt, max_tokens=1500)
+
+    def plan_significance_batches(
+        self, papers_data: list[dict[str, Any]]
+    ) -> list[list[int]]:
+        """
+        按令牌预算规划批量评分的批次
+
+        每批的论文数受输出预算（ai_max_tokens）限制，论文内容受输入预算限制。
+
+        Args:
+            papers_data: 论文数据列表
+
+        Returns:
+            批次列表，每个批次为论文下标列表
+        """
+        max_items = max(1, self.max_tokens // BATCH_ENTRY_OUTPUT_TOKENS)
+        return pack_by_budget(
+            range(len(papers_data)),
+            lambda i: estimate_tokens(_batch_entry_text("", papers_data[i])),
+            BATCH_INPUT_TOKEN_BUDGET,
+            max_items=max_items,
+        )
+
+    async def analyze_significance_batch(
+        self, papers_data: list[dict[str, Any]]
+    ) -> list[dict[str, Any]]:
+        """
+        用一次请求为多篇论文评分
+
+        模型返回 {arxiv_id, importance_score, keywords} 组成的JSON数组；
+        被遗漏或格式错误的论文回退为逐篇分析。
+
+        Args:
+            papers_data: 同一批次的论文数据列表
+
+        Returns:
+            分析结果列表（与输入顺序一致）
+        """
+        if not self.is_enabled():
+            return [
+                {
+                    "error": "分析器未启用",
+                    "success": False,
+                    "importance_score": DEFAULT_IMPORTANCE_SCORE,
+                }
+                for _ in papers_data
+            ]
+
+        results: list[dict[str, Any] | None] = [None] * len(papers_data)
+        keys: list[str | None] = []
+        for i, paper_data in enumerate(papers_data):
+            key = self._memo_key(
+                "significance_batch", BATCH_SIGNIFICANCE_PROMPT_VERSION, paper_data
+            )
+            keys.append(key)
+            if key is not None:
+                results[i] = self._memo_get(key, paper_data)
+
+        # 批内唯一的论文编号，缺失或重复时使用序号
+        labels: dict[str, int] = {}
+        for i, paper_data in enumerate(papers_data):
+            if results[i] is not None:
+                continue
+            label = str(paper_data.get("arxiv_id") or paper_data.get("id") or "")
+            if not label or label in labels:
+                label = f"paper-{i + 1}"
+            labels[label] = i
+
+        if labels:
+            entries = await self._score_batch(
+                {label: papers_data[i] for label, i in labels.items()}
+            )
+            for label, i in labels.items():
+                result = entries.get(label)
+                if result is not None:
+                    results[i] = result
+                    if keys[i] is not None:
+                        self.memo.set(keys[i], result)
+
+        missing = [i for i, result in enumerate(results) if result is None]
+        if missing:
+            logger.info(f"批量评分遗漏 {len(missing)} 篇论文，回退为逐篇分析")
+            fallback = await asyncio.gather(
+                *(self.analyze_paper_significance(papers_data[i]) for i in missing)
+            )
+            for i, result in zip(missing, fallback, strict=True):
+                results[i] = result
+
+        return results
+
+    async def _score_batch(
+        self, papers: dict[str, dict[str, Any]]
+    ) -> dict[str, dict[str, Any]]:
+        """
+        发送批量评分请求（不经过缓存）
+
+        Args:
+            papers: {论文编号: 论文数据}
+
+        Returns:
+            {论文编号: 分析结果}，只包含格式正确的条目
+        """
+        entries = "\n\n".join(
+            _batch_entry_text(label, paper) for label, paper in papers.items()
+        )
+        prompt = f"""请评估以下 {len(papers)} 篇学术论文的重要性：
+
+{entries}
+
+对每篇论文综合研究意义、技术创新点和应用价值，给出1-10分的重要性评分（10分最高），并提取3-5个关键技术词汇。
+
+请只输出一个JSON数组，不要输出其他内容，每篇论文一个元素，格式如下：
+[{{"arxiv_id": "论文编号", "importance_score": 7.5, "keywords": ["关键词1", "关键词2"]}}]
+"""
+
+        response = await self._call_llm(prompt, max_tokens=self.max_tokens)
+        if not response:
+            return {}
+
+        try:
+            items = parse_json_response(response, list)
+        except ValueError as e:
+            logger.warning(f"批量评分结果解析失败: {e}")
+            return {}
+
+        analysis_time = datetime.now().isoformat()
+        scored: dict[str, dict[str, Any]] = {}
+        for item in items:
+            if not isinstance(item, dict) or str(item.get("arxiv_id")) not in papers:
+                continue
+            score = validate_importance_score(item.get("importance_score"))
+            keywords = item.get("keywords", [])
+            if (
+                score is None
+                or not isinstance(keywords, list)
+                or not all(isinstance(k, str) for k in keywords)
+            ):
+                continue
+
+            scored[str(item["arxiv_id"])] = {
+                "analysis_type": "significance",
+                "content": f"关键词: {', '.join(keywords)}" if keywords else "",
+                "keywords": keywords,
+                "model": self.model,
+                "analysis_time": analysis_time,
+                "importance_score": score,
+                "batched": True,
+                "success": True,
+            }
+        return scored
+
     async def analyze_paper_technical_details(
         self, paper_data: dict[str, Any]
     ) -> dict[str, Any]:
@@ -181,8 +845,19 @@ class PaperAnalyzer:
         if not self.is_enabled():
             return {"error": "分析器未启用", "success": False}
 
+        return await self._memoized(
+            "technical",
+            TECHNICAL_PROMPT_VERSION,
+            paper_data,
+            lambda: self._analyze_technical_details(paper_data),
+        )
+
+    async def _analyze_technical_details(
+        self, paper_data: dict[str, Any]
+    ) -> dict[str, Any]:
+        """调用LLM分析论文技术细节（不经过缓存）"""
         title = paper_data.get("title", "未知标题")
-        abstract = paper_data.get("summary", paper_data.get("abstract", "无摘要"))
+        abstract = _paper_abstract(paper_data)
 
         prompt = f"""请对以下学术论文进行技术深度分析：
 
@@ -218,13 +893,14 @@ class PaperAnalyzer:
             return {"error": "LLM分析失败", "success": False}
 
     async def generate_comprehensive_report(
-        self, paper_data: dict[str, Any]
+        self, paper_data: dict[str, Any], merged: bool | None = None
     ) -> dict[str, Any]:
         """
         生成综合分析报告
 
         Args:
             paper_data: 论文数据
+            merged: 是否合并为单次结构化输出调用，None 时使用配置
 
         Returns:
             综合分析报告
@@ -232,15 +908,41 @@ class PaperAnalyzer:
         if not self.is_enabled():
             return {"error": "分析器未启用", "success": False}
 
-        # 并行执行多种分析
-        significance_task = self.analyze_paper_significance(paper_data)
-        technical_task = self.analyze_paper_technical_details(paper_data)
+        if merged is None:
+            merged = self.merge_comprehensive
 
         try:
-            significance_result = await significance_task
-            technical_result = await technical_task
+            sections: dict[str, Any] | None = None
+            if merged:
+                merged_result = await self._memoized(
+                    "comprehensive_merged",
+                    MERGED_PROMPT_VERSION,
+                    paper_data,
+                    lambda: self._analyze_merged(paper_data),
+                )
+                if merged_result.get("success"):
+                    sections = merged_result
+                    if merged_result.get("cached"):
+                        # 命中缓存时各分项同样标记，便于报告和缓存统计计数
+                        sections = {
+                            key: {**merged_result[key], "cached": True}
+                            for key in COMPREHENSIVE_ANALYSES
+                        }
+                else:
+                    logger.warning("合并分析失败，回退为分项并发分析")
+
+            if sections is None:
+                # 并发执行各项分析（请求速率由共享限流器控制）
+                results = await asyncio.gather(
+                    *(
+                        getattr(self, method)(paper_data)
+                        for method in COMPREHENSIVE_ANALYSES.values()
+                    )
+                )
+                sections = dict(zip(COMPREHENSIVE_ANALYSES, results, strict=True))
 
-            return {
+            significance_result = sections["significance_analysis"]
+            report = {
                 "analysis_type": "comprehensive",
                 "paper_info": {
                     "title": paper_data.get("title", "未知标题"),
@@ -248,29 +950,107 @@ class PaperAnalyzer:
                     "arxiv_id": paper_data.get("arxiv_id", paper_data.get("id", "")),
                     "categories": paper_data.get("categories", []),
                 },
-                "significance_analysis": significance_result,
-                "technical_analysis": technical_result,
-                "overall_score": significance_result.get("importance_score", 5.0),
+                **{key: sections[key] for key in COMPREHENSIVE_ANALYSES},
+                "overall_score": significance_result.get(
+                    "importance_score", DEFAULT_IMPORTANCE_SCORE
+                ),
                 "analysis_time": datetime.now().isoformat(),
                 "success": True,
             }
+            if all(sections[key].get("cached") for key in COMPREHENSIVE_ANALYSES):
+                report["cached"] = True
+            return report
 
         except Exception as e:
             logger.error(f"综合分析失败: {e}")
             return {"error": f"综合分析失败: {str(e)}", "success": False}
 
+    async def _analyze_merged(self, paper_data: dict[str, Any]) -> dict[str, Any]:
+        """
+        用一次结构化输出调用同时完成重要性和技术分析（不经过缓存）
+
+        Returns:
+            {"significance_analysis": ..., "technical_analysis": ..., "success": True}，
+            失败时为 {"error": ..., "success": False}
+        """
+        title = paper_data.get("title", "未知标题")
+        abstract = _paper_abstract(paper_data)
+        authors = paper_data.get("authors", [])
+        categories = paper_data.get("categories", [])
+
+        prompt = f"""请对以下学术论文同时进行重要性分析和技术深度分析：
+
+论文标题：{title}
+
+作者：{", ".join(authors) if authors else "未知"}
+
+分类：{", ".join(categories) if categories else "未知"}
+
+摘要：
+{abstract}
+
+重要性分析（significance）请涵盖：研究意义、技术创新点、应用价值、研究质量评估、关键词提取。
+技术分析（technical）请涵盖：方法论、算法/模型原理、实验设计、技术难点、与现有工作的关系、可重现性、技术局限性。
+
+请只输出一个JSON对象，不要输出其他内容，格式如下（分析内容用中文Markdown）：
+{{"significance": "重要性分析内容", "importance_score": 1到10之间的数字, "technical": "技术分析内容"}}
+"""
+
+        response = await self._call_llm(prompt, max_tokens=3000)
+        if not response:
+            return {"error": "LLM分析失败", "success": False}
+
+        try:
+            parsed = parse_json_response(response)
+            significance = str(parsed["significance"])
+            technical = str(parsed["technical"])
+            importance_score = validate_importance_score(parsed["importance_score"])
+            if importance_score is None:
+                raise ValueError(f"无效的重要性评分: {parsed['importance_score']!r}")
+        except (ValueError, KeyError, TypeError) as e:
+            logger.warning(f"合并分析结果解析失败: {e}")
+            return {"error": f"合并分析结果解析失败: {e}", "success": False}
+
+        analysis_time = datetime.now().isoformat()
+        return {
+            "significance_analysis": {
+                "analysis_type": "significance",
+                "content": significance,
+                "model": self.model,
+                "analysis_time": analysis_time,
+                "importance_score": importance_score,
+                "success": True,
+            },
+            "technical_analysis": {
+                "analysis_type": "technical",
+                "content": technical,
+                "model": self.model,
+                "analysis_time": analysis_time,
+                "success": True,
+            },
+            "success": True,
+        }
+
     async def analyze_multiple_papers(
-        self, papers_data: list[dict[str, Any]], mode: str = "significance"
+        self,
+        papers_data: list[dict[str, Any]],
+        mode: str = "significance",
+        concurrency: int = 3,
+        deadline: float | None = None,
     ) -> list[dict[str, Any]]:
         """
         批量分析多篇论文
 
         Args:
             papers_data: 论文数据列表
-            mode: 分析模式 ("significance", "technical", "comprehensive")
+            mode: 分析模式 ("significance", "significance_batch", "structured",
+                "technical", "comprehensive")，significance_batch 按令牌预算把多篇论文
+                合并到一次请求中评分，structured 使用结构化输出
+            concurrency: 最大并发分析数（请求速率由共享限流器控制）
+            deadline: 整体截止时间(秒)，超时未完成的论文返回带默认评分的超时结果
 
         Returns:
-            分析结果列表
+            分析结果列表（与输入顺序一致）
         """
         if not self.is_enabled():
             return [{"error": "分析器未启用", "success": False} for _ in papers_data]
@@ -280,38 +1060,74 @@ class PaperAnalyzer:
 
         logger.info(f"开始批量分析 {len(papers_data)} 篇论文，模式: {mode}")
 
-        results = []
+        # 根据模式选择分析方法；每个任务分析一组论文（非批量模式下每组一篇）
+        if mode == "significance_batch":
+            groups = self.plan_significance_batches(papers_data)
+
+            async def analyze_group(group):
+                return await self.analyze_significance_batch(
+                    [papers_data[i] for i in group]
+                )
 
-        # 根据模式选择分析方法
-        if mode == "significance":
-            analyze_func = self.analyze_paper_significance
-        elif mode == "technical":
-            analyze_func = self.analyze_paper_technical_details
-        elif mode == "comprehensive":
-            analyze_func = self.generate_comprehensive_report
         else:
-            raise ValueError(f"不支持的分析模式: {mode}")
+            if mode == "significance":
+                analyze_func = self.analyze_paper_significance
+            elif mode == "structured":
+                analyze_func = self.analyze_paper_structured
+            elif mode == "technical":
+                analyze_func = self.analyze_paper_technical_details
+            elif mode == "comprehensive":
+                analyze_func = self.generate_comprehensive_report
+            else:
+                raise ValueError(f"不支持的分析模式: {mode}")
 
-        # 批量处理（这里可以根据需要调整并发度）
-        import asyncio
+            groups = [[i] for i in range(len(papers_data))]
 
-        semaphore = asyncio.Semaphore(3)  # 限制并发数
+            async def analyze_group(group):
+                return [await analyze_func(papers_data[group[0]])]
 
-        async def analyze_with_semaphore(paper_data):
+        # 批量处理（并发数限制在途请求，速率由共享限流器控制）
+        semaphore = asyncio.Semaphore(max(1, concurrency))
+
+        async def analyze_with_semaphore(group):
             async with semaphore:
-                return await analyze_func(paper_data)
+                return await analyze_group(group)
 
-        tasks = [analyze_with_semaphore(paper) for paper in papers_data]
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+        tasks = [asyncio.create_task(analyze_with_semaphore(group)) for group in groups]
+        try:
+            _done, pending = await asyncio.wait(tasks, timeout=deadline)
+        finally:
+            # 截止时间到达（或调用方被取消）时取消未完成的分析
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+        if pending:
+            logger.warning(
+                f"{len(pending)} 篇论文未在 {deadline}s 内完成分析，使用默认结果"
+            )
 
-        # 处理异常结果
-        processed_results = []
-        for i, result in enumerate(results):
-            if isinstance(result, Exception):
-                logger.error(f"论文 {i} 分析失败: {result}")
-                processed_results.append({"error": str(result), "success": False})
+        # 处理异常和超时结果
+        processed_results: list[dict[str, Any]] = [{} for _ in papers_data]
+        for group, task in zip(groups, tasks, strict=True):
+            if task in pending or task.cancelled():
+                group_results = []
+                for _ in group:
+                    result = {"error": "分析超时", "success": False, "timed_out": True}
+                    if mode in SCORING_MODES:
+                        result["importance_score"] = DEFAULT_IMPORTANCE_SCORE
+                    group_results.append(result)
+            elif task.exception() is not None:
+                logger.error(f"论文 {group} 分析失败: {task.exception()}")
+                group_results = [
+                    {"error": str(task.exception()), "success": False} for _ in group
+                ]
             else:
-                processed_results.append(result)
+                group_results = task.result()
+
+            for i, result in zip(group, group_results, strict=True):
+                processed_results[i] = result
 
         logger.info(
             f"批量分析完成，成功: {sum(1 for r in processed_results if r.get('success'))}/{len(processed_results)}"
@@ -336,6 +1152,7 @@ class PaperAnalyzer:
             "total_papers": len(papers_analysis),
             "successful_analysis": sum(1 for p in papers_analysis if p.get("success")),
             "failed_analysis": sum(1 for p in papers_analysis if not p.get("success")),
+            "cached_analysis": sum(1 for p in papers_analysis if p.get("cached")),
             "average_importance": 0.0,
             "high_importance_papers": [],
             "top_categories": {},
@@ -388,6 +1205,9 @@ class PaperAnalyzer:
         if summary["failed_analysis"] > 0:
             parts.append(f"❌ 分析失败 {summary['failed_analysis']} 篇")
 
+        if summary.get("cached_analysis"):
+            parts.append(f"♻️ 复用缓存分析 {summary['cached_analysis']} 篇")
+
         if summary["average_importance"] > 0:
             parts.append(f"📈 平均重要性评分 {summary['average_importance']:.1f}/10")
 
@@ -418,16 +1238,17 @@ async def analyze_paper(
     Returns:
         分析结果
     """
-    analyzer = PaperAnalyzer(config)
-
-    if mode == "significance":
-        return await analyzer.analyze_paper_significance(paper_data)
-    elif mode == "technical":
-        return await analyzer.analyze_paper_technical_details(paper_data)
-    elif mode == "comprehensive":
-        return await analyzer.generate_comprehensive_report(paper_data)
-    else:
-        raise ValueError(f"不支持的分析模式: {mode}")
+    async with PaperAnalyzer(config) as analyzer:
+        if mode == "significance":
+            return await analyzer.analyze_paper_significance(paper_data)
+        elif mode == "structured":
+            return await analyzer.analyze_paper_structured(paper_data)
+        elif mode == "technical":
+            return await analyzer.analyze_paper_technical_details(paper_data)
+        elif mode == "comprehensive":
+            return await analyzer.generate_comprehensive_report(paper_data)
+        else:
+            raise ValueError(f"不支持的分析模式: {mode}")
 
 
 async def analyze_multiple_papers(
@@ -444,8 +1265,8 @@ async def analyze_multiple_papers(
     Returns:
         分析结果列表
     """
-    analyzer = PaperAnalyzer(config)
-    return await analyzer.analyze_multiple_papers(papers_data, mode)
+    async with PaperAnalyzer(config) as analyzer:
+        return await analyzer.analyze_multiple_papers(papers_data, mode)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,208 @@
+"""
+Atom响应解析模块
+
+基于 XMLPullParser 的增量解析器：按数据块喂入ArXiv API响应，
+每个 </entry> 闭合后立即产出论文字典并释放已处理的元素，
+条目字段通过直接子元素查找获取，避免逐字段的后代搜索。
+"""
+
+import logging
+import xml.etree.ElementTree as ET
+from datetime import datetime
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+ATOM_NS = "http://www.w3.org/2005/Atom"
+ARXIV_NS = "http://arxiv.org/schemas/atom"
+OPENSEARCH_NS = "http://a9.com/-/spec/opensearch/1.1/"
+
+# 预先展开的带命名空间标签名
+_ENTRY = f"{{{ATOM_NS}}}entry"
+_ID = f"{{{ATOM_NS}}}id"
+_TITLE = f"{{{ATOM_NS}}}title"
+_SUMMARY = f"{{{ATOM_NS}}}summary"
+_AUTHOR = f"{{{ATOM_NS}}}author"
+_NAME = f"{{{ATOM_NS}}}name"
+_PUBLISHED = f"{{{ATOM_NS}}}published"
+_UPDATED = f"{{{ATOM_NS}}}updated"
+_CATEGORY = f"{{{ATOM_NS}}}category"
+_DOI = f"{{{ARXIV_NS}}}doi"
+_JOURNAL_REF = f"{{{ARXIV_NS}}}journal_ref"
+_TOTAL_RESULTS = f"{{{OPENSEARCH_NS}}}totalResults"
+
+
+def _text(elem: ET.Element) -> str:
+    """获取元素去除首尾空白后的文本"""
+    return (elem.text or "").strip()
+
+
+def _parse_datetime(value: str) -> datetime | None:
+    """解析ISO格式时间（兼容结尾的Z）"""
+    try:
+        return datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        return None
+
+
+def parse_entry(entry: ET.Element) -> dict[str, Any] | None:
+    """
+    解析单个论文条目
+
+    Args:
+        entry: <entry> 元素
+
+    Returns:
+        论文数据字典，缺少ID时返回 None
+    """
+    arxiv_url = None
+    title = ""
+    abstract = ""
+    authors: list[str] = []
+    categories: list[str] = []
+    submitted_date = None
+    updated_date = None
+    doi = None
+    journal_ref = None
+
+    # 单次遍历直接子元素
+    for child in entry:
+        tag = child.tag
+        if tag == _ID:
+            arxiv_url = _text(child)
+        elif tag == _TITLE:
+            title = _text(child)
+        elif tag == _SUMMARY:
+            abstract = _text(child)
+        elif tag == _AUTHOR:
+            name_elem = child.find(_NAME)
+            if name_elem is not None:
+                authors.append(_text(name_elem))
+        elif tag == _CATEGORY:
+            term = child.get("term")
+            if term:
+                categories.append(term)
+        elif tag == _PUBLISHED:
+            submitted_date = _parse_datetime(_text(child))
+        elif tag == _UPDATED:
+            updated_date = _parse_datetime(_text(child))
+        elif tag == _DOI:
+            if doi is None:
+                doi = _text(child)
+        elif tag == _JOURNAL_REF and journal_ref is None:
+            journal_ref = _text(child)
+
+    if not arxiv_url:
+        return None
+
+    arxiv_id = arxiv_url.split("/")[-1]  # 提取ID部分
+
+    return {
+        "arxiv_id": arxiv_id,
+        "title": title,
+        "authors": authors,
+        "abstract": abstract,
+        "primary_category": categories[0] if categories else None,
+        "categories": categories,
+        "submitted_date": submitted_date,
+        "updated_date": updated_date,
+        "doi": doi,
+        "journal_ref": journal_ref,
+        "arxiv_url": arxiv_url,
+        "pdf_url": f"https://arxiv.org/pdf/{arxiv_id}.pdf",
+    }
+
+
+class AtomStreamParser:
+    """ArXiv Atom响应的增量解析器"""
+
+    def __init__(self):
+        """初始化解析器"""
+        self._parser = ET.XMLPullParser(events=("start", "end"))
+        self._root: ET.Element | None = None
+
+        self.total_results = 0
+        self.count = 0
+
+    def _drain(self) -> list[dict[str, Any]]:
+        """处理已就绪的解析事件，返回新闭合的条目"""
+        papers = []
+        for event, elem in self._parser.read_events():
+            if event == "start":
+                if self._root is None:
+                    self._root = elem
+                continue
+
+            if elem.tag == _ENTRY:
+                try:
+                    paper_data = parse_entry(elem)
+                except Exception as e:
+                    logger.warning(f"Failed to parse entry: {e}")
+                    paper_data = None
+                if paper_data:
+                    papers.append(paper_data)
+
+                # 释放已处理的条目
+                elem.clear()
+                if self._root is not None:
+                    self._root.remove(elem)
+            elif elem.tag == _TOTAL_RESULTS:
+                try:
+                    self.total_results = int(_text(elem))
+                except ValueError:
+                    self.total_results = 0
+
+        self.count += len(papers)
+        return papers
+
+    def feed(self, data: bytes | str) -> list[dict[str, Any]]:
+        """
+        喂入一块响应数据
+
+        Args:
+            data: 响应数据块
+
+        Returns:
+            本次数据块中闭合的论文条目
+
+        Raises:
+            ET.ParseError: XML格式错误
+        """
+        self._parser.feed(data)
+        return self._drain()
+
+    def close(self) -> list[dict[str, Any]]:
+        """
+        结束解析
+
+        Returns:
+            剩余的论文条目
+
+        Raises:
+            ET.ParseError: XML不完整或格式错误
+        """
+        self._parser.close()
+        return self._drain()
+
+
+def parse_feed(content: bytes | str) -> dict[str, Any]:
+    """
+    解析完整的ArXiv API响应
+
+    Args:
+        content: 响应内容
+
+    Returns:
+        {"total_results": 总数, "papers": 论文列表, "count": 条目数}
+
+    Raises:
+        ET.ParseError: XML格式错误
+    """
+    parser = AtomStreamParser()
+    papers = parser.feed(content)
+    papers.extend(parser.close())
+    return {
+        "total_results": parser.total_results,
+        "papers": papers,
+        "count": len(papers),
+    }
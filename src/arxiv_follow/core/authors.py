@@ -0,0 +1,112 @@
+"""
+作者姓名匹配模块
+
+合并作者查询（au:"A" OR au:"B" ...）返回的论文需要按作者姓名分回各个研究者。
+ArXiv 的作者检索对大小写、重音和名字缩写都比较宽松，这里按同样的规则做归一化匹配。
+"""
+
+import re
+import unicodedata
+from collections.abc import Iterable
+
+_NON_ALNUM = re.compile(r"[^0-9a-z]+")
+
+
+def normalize_author_name(name: str) -> str:
+    """
+    归一化作者姓名（去重音、小写、标点转空格）
+
+    Args:
+        name: 原始姓名
+
+    Returns:
+        归一化后的姓名，如 "José  García-López" -> "jose garcia lopez"
+    """
+    decomposed = unicodedata.normalize("NFKD", name)
+    ascii_name = "".join(c for c in decomposed if not unicodedata.combining(c))
+    return _NON_ALNUM.sub(" ", ascii_name.lower()).strip()
+
+
+def initial_key(name: str) -> str:
+    """
+    获取 "名字首字母 + 姓" 形式的匹配键
+
+    Args:
+        name: 原始姓名
+
+    Returns:
+        如 "John Smith" -> "j smith"，单个词时返回该词
+    """
+    parts = normalize_author_name(name).split()
+    if len(parts) < 2:
+        return parts[0] if parts else ""
+    return f"{parts[0][0]} {parts[-1]}"
+
+
+def is_abbreviated(name: str) -> bool:
+    """
+    判断姓名的名字部分是否为缩写
+
+    Args:
+        name: 原始姓名
+
+    Returns:
+        如 "J. Smith"、"J Smith" 为 True，"John Smith" 为 False
+    """
+    parts = normalize_author_name(name).split()
+    return len(parts) >= 2 and len(parts[0]) == 1
+
+
+class AuthorMatcher:
+    """将论文作者列表匹配回被监控的研究者"""
+
+    def __init__(self, researchers: dict[str, Iterable[str]]):
+        """
+        初始化匹配器
+
+        Args:
+            researchers: {研究者姓名: 姓名变体列表}
+        """
+        self._full: dict[str, set[str]] = {}
+        self._initials: dict[str, set[str]] = {}
+        # 仅由缩写姓名变体生成的首字母键，用于匹配写全名的论文作者
+        self._abbreviated: dict[str, set[str]] = {}
+
+        for researcher, variants in researchers.items():
+            for name in (researcher, *variants):
+                full = normalize_author_name(name)
+                if full:
+                    self._full.setdefault(full, set()).add(researcher)
+                key = initial_key(name)
+                if key:
+                    self._initials.setdefault(key, set()).add(researcher)
+                    if is_abbreviated(name):
+                        self._abbreviated.setdefault(key, set()).add(researcher)
+
+    def match(self, paper_authors: Iterable[str]) -> set[str]:
+        """
+        找出论文作者中包含的研究者
+
+        优先按完整姓名匹配；完整姓名未命中时，只有一方是缩写（论文作者写作
+        "J. Smith"，或研究者只登记了缩写姓名）才按首字母+姓匹配，且仅在该键唯一
+        对应一位研究者时采用，避免 "Jane Smith" 被归到 "John Smith" 名下。
+
+        Args:
+            paper_authors: 论文作者列表
+
+        Returns:
+            匹配到的研究者姓名集合
+        """
+        matched: set[str] = set()
+        for author in paper_authors:
+            full_matches = self._full.get(normalize_author_name(author))
+            if full_matches:
+                matched |= full_matches
+                continue
+
+            candidates = self._initials if is_abbreviated(author) else self._abbreviated
+            initial_matches = candidates.get(initial_key(author), set())
+            if len(initial_matches) == 1:
+                matched |= initial_matches
+
+        return matched
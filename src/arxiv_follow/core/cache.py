@@ -0,0 +1,225 @@
+"""
+磁盘缓存模块
+
+基于内容寻址的持久化缓存：按键的 SHA-256 摘要存放条目，
+支持 TTL 过期和按最近访问时间（LRU）淘汰以控制缓存总大小。
+"""
+
+import contextlib
+import hashlib
+import logging
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+logger = logging.getLogger(__name__)
+
+
+def normalize_url(url: str) -> str:
+    """
+    规范化URL，使等价请求得到相同的缓存键
+
+    Args:
+        url: 原始URL
+
+    Returns:
+        规范化后的URL（小写协议/主机，查询参数排序，去掉片段）
+    """
+    parts = urlsplit(url)
+    query = urlencode(sorted(parse_qsl(parts.query, keep_blank_values=True)))
+    return urlunsplit(
+        (parts.scheme.lower(), parts.netloc.lower(), parts.path or "/", query, "")
+    )
+
+
+class DiskCache:
+    """内容寻址的磁盘缓存（TTL 过期 + LRU 淘汰）"""
+
+    # 淘汰时清理到上限的该比例以下，避免每次写入都触发淘汰
+    EVICTION_TARGET_RATIO = 0.9
+
+    def __init__(
+        self,
+        cache_dir: str | os.PathLike[str],
+        ttl_seconds: int,
+        max_size_mb: int,
+        namespace: str = "default",
+    ):
+        """
+        初始化磁盘缓存
+
+        Args:
+            cache_dir: 缓存根目录
+            ttl_seconds: 条目生存时间(秒)
+            max_size_mb: 缓存目录最大大小(MB)
+            namespace: 命名空间（子目录），用于隔离不同类型的缓存
+        """
+        self.root = Path(cache_dir) / namespace
+        self.ttl_seconds = ttl_seconds
+        self.max_size_bytes = max_size_mb * 1024 * 1024
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        self._lock = threading.Lock()
+        self._current_size: int | None = None
+
+    @staticmethod
+    def _digest(key: str) -> str:
+        """计算缓存键摘要"""
+        return hashlib.sha256(key.encode("utf-8")).hexdigest()
+
+    def _path_for(self, key: str) -> Path:
+        """获取缓存键对应的文件路径（按前两位分桶）"""
+        digest = self._digest(key)
+        return self.root / digest[:2] / f"{digest}.bin"
+
+    def _is_expired(self, stat: os.stat_result, now: float) -> bool:
+        """检查条目是否过期（写入时间记录在 mtime 中）"""
+        return now - stat.st_mtime >= self.ttl_seconds
+
+    def get(self, key: str) -> bytes | None:
+        """
+        读取缓存条目
+
+        Args:
+            key: 缓存键
+
+        Returns:
+            缓存内容，未命中或已过期时返回 None
+        """
+        path = self._path_for(key)
+        now = time.time()
+
+        try:
+            stat = path.stat()
+            if self._is_expired(stat, now):
+                self._remove(path, stat.st_size)
+                self.misses += 1
+                return None
+
+            data = path.read_bytes()
+            # 以 atime 记录最近访问时间，供LRU淘汰使用（mtime 保持为写入时间）
+            os.utime(path, (now, stat.st_mtime))
+        except FileNotFoundError:
+            self.misses += 1
+            return None
+        except OSError as e:
+            logger.warning(f"读取缓存失败: {e}")
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        return data
+
+    def set(self, key: str, value: bytes) -> None:
+        """
+        写入缓存条目
+
+        Args:
+            key: 缓存键
+            value: 缓存内容
+        """
+        if len(value) > self.max_size_bytes:
+            logger.debug("缓存条目超过最大缓存大小，跳过写入")
+            return
+
+        path = self._path_for(key)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            old_size = path.stat().st_size if path.exists() else 0
+
+            # 先写临时文件再原子替换，避免并发读到半写入的数据
+            tmp_path = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+            tmp_path.write_bytes(value)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning(f"写入缓存失败: {e}")
+            return
+
+        with self._lock:
+            if self._current_size is None:
+                self._current_size = self._scan_size()
+            else:
+                self._current_size += len(value) - old_size
+
+            if self._current_size > self.max_size_bytes:
+                self._evict()
+
+    def delete(self, key: str) -> None:
+        """删除缓存条目"""
+        path = self._path_for(key)
+        with contextlib.suppress(FileNotFoundError):
+            self._remove(path, path.stat().st_size)
+
+    def clear(self) -> None:
+        """清空当前命名空间下的所有条目"""
+        for path, _stat in self._iter_entries():
+            path.unlink(missing_ok=True)
+        with self._lock:
+            self._current_size = 0
+
+    def stats(self) -> dict[str, Any]:
+        """获取缓存统计信息"""
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": self.hits / total if total else 0.0,
+            "size_bytes": self._current_size,
+        }
+
+    def _remove(self, path: Path, size: int) -> None:
+        """删除单个条目并更新大小统计"""
+        try:
+            path.unlink()
+        except FileNotFoundError:
+            return
+        with self._lock:
+            if self._current_size is not None:
+                self._current_size = max(0, self._current_size - size)
+
+    def _iter_entries(self) -> list[tuple[Path, os.stat_result]]:
+        """列出所有缓存条目"""
+        entries = []
+        if not self.root.exists():
+            return entries
+        for path in self.root.glob("*/*.bin"):
+            try:
+                entries.append((path, path.stat()))
+            except FileNotFoundError:
+                continue
+        return entries
+
+    def _scan_size(self) -> int:
+        """扫描磁盘计算当前缓存大小"""
+        return sum(stat.st_size for _path, stat in self._iter_entries())
+
+    def _evict(self) -> None:
+        """淘汰过期条目和最久未访问的条目（调用方需持有锁）"""
+        now = time.time()
+        target = int(self.max_size_bytes * self.EVICTION_TARGET_RATIO)
+
+        entries = self._iter_entries()
+        size = sum(stat.st_size for _path, stat in entries)
+
+        # 过期条目优先，其余按最近访问时间从旧到新
+        entries.sort(key=lambda e: (not self._is_expired(e[1], now), e[1].st_atime))
+
+        for path, stat in entries:
+            if size <= target:
+                break
+            try:
+                path.unlink()
+            except FileNotFoundError:
+                continue
+            size -= stat.st_size
+            self.evictions += 1
+
+        self._current_size = size
+        logger.debug(f"缓存淘汰完成，当前大小: {size} 字节")
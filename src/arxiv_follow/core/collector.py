@@ -5,9 +5,10 @@
 """
 
 import asyncio
-import contextlib
+import copy
 import logging
 import xml.etree.ElementTree as ET
+from collections import deque
 from collections.abc import AsyncIterator
 from datetime import date, datetime, timedelta
 from typing import Any
@@ -18,11 +19,205 @@ from pydantic import ValidationError
 
 from ..models import Paper, PaperContent, PaperMetadata, SearchQuery, SearchResult
 from ..models.config import AppConfig
+from ..storage import split_arxiv_id
+from .atom import AtomStreamParser, parse_feed
+from .authors import AuthorMatcher
+from .cache import DiskCache, normalize_url
+from .conditional import ConditionalCache
+from .ratelimit import get_rate_limiter
+from .resilience import (
+    RETRY_STATUS_CODES,
+    RetryableHTTPError,
+    call_with_retry,
+    raise_for_retryable,
+)
+from .singleflight import SingleFlight
 
 # 配置日志
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# 单个 id_list 请求包含的最大ID数量
+ID_LIST_BATCH_SIZE = 100
+
+# 合并作者查询的限制：每个查询的最大作者数和 search_query 最大长度（控制URL长度）
+AUTHOR_QUERY_MAX_AUTHORS = 20
+AUTHOR_QUERY_MAX_LENGTH = 1500
+# 单个合并查询最多获取的结果数，超过时拆分作者分组
+AUTHOR_QUERY_MAX_RESULTS = 500
+
+# 日期分片采集：每个日期窗口最多获取的结果数（超过时继续拆分窗口）和每页数量
+HARVEST_WINDOW_MAX_RESULTS = 1000
+HARVEST_PAGE_SIZE = 200
+# 规划窗口时按平均密度只填充上限的一半，给工作日/周末的投稿量波动留出余量
+HARVEST_WINDOW_FILL = 0.5
+
+# 流式下载结果：(增量解析器, 已解析的论文, 原始数据块（未启用缓存时为 None）)
+_Download = tuple[AtomStreamParser, list[dict[str, Any]], list[bytes] | None]
+
+
+def plan_pages(
+    total_results: int,
+    batch_size: int,
+    max_total: int | None = None,
+    start: int = 0,
+) -> list[tuple[int, int]]:
+    """
+    根据结果总数规划分页
+
+    Args:
+        total_results: opensearch:totalResults 报告的结果总数
+        batch_size: 每页数量
+        max_total: 最大获取总数
+        start: 起始偏移（已获取的数量）
+
+    Returns:
+        [(start, max_results), ...]
+    """
+    end = min(total_results, max_total) if max_total else total_results
+    return [
+        (offset, min(batch_size, end - offset))
+        for offset in range(start, end, batch_size)
+    ]
+
+
+def _author_clause(author: str) -> str:
+    """构建单个作者的查询条件"""
+    return f'au:"{author}"'
+
+
+def build_author_query(
+    authors: list[str], date_from: date | None = None, date_to: date | None = None
+) -> str:
+    """
+    构建合并作者查询
+
+    Args:
+        authors: 作者姓名列表
+        date_from: 提交开始日期（含）
+        date_to: 提交结束日期（含）
+
+    Returns:
+        如 (au:"A" OR au:"B") AND submittedDate:[202501010000 TO 202501022359]
+    """
+    query = f"({' OR '.join(_author_clause(author) for author in authors)})"
+    if date_from or date_to:
+        start = date_from.strftime("%Y%m%d0000") if date_from else "*"
+        end = date_to.strftime("%Y%m%d2359") if date_to else "*"
+        query += f" AND submittedDate:[{start} TO {end}]"
+    return query
+
+
+def plan_author_queries(
+    authors: list[str],
+    max_authors: int = AUTHOR_QUERY_MAX_AUTHORS,
+    max_length: int = AUTHOR_QUERY_MAX_LENGTH,
+    variants: dict[str, list[str]] | None = None,
+) -> list[list[str]]:
+    """
+    将作者列表打包为若干合并查询分组
+
+    Args:
+        authors: 作者姓名列表
+        max_authors: 每组最大作者数
+        max_length: 每组作者条件的最大总长度
+        variants: {作者姓名: 姓名变体列表}，变体同样计入查询长度
+
+    Returns:
+        作者分组列表（保持输入顺序）
+    """
+    chunks: list[list[str]] = []
+    current: list[str] = []
+    length = 0
+
+    for author in dict.fromkeys(authors):
+        # 每个姓名额外占用 " OR " 分隔符
+        names = (author, *(variants or {}).get(author, []))
+        clause_length = sum(len(_author_clause(name)) + 4 for name in names)
+        if current and (
+            len(current) >= max_authors or length + clause_length > max_length
+        ):
+            chunks.append(current)
+            current, length = [], 0
+        current.append(author)
+        length += clause_length
+
+    if current:
+        chunks.append(current)
+    return chunks
+
+
+def build_date_range_query(
+    categories: list[str] | None = None,
+    date_from: date | None = None,
+    date_to: date | None = None,
+) -> str:
+    """
+    构建按分类和提交日期过滤的查询
+
+    Args:
+        categories: 分类列表（OR 关系），为空时搜索所有分类
+        date_from: 提交开始日期（含）
+        date_to: 提交结束日期（含）
+
+    Returns:
+        如 (cat:cs.AI OR cat:cs.CL) AND submittedDate:[202501010000 TO 202501072359]
+    """
+    if categories:
+        query = f"({' OR '.join(f'cat:{cat}' for cat in categories)})"
+    else:
+        query = "all:*"  # 搜索所有分类
+
+    if date_from or date_to:
+        start = date_from.strftime("%Y%m%d0000") if date_from else "*"
+        end = date_to.strftime("%Y%m%d2359") if date_to else "*"
+        query += f" AND submittedDate:[{start} TO {end}]"
+    return query
+
+
+def plan_date_windows(
+    date_from: date,
+    date_to: date,
+    total_results: int,
+    window_limit: int = HARVEST_WINDOW_MAX_RESULTS,
+) -> list[tuple[date, date]]:
+    """
+    根据探测到的结果总数将日期范围切分为互不重叠的窗口
+
+    Args:
+        date_from: 开始日期（含）
+        date_to: 结束日期（含）
+        total_results: 整个日期范围的 opensearch:totalResults
+        window_limit: 单个窗口的结果上限
+
+    Returns:
+        [(窗口开始日期, 窗口结束日期), ...]，按日期从新到旧排列
+    """
+    days = (date_to - date_from).days + 1
+    if days <= 0:
+        return []
+
+    if total_results <= window_limit:
+        days_per_window = days
+    else:
+        # 按平均每日结果数估算窗口天数，至少为一天
+        per_day = total_results / days
+        days_per_window = max(1, int(window_limit * HARVEST_WINDOW_FILL / per_day))
+
+    windows = []
+    window_end = date_to
+    while window_end >= date_from:
+        window_start = max(date_from, window_end - timedelta(days=days_per_window - 1))
+        windows.append((window_start, window_end))
+        window_end = window_start - timedelta(days=1)
+    return windows
+
+
+def _submitted_timestamp(paper_data: dict[str, Any]) -> float:
+    """论文提交时间戳（缺失时排在最后）"""
+    submitted = paper_data.get("submitted_date")
+    return submitted.timestamp() if submitted else float("-inf")
+
 
 class ArxivCollector:
     """ArXiv 论文收集器"""
@@ -31,9 +226,12 @@ class ArxivCollector:
         """初始化收集器"""
         self.config = config
         self.base_url = config.api.arxiv_base_url
-        self.delay = config.api.arxiv_delay_seconds
+        self.rate_limiter = get_rate_limiter(config)
         self.timeout = config.api.arxiv_timeout_seconds
 
+        # 合并本收集器上相同的并发请求
+        self.flights = SingleFlight()
+
         # HTTP客户端配置
         self.client = httpx.AsyncClient(
             timeout=self.timeout,
@@ -41,12 +239,20 @@ class ArxivCollector:
             follow_redirects=True,
         )
 
-        # 命名空间映射（用于XML解析）
-        self.namespaces = {
-            "atom": "http://www.w3.org/2005/Atom",
-            "arxiv": "http://arxiv.org/schemas/atom",
-            "opensearch": "http://a9.com/-/spec/opensearch/1.1/",
-        }
+        # 响应缓存（按规范化的查询URL寻址）
+        storage = config.storage
+        self.cache = (
+            DiskCache(
+                storage.cache_dir,
+                ttl_seconds=storage.cache_ttl_seconds,
+                max_size_mb=storage.max_cache_size_mb,
+                namespace="arxiv_api",
+            )
+            if storage.enable_cache and storage.cache_ttl_seconds > 0
+            else None
+        )
+        # 论文HTML内容的条件请求缓存（ETag/Last-Modified + 无HTML版本的负缓存）
+        self.content_cache = ConditionalCache.from_config(storage)
 
     async def __aenter__(self):
         """异步上下文管理器入口"""
@@ -63,136 +269,113 @@ class ArxivCollector:
 
     def _build_query_url(self, **params) -> str:
         """构建查询URL"""
-        # 处理搜索查询
+        # 处理搜索查询（search_query 与 id_list 至少提供一个）
         search_query = params.get("search_query", "")
-        if not search_query:
-            raise ValueError("search_query is required")
+        id_list = params.get("id_list") or []
+        if not search_query and not id_list:
+            raise ValueError("search_query or id_list is required")
 
         # 构建查询参数
-        query_params = {
-            "search_query": search_query,
-            "start": params.get("start", 0),
-            "max_results": params.get("max_results", 50),
-            "sortBy": params.get("sortBy", "submittedDate"),
-            "sortOrder": params.get("sortOrder", "descending"),
-        }
+        query_params: dict[str, Any] = {}
+        if search_query:
+            query_params["search_query"] = search_query
+        if id_list:
+            query_params["id_list"] = ",".join(id_list)
+
+        query_params.update(
+            {
+                "start": params.get("start", 0),
+                "max_results": params.get("max_results", 50),
+                "sortBy": params.get("sortBy", "submittedDate"),
+                "sortOrder": params.get("sortOrder", "descending"),
+            }
+        )
 
         return f"{self.base_url}?{urlencode(query_params)}"
 
-    def _parse_arxiv_response(self, xml_content: str) -> dict[str, Any]:
+    def _parse_arxiv_response(self, xml_content: bytes | str) -> dict[str, Any]:
         """解析ArXiv API响应"""
         try:
-            root = ET.fromstring(xml_content)
-
-            # 获取总数
-            total_results = root.find(".//opensearch:totalResults", self.namespaces)
-            total = int(total_results.text) if total_results is not None else 0
-
-            # 获取论文条目
-            entries = root.findall(".//atom:entry", self.namespaces)
-            papers = []
-
-            for entry in entries:
-                try:
-                    paper_data = self._parse_entry(entry)
-                    if paper_data:
-                        papers.append(paper_data)
-                except Exception as e:
-                    logger.warning(f"Failed to parse entry: {e}")
-                    continue
-
-            return {"total_results": total, "papers": papers, "count": len(papers)}
-
+            return parse_feed(xml_content)
         except ET.ParseError as e:
             logger.error(f"Failed to parse XML response: {e}")
             raise ValueError(f"Invalid XML response: {e}") from e
 
-    def _parse_entry(self, entry: ET.Element) -> dict[str, Any] | None:
-        """解析单个论文条目"""
-        try:
-            # 基础信息
-            title_elem = entry.find(".//atom:title", self.namespaces)
-            title = title_elem.text.strip() if title_elem is not None else ""
+    async def _fetch_feed(self, url: str) -> tuple[dict[str, Any], bool]:
+        """
+        获取并解析ArXiv API响应（优先读取缓存）
 
-            summary_elem = entry.find(".//atom:summary", self.namespaces)
-            abstract = summary_elem.text.strip() if summary_elem is not None else ""
+        相同规范化URL的并发请求合并为一次，复用的结果深拷贝后返回，
+        避免调用方之间互相修改论文字典。
 
-            # ArXiv ID
-            id_elem = entry.find(".//atom:id", self.namespaces)
-            if id_elem is None:
-                return None
+        Args:
+            url: 查询URL
 
-            arxiv_url = id_elem.text.strip()
-            arxiv_id = arxiv_url.split("/")[-1]  # 提取ID部分
-
-            # 作者
-            authors = []
-            author_elems = entry.findall(".//atom:author", self.namespaces)
-            for author_elem in author_elems:
-                name_elem = author_elem.find(".//atom:name", self.namespaces)
-                if name_elem is not None:
-                    authors.append(name_elem.text.strip())
-
-            # 日期
-            published_elem = entry.find(".//atom:published", self.namespaces)
-            submitted_date = None
-            if published_elem is not None:
-                with contextlib.suppress(ValueError):
-                    submitted_date = datetime.fromisoformat(
-                        published_elem.text.replace("Z", "+00:00")
-                    )
+        Returns:
+            (解析结果, 是否命中缓存)
+        """
+        (result_data, cache_hit), shared = await self.flights.do(
+            ("feed", normalize_url(url)), lambda: self._download_feed(url)
+        )
+        if shared:
+            result_data = copy.deepcopy(result_data)
+        return result_data, cache_hit
+
+    async def _download_feed(self, url: str) -> tuple[dict[str, Any], bool]:
+        """
+        下载并解析ArXiv API响应（优先读取缓存）
+
+        网络响应按数据块增量解析，不再整体解码为字符串后构建完整DOM。
+
+        Args:
+            url: 查询URL
+
+        Returns:
+            (解析结果, 是否命中缓存)
+        """
+        cache_key = normalize_url(url)
+        cached = self.cache.get(cache_key) if self.cache else None
+
+        if cached is not None:
+            logger.debug(f"Cache hit: {url}")
+            return self._parse_arxiv_response(cached), True
+
+        async def download() -> _Download:
+            parser = AtomStreamParser()
+            papers: list[dict[str, Any]] = []
+            # 仅在启用缓存时保留原始数据块
+            chunks: list[bytes] | None = [] if self.cache else None
+
+            async with self.client.stream("GET", url) as response:
+                raise_for_retryable(response)
+                response.raise_for_status()
+                try:
+                    async for chunk in response.aiter_bytes():
+                        papers.extend(parser.feed(chunk))
+                        if chunks is not None:
+                            chunks.append(chunk)
+                    papers.extend(parser.close())
+                except ET.ParseError as e:
+                    logger.error(f"Failed to parse XML response: {e}")
+                    raise ValueError(f"Invalid XML response: {e}") from e
+            return parser, papers, chunks
+
+        # 429/5xx 和网络错误按 http_retries 退避重试，arXiv 熔断期间直接失败
+        parser, papers, chunks = await call_with_retry(
+            download, url, self.config.api.http_retries, rate_limiter=self.rate_limiter
+        )
 
-            updated_elem = entry.find(".//atom:updated", self.namespaces)
-            updated_date = None
-            if updated_elem is not None:
-                with contextlib.suppress(ValueError):
-                    updated_date = datetime.fromisoformat(
-                        updated_elem.text.replace("Z", "+00:00")
-                    )
+        result_data = {
+            "total_results": parser.total_results,
+            "papers": papers,
+            "count": len(papers),
+        }
 
-            # 分类
-            categories = []
-            category_elems = entry.findall(".//atom:category", self.namespaces)
-            for cat_elem in category_elems:
-                term = cat_elem.get("term")
-                if term:
-                    categories.append(term)
-
-            primary_category = categories[0] if categories else None
-
-            # DOI和期刊引用
-            doi = None
-            journal_ref = None
-
-            arxiv_elems = entry.findall(".//arxiv:doi", self.namespaces)
-            if arxiv_elems:
-                doi = arxiv_elems[0].text.strip()
-
-            journal_elems = entry.findall(".//arxiv:journal_ref", self.namespaces)
-            if journal_elems:
-                journal_ref = journal_elems[0].text.strip()
-
-            # 构建链接
-            pdf_url = f"https://arxiv.org/pdf/{arxiv_id}.pdf"
-
-            return {
-                "arxiv_id": arxiv_id,
-                "title": title,
-                "authors": authors,
-                "abstract": abstract,
-                "primary_category": primary_category,
-                "categories": categories,
-                "submitted_date": submitted_date,
-                "updated_date": updated_date,
-                "doi": doi,
-                "journal_ref": journal_ref,
-                "arxiv_url": arxiv_url,
-                "pdf_url": pdf_url,
-            }
+        # 解析成功后才写入缓存
+        if chunks is not None:
+            self.cache.set(cache_key, b"".join(chunks))
 
-        except Exception as e:
-            logger.error(f"Error parsing entry: {e}")
-            return None
+        return result_data, False
 
     async def search_by_query(
         self, query: str, max_results: int = 50, start: int = 0
@@ -204,11 +387,7 @@ class ArxivCollector:
             )
 
             logger.info(f"Searching ArXiv: {query}")
-            response = await self.client.get(url)
-            response.raise_for_status()
-
-            # 解析响应
-            result_data = self._parse_arxiv_response(response.text)
+            result_data, cache_hit = await self._fetch_feed(url)
 
             # 构建搜索结果
             search_query = SearchQuery(
@@ -223,6 +402,9 @@ class ArxivCollector:
 
             search_result.metrics.total_found = result_data["total_results"]
             search_result.metrics.total_returned = result_data["count"]
+            if self.cache:
+                search_result.metrics.cache_hits = int(cache_hit)
+                search_result.metrics.cache_misses = int(not cache_hit)
             search_result.update_metrics()
 
             return search_result
@@ -244,6 +426,93 @@ class ArxivCollector:
 
         return await self.search_by_query(query, max_results)
 
+    async def search_authors_combined(
+        self,
+        researchers: list[str] | dict[str, list[str]],
+        date_from: date | None = None,
+        date_to: date | None = None,
+        batch_size: int = 100,
+        max_results_per_query: int = AUTHOR_QUERY_MAX_RESULTS,
+    ) -> dict[str, list[dict[str, Any]]]:
+        """
+        用合并的 OR 查询批量检索多位研究者的论文，并按姓名分回各研究者
+
+        Args:
+            researchers: 研究者姓名列表，或 {研究者姓名: 姓名变体列表}
+            date_from: 提交开始日期（含）
+            date_to: 提交结束日期（含）
+            batch_size: 每页结果数
+            max_results_per_query: 单个合并查询最多获取的结果数，超过时拆分分组
+
+        Returns:
+            {研究者姓名: 论文列表}，顺序与输入一致
+        """
+        if isinstance(researchers, dict):
+            variants = {name: list(names) for name, names in researchers.items()}
+        else:
+            variants = {name: [] for name in researchers}
+
+        results: dict[str, list[dict[str, Any]]] = {name: [] for name in variants}
+        seen: dict[str, set[str]] = {name: set() for name in variants}
+
+        # 姓名变体也加入查询，确保结果覆盖
+        queue = deque(plan_author_queries(list(variants), variants=variants))
+        requests = 0
+
+        while queue:
+            chunk = queue.popleft()
+            query_names = list(
+                dict.fromkeys(n for name in chunk for n in (name, *variants[name]))
+            )
+            query = build_author_query(query_names, date_from, date_to)
+
+            try:
+                first_page = await self._fetch_page(query, 0, batch_size)
+                requests += 1
+            except Exception as e:
+                logger.error(
+                    f"Combined author query failed ({len(chunk)} authors): {e}"
+                )
+                continue
+
+            # 结果过多时拆分分组，避免分页超过上限
+            total = first_page["total_results"]
+            if total > max_results_per_query and len(chunk) > 1:
+                middle = len(chunk) // 2
+                queue.appendleft(chunk[middle:])
+                queue.appendleft(chunk[:middle])
+                continue
+
+            papers = list(first_page["papers"])
+            for page_start, page_size in plan_pages(
+                total,
+                batch_size,
+                max_total=max_results_per_query,
+                start=len(papers),
+            ):
+                try:
+                    page = await self._fetch_page(query, page_start, page_size)
+                    requests += 1
+                except Exception as e:
+                    logger.error(f"Failed to fetch page at {page_start}: {e}")
+                    break
+                if not page["papers"]:
+                    break
+                papers.extend(page["papers"])
+
+            # 按作者姓名分回各研究者
+            matcher = AuthorMatcher({name: variants[name] for name in chunk})
+            for paper_data in papers:
+                for name in matcher.match(paper_data.get("authors", [])):
+                    if paper_data["arxiv_id"] not in seen[name]:
+                        seen[name].add(paper_data["arxiv_id"])
+                        results[name].append(paper_data)
+
+        logger.info(
+            f"Combined author search: {len(variants)} researchers, {requests} requests"
+        )
+        return results
+
     async def search_by_categories(
         self, categories: list[str], max_results: int = 50
     ) -> SearchResult:
@@ -261,37 +530,167 @@ class ArxivCollector:
         categories: list[str] | None = None,
         max_results: int = 50,
     ) -> SearchResult:
-        """按日期范围搜索论文"""
-        query_parts = []
+        """
+        按日期范围搜索论文
+
+        结果数超过单页时按日期窗口分片并发采集（见 harvest_date_range），
+        避免单个查询被截断或长时间串行翻页。
+        """
+        if date_from and max_results > HARVEST_PAGE_SIZE:
+            return await self.harvest_date_range(
+                date_from, date_to, categories=categories, max_results=max_results
+            )
 
-        # 添加分类条件
-        if categories:
-            cat_queries = [f"cat:{cat}" for cat in categories]
-            query_parts.append(f"({' OR '.join(cat_queries)})")
-        else:
-            query_parts.append("all:*")  # 搜索所有分类
+        query = build_date_range_query(categories, date_from, date_to)
+        return await self.search_by_query(query, max_results)
 
-        # 添加日期条件
-        if date_from or date_to:
-            date_query = "submittedDate:["
+    async def harvest_date_range(
+        self,
+        date_from: date,
+        date_to: date | None = None,
+        categories: list[str] | None = None,
+        max_results: int | None = None,
+        window_limit: int = HARVEST_WINDOW_MAX_RESULTS,
+        batch_size: int = HARVEST_PAGE_SIZE,
+    ) -> SearchResult:
+        """
+        按日期窗口分片采集较大日期范围内的论文
+
+        先用 max_results=1 的探测请求获取整个范围的 opensearch:totalResults，
+        据此规划窗口大小；各窗口在 max_concurrent_requests 限制下并发获取
+        （请求速率仍由共享限流器控制），结果仍超过上限的窗口继续对半拆分。
+        指定 max_results 时按从新到旧的顺序分批处理窗口，每个窗口只翻页到剩余
+        配额，已采集够 max_results 篇后不再启动新的窗口。
+        最终按 arxiv_id 去重，并按提交时间从新到旧排序。
+
+        Args:
+            date_from: 提交开始日期（含）
+            date_to: 提交结束日期（含），默认为今天
+            categories: 分类列表（OR 关系）
+            max_results: 最大返回数量，None 表示不限制
+            window_limit: 单个窗口的结果上限
+            batch_size: 每页数量
+
+        Returns:
+            合并后的搜索结果
+        """
+        date_to = date_to or date.today()
+        query = build_date_range_query(categories, date_from, date_to)
+
+        probe = await self._fetch_page(query, 0, 1)
+        total = probe["total_results"]
+        windows = (
+            plan_date_windows(date_from, date_to, total, window_limit) if total else []
+        )
 
-            if date_from:
-                date_query += date_from.strftime("%Y%m%d")
-            else:
-                date_query += "*"
+        concurrency = self.config.max_concurrent_requests
+        semaphore = asyncio.Semaphore(concurrency)
+        requests = 1
+
+        async def fetch(window_query: str, start: int, size: int) -> dict[str, Any]:
+            nonlocal requests
+            async with semaphore:
+                requests += 1
+                return await self._fetch_page(window_query, start, size)
+
+        async def harvest_window(
+            window_start: date, window_end: date, limit: int | None
+        ) -> list[dict[str, Any]]:
+            window_query = build_date_range_query(categories, window_start, window_end)
+            page_size = batch_size if limit is None else min(batch_size, limit)
+            try:
+                first_page = await fetch(window_query, 0, page_size)
+            except Exception as e:
+                logger.error(f"Harvest window {window_start}~{window_end} failed: {e}")
+                return []
+
+            # 需要的结果超过上限时对半拆分窗口（单日窗口无法再拆分）
+            window_total = first_page["total_results"]
+            days = (window_end - window_start).days + 1
+            needs_all = limit is None or limit > window_limit
+            if window_total > window_limit and needs_all and days > 1:
+                middle = window_start + timedelta(days=days // 2 - 1)
+                newer = (middle + timedelta(days=1), window_end)
+                older = (window_start, middle)
+                if limit is None:
+                    halves = await asyncio.gather(
+                        harvest_window(*newer, None), harvest_window(*older, None)
+                    )
+                    return [paper for half in halves for paper in half]
+                # 有配额时先采集较新的一半，剩余配额再交给较早的一半
+                papers = await harvest_window(*newer, limit)
+                if len(papers) < limit:
+                    papers += await harvest_window(*older, limit - len(papers))
+                return papers
+            if window_total > window_limit and needs_all:
+                logger.warning(
+                    f"{window_start} has {window_total} results, "
+                    f"truncated to {window_limit}"
+                )
 
-            date_query += " TO "
+            pages = plan_pages(
+                window_total,
+                batch_size,
+                max_total=window_limit if limit is None else min(window_limit, limit),
+                start=len(first_page["papers"]),
+            )
+            if first_page["count"] < page_size:
+                pages = []
 
-            if date_to:
-                date_query += date_to.strftime("%Y%m%d")
-            else:
-                date_query += "*"
+            results = await asyncio.gather(
+                *(fetch(window_query, start, size) for start, size in pages),
+                return_exceptions=True,
+            )
+            papers = list(first_page["papers"])
+            for result in results:
+                if isinstance(result, Exception):
+                    logger.error(f"Harvest page failed: {result}")
+                    continue
+                papers.extend(result["papers"])
+            return papers
+
+        # 窗口边界和分页漂移可能产生重复，按不含版本号的ID去重
+        papers_by_id: dict[str, dict[str, Any]] = {}
+        step = len(windows) if max_results is None else concurrency
+        harvested = 0
+        for index in range(0, len(windows), max(step, 1)):
+            remaining = None if max_results is None else max_results - len(papers_by_id)
+            if remaining is not None and remaining <= 0:
+                break
+            window_results = await asyncio.gather(
+                *(
+                    harvest_window(start, end, remaining)
+                    for start, end in windows[index : index + step]
+                )
+            )
+            harvested += len(window_results)
+            for window_papers in window_results:
+                for paper_data in window_papers:
+                    papers_by_id.setdefault(
+                        split_arxiv_id(paper_data["arxiv_id"])[0], paper_data
+                    )
 
-            date_query += "]"
-            query_parts.append(date_query)
+        papers = sorted(papers_by_id.values(), key=_submitted_timestamp, reverse=True)
+        if max_results is not None:
+            papers = papers[:max_results]
 
-        query = " AND ".join(query_parts)
-        return await self.search_by_query(query, max_results)
+        logger.info(
+            f"Harvested {len(papers)} papers from {harvested}/{len(windows)} "
+            f"date windows ({requests} requests)"
+        )
+
+        search_result = SearchResult(
+            query=SearchQuery(
+                query_id=f"arxiv_{datetime.now().strftime('%Y%m%d_%H%M%S')}",
+                search_type="keyword",
+                query_text=query,
+            ),
+            papers=papers,
+        )
+        search_result.metrics.total_found = total
+        search_result.metrics.total_returned = len(papers)
+        search_result.update_metrics()
+        return search_result
 
     async def search_recent_papers(
         self,
@@ -333,29 +732,63 @@ class ArxivCollector:
             return None
 
     async def get_paper_content(self, arxiv_id: str) -> PaperContent | None:
-        """获取论文内容（如果有HTML版本）"""
+        """
+        获取论文内容（如果有HTML版本）
+
+        同一篇论文的并发请求合并为一次，每个调用方得到独立的副本。
+        """
+        content, shared = await self.flights.do(
+            ("html", arxiv_id), lambda: self._download_paper_content(arxiv_id)
+        )
+        if shared and content is not None:
+            content = content.model_copy(deep=True)
+        return content
+
+    async def _download_paper_content(self, arxiv_id: str) -> PaperContent | None:
+        """
+        下载论文HTML内容
+
+        启用缓存时发送条件请求，HTML未变化（304）时使用缓存内容，
+        没有HTML版本的论文在负缓存有效期内不再探测。
+        """
         try:
             # 尝试获取HTML版本
             html_url = f"https://arxiv.org/html/{arxiv_id}"
 
-            response = await self.client.get(html_url)
+            async def fetch_html() -> tuple[int, str]:
+                if self.content_cache is not None:
+                    result = await self.content_cache.fetch(
+                        self.client, html_url, self.rate_limiter
+                    )
+                    status_code, html = result["status_code"], result["text"]
+                else:
+                    await self.rate_limiter.acquire(html_url)
+                    response = await self.client.get(html_url)
+                    status_code, html = response.status_code, response.text
+                if status_code in RETRY_STATUS_CODES:
+                    raise RetryableHTTPError(status_code)
+                return status_code, html
+
+            status_code, html = await call_with_retry(
+                fetch_html, html_url, self.config.api.http_retries
+            )
 
-            if response.status_code == 200:
+            if status_code == 200:
                 # 成功获取HTML内容
                 content = PaperContent(
                     arxiv_id=arxiv_id,
-                    html_content=response.text,
+                    html_content=html,
                     extraction_method="html",
                     extraction_success=True,
                     language="en",
                 )
 
                 # 简单的内容提取
-                if "latex" in response.text.lower():
+                if "latex" in html.lower():
                     content.has_latex = True
 
                 if any(
-                    keyword in response.text.lower()
+                    keyword in html.lower()
                     for keyword in ["code", "github", "implementation"]
                 ):
                     content.has_code = True
@@ -369,83 +802,207 @@ class ArxivCollector:
             logger.warning(f"Failed to get content for {arxiv_id}: {e}")
             return None
 
+    async def get_papers_by_ids(
+        self,
+        arxiv_ids: list[str],
+        batch_size: int = ID_LIST_BATCH_SIZE,
+        failed_ids: list[str] | None = None,
+    ) -> dict[str, Paper | None]:
+        """
+        通过 id_list 批量获取论文详情
+
+        Args:
+            arxiv_ids: ArXiv ID列表（可带或不带版本号）
+            batch_size: 每个请求包含的ID数量
+            failed_ids: 提供时追加请求失败（重试后仍出错）的ID，以便与不存在的论文区分
+
+        Returns:
+            按输入顺序排列的 {arxiv_id: Paper}，未找到或请求失败的ID对应 None
+        """
+        results: dict[str, Paper | None] = dict.fromkeys(arxiv_ids)
+        unique_ids = list(results)
+
+        for i in range(0, len(unique_ids), batch_size):
+            chunk = unique_ids[i : i + batch_size]
+            url = self._build_query_url(id_list=chunk, max_results=len(chunk))
+
+            try:
+                result_data, _cache_hit = await self._fetch_feed(url)
+            except Exception as e:
+                logger.error(
+                    f"Failed to fetch id_list batch starting at {i} "
+                    f"({', '.join(chunk)}): {e}"
+                )
+                if failed_ids is not None:
+                    failed_ids.extend(chunk)
+                continue
+
+            # 返回条目的ID带版本号，同时按完整ID和去版本号ID建立索引
+            found: dict[str, dict[str, Any]] = {}
+            for paper_data in result_data["papers"]:
+                entry_id = paper_data["arxiv_id"]
+                found[entry_id] = paper_data
+                found.setdefault(split_arxiv_id(entry_id)[0], paper_data)
+
+            for arxiv_id in chunk:
+                paper_data = found.get(arxiv_id)
+                if paper_data is None:
+                    continue
+                try:
+                    results[arxiv_id] = Paper(metadata=PaperMetadata(**paper_data))
+                except ValidationError as e:
+                    logger.error(f"Validation error for paper {arxiv_id}: {e}")
+
+        return results
+
     async def collect_papers_batch(
         self, arxiv_ids: list[str], include_content: bool = False
     ) -> list[Paper]:
-        """批量收集论文"""
-        papers = []
+        """批量收集论文（结果顺序与输入一致）"""
+        failed_ids: list[str] = []
+        papers_by_id = await self.get_papers_by_ids(arxiv_ids, failed_ids=failed_ids)
 
-        for arxiv_id in arxiv_ids:
-            try:
-                # 获取论文详情
-                paper = await self.get_paper_details(arxiv_id)
-                if not paper:
-                    continue
+        if failed_ids:
+            logger.error(
+                f"{len(failed_ids)} papers could not be fetched: {', '.join(failed_ids)}"
+            )
+        failed = set(failed_ids)
+        missing_ids = [
+            pid
+            for pid, paper in papers_by_id.items()
+            if paper is None and pid not in failed
+        ]
+        if missing_ids:
+            logger.warning(
+                f"{len(missing_ids)} papers not found: {', '.join(missing_ids)}"
+            )
 
-                # 获取内容（如果需要）
-                if include_content:
-                    content = await self.get_paper_content(arxiv_id)
-                    if content:
-                        paper.content = content
+        papers = [paper for paper in papers_by_id.values() if paper is not None]
 
-                papers.append(paper)
+        # 并发获取内容（受 max_concurrent_requests 限制）
+        if include_content and papers:
+            semaphore = asyncio.Semaphore(self.config.max_concurrent_requests)
 
-                # 延迟以避免过度请求
-                if self.delay > 0:
-                    await asyncio.sleep(self.delay)
+            async def attach_content(paper: Paper) -> None:
+                async with semaphore:
+                    content = await self.get_paper_content(paper.arxiv_id)
+                if content:
+                    paper.content = content
 
-            except Exception as e:
-                logger.error(f"Failed to collect paper {arxiv_id}: {e}")
-                continue
+            await asyncio.gather(*(attach_content(paper) for paper in papers))
 
         logger.info(
             f"Successfully collected {len(papers)} papers out of {len(arxiv_ids)}"
         )
         return papers
 
+    async def _fetch_page(
+        self, query: str, start: int, max_results: int
+    ) -> dict[str, Any]:
+        """获取单页搜索结果"""
+        url = self._build_query_url(
+            search_query=query, start=start, max_results=max_results
+        )
+        result_data, _cache_hit = await self._fetch_feed(url)
+        return result_data
+
     async def stream_search_results(
-        self, query: str, batch_size: int = 50, max_total: int | None = None
+        self,
+        query: str,
+        batch_size: int = 50,
+        max_total: int | None = None,
+        prefetch: int = 1,
     ) -> AsyncIterator[list[dict[str, Any]]]:
-        """流式搜索结果（用于大量数据）"""
-        start = 0
-        total_retrieved = 0
+        """
+        流式搜索结果（用于大量数据）
 
-        while True:
-            try:
-                # 计算本次获取数量
-                current_batch_size = batch_size
-                if max_total and (total_retrieved + batch_size) > max_total:
-                    current_batch_size = max_total - total_retrieved
+        首页返回 opensearch:totalResults 后规划全部分页，并在调用方处理当前批次时
+        提前发起后续 prefetch 页的请求（请求速率仍由共享限流器控制）。
 
-                if current_batch_size <= 0:
-                    break
+        Args:
+            query: 查询字符串
+            batch_size: 每页数量
+            max_total: 最大获取总数
+            prefetch: 预取深度（0 表示严格串行）
 
-                # 执行搜索
-                result = await self.search_by_query(query, current_batch_size, start)
+        Yields:
+            每页的论文数据列表
+        """
+        first_size = min(batch_size, max_total) if max_total else batch_size
+        if first_size <= 0:
+            return
 
-                if not result.papers:
-                    break
+        try:
+            first_page = await self._fetch_page(query, 0, first_size)
+        except Exception as e:
+            logger.error(f"Error in stream search: {e}")
+            return
+
+        if not first_page["papers"]:
+            return
+
+        # 根据总数规划剩余分页
+        pages = plan_pages(
+            first_page["total_results"],
+            batch_size,
+            max_total=max_total,
+            start=len(first_page["papers"]),
+        )
+        if len(first_page["papers"]) < first_size:
+            pages = []
+
+        pending: deque[tuple[asyncio.Task, int]] = deque()
+        next_page = 0
+
+        def schedule() -> None:
+            """补齐预取队列"""
+            nonlocal next_page
+            while next_page < len(pages) and len(pending) < max(prefetch, 1):
+                page_start, page_size = pages[next_page]
+                task = asyncio.create_task(
+                    self._fetch_page(query, page_start, page_size)
+                )
+                pending.append((task, page_size))
+                next_page += 1
 
-                yield result.papers
+        try:
+            # 在产出首页之前就发起预取
+            if prefetch > 0:
+                schedule()
 
-                total_retrieved += len(result.papers)
-                start += len(result.papers)
+            yield first_page["papers"]
 
-                # 检查是否已达到最大数量
-                if max_total and total_retrieved >= max_total:
+            while True:
+                if not pending:
+                    schedule()
+                if not pending:
                     break
 
-                # 检查是否还有更多结果
-                if len(result.papers) < batch_size:
+                task, page_size = pending.popleft()
+                try:
+                    page = await task
+                except Exception as e:
+                    logger.error(f"Error in stream search: {e}")
                     break
 
-                # 延迟
-                if self.delay > 0:
-                    await asyncio.sleep(self.delay)
+                # totalResults 可能不准确，遇到空页或不满页即停止
+                if not page["papers"]:
+                    break
 
-            except Exception as e:
-                logger.error(f"Error in stream search: {e}")
-                break
+                if prefetch > 0:
+                    schedule()
+
+                yield page["papers"]
+
+                if page["count"] < page_size:
+                    break
+        finally:
+            # 调用方提前结束时取消未完成的预取
+            tasks = [task for task, _size in pending]
+            for task in tasks:
+                task.cancel()
+            if tasks:
+                await asyncio.gather(*tasks, return_exceptions=True)
 
     def create_smart_query(
         self,
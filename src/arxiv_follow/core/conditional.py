@@ -0,0 +1,233 @@
+"""
+条件请求缓存模块
+
+论文HTML渲染版本和研究者TSV表格很少变化，却在每次运行时被完整重新下载。
+这里保存响应的 ETag/Last-Modified，再次请求时发送 If-None-Match/If-Modified-Since，
+服务器返回 304 时直接使用缓存内容；
+资源不存在的结果（如没有HTML版本的论文）按较短的TTL单独记住，期间不再探测。
+"""
+
+import json
+import logging
+import threading
+import time
+from typing import Any
+
+import httpx
+
+from ..models.config import StorageConfig, load_config
+from .cache import DiskCache, normalize_url
+
+logger = logging.getLogger(__name__)
+
+# 视为"资源不存在"并做负缓存的状态码（限流和服务器错误不缓存）
+NEGATIVE_STATUS_CODES = frozenset({404, 410})
+
+
+class ConditionalCache:
+    """保存校验器（ETag/Last-Modified）的条件请求缓存"""
+
+    def __init__(self, cache: DiskCache, negative_ttl_seconds: int):
+        """
+        初始化条件请求缓存
+
+        Args:
+            cache: 底层磁盘缓存（TTL 决定校验器的保留时间）
+            negative_ttl_seconds: 资源不存在结果的缓存时间(秒)
+        """
+        self.cache = cache
+        self.negative_ttl_seconds = negative_ttl_seconds
+        self.revalidated = 0
+        self.negative_hits = 0
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_config(cls, storage: StorageConfig) -> "ConditionalCache | None":
+        """
+        根据存储配置创建条件请求缓存
+
+        Args:
+            storage: 存储配置
+
+        Returns:
+            条件请求缓存，缓存被禁用时返回 None
+        """
+        if not storage.enable_cache or storage.content_cache_ttl_seconds <= 0:
+            return None
+        return cls(
+            DiskCache(
+                storage.cache_dir,
+                ttl_seconds=storage.content_cache_ttl_seconds,
+                max_size_mb=storage.max_cache_size_mb,
+                namespace="content",
+            ),
+            negative_ttl_seconds=storage.negative_cache_ttl_seconds,
+        )
+
+    def _load(self, key: str) -> dict[str, Any] | None:
+        """读取缓存条目"""
+        data = self.cache.get(key)
+        if data is None:
+            return None
+        try:
+            return json.loads(data)
+        except ValueError as e:
+            logger.warning(f"条件请求缓存条目损坏，已删除: {e}")
+            self.cache.delete(key)
+            return None
+
+    def _store(self, key: str, entry: dict[str, Any]) -> None:
+        """写入缓存条目"""
+        self.cache.set(key, json.dumps(entry, ensure_ascii=False).encode("utf-8"))
+
+    def _prepare(self, key: str) -> tuple[dict[str, Any] | None, dict[str, str] | None]:
+        """
+        查找缓存条目并构建条件请求头
+
+        Returns:
+            (缓存条目, 请求头)，负缓存仍然有效时请求头为 None
+        """
+        entry = self._load(key)
+        if entry is None:
+            return None, {}
+
+        if entry["status_code"] != 200:
+            if time.time() - entry["fetched_at"] < self.negative_ttl_seconds:
+                return entry, None
+            # 负缓存过期，重新探测
+            return None, {}
+
+        headers = {}
+        if entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+        return entry, headers
+
+    def _negative_result(self, entry: dict[str, Any]) -> dict[str, Any]:
+        """返回负缓存命中结果"""
+        with self._lock:
+            self.negative_hits += 1
+        return {"status_code": entry["status_code"], "text": "", "from_cache": True}
+
+    def _resolve(
+        self, key: str, entry: dict[str, Any] | None, response: httpx.Response
+    ) -> dict[str, Any]:
+        """根据响应更新缓存并返回结果"""
+        now = time.time()
+        status = response.status_code
+
+        if status == 304 and entry is not None:
+            with self._lock:
+                self.revalidated += 1
+            # 刷新抓取时间和校验器，延长保留时间
+            entry["fetched_at"] = now
+            entry["etag"] = response.headers.get("ETag") or entry.get("etag")
+            entry["last_modified"] = response.headers.get("Last-Modified") or entry.get(
+                "last_modified"
+            )
+            self._store(key, entry)
+            return {"status_code": 200, "text": entry["text"], "from_cache": True}
+
+        if status == 200:
+            etag = response.headers.get("ETag")
+            last_modified = response.headers.get("Last-Modified")
+            # 没有校验器的响应无法重新验证，不缓存
+            if etag or last_modified:
+                self._store(
+                    key,
+                    {
+                        "status_code": 200,
+                        "etag": etag,
+                        "last_modified": last_modified,
+                        "text": response.text,
+                        "fetched_at": now,
+                    },
+                )
+        elif status in NEGATIVE_STATUS_CODES:
+            self._store(key, {"status_code": status, "fetched_at": now})
+
+        return {"status_code": status, "text": response.text, "from_cache": False}
+
+    async def fetch(
+        self, client: httpx.AsyncClient, url: str, rate_limiter: Any = None
+    ) -> dict[str, Any]:
+        """
+        发送条件GET请求
+
+        Args:
+            client: 异步HTTP客户端
+            url: 请求URL
+            rate_limiter: 限流器，只在实际发送请求时获取令牌
+
+        Returns:
+            包含 status_code、text 和 from_cache 的结果；304 响应的 status_code 记为 200
+        """
+        key = normalize_url(url)
+        entry, headers = self._prepare(key)
+        if headers is None:
+            return self._negative_result(entry)
+
+        if rate_limiter is not None:
+            await rate_limiter.acquire(url)
+        response = await client.get(url, headers=headers)
+        return self._resolve(key, entry, response)
+
+    def fetch_sync(
+        self, client: httpx.Client, url: str, rate_limiter: Any = None
+    ) -> dict[str, Any]:
+        """
+        发送条件GET请求（同步版本）
+
+        Args:
+            client: HTTP客户端
+            url: 请求URL
+            rate_limiter: 限流器，只在实际发送请求时获取令牌
+
+        Returns:
+            包含 status_code、text 和 from_cache 的结果；304 响应的 status_code 记为 200
+        """
+        key = normalize_url(url)
+        entry, headers = self._prepare(key)
+        if headers is None:
+            return self._negative_result(entry)
+
+        if rate_limiter is not None:
+            rate_limiter.acquire_sync(url)
+        response = client.get(url, headers=headers)
+        return self._resolve(key, entry, response)
+
+    def stats(self) -> dict[str, Any]:
+        """获取缓存统计信息"""
+        with self._lock:
+            return {
+                "revalidated": self.revalidated,
+                "negative_hits": self.negative_hits,
+                **self.cache.stats(),
+            }
+
+
+_content_cache: ConditionalCache | None = None
+_content_cache_resolved = False
+_content_cache_lock = threading.Lock()
+
+
+def get_content_cache(storage: StorageConfig | None = None) -> ConditionalCache | None:
+    """
+    获取进程级共享的条件请求缓存
+
+    Args:
+        storage: 首次创建时使用的存储配置
+
+    Returns:
+        条件请求缓存，缓存被禁用时返回 None
+    """
+    global _content_cache, _content_cache_resolved
+    if not _content_cache_resolved:
+        with _content_cache_lock:
+            if not _content_cache_resolved:
+                _content_cache = ConditionalCache.from_config(
+                    storage or load_config().storage
+                )
+                _content_cache_resolved = True
+    return _content_cache
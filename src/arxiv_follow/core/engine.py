@@ -7,10 +7,12 @@
 import logging
 import uuid
 from datetime import date, datetime, timedelta
+from typing import Any
 
 from ..models import SearchFilters, SearchQuery, SearchResult, SearchType
 from ..models.config import AppConfig
-from .collector import ArxivCollector
+from ..storage import SQLitePaperStore, create_paper_store, split_arxiv_id
+from .collector import ArxivCollector, build_author_query
 
 logger = logging.getLogger(__name__)
 
@@ -18,11 +20,33 @@ logger = logging.getLogger(__name__)
 class SearchEngine:
     """统一搜索引擎"""
 
-    def __init__(self, config: AppConfig):
-        """初始化搜索引擎"""
+    def __init__(self, config: AppConfig, store: SQLitePaperStore | None = None):
+        """
+        初始化搜索引擎
+
+        Args:
+            config: 应用配置
+            store: 论文存储，不提供且启用本地检索时在首次使用时按配置创建
+        """
         self.config = config
         self.collector = ArxivCollector(config)
 
+        self._store = store
+        self._store_resolved = store is not None or not config.storage.local_search
+        self._owns_store = False
+
+    @property
+    def store(self) -> SQLitePaperStore | None:
+        """论文存储（按需创建，不可用时为 None）"""
+        if not self._store_resolved:
+            self._store_resolved = True
+            try:
+                self._store = create_paper_store(self.config)
+                self._owns_store = True
+            except Exception as e:
+                logger.warning(f"论文存储不可用，本地检索已禁用: {e}")
+        return self._store
+
     async def __aenter__(self):
         """异步上下文管理器入口"""
         await self.collector.__aenter__()
@@ -31,10 +55,18 @@ class SearchEngine:
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         """异步上下文管理器出口"""
         await self.collector.__aexit__(exc_type, exc_val, exc_tb)
+        self._close_store()
 
     async def close(self):
         """关闭搜索引擎"""
         await self.collector.close()
+        self._close_store()
+
+    def _close_store(self) -> None:
+        """关闭自行创建的论文存储"""
+        if self._owns_store and self._store:
+            self._store.close()
+            self._store = None
 
     def _create_query_id(self) -> str:
         """创建查询ID"""
@@ -86,10 +118,18 @@ class SearchEngine:
             # 构建作者列表
             authors = query.researchers.copy()
 
-            # 执行搜索
-            result = await self.collector.search_by_authors(
-                authors=authors, max_results=query.filters.max_results
-            )
+            # 有日期范围时直接在ArXiv查询中限定提交日期
+            date_range = self._apply_date_filters(query)
+            if date_range:
+                result = await self.collector.search_by_query(
+                    query=build_author_query(authors, date_range[0], date_range[1]),
+                    max_results=query.filters.max_results,
+                )
+            else:
+                result = await self.collector.search_by_authors(
+                    authors=authors, max_results=query.filters.max_results
+                )
+            self._ingest(result.papers)
 
             # 更新查询信息
             result.query = query
@@ -133,6 +173,7 @@ class SearchEngine:
                 result = await self.collector.search_by_categories(
                     categories=categories, max_results=query.filters.max_results
                 )
+            self._ingest(result.papers)
 
             # 更新查询信息
             result.query = query
@@ -183,6 +224,7 @@ class SearchEngine:
             result = await self.collector.search_by_query(
                 query=search_string, max_results=query.filters.max_results
             )
+            self._ingest(result.papers)
 
             # 更新查询信息
             result.query = query
@@ -201,27 +243,146 @@ class SearchEngine:
             logger.error(f"Error in keyword search: {e}")
             return self._create_error_result(query, str(e))
 
+    def _build_local_query(self, query: SearchQuery) -> str:
+        """
+        构建本地检索查询（与 arXiv 查询语法一致）
+
+        查询文本原样作为 arXiv 风格的查询，关键词按短语 OR 组合，
+        再与分类、研究者和排除分类条件 AND 组合。
+        """
+        query_parts = []
+        if query.query_text:
+            query_parts.append(f"({query.query_text})")
+        if query.keywords:
+            keywords = " OR ".join(f'"{keyword}"' for keyword in query.keywords)
+            query_parts.append(f"({keywords})")
+
+        categories = self._build_category_filter(query)
+        if categories:
+            query_parts.append(f"({' OR '.join(f'cat:{cat}' for cat in categories)})")
+        if query.researchers:
+            authors = " OR ".join(f'au:"{author}"' for author in query.researchers)
+            query_parts.append(f"({authors})")
+        for cat in query.filters.exclude_categories:
+            query_parts.append(f"-cat:{cat}")
+
+        return " AND ".join(query_parts) if query_parts else "all:*"
+
+    def _search_store(
+        self, search_string: str, query: SearchQuery
+    ) -> list[dict[str, Any]]:
+        """
+        在本地论文存储上执行检索
+
+        Args:
+            search_string: arXiv 风格的查询
+            query: 搜索查询（提供日期过滤和最大结果数）
+
+        Returns:
+            论文列表（附带 local_score），按相关性降序
+        """
+        if not self.store:
+            raise RuntimeError("论文存储不可用，无法进行本地检索")
+
+        date_range = self._apply_date_filters(query) or (None, None)
+        hits = self.store.search_papers(
+            search_string,
+            date_from=date_range[0],
+            date_to=date_range[1],
+            limit=query.filters.max_results,
+        )
+
+        papers = []
+        for metadata, score in hits:
+            paper = metadata.model_dump()
+            paper["local_score"] = round(score, 4)
+            papers.append(paper)
+        return papers
+
+    def _ingest(self, papers: list[dict[str, Any]]) -> None:
+        """将从 arXiv 获取的论文写入存储（全文索引随之增量更新）"""
+        if not self.store or not papers:
+            return
+        try:
+            self.store.upsert_papers(papers)
+        except Exception as e:
+            logger.warning(f"保存搜索结果失败: {e}")
+
+    async def search_local(self, query: SearchQuery) -> SearchResult:
+        """本地全文检索（只查询已存储的论文，不访问 arXiv）"""
+        try:
+            start_time = datetime.now()
+
+            papers = self._search_store(self._build_local_query(query), query)
+
+            result = SearchResult(query=query, papers=papers, execution_time=start_time)
+            result.metrics.total_found = len(papers)
+            result.update_metrics()
+
+            # 应用额外过滤
+            result = await self._apply_post_filters(result, query)
+
+            # 计算搜索时间
+            search_time = (datetime.now() - start_time).total_seconds() * 1000
+            result.metrics.search_time_ms = search_time
+
+            return result
+
+        except Exception as e:
+            logger.error(f"Error in local search: {e}")
+            return self._create_error_result(query, str(e))
+
     async def search_hybrid(self, query: SearchQuery) -> SearchResult:
-        """混合搜索（结合多种策略）"""
+        """
+        混合搜索（结合多种策略）
+
+        同一查询同时在本地全文索引和 arXiv 上执行：arXiv 结果（按提交时间从新到旧）
+        在前并写入存储，再用本地独有的结果补足最大结果数；arXiv 查询失败时
+        退回本地结果。
+        """
         try:
             start_time = datetime.now()
 
             # 创建智能查询
+            date_range = self._apply_date_filters(query)
             smart_query = self.collector.create_smart_query(
                 topics=query.topics,
                 authors=query.researchers,
-                date_from=(
-                    self._apply_date_filters(query)[0]
-                    if self._apply_date_filters(query)
-                    else None
-                ),
+                date_from=date_range[0] if date_range else None,
                 exclude_categories=query.filters.exclude_categories,
             )
 
-            # 执行搜索
-            result = await self.collector.search_by_query(
-                query=smart_query, max_results=query.filters.max_results
-            )
+            # 本地检索
+            local_papers: list[dict[str, Any]] = []
+            if self.store:
+                try:
+                    local_papers = self._search_store(smart_query, query)
+                except Exception as e:
+                    logger.warning(f"本地检索失败，仅使用 arXiv 结果: {e}")
+
+            max_results = query.filters.max_results
+            try:
+                result = await self.collector.search_by_query(
+                    query=smart_query, max_results=max_results
+                )
+            except Exception as e:
+                if not local_papers:
+                    raise
+                logger.warning(f"arXiv 搜索失败，仅使用本地结果: {e}")
+                result = SearchResult(query=query, papers=local_papers)
+                result.metrics.total_found = len(local_papers)
+            else:
+                self._ingest(result.papers)
+
+                # arXiv 结果在前，补充 arXiv 未返回的本地结果
+                seen = {split_arxiv_id(p["arxiv_id"])[0] for p in result.papers}
+                local_only = [
+                    p
+                    for p in local_papers
+                    if split_arxiv_id(p["arxiv_id"])[0] not in seen
+                ]
+                result.papers = (result.papers + local_only)[:max_results]
+            result.update_metrics()
 
             # 更新查询信息
             result.query = query
@@ -253,6 +414,8 @@ class SearchEngine:
             return await self.search_by_keywords(query)
         elif query.search_type == SearchType.HYBRID:
             return await self.search_hybrid(query)
+        elif query.search_type == SearchType.LOCAL:
+            return await self.search_local(query)
         else:
             # 默认使用混合搜索
             query.search_type = SearchType.HYBRID
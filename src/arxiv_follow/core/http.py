@@ -0,0 +1,257 @@
+"""
+共享HTTP客户端模块
+
+进程级复用的同步 httpx.Client：保持长连接、可配置连接池上限，
+在安装了 h2 时启用 HTTP/2，并通过事件钩子统一接入限流和按主机的连接统计。
+"""
+
+import atexit
+import logging
+import threading
+import time
+from collections import defaultdict
+from typing import Any
+
+import httpx
+
+from ..models.config import APIConfig, AppConfig, load_config
+from .ratelimit import get_rate_limiter
+
+logger = logging.getLogger(__name__)
+
+
+def _http2_available() -> bool:
+    """检查是否安装了 HTTP/2 依赖"""
+    try:
+        import h2  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def _use_http2(api: APIConfig) -> bool:
+    """根据配置决定是否启用 HTTP/2（启用但未安装 h2 时回退到 HTTP/1.1）"""
+    if not api.http2_enabled:
+        return False
+    if not _http2_available():
+        logger.warning(
+            '已启用 HTTP/2 但未安装 h2（pip install "httpx[http2]"），使用 HTTP/1.1'
+        )
+        return False
+    return True
+
+
+class HostStats:
+    """单个主机的请求和连接统计（线程安全）"""
+
+    def __init__(self):
+        """初始化统计"""
+        self._lock = threading.Lock()
+        self.requests = 0
+        self.connections_opened = 0
+        self.errors = 0
+        self.status_codes: dict[int, int] = defaultdict(int)
+        self.total_elapsed = 0.0
+
+    def record_request(self) -> None:
+        """记录一次请求"""
+        with self._lock:
+            self.requests += 1
+
+    def record_connection(self) -> None:
+        """记录一次新建TCP连接"""
+        with self._lock:
+            self.connections_opened += 1
+
+    def record_response(self, status_code: int, elapsed: float) -> None:
+        """记录一次响应"""
+        with self._lock:
+            self.status_codes[status_code] += 1
+            self.total_elapsed += elapsed
+            if status_code >= 400:
+                self.errors += 1
+
+    def to_dict(self) -> dict[str, Any]:
+        """转换为字典"""
+        with self._lock:
+            reused = max(0, self.requests - self.connections_opened)
+            return {
+                "requests": self.requests,
+                "connections_opened": self.connections_opened,
+                "connection_reuse_rate": (
+                    reused / self.requests if self.requests else 0.0
+                ),
+                "errors": self.errors,
+                "status_codes": dict(self.status_codes),
+                "avg_response_time_ms": (
+                    self.total_elapsed * 1000 / self.requests if self.requests else 0.0
+                ),
+            }
+
+
+class SharedHTTPClient:
+    """带连接池、限流和统计的共享HTTP客户端"""
+
+    def __init__(self, config: AppConfig, transport: httpx.BaseTransport | None = None):
+        """
+        初始化共享客户端
+
+        Args:
+            config: 应用配置
+            transport: 自定义传输层（用于测试）
+        """
+        api = config.api
+        self.http2 = _use_http2(api)
+        self.limits = httpx.Limits(
+            max_connections=api.http_max_connections,
+            max_keepalive_connections=api.http_max_keepalive_connections,
+            keepalive_expiry=api.http_keepalive_expiry,
+        )
+
+        self._stats: dict[str, HostStats] = defaultdict(HostStats)
+        self._stats_lock = threading.Lock()
+
+        self.client = httpx.Client(
+            http2=self.http2,
+            limits=self.limits,
+            timeout=float(api.http_timeout),
+            follow_redirects=True,
+            headers={"User-Agent": api.user_agent},
+            transport=transport,
+            event_hooks={
+                "request": [self._on_request],
+                "response": [self._on_response],
+            },
+        )
+
+    def _host_stats(self, host: str) -> HostStats:
+        """获取主机统计对象"""
+        with self._stats_lock:
+            return self._stats[host]
+
+    def _on_request(self, request: httpx.Request) -> None:
+        """请求钩子：限流并记录请求和新建连接"""
+        get_rate_limiter().acquire_sync(str(request.url))
+
+        stats = self._host_stats(request.url.host)
+        stats.record_request()
+
+        def trace(event_name: str, _info: dict[str, Any]) -> None:
+            if event_name == "connection.connect_tcp.complete":
+                stats.record_connection()
+
+        request.extensions["trace"] = trace
+        request.extensions["arxiv_follow.started"] = time.monotonic()
+
+    def _on_response(self, response: httpx.Response) -> None:
+        """响应钩子：记录状态码和耗时"""
+        # 钩子在读取响应体之前触发，耗时按响应头到达时间计算
+        started = response.request.extensions.get("arxiv_follow.started")
+        elapsed = time.monotonic() - started if started is not None else 0.0
+        self._host_stats(response.request.url.host).record_response(
+            response.status_code, elapsed
+        )
+
+    def stats(self) -> dict[str, dict[str, Any]]:
+        """获取按主机的统计信息"""
+        with self._stats_lock:
+            hosts = dict(self._stats)
+        return {host: stats.to_dict() for host, stats in hosts.items()}
+
+    def close(self) -> None:
+        """关闭客户端并释放连接池"""
+        self.client.close()
+
+
+# 进程级共享客户端
+_shared_client: SharedHTTPClient | None = None
+_shared_client_lock = threading.Lock()
+
+
+def get_shared_client(config: AppConfig | None = None) -> SharedHTTPClient:
+    """
+    获取进程级共享客户端（首次调用时创建）
+
+    Args:
+        config: 首次创建时使用的配置，不提供则加载默认配置
+
+    Returns:
+        共享客户端
+    """
+    global _shared_client
+    if _shared_client is None:
+        with _shared_client_lock:
+            if _shared_client is None:
+                _shared_client = SharedHTTPClient(config or load_config())
+                logger.debug(
+                    f"创建共享HTTP客户端 (HTTP/2: {_shared_client.http2}, "
+                    f"最大连接数: {_shared_client.limits.max_connections})"
+                )
+    return _shared_client
+
+
+def get_http_client(config: AppConfig | None = None) -> httpx.Client:
+    """
+    获取进程级共享的 httpx.Client
+
+    Args:
+        config: 首次创建时使用的配置
+
+    Returns:
+        共享的 httpx.Client
+    """
+    return get_shared_client(config).client
+
+
+def create_async_client(
+    config: AppConfig | None = None,
+    timeout: float | None = None,
+    max_connections: int | None = None,
+) -> httpx.AsyncClient:
+    """
+    创建与共享客户端配置一致的异步客户端
+
+    异步客户端绑定到事件循环，因此不做进程级共享，由调用方负责关闭。
+
+    Args:
+        config: 应用配置，不提供则加载默认配置
+        timeout: 请求超时时间(秒)，默认使用 http_timeout
+        max_connections: 最大连接数，默认使用 http_max_connections
+
+    Returns:
+        httpx.AsyncClient
+    """
+    api = (config or load_config()).api
+    max_connections = max_connections or api.http_max_connections
+    return httpx.AsyncClient(
+        http2=_use_http2(api),
+        limits=httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=min(
+                max_connections, api.http_max_keepalive_connections
+            ),
+            keepalive_expiry=api.http_keepalive_expiry,
+        ),
+        timeout=float(timeout if timeout is not None else api.http_timeout),
+        follow_redirects=True,
+        headers={"User-Agent": api.user_agent},
+    )
+
+
+def get_http_stats() -> dict[str, dict[str, Any]]:
+    """获取共享客户端的按主机统计信息"""
+    if _shared_client is None:
+        return {}
+    return _shared_client.stats()
+
+
+def close_http_client() -> None:
+    """关闭共享客户端（下次获取时重新创建）"""
+    global _shared_client
+    with _shared_client_lock:
+        if _shared_client is not None:
+            _shared_client.close()
+            _shared_client = None
+
+
+atexit.register(close_http_client)
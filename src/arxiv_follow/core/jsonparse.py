@@ -0,0 +1,70 @@
+"""
+LLM JSON 输出解析模块
+
+模型按要求输出JSON时，仍常见代码块包裹、前后多余说明、尾随逗号和中文引号等问题。
+这里先尝试严格解析，失败时再做一轮宽松修正，仍失败才由调用方发起修复请求。
+"""
+
+import json
+import re
+from typing import Any
+
+_FENCE_RE = re.compile(r"```(?:json)?\s*(.*?)```", re.DOTALL | re.IGNORECASE)
+_TRAILING_COMMA_RE = re.compile(r",\s*([}\]])")
+_SMART_QUOTES = str.maketrans({"“": '"', "”": '"', "‘": "'", "’": "'"})
+
+_decoder = json.JSONDecoder()
+
+
+def _candidates(text: str) -> list[str]:
+    """获取可能包含JSON的文本片段（代码块内容优先）"""
+    blocks = [block.strip() for block in _FENCE_RE.findall(text)]
+    return [*blocks, text.strip()]
+
+
+def _scan(text: str, expected: type) -> Any:
+    """从每个可能的起始括号尝试解码，返回第一个类型符合的JSON值"""
+    opener = "{" if expected is dict else "["
+    start = text.find(opener)
+    while start != -1:
+        try:
+            value, _ = _decoder.raw_decode(text, start)
+        except ValueError:
+            pass
+        else:
+            if isinstance(value, expected):
+                return value
+        start = text.find(opener, start + 1)
+    raise ValueError(f"响应中没有合法的JSON{'对象' if expected is dict else '数组'}")
+
+
+def parse_json_response(text: str, expected: type = dict) -> Any:
+    """
+    从LLM响应中解析JSON对象或数组
+
+    先严格解析；失败时修正中文引号和尾随逗号后重试。
+
+    Args:
+        text: LLM响应文本
+        expected: 期望的类型（dict 或 list）
+
+    Returns:
+        解析出的JSON值
+
+    Raises:
+        ValueError: 响应中没有合法的JSON
+    """
+    if expected not in (dict, list):
+        raise ValueError(f"不支持的JSON类型: {expected}")
+
+    error: ValueError | None = None
+    for candidate in _candidates(text):
+        for fix in (False, True):
+            source = candidate
+            if fix:
+                source = _TRAILING_COMMA_RE.sub(r"\1", source.translate(_SMART_QUOTES))
+            try:
+                return _scan(source, expected)
+            except ValueError as e:
+                error = e
+    raise error or ValueError("响应为空")
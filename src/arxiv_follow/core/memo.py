@@ -0,0 +1,275 @@
+"""
+LLM分析结果记忆模块
+
+同一篇论文会在研究者监控、主题监控以及之后几天的运行中反复出现，
+按 (提示词模板版本, 模型, 温度, 标题+摘要哈希) 将分析结果持久化到磁盘缓存，
+命中时直接返回，避免重复调用LLM。
+
+报告翻译同理：日报和周报中的论文标题、摘要大量重复，
+按 (原文哈希, 源语言, 目标语言, 模型) 记住每个片段的译文。
+"""
+
+import hashlib
+import json
+import logging
+import threading
+from typing import Any
+
+from ..models.config import StorageConfig
+from .cache import DiskCache
+
+logger = logging.getLogger(__name__)
+
+
+def content_hash(title: str, abstract: str) -> str:
+    """
+    计算论文标题和摘要的内容哈希（忽略空白差异）
+
+    Args:
+        title: 论文标题
+        abstract: 论文摘要
+
+    Returns:
+        SHA-256 十六进制摘要
+    """
+    normalized = " ".join(title.split()) + "\n" + " ".join(abstract.split())
+    return hashlib.sha256(normalized.encode("utf-8")).hexdigest()
+
+
+class AnalysisMemo:
+    """LLM分析结果的持久化记忆"""
+
+    def __init__(self, cache: DiskCache):
+        """
+        初始化分析记忆
+
+        Args:
+            cache: 底层磁盘缓存
+        """
+        self.cache = cache
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_config(cls, storage: StorageConfig) -> "AnalysisMemo | None":
+        """
+        根据存储配置创建分析记忆
+
+        Args:
+            storage: 存储配置
+
+        Returns:
+            分析记忆，缓存被禁用时返回 None
+        """
+        if not storage.enable_cache or storage.analysis_cache_ttl_seconds <= 0:
+            return None
+        return cls(
+            DiskCache(
+                storage.cache_dir,
+                ttl_seconds=storage.analysis_cache_ttl_seconds,
+                max_size_mb=storage.max_cache_size_mb,
+                namespace="analysis",
+            )
+        )
+
+    @staticmethod
+    def make_key(
+        analysis_type: str,
+        prompt_version: str,
+        model: str,
+        temperature: float,
+        title: str,
+        abstract: str,
+    ) -> str:
+        """
+        构建记忆键
+
+        Args:
+            analysis_type: 分析类型
+            prompt_version: 提示词模板版本
+            model: 模型名称
+            temperature: 采样温度
+            title: 论文标题
+            abstract: 论文摘要
+
+        Returns:
+            记忆键
+        """
+        return (
+            f"{analysis_type}:{prompt_version}:{model}:{temperature:g}:"
+            f"{content_hash(title, abstract)}"
+        )
+
+    def get(self, key: str) -> dict[str, Any] | None:
+        """
+        读取分析结果
+
+        Args:
+            key: 记忆键
+
+        Returns:
+            分析结果字典，未命中时返回 None
+        """
+        data = self.cache.get(key)
+        result = None
+        if data is not None:
+            try:
+                result = json.loads(data)
+            except ValueError as e:
+                logger.warning(f"分析缓存条目损坏，已删除: {e}")
+                self.cache.delete(key)
+
+        with self._lock:
+            if result is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        return result
+
+    def set(self, key: str, result: dict[str, Any]) -> None:
+        """
+        写入分析结果
+
+        Args:
+            key: 记忆键
+            result: 分析结果字典
+        """
+        try:
+            data = json.dumps(result, ensure_ascii=False).encode("utf-8")
+        except (TypeError, ValueError) as e:
+            logger.warning(f"分析结果无法序列化，跳过缓存: {e}")
+            return
+        self.cache.set(key, data)
+
+    def stats(self) -> dict[str, Any]:
+        """获取命中统计"""
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / total if total else 0.0,
+            }
+
+
+def segment_hash(text: str) -> str:
+    """
+    计算翻译片段的内容哈希（忽略首尾空白）
+
+    Args:
+        text: 片段原文
+
+    Returns:
+        SHA-256 十六进制摘要
+    """
+    return hashlib.sha256(text.strip().encode("utf-8")).hexdigest()
+
+
+class TranslationMemory:
+    """报告片段译文的持久化记忆"""
+
+    def __init__(self, cache: DiskCache):
+        """
+        初始化翻译记忆
+
+        Args:
+            cache: 底层磁盘缓存
+        """
+        self.cache = cache
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_config(cls, storage: StorageConfig) -> "TranslationMemory | None":
+        """
+        根据存储配置创建翻译记忆
+
+        Args:
+            storage: 存储配置
+
+        Returns:
+            翻译记忆，缓存被禁用时返回 None
+        """
+        if not storage.enable_cache or storage.translation_cache_ttl_seconds <= 0:
+            return None
+        return cls(
+            DiskCache(
+                storage.cache_dir,
+                ttl_seconds=storage.translation_cache_ttl_seconds,
+                max_size_mb=storage.max_cache_size_mb,
+                namespace="translation",
+            )
+        )
+
+    @staticmethod
+    def make_key(
+        prompt_version: str,
+        source_lang: str,
+        target_lang: str,
+        model: str,
+        text: str,
+    ) -> str:
+        """
+        构建记忆键
+
+        Args:
+            prompt_version: 提示词模板版本
+            source_lang: 源语言
+            target_lang: 目标语言
+            model: 模型名称
+            text: 片段原文
+
+        Returns:
+            记忆键
+        """
+        return (
+            f"{prompt_version}:{source_lang}:{target_lang}:{model}:{segment_hash(text)}"
+        )
+
+    def get(self, key: str) -> str | None:
+        """
+        读取片段译文
+
+        Args:
+            key: 记忆键
+
+        Returns:
+            译文，未命中时返回 None
+        """
+        data = self.cache.get(key)
+        result = None
+        if data is not None:
+            try:
+                result = data.decode("utf-8")
+            except UnicodeDecodeError as e:
+                logger.warning(f"翻译缓存条目损坏，已删除: {e}")
+                self.cache.delete(key)
+
+        with self._lock:
+            if result is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        return result
+
+    def set(self, key: str, translation: str) -> None:
+        """
+        写入片段译文
+
+        Args:
+            key: 记忆键
+            translation: 译文
+        """
+        self.cache.set(key, translation.encode("utf-8"))
+
+    def stats(self) -> dict[str, Any]:
+        """获取命中统计"""
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / total if total else 0.0,
+            }
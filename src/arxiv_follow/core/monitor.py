@@ -6,10 +6,12 @@
 """
 
 import logging
-from datetime import datetime, timedelta
+from collections.abc import Callable, Iterable
+from datetime import date, datetime, timedelta
 from typing import Any
 
 from ..models import (
+    PaperAnalysis,
     SearchFilters,
     SearchQuery,
     SearchResult,
@@ -19,27 +21,57 @@ from ..models import (
     TaskType,
 )
 from ..models.config import AppConfig
-from .analyzer import PaperAnalyzer
+from ..models.paper import AnalysisType
+from ..storage import SQLitePaperStore, create_paper_store, split_arxiv_id
+from .analyzer import DEFAULT_IMPORTANCE_SCORE, PaperAnalyzer
+from .authors import AuthorMatcher
 from .collector import ArxivCollector
 from .engine import SearchEngine
+from .ranker import PaperPreRanker, build_profile, paper_text
 
 logger = logging.getLogger(__name__)
 
+# 水位线回看的重叠时间，覆盖论文提交到在API中可见之间的延迟
+WATERMARK_OVERLAP = timedelta(days=1)
+
+# 构建兴趣画像时历史论文的最低重要性评分
+PROFILE_MIN_SCORE = 7.0
+
 
 class PaperMonitor:
     """现代化论文监控器"""
 
-    def __init__(self, config: AppConfig):
-        """初始化监控器"""
+    def __init__(self, config: AppConfig, store: SQLitePaperStore | None = None):
+        """
+        初始化监控器
+
+        Args:
+            config: 应用配置
+            store: 论文存储，不提供且启用增量监控时按配置创建
+        """
         self.config = config
         self.collector = ArxivCollector(config)
         self.analyzer = (
             PaperAnalyzer(config) if config.is_feature_enabled("ai_analysis") else None
         )
-        self.engine = SearchEngine(config)
+
+        self.store = store
+        self._owns_store = False
+        if store is None and config.monitoring.incremental_monitoring:
+            try:
+                self.store = create_paper_store(config)
+                self._owns_store = True
+            except Exception as e:
+                logger.warning(f"论文存储不可用，增量监控已禁用: {e}")
+        # 搜索引擎共享同一论文存储（本地检索）
+        self.engine = SearchEngine(config, store=self.store)
+
+        self.incremental_stats = {"new": 0, "updated": 0, "skipped": 0}
+        self.prerank_stats = {"candidates": 0, "forwarded": 0, "gated": 0}
 
         logger.info("论文监控器初始化完成")
         logger.info(f"AI分析: {'启用' if self.analyzer else '禁用'}")
+        logger.info(f"增量监控: {'启用' if self.store else '禁用'}")
 
     async def __aenter__(self):
         """异步上下文管理器入口"""
@@ -51,76 +83,354 @@ class PaperMonitor:
         """异步上下文管理器出口"""
         await self.collector.__aexit__(exc_type, exc_val, exc_tb)
         await self.engine.__aexit__(exc_type, exc_val, exc_tb)
+        if self.analyzer:
+            await self.analyzer.close()
+        if self._owns_store and self.store:
+            self.store.close()
+
+    def _build_filters(
+        self, query_keys: Iterable[str], days_back: int
+    ) -> SearchFilters:
+        """
+        构建监控查询的时间过滤器
+
+        所有查询键都有水位线时，把查询起点收窄到最早的水位线（减去重叠时间），
+        否则回溯 days_back 天。
+        """
+        window_start = date.today() - timedelta(days=days_back)
+        keys = list(query_keys)
+        if not self.store or not keys:
+            return SearchFilters(days_back=days_back, max_results=100)
+
+        try:
+            marks = [self.store.get_watermark(key) for key in keys]
+        except Exception as e:
+            logger.warning(f"读取水位线失败: {e}")
+            marks = [None]
+
+        if all(marks):
+            start = (min(mark[0] for mark in marks) - WATERMARK_OVERLAP).date()
+            if start > window_start:
+                logger.info(f"按水位线收窄查询范围: {start} 起")
+                return SearchFilters(date_from=start, max_results=100)
+
+        return SearchFilters(days_back=days_back, max_results=100)
+
+    def _filter_unseen(
+        self, scope: str, papers: list[dict[str, Any]]
+    ) -> list[dict[str, Any]]:
+        """
+        过滤掉该监控范围内已处理过的论文
+
+        Args:
+            scope: 监控范围（daily/weekly）
+            papers: 论文列表
+
+        Returns:
+            未处理过的论文；启用 include_updated_versions 时也包含已见论文的新版本
+        """
+        try:
+            seen = self.store.get_seen_versions(
+                scope, [p["arxiv_id"] for p in papers if p.get("arxiv_id")]
+            )
+        except Exception as e:
+            logger.warning(f"读取已处理论文失败，按全部新论文处理: {e}")
+            return papers
+
+        include_updates = self.config.monitoring.include_updated_versions
+        fresh = []
+        for paper in papers:
+            arxiv_id = paper.get("arxiv_id")
+            if not arxiv_id:
+                fresh.append(paper)
+                continue
+
+            base_id, version = split_arxiv_id(arxiv_id)
+            seen_version = seen.get(base_id)
+            if seen_version is None:
+                self.incremental_stats["new"] += 1
+                fresh.append(paper)
+            elif include_updates and version > seen_version:
+                paper["is_new_version"] = True
+                self.incremental_stats["updated"] += 1
+                fresh.append(paper)
+            else:
+                self.incremental_stats["skipped"] += 1
+
+        return fresh
+
+    def _record_seen(
+        self,
+        scope: str,
+        papers: list[dict[str, Any]],
+        query_keys: dict[str, str],
+        match: Callable[[dict[str, Any]], Iterable[str]],
+    ) -> None:
+        """
+        保存已处理的论文并推进各查询的水位线
+
+        AI 分析失败或超时（使用默认评分）的论文不记为已处理，
+        相关查询的水位线也不会越过这些论文，下次运行时重新分析。
+
+        Args:
+            scope: 监控范围
+            papers: 本次处理的论文
+            query_keys: {研究者/主题: 查询键}
+            match: 返回论文所属研究者/主题的函数
+        """
+
+        def query_items(paper: dict[str, Any]):
+            updated = paper.get("updated_date") or paper.get("submitted_date")
+            if not updated or not paper.get("arxiv_id"):
+                return
+            for name in match(paper):
+                key = query_keys.get(name)
+                if key:
+                    yield key, updated
+
+        done, pending = [], []
+        for paper in papers:
+            analysis = paper.get("ai_analysis")
+            if analysis is not None and not analysis.get("success"):
+                pending.append(paper)
+            else:
+                done.append(paper)
+
+        # 各查询最早的未完成论文时间，水位线不能越过它
+        holds: dict[str, Any] = {}
+        for paper in pending:
+            for key, updated in query_items(paper):
+                holds[key] = min(holds.get(key, updated), updated)
+        if pending:
+            logger.info(f"{len(pending)} 篇论文分析未完成，下次运行时重新处理")
+
+        try:
+            self.store.upsert_papers(papers)
+            self.store.mark_seen(
+                scope, [p["arxiv_id"] for p in done if p.get("arxiv_id")]
+            )
+
+            for paper in done:
+                for key, updated in query_items(paper):
+                    if key in holds and updated >= holds[key]:
+                        continue
+                    self.store.advance_watermark(key, updated, paper["arxiv_id"])
+        except Exception as e:
+            logger.warning(f"保存监控水位线失败: {e}")
+
+    async def _analyze_papers(self, papers: list[dict[str, Any]]) -> None:
+        """
+        并发分析论文重要性，结果写回论文字典
+
+        超过整体截止时间仍未完成的论文使用默认评分，不阻塞报告生成。
+
+        Args:
+            papers: 论文列表（原地写入 ai_analysis 和 importance_score）
+        """
+        if not papers:
+            return
+
+        monitoring = self.config.monitoring
+        integrations = self.config.integrations
+        if integrations.ai_batch_scoring:
+            mode = "significance_batch"
+        elif integrations.ai_structured_output:
+            mode = "structured"
+        else:
+            mode = "significance"
+        try:
+            analyses = await self.analyzer.analyze_multiple_papers(
+                papers,
+                mode=mode,
+                concurrency=monitoring.analysis_concurrency,
+                deadline=monitoring.analysis_deadline_seconds,
+            )
+        except Exception as e:
+            logger.warning(f"分析论文失败: {e}")
+            analyses = [{"error": str(e), "success": False} for _ in papers]
+
+        for paper_data, analysis in zip(papers, analyses, strict=True):
+            paper_data["ai_analysis"] = analysis
+            paper_data["importance_score"] = analysis.get(
+                "importance_score", DEFAULT_IMPORTANCE_SCORE
+            )
+
+        if self.store:
+            self._save_scores(papers)
+
+    def _save_scores(self, papers: list[dict[str, Any]]) -> None:
+        """保存成功的重要性评分，供之后构建兴趣画像"""
+        try:
+            self.store.upsert_papers(papers)
+            for paper in papers:
+                analysis = paper.get("ai_analysis") or {}
+                if not analysis.get("success") or not paper.get("arxiv_id"):
+                    continue
+                if isinstance(analysis.get("analysis"), dict):
+                    # 结构化分析结果可直接还原为 PaperAnalysis
+                    record = PaperAnalysis.model_validate(analysis["analysis"])
+                    record.arxiv_id = paper["arxiv_id"]
+                else:
+                    record = PaperAnalysis(
+                        arxiv_id=paper["arxiv_id"],
+                        analysis_type=AnalysisType.IMPORTANCE,
+                        score=min(10.0, max(0.0, paper["importance_score"])),
+                        summary=analysis.get("content", ""),
+                        keywords=analysis.get("keywords", []),
+                        model_used=analysis.get("model", ""),
+                    )
+                self.store.upsert_analysis(record)
+        except Exception as e:
+            logger.warning(f"保存论文评分失败: {e}")
+
+    def _prerank(
+        self, topics: list[str], papers: list[dict[str, Any]]
+    ) -> list[dict[str, Any]]:
+        """
+        本地预排序，只保留最相关的论文交给AI分析
+
+        查询由监控主题、prerank_keywords 和历史高分论文的兴趣画像组成。
+
+        Args:
+            topics: 监控主题
+            papers: 候选论文
+
+        Returns:
+            选中的论文（按预排序得分降序）
+        """
+        monitoring = self.config.monitoring
+        profile = {}
+        if self.store and monitoring.prerank_profile_size:
+            try:
+                history = self.store.top_scored_papers(
+                    AnalysisType.IMPORTANCE,
+                    PROFILE_MIN_SCORE,
+                    monitoring.prerank_profile_size,
+                )
+                profile = build_profile(paper_text(p.model_dump()) for p in history)
+            except Exception as e:
+                logger.warning(f"构建兴趣画像失败: {e}")
+
+        ranker = PaperPreRanker([*topics, *monitoring.prerank_keywords], profile)
+        selected, rest = ranker.rank(papers, monitoring.prerank_top_k)
+
+        self.prerank_stats["candidates"] += len(papers)
+        self.prerank_stats["forwarded"] += len(selected)
+        logger.info(f"本地预排序: {len(papers)} 篇候选，{len(selected)} 篇进入AI分析")
+        return selected
 
     async def monitor_researchers(
-        self, researchers: list[str], days_back: int = 1
+        self, researchers: list[str], days_back: int = 1, scope: str | None = None
     ) -> SearchResult:
-        """监控研究者的新论文"""
+        """
+        监控研究者的新论文
+
+        Args:
+            researchers: 研究者姓名列表
+            days_back: 回溯天数
+            scope: 增量监控范围（如 daily），为 None 时不做增量过滤
+
+        Returns:
+            搜索结果
+        """
+        query_keys = (
+            {name: f"{scope}:researcher:{name}" for name in researchers}
+            if scope and self.store
+            else {}
+        )
         query = SearchQuery(
             query_id=f"researchers_{datetime.now().strftime('%Y%m%d_%H%M%S')}",
             search_type=SearchType.RESEARCHER,
             query_text=f"监控 {len(researchers)} 位研究者",
             researchers=researchers,
-            filters=SearchFilters(days_back=days_back, max_results=100),
+            filters=self._build_filters(query_keys.values(), days_back),
         )
 
         result = await self.engine.search(query)
 
+        if result.success and query_keys:
+            result.papers = self._filter_unseen(scope, result.papers)
+
         if result.success and self.analyzer:
             # 对结果进行AI分析
-            analyzed_papers = []
-            for paper_data in result.papers:
-                try:
-                    analysis = await self.analyzer.analyze_paper_significance(
-                        paper_data
-                    )
-                    paper_data["ai_analysis"] = analysis
-                    analyzed_papers.append(paper_data)
-                except Exception as e:
-                    logger.warning(f"分析论文失败: {e}")
-                    analyzed_papers.append(paper_data)
-
-            result.papers = analyzed_papers
+            await self._analyze_papers(result.papers)
+
+        if result.success and query_keys:
+            matcher = AuthorMatcher({name: [] for name in researchers})
+            self._record_seen(
+                scope,
+                result.papers,
+                query_keys,
+                lambda paper: matcher.match(paper.get("authors", [])),
+            )
 
         return result
 
     async def monitor_topics(
-        self, topics: list[str], days_back: int = 1
+        self, topics: list[str], days_back: int = 1, scope: str | None = None
     ) -> SearchResult:
-        """监控主题的新论文"""
+        """
+        监控主题的新论文
+
+        Args:
+            topics: 主题（分类）列表
+            days_back: 回溯天数
+            scope: 增量监控范围（如 daily），为 None 时不做增量过滤
+
+        Returns:
+            搜索结果
+        """
+        query_keys = (
+            {topic: f"{scope}:topic:{topic}" for topic in topics}
+            if scope and self.store
+            else {}
+        )
         query = SearchQuery(
             query_id=f"topics_{datetime.now().strftime('%Y%m%d_%H%M%S')}",
             search_type=SearchType.TOPIC,
             query_text=f"监控主题: {', '.join(topics)}",
             topics=topics,
-            filters=SearchFilters(days_back=days_back, max_results=100),
+            filters=self._build_filters(query_keys.values(), days_back),
         )
 
         result = await self.engine.search(query)
 
+        if result.success and query_keys:
+            result.papers = self._filter_unseen(scope, result.papers)
+        candidates = result.papers
+
         if result.success and self.analyzer:
-            # 按重要性排序
-            scored_papers = []
-            for paper_data in result.papers:
-                try:
-                    analysis = await self.analyzer.analyze_paper_significance(
-                        paper_data
-                    )
-                    paper_data["ai_analysis"] = analysis
-                    paper_data["importance_score"] = analysis.get(
-                        "importance_score", 5.0
-                    )
-                    scored_papers.append(paper_data)
-                except Exception as e:
-                    logger.warning(f"分析论文失败: {e}")
-                    paper_data["importance_score"] = 5.0
-                    scored_papers.append(paper_data)
+            prerank = self.config.monitoring.prerank_enabled
+            if prerank:
+                result.papers = self._prerank(topics, result.papers)
+
+            await self._analyze_papers(result.papers)
+
+            # 预排序时按最低评分过滤AI分析结果
+            if prerank:
+                min_score = self.config.monitoring.min_paper_score
+                kept = [
+                    p
+                    for p in result.papers
+                    if p.get("importance_score", DEFAULT_IMPORTANCE_SCORE) >= min_score
+                ]
+                self.prerank_stats["gated"] += len(result.papers) - len(kept)
+                result.papers = kept
 
             # 按重要性评分排序
-            scored_papers.sort(
-                key=lambda x: x.get("importance_score", 5.0), reverse=True
+            result.papers.sort(
+                key=lambda x: x.get("importance_score", DEFAULT_IMPORTANCE_SCORE),
+                reverse=True,
+            )
+
+        # 未进入AI分析的候选论文同样记为已处理，避免下次重复排序
+        if result.success and query_keys:
+            self._record_seen(
+                scope,
+                candidates,
+                query_keys,
+                lambda paper: paper.get("categories", []),
             )
-            result.papers = scored_papers
 
         return result
 
@@ -139,19 +449,22 @@ class PaperMonitor:
             "success": True,
         }
 
+        self.incremental_stats = {"new": 0, "updated": 0, "skipped": 0}
+        self.prerank_stats = {"candidates": 0, "forwarded": 0, "gated": 0}
+
         try:
             # 监控研究者
             if researchers:
                 logger.info(f"开始监控 {len(researchers)} 位研究者")
                 results["researcher_results"] = await self.monitor_researchers(
-                    researchers, days_back=1
+                    researchers, days_back=1, scope="daily"
                 )
 
             # 监控主题
             if topics:
                 logger.info(f"开始监控主题: {', '.join(topics)}")
                 results["topic_results"] = await self.monitor_topics(
-                    topics, days_back=1
+                    topics, days_back=1, scope="daily"
                 )
 
             # 生成摘要
@@ -182,19 +495,22 @@ class PaperMonitor:
             "success": True,
         }
 
+        self.incremental_stats = {"new": 0, "updated": 0, "skipped": 0}
+        self.prerank_stats = {"candidates": 0, "forwarded": 0, "gated": 0}
+
         try:
             # 监控研究者（过去7天）
             if researchers:
                 logger.info(f"开始每周监控 {len(researchers)} 位研究者")
                 results["researcher_results"] = await self.monitor_researchers(
-                    researchers, days_back=7
+                    researchers, days_back=7, scope="weekly"
                 )
 
             # 监控主题（过去7天）
             if topics:
                 logger.info(f"开始每周监控主题: {', '.join(topics)}")
                 results["topic_results"] = await self.monitor_topics(
-                    topics, days_back=7
+                    topics, days_back=7, scope="weekly"
                 )
 
             # 生成摘要
@@ -219,6 +535,14 @@ class PaperMonitor:
             "ai_insights": None,
         }
 
+        # 增量监控统计（新论文/新版本/已处理跳过）
+        if self.store:
+            summary["incremental"] = dict(self.incremental_stats)
+
+        # 预排序统计（候选/进入AI分析/低于最低评分被过滤）
+        if self.analyzer and self.config.monitoring.prerank_enabled:
+            summary["prerank"] = dict(self.prerank_stats)
+
         # 统计研究者论文
         if results["researcher_results"] and results["researcher_results"].success:
             summary["researcher_papers"] = len(results["researcher_results"].papers)
@@ -238,6 +562,20 @@ class PaperMonitor:
         if results["topic_results"] and results["topic_results"].success:
             all_papers.extend(results["topic_results"].papers)
 
+        # AI分析结果缓存命中情况（同一论文在研究者和主题结果中重复出现时分别计数）
+        if self.analyzer:
+            analyses = [
+                p["ai_analysis"]
+                for p in all_papers
+                if isinstance(p.get("ai_analysis"), dict)
+            ]
+            hits = sum(1 for a in analyses if a.get("cached"))
+            summary["analysis_cache"] = {
+                "hits": hits,
+                "misses": len(analyses) - hits,
+                "hit_rate": hits / len(analyses) if analyses else 0.0,
+            }
+
         # 去重并按重要性排序
         unique_papers = {
             p.get("arxiv_id"): p for p in all_papers if p.get("arxiv_id")
@@ -0,0 +1,293 @@
+"""
+本地论文预排序模块
+
+在调用LLM之前，用 BM25 按标题+摘要对候选论文做一次纯本地的相关性打分，
+查询由监控主题、配置的关键词以及历史高分论文构建的兴趣画像组成，
+只把排名靠前的论文交给 PaperAnalyzer，以控制LLM调用量。
+"""
+
+import math
+import re
+from collections import Counter
+from collections.abc import Iterable
+from typing import Any
+
+_TOKEN_RE = re.compile(r"[a-z0-9]+(?:-[a-z0-9]+)*")
+# arXiv 分类代码，如 cs.CR、stat.ML、astro-ph.GA
+_CATEGORY_RE = re.compile(r"[a-z-]+\.[A-Za-z-]+")
+
+# 常见分类代码对应的描述性词项（分类代码本身不会出现在标题和摘要中）
+CATEGORY_TERMS = {
+    "cs.AI": "artificial intelligence reasoning agents planning",
+    "cs.CL": "language models natural language processing translation",
+    "cs.CR": "security privacy cryptography attacks malware vulnerability",
+    "cs.CV": "computer vision image video segmentation detection",
+    "cs.HC": "human-computer interaction user interface",
+    "cs.IR": "information retrieval search recommendation ranking",
+    "cs.LG": "machine learning neural networks training",
+    "cs.RO": "robotics robot manipulation navigation control",
+    "cs.SE": "software engineering code testing program",
+    "cs.SI": "social networks information networks graph",
+    "math.OC": "optimization control convex",
+    "math.ST": "statistics estimation inference",
+    "stat.ML": "machine learning statistical inference",
+    "astro-ph": "astrophysics galaxies stars cosmology",
+    "econ": "economics markets",
+    "physics.gen-ph": "physics",
+    "q-bio": "biology protein genomics",
+}
+
+# 常见英文停用词（摘要中高频但无区分度的词）
+STOPWORDS = frozenset(
+    {
+        "a",
+        "an",
+        "and",
+        "are",
+        "as",
+        "at",
+        "be",
+        "by",
+        "can",
+        "for",
+        "from",
+        "has",
+        "have",
+        "in",
+        "into",
+        "is",
+        "it",
+        "its",
+        "of",
+        "on",
+        "or",
+        "our",
+        "that",
+        "the",
+        "their",
+        "these",
+        "this",
+        "to",
+        "we",
+        "which",
+        "with",
+        "via",
+        "using",
+        "based",
+        "than",
+        "then",
+        "there",
+        "they",
+        "was",
+        "were",
+        "been",
+        "also",
+        "such",
+        "show",
+        "shows",
+        "paper",
+        "propose",
+        "proposed",
+        "approach",
+        "method",
+        "methods",
+        "results",
+        "new",
+        "two",
+        "one",
+        "more",
+        "most",
+        "other",
+        "both",
+        "while",
+    }
+)
+
+
+def tokenize(text: str) -> list[str]:
+    """
+    把文本切分为小写词项（去停用词和单字符词）
+
+    Args:
+        text: 文本
+
+    Returns:
+        词项列表，如 "Graph Neural-Networks for X" -> ["graph", "neural-networks"]
+    """
+    return [
+        token
+        for token in _TOKEN_RE.findall(text.lower())
+        if len(token) > 1 and token not in STOPWORDS
+    ]
+
+
+def topic_terms(topic: str) -> str:
+    """
+    把监控主题转换为可用于文本匹配的词项
+
+    Args:
+        topic: 主题，可以是分类代码或关键词短语
+
+    Returns:
+        分类代码对应的描述性词项；未知分类代码返回空字符串，其他主题原样返回
+    """
+    if topic in CATEGORY_TERMS:
+        return CATEGORY_TERMS[topic]
+    if _CATEGORY_RE.fullmatch(topic):
+        return ""
+    return topic
+
+
+def paper_text(paper: dict[str, Any]) -> str:
+    """获取用于排序的论文文本（标题+摘要）"""
+    abstract = paper.get("summary") or paper.get("abstract") or ""
+    return f"{paper.get('title', '')} {abstract}"
+
+
+def build_profile(texts: Iterable[str], max_terms: int = 50) -> dict[str, float]:
+    """
+    从历史高分论文构建兴趣画像
+
+    按出现该词项的论文数取前 max_terms 个词项，权重归一化到 (0, 1]。
+
+    Args:
+        texts: 历史高分论文的文本
+        max_terms: 画像最多包含的词项数
+
+    Returns:
+        {词项: 权重}
+    """
+    document_counts: Counter[str] = Counter()
+    for text in texts:
+        document_counts.update(set(tokenize(text)))
+
+    top = document_counts.most_common(max_terms)
+    if not top:
+        return {}
+    highest = top[0][1]
+    return {term: count / highest for term, count in top}
+
+
+class BM25Ranker:
+    """BM25 相关性打分器"""
+
+    def __init__(self, documents: list[str], k1: float = 1.5, b: float = 0.75):
+        """
+        对候选文档建立词频统计
+
+        Args:
+            documents: 候选文档文本列表
+            k1: 词频饱和参数
+            b: 文档长度归一化参数
+        """
+        self.k1 = k1
+        self.b = b
+        self.term_freqs = [Counter(tokenize(doc)) for doc in documents]
+        self.doc_lengths = [sum(tf.values()) for tf in self.term_freqs]
+        self.avg_length = (
+            sum(self.doc_lengths) / len(self.doc_lengths) if self.doc_lengths else 0.0
+        )
+
+        # 倒排表：词项 -> [(文档下标, 词频)]
+        self.postings: dict[str, list[tuple[int, int]]] = {}
+        for doc_id, tf in enumerate(self.term_freqs):
+            for term, freq in tf.items():
+                self.postings.setdefault(term, []).append((doc_id, freq))
+
+    def idf(self, term: str) -> float:
+        """计算词项的逆文档频率（非负的 BM25 变体）"""
+        n = len(self.term_freqs)
+        df = len(self.postings.get(term, ()))
+        return math.log(1 + (n - df + 0.5) / (df + 0.5))
+
+    def score(self, query: dict[str, float]) -> list[float]:
+        """
+        一次遍历为所有候选文档打分
+
+        只访问查询词项的倒排表，而不是逐篇比较。
+
+        Args:
+            query: {词项: 权重}
+
+        Returns:
+            各文档的得分（与输入顺序一致）
+        """
+        scores = [0.0] * len(self.term_freqs)
+        if not self.avg_length:
+            return scores
+
+        for term, weight in query.items():
+            postings = self.postings.get(term)
+            if not postings:
+                continue
+            idf = self.idf(term) * weight
+            for doc_id, freq in postings:
+                norm = self.k1 * (
+                    1 - self.b + self.b * self.doc_lengths[doc_id] / self.avg_length
+                )
+                scores[doc_id] += idf * freq * (self.k1 + 1) / (freq + norm)
+        return scores
+
+
+class PaperPreRanker:
+    """按主题、关键词和兴趣画像对候选论文预排序"""
+
+    def __init__(
+        self,
+        terms: Iterable[str] = (),
+        profile: dict[str, float] | None = None,
+        profile_weight: float = 0.5,
+    ):
+        """
+        初始化预排序器
+
+        Args:
+            terms: 主题和关键词（每个可以是短语，分类代码转换为描述性词项）
+            profile: 兴趣画像 {词项: 权重}
+            profile_weight: 画像词项相对关键词的权重
+        """
+        self.query: dict[str, float] = {}
+        for term, weight in (profile or {}).items():
+            self.query[term] = weight * profile_weight
+        for phrase in terms:
+            for token in tokenize(topic_terms(phrase)):
+                self.query[token] = 1.0
+
+    def rank(
+        self, papers: list[dict[str, Any]], top_k: int
+    ) -> tuple[list[dict[str, Any]], list[dict[str, Any]]]:
+        """
+        选出最相关的 top_k 篇论文
+
+        每篇论文写入 prerank_score；相关论文不足 top_k 篇时，用得分为 0 的论文
+        按提交时间从新到旧补足。查询为空时无法排序，全部论文都被选中。
+
+        Args:
+            papers: 候选论文
+            top_k: 最多选出的论文数
+
+        Returns:
+            (选中的论文（按得分降序）, 未选中的论文)
+        """
+        if not self.query:
+            return list(papers), []
+
+        scores = BM25Ranker([paper_text(p) for p in papers]).score(self.query)
+        for paper, score in zip(papers, scores, strict=True):
+            paper["prerank_score"] = round(score, 4)
+
+        order = sorted(range(len(papers)), key=lambda i: scores[i], reverse=True)
+        chosen = [i for i in order if scores[i] > 0][:top_k]
+        if len(chosen) < top_k:
+            unmatched = sorted(
+                (i for i in order if scores[i] <= 0),
+                key=lambda i: str(papers[i].get("submitted_date") or ""),
+                reverse=True,
+            )
+            chosen += unmatched[: top_k - len(chosen)]
+
+        selected = set(chosen)
+        return (
+            [papers[i] for i in chosen],
+            [papers[i] for i in order if i not in selected],
+        )
@@ -0,0 +1,286 @@
+"""
+速率限制模块
+
+按主机划分的令牌桶限流器，进程内所有出站HTTP请求共享同一实例。
+同时支持异步和同步调用方，并提供令牌余量和等待时间直方图用于调优。
+"""
+
+import asyncio
+import bisect
+import logging
+import threading
+import time
+from typing import Any
+from urllib.parse import urlsplit
+
+from ..models.config import AppConfig, load_config
+
+logger = logging.getLogger(__name__)
+
+# 等待时间直方图的桶上界(秒)
+WAIT_BUCKETS = (0.0, 0.01, 0.1, 0.5, 1.0, 2.0, 5.0, 10.0, 30.0)
+
+
+class TokenBucket:
+    """令牌桶（线程安全）"""
+
+    def __init__(self, rate: float, capacity: float):
+        """
+        初始化令牌桶
+
+        Args:
+            rate: 每秒补充的令牌数
+            capacity: 桶容量（允许的突发请求数）
+        """
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1")
+
+        self.rate = rate
+        self.capacity = capacity
+
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+        # 统计信息
+        self.requests = 0
+        self.total_wait = 0.0
+        self.wait_histogram = [0] * (len(WAIT_BUCKETS) + 1)
+
+    def _refill(self, now: float) -> None:
+        """按流逝时间补充令牌（调用方需持有锁）"""
+        elapsed = now - self._updated
+        if elapsed > 0:
+            self._tokens = min(self.capacity, self._tokens + elapsed * self.rate)
+            self._updated = now
+
+    def reserve(self, tokens: float = 1.0) -> float:
+        """
+        预占令牌并返回需要等待的时间
+
+        令牌可以被预占为负数，后续调用方按顺序排队等待，
+        因此同步和异步调用方可以共享同一个桶。
+
+        Args:
+            tokens: 需要的令牌数
+
+        Returns:
+            需要等待的秒数
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            self._tokens -= tokens
+            wait = max(0.0, -self._tokens / self.rate)
+
+            self.requests += 1
+            self.total_wait += wait
+            self.wait_histogram[bisect.bisect_left(WAIT_BUCKETS, wait)] += 1
+
+        return wait
+
+    def refund(self, tokens: float = 1.0) -> None:
+        """归还未使用的预占令牌（如等待期间被取消）"""
+        with self._lock:
+            self._refill(time.monotonic())
+            self._tokens = min(self.capacity, self._tokens + tokens)
+
+    async def acquire(self, tokens: float = 1.0) -> float:
+        """异步获取令牌，返回实际等待时间（等待期间被取消时归还预占的令牌）"""
+        wait = self.reserve(tokens)
+        if wait > 0:
+            try:
+                await asyncio.sleep(wait)
+            except asyncio.CancelledError:
+                self.refund(tokens)
+                raise
+        return wait
+
+    def acquire_sync(self, tokens: float = 1.0) -> float:
+        """同步获取令牌，返回实际等待时间"""
+        wait = self.reserve(tokens)
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+    @property
+    def fill_level(self) -> float:
+        """当前可用令牌数（预占时可能为负）"""
+        with self._lock:
+            self._refill(time.monotonic())
+            return self._tokens
+
+    def stats(self) -> dict[str, Any]:
+        """获取统计信息"""
+        labels = [f"<={bound}s" for bound in WAIT_BUCKETS] + [f">{WAIT_BUCKETS[-1]}s"]
+        return {
+            "rate_per_second": self.rate,
+            "capacity": self.capacity,
+            "fill_level": round(self.fill_level, 3),
+            "requests": self.requests,
+            "total_wait_seconds": round(self.total_wait, 3),
+            "wait_histogram": dict(zip(labels, self.wait_histogram, strict=True)),
+        }
+
+
+class RateLimiter:
+    """按主机划分的限流器"""
+
+    def __init__(
+        self,
+        host_limits: dict[str, tuple[float, float]],
+        default_limit: tuple[float, float],
+        enabled: bool = True,
+    ):
+        """
+        初始化限流器
+
+        Args:
+            host_limits: {主机名: (每秒令牌数, 桶容量)}
+            default_limit: 未配置主机使用的 (每秒令牌数, 桶容量)
+            enabled: 是否启用限流
+        """
+        self.enabled = enabled
+        self.host_limits = host_limits
+        self.default_limit = default_limit
+
+        self._buckets: dict[str, TokenBucket] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_config(cls, config: AppConfig) -> "RateLimiter":
+        """根据应用配置创建限流器"""
+        per_second = config.max_requests_per_minute / 60.0
+        burst = float(config.rate_limit_burst)
+        default_limit = (per_second, burst)
+
+        # ArXiv API 要求每次请求间隔 arxiv_delay_seconds，不允许突发
+        delay = config.api.arxiv_delay_seconds
+        arxiv_api_limit = (1.0 / delay, 1.0) if delay > 0 else default_limit
+
+        arxiv_api_host = (
+            urlsplit(config.api.arxiv_base_url).hostname or "export.arxiv.org"
+        )
+        openrouter_host = (
+            urlsplit(config.api.openrouter_base_url).hostname or "openrouter.ai"
+        )
+        dida_host = urlsplit(config.api.dida_base_url).hostname or "api.dida365.com"
+
+        host_limits = {
+            arxiv_api_host: arxiv_api_limit,
+            "arxiv.org": default_limit,
+            openrouter_host: default_limit,
+            dida_host: default_limit,
+        }
+
+        return cls(
+            host_limits=host_limits,
+            default_limit=default_limit,
+            enabled=config.enable_rate_limiting,
+        )
+
+    @staticmethod
+    def _host_of(url_or_host: str) -> str:
+        """从URL或主机名中提取主机名"""
+        if "://" in url_or_host:
+            return (urlsplit(url_or_host).hostname or "").lower()
+        return url_or_host.lower()
+
+    def bucket_for(self, url_or_host: str) -> TokenBucket:
+        """获取主机对应的令牌桶（按需创建）"""
+        host = self._host_of(url_or_host)
+        with self._lock:
+            bucket = self._buckets.get(host)
+            if bucket is None:
+                rate, capacity = self.host_limits.get(host, self.default_limit)
+                bucket = TokenBucket(rate, capacity)
+                self._buckets[host] = bucket
+            return bucket
+
+    async def acquire(self, url_or_host: str) -> float:
+        """异步等待直到允许向该主机发送请求"""
+        if not self.enabled:
+            return 0.0
+        wait = await self.bucket_for(url_or_host).acquire()
+        if wait > 0:
+            logger.debug(f"限流等待 {wait:.2f}s: {self._host_of(url_or_host)}")
+        return wait
+
+    def acquire_sync(self, url_or_host: str) -> float:
+        """同步等待直到允许向该主机发送请求"""
+        if not self.enabled:
+            return 0.0
+        wait = self.bucket_for(url_or_host).acquire_sync()
+        if wait > 0:
+            logger.debug(f"限流等待 {wait:.2f}s: {self._host_of(url_or_host)}")
+        return wait
+
+    def stats(self) -> dict[str, dict[str, Any]]:
+        """获取各主机的统计信息"""
+        with self._lock:
+            buckets = dict(self._buckets)
+        return {host: bucket.stats() for host, bucket in buckets.items()}
+
+
+def limiter_settings(config: AppConfig) -> tuple:
+    """提取配置中影响限流的设置，用作共享限流器的键"""
+    return (
+        config.enable_rate_limiting,
+        config.max_requests_per_minute,
+        config.rate_limit_burst,
+        config.api.arxiv_delay_seconds,
+        config.api.arxiv_base_url,
+        config.api.openrouter_base_url,
+        config.api.dida_base_url,
+    )
+
+
+# 进程级共享限流器（按限流设置区分，第一个创建的为默认限流器）
+_rate_limiters: dict[tuple, RateLimiter] = {}
+_default_settings: tuple | None = None
+_rate_limiter_lock = threading.Lock()
+
+
+def get_rate_limiter(config: AppConfig | None = None) -> RateLimiter:
+    """
+    获取进程级共享限流器
+
+    限流设置相同的调用方共享同一组令牌桶；设置不同的配置（如另一个
+    arxiv_delay_seconds）得到独立的限流器，不会被先创建的限流器覆盖。
+
+    Args:
+        config: 应用配置，不提供时返回默认限流器（尚未创建时加载默认配置）
+
+    Returns:
+        共享的限流器实例
+    """
+    global _default_settings
+    with _rate_limiter_lock:
+        if config is None:
+            if _default_settings is not None:
+                return _rate_limiters[_default_settings]
+            config = load_config()
+
+        settings = limiter_settings(config)
+        limiter = _rate_limiters.get(settings)
+        if limiter is None:
+            limiter = RateLimiter.from_config(config)
+            _rate_limiters[settings] = limiter
+            if _default_settings is None:
+                _default_settings = settings
+            else:
+                logger.info("限流设置与默认限流器不同，使用独立的限流器")
+        return limiter
+
+
+def configure_rate_limiter(config: AppConfig) -> RateLimiter:
+    """根据配置重建进程级共享限流器，并将其设为默认限流器"""
+    global _default_settings
+    with _rate_limiter_lock:
+        settings = limiter_settings(config)
+        _rate_limiters.clear()
+        _rate_limiters[settings] = RateLimiter.from_config(config)
+        _default_settings = settings
+        return _rate_limiters[settings]
@@ -0,0 +1,449 @@
+"""
+请求容错模块
+
+为所有出站HTTP请求提供统一的重试和熔断：
+- 带抖动的指数退避，服务器返回 Retry-After 时按其要求等待
+- 重试次数由 APIConfig.http_retries 控制
+- 按主机划分的熔断器：连续失败达到阈值后在冷却期内直接失败，
+  避免某个上游（arXiv、OpenRouter）降级时每个请求都等到超时
+"""
+
+import asyncio
+import logging
+import random
+import threading
+import time
+from collections.abc import Awaitable, Callable
+from email.utils import parsedate_to_datetime
+from typing import Any, TypeVar
+from urllib.parse import urlsplit
+
+import httpx
+
+from ..models.config import AppConfig, load_config
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# 需要重试的HTTP状态码（限流和服务端错误）
+RETRY_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+RETRY_BASE_DELAY = 1.0
+RETRY_MAX_DELAY = 30.0
+# Retry-After 要求的等待超过该值时不再等待，直接失败
+RETRY_AFTER_MAX_DELAY = 60.0
+# 非幂等请求（POST）只在请求确定未被处理时重试
+NON_IDEMPOTENT_RETRY_STATUS_CODES = frozenset({429})
+
+
+class RetryableHTTPError(Exception):
+    """可重试的HTTP错误响应（429/5xx）"""
+
+    def __init__(self, status_code: int, retry_after: float | None = None):
+        """
+        Args:
+            status_code: HTTP状态码
+            retry_after: 服务器要求的等待时间(秒)
+        """
+        super().__init__(f"HTTP {status_code}")
+        self.status_code = status_code
+        self.retry_after = retry_after
+
+
+class CircuitOpenError(Exception):
+    """熔断器打开，请求未发送"""
+
+    def __init__(self, host: str, retry_in: float):
+        """
+        Args:
+            host: 上游主机
+            retry_in: 距离允许试探请求的剩余时间(秒)
+        """
+        super().__init__(f"{host} 熔断中，{retry_in:.0f}s 后重试")
+        self.host = host
+        self.retry_in = retry_in
+
+
+# 默认视为可重试失败的异常（网络错误和 429/5xx 响应）
+RETRYABLE_ERRORS: tuple[type[BaseException], ...] = (
+    httpx.TransportError,
+    RetryableHTTPError,
+)
+
+
+def backoff_delay(
+    attempt: int, base: float = RETRY_BASE_DELAY, cap: float = RETRY_MAX_DELAY
+) -> float:
+    """
+    计算带抖动的指数退避时间（full jitter）
+
+    Args:
+        attempt: 已失败的次数（从0开始）
+        base: 基础退避时间(秒)
+        cap: 最大退避时间(秒)
+
+    Returns:
+        本次重试前的等待时间(秒)
+    """
+    return random.uniform(0, min(cap, base * 2**attempt))
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """
+    解析 Retry-After 响应头
+
+    Args:
+        value: 响应头的值（秒数或HTTP日期）
+
+    Returns:
+        需要等待的秒数，无法解析时返回 None
+    """
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, retry_at.timestamp() - time.time())
+
+
+def raise_for_retryable(
+    response: httpx.Response, statuses: frozenset[int] = RETRY_STATUS_CODES
+) -> httpx.Response:
+    """
+    响应状态码可重试时抛出 RetryableHTTPError
+
+    Args:
+        response: HTTP响应
+        statuses: 视为可重试的状态码
+
+    Returns:
+        原响应（不可重试时）
+
+    Raises:
+        RetryableHTTPError: 状态码可重试（默认 429/5xx）
+    """
+    if response.status_code in statuses:
+        raise RetryableHTTPError(
+            response.status_code,
+            parse_retry_after(response.headers.get("Retry-After")),
+        )
+    return response
+
+
+class CircuitBreaker:
+    """单个上游主机的熔断器（线程安全）"""
+
+    def __init__(self, host: str, failure_threshold: int, reset_timeout: float):
+        """
+        初始化熔断器
+
+        Args:
+            host: 上游主机
+            failure_threshold: 打开熔断器的连续失败次数
+            reset_timeout: 打开后允许试探请求前的冷却时间(秒)
+        """
+        self.host = host
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+
+        self._failures = 0
+        self._opened_at: float | None = None
+        # 半开状态下是否已有试探请求在途
+        self._probing = False
+        self._lock = threading.Lock()
+
+        # 统计信息
+        self.rejected = 0
+        self.opened = 0
+
+    @property
+    def state(self) -> str:
+        """当前状态：closed / open / half_open"""
+        with self._lock:
+            return self._state(time.monotonic())
+
+    def _state(self, now: float) -> str:
+        """计算当前状态（调用方需持有锁）"""
+        if self._opened_at is None:
+            return "closed"
+        if now - self._opened_at < self.reset_timeout:
+            return "open"
+        return "half_open"
+
+    def before_request(self) -> None:
+        """
+        发送请求前检查熔断状态
+
+        冷却期结束后进入半开状态，只放行一个试探请求，其余请求在试探结束前继续被拒绝。
+
+        Raises:
+            CircuitOpenError: 熔断器打开，或半开状态下已有试探请求在途
+        """
+        with self._lock:
+            now = time.monotonic()
+            state = self._state(now)
+            if state == "open":
+                self.rejected += 1
+                raise CircuitOpenError(
+                    self.host, self.reset_timeout - (now - self._opened_at)
+                )
+            if state == "half_open":
+                if self._probing:
+                    self.rejected += 1
+                    raise CircuitOpenError(self.host, 0.0)
+                self._probing = True
+
+    def release_probe(self) -> None:
+        """试探请求未得出结果（如被取消或非可重试异常）时释放试探名额，保持半开状态"""
+        with self._lock:
+            self._probing = False
+
+    def record_success(self) -> None:
+        """记录成功（上游有响应），关闭熔断器"""
+        with self._lock:
+            if self._opened_at is not None:
+                logger.info(f"上游已恢复，关闭熔断器: {self.host}")
+            self._failures = 0
+            self._opened_at = None
+            self._probing = False
+
+    def record_failure(self) -> None:
+        """记录失败，连续失败达到阈值（或半开试探失败）时打开熔断器"""
+        with self._lock:
+            now = time.monotonic()
+            self._failures += 1
+            half_open = self._state(now) == "half_open"
+            self._probing = False
+            if half_open or (
+                self._opened_at is None and self._failures >= self.failure_threshold
+            ):
+                self._opened_at = now
+                self.opened += 1
+                logger.warning(
+                    f"{self.host} 连续失败 {self._failures} 次，"
+                    f"熔断 {self.reset_timeout:.0f}s"
+                )
+
+    def stats(self) -> dict[str, Any]:
+        """获取统计信息"""
+        with self._lock:
+            return {
+                "state": self._state(time.monotonic()),
+                "consecutive_failures": self._failures,
+                "opened": self.opened,
+                "rejected": self.rejected,
+            }
+
+
+class CircuitBreakers:
+    """按主机划分的熔断器集合"""
+
+    def __init__(self, failure_threshold: int, reset_timeout: float):
+        """
+        Args:
+            failure_threshold: 打开熔断器的连续失败次数
+            reset_timeout: 熔断冷却时间(秒)
+        """
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._breakers: dict[str, CircuitBreaker] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_config(cls, config: AppConfig) -> "CircuitBreakers":
+        """根据应用配置创建熔断器集合"""
+        return cls(
+            failure_threshold=config.api.circuit_breaker_threshold,
+            reset_timeout=float(config.api.circuit_breaker_reset_seconds),
+        )
+
+    def breaker_for(self, url_or_host: str) -> CircuitBreaker:
+        """获取主机对应的熔断器（按需创建）"""
+        if "://" in url_or_host:
+            host = (urlsplit(url_or_host).hostname or "").lower()
+        else:
+            host = url_or_host.lower()
+        with self._lock:
+            breaker = self._breakers.get(host)
+            if breaker is None:
+                breaker = CircuitBreaker(
+                    host, self.failure_threshold, self.reset_timeout
+                )
+                self._breakers[host] = breaker
+            return breaker
+
+    def stats(self) -> dict[str, dict[str, Any]]:
+        """获取各主机的统计信息"""
+        with self._lock:
+            breakers = dict(self._breakers)
+        return {host: breaker.stats() for host, breaker in breakers.items()}
+
+
+# 进程级共享熔断器
+_breakers: CircuitBreakers | None = None
+_breakers_lock = threading.Lock()
+
+
+def get_circuit_breakers(config: AppConfig | None = None) -> CircuitBreakers:
+    """
+    获取进程级共享的熔断器集合
+
+    Args:
+        config: 首次创建时使用的配置
+
+    Returns:
+        共享的熔断器集合
+    """
+    global _breakers
+    if _breakers is None:
+        with _breakers_lock:
+            if _breakers is None:
+                _breakers = CircuitBreakers.from_config(config or load_config())
+    return _breakers
+
+
+def configure_circuit_breakers(config: AppConfig) -> CircuitBreakers:
+    """根据配置重建进程级共享熔断器（同时清空所有熔断状态）"""
+    global _breakers
+    with _breakers_lock:
+        _breakers = CircuitBreakers.from_config(config)
+    return _breakers
+
+
+def _retry_wait(attempt: int, error: BaseException) -> float | None:
+    """
+    计算重试前的等待时间
+
+    Returns:
+        等待秒数；Retry-After 要求的等待过长时返回 None（放弃重试）
+    """
+    delay = backoff_delay(attempt)
+    retry_after = getattr(error, "retry_after", None)
+    if retry_after is not None:
+        if retry_after > RETRY_AFTER_MAX_DELAY:
+            return None
+        delay = max(delay, retry_after)
+    return delay
+
+
+async def call_with_retry(
+    fn: Callable[[], Awaitable[T]],
+    url: str,
+    retries: int,
+    rate_limiter: Any = None,
+    retry_on: tuple[type[BaseException], ...] | None = None,
+    on_retry: Callable[[int, BaseException, float], None] | None = None,
+) -> T:
+    """
+    带重试和熔断地执行一次请求
+
+    fn 通过抛出 retry_on 中的异常（默认 httpx.TransportError 和 RetryableHTTPError）
+    表示可重试的失败，这些失败计入熔断器；其他异常（如 404）说明上游正常响应，直接向上抛出。
+
+    Args:
+        fn: 发送一次请求的协程函数
+        url: 请求URL（用于选择熔断器和限流桶）
+        retries: 最大重试次数
+        rate_limiter: 限流器，每次尝试前获取令牌
+        retry_on: 视为可重试失败的异常类型
+        on_retry: 重试前的回调 (已失败次数, 异常, 等待秒数)
+
+    Returns:
+        fn 的返回值
+
+    Raises:
+        CircuitOpenError: 熔断器打开
+    """
+    breaker = get_circuit_breakers().breaker_for(url)
+    retryable = retry_on or RETRYABLE_ERRORS
+
+    for attempt in range(retries + 1):
+        breaker.before_request()
+        try:
+            if rate_limiter is not None:
+                await rate_limiter.acquire(url)
+            result = await fn()
+        except retryable as e:
+            breaker.record_failure()
+            delay = _retry_wait(attempt, e)
+            # 达到重试上限、Retry-After 过长或本次失败触发熔断时不再重试
+            if attempt >= retries or delay is None or breaker.state == "open":
+                raise
+            if on_retry is not None:
+                on_retry(attempt, e, delay)
+            logger.warning(
+                f"请求失败（{type(e).__name__}: {e}），"
+                f"{delay:.1f}s 后进行第 {attempt + 1} 次重试: {breaker.host}"
+            )
+            await asyncio.sleep(delay)
+        except BaseException:
+            # 非可重试异常或取消：不计入熔断，但释放半开试探名额
+            breaker.release_probe()
+            raise
+        else:
+            breaker.record_success()
+            return result
+
+    raise AssertionError("unreachable")
+
+
+def call_with_retry_sync(
+    fn: Callable[[], T],
+    url: str,
+    retries: int,
+    rate_limiter: Any = None,
+    retry_on: tuple[type[BaseException], ...] | None = None,
+    on_retry: Callable[[int, BaseException, float], None] | None = None,
+) -> T:
+    """
+    带重试和熔断地执行一次请求（同步版本）
+
+    Args:
+        fn: 发送一次请求的函数
+        url: 请求URL（用于选择熔断器和限流桶）
+        retries: 最大重试次数
+        rate_limiter: 限流器，每次尝试前获取令牌
+        retry_on: 视为可重试失败的异常类型
+        on_retry: 重试前的回调 (已失败次数, 异常, 等待秒数)
+
+    Returns:
+        fn 的返回值
+
+    Raises:
+        CircuitOpenError: 熔断器打开
+    """
+    breaker = get_circuit_breakers().breaker_for(url)
+    retryable = retry_on or RETRYABLE_ERRORS
+
+    for attempt in range(retries + 1):
+        breaker.before_request()
+        try:
+            if rate_limiter is not None:
+                rate_limiter.acquire_sync(url)
+            result = fn()
+        except retryable as e:
+            breaker.record_failure()
+            delay = _retry_wait(attempt, e)
+            # 达到重试上限、Retry-After 过长或本次失败触发熔断时不再重试
+            if attempt >= retries or delay is None or breaker.state == "open":
+                raise
+            if on_retry is not None:
+                on_retry(attempt, e, delay)
+            logger.warning(
+                f"请求失败（{type(e).__name__}: {e}），"
+                f"{delay:.1f}s 后进行第 {attempt + 1} 次重试: {breaker.host}"
+            )
+            time.sleep(delay)
+        except BaseException:
+            # 非可重试异常或取消：不计入熔断，但释放半开试探名额
+            breaker.release_probe()
+            raise
+        else:
+            breaker.record_success()
+            return result
+
+    raise AssertionError("unreachable")
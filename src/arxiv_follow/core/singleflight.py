@@ -0,0 +1,86 @@
+"""
+并发请求合并模块（singleflight）
+
+研究者监控和主题监控并发运行、或多个命令共享同一进程时，
+相同的查询URL会被同时请求多次。这里让相同键的并发调用共享同一个进行中的任务，
+只有第一个调用者真正发起请求，其余调用者等待同一结果。
+"""
+
+import asyncio
+import logging
+from collections.abc import Awaitable, Callable, Hashable
+from typing import Any, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class _Call:
+    """进行中的调用"""
+
+    def __init__(self, task: asyncio.Future):
+        self.task = task
+        self.waiters = 0
+
+
+class SingleFlight:
+    """合并相同键的并发异步调用"""
+
+    def __init__(self):
+        """初始化调用表和统计"""
+        # 键包含事件循环ID，避免不同事件循环之间共享任务
+        self._calls: dict[tuple[int, Hashable], _Call] = {}
+        self.calls = 0
+        self.deduplicated = 0
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[T]]) -> tuple[T, bool]:
+        """
+        执行调用，相同键已有进行中的调用时等待其结果
+
+        任务在独立的 Task 中运行，某个等待者被取消不会影响其他等待者；
+        所有等待者都被取消时才取消任务。
+
+        Args:
+            key: 请求键（调用方负责规范化）
+            fn: 发起请求的协程函数
+
+        Returns:
+            (结果, 是否复用了其他调用者的结果)
+        """
+        flight_key = (id(asyncio.get_running_loop()), key)
+        call = self._calls.get(flight_key)
+        shared = call is not None
+
+        if call is None:
+            call = _Call(asyncio.ensure_future(fn()))
+            self._calls[flight_key] = call
+            call.task.add_done_callback(lambda _task: self._forget(flight_key, call))
+            self.calls += 1
+        else:
+            self.deduplicated += 1
+            logger.debug(f"合并进行中的请求: {key}")
+
+        call.waiters += 1
+        try:
+            return await asyncio.shield(call.task), shared
+        finally:
+            call.waiters -= 1
+            if call.waiters == 0 and not call.task.done():
+                self._forget(flight_key, call)
+                call.task.cancel()
+
+    def _forget(self, flight_key: tuple[int, Hashable], call: _Call) -> None:
+        """从调用表中移除已结束（或被放弃）的调用"""
+        if self._calls.get(flight_key) is call:
+            del self._calls[flight_key]
+
+    def stats(self) -> dict[str, Any]:
+        """获取合并统计"""
+        total = self.calls + self.deduplicated
+        return {
+            "calls": self.calls,
+            "deduplicated": self.deduplicated,
+            "in_flight": len(self._calls),
+            "dedup_rate": self.deduplicated / total if total else 0.0,
+        }
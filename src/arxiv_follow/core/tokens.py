@@ -0,0 +1,154 @@
+"""
+令牌预算模块
+
+按令牌预算估算提示词大小、把条目打包成批次以及截断或切分长文本，
+不依赖具体模型的分词器：
+中日韩字符大致一个字符一个令牌，其余文本大致四个字符一个令牌。
+"""
+
+import math
+from collections.abc import Callable, Iterable
+from typing import TypeVar
+
+T = TypeVar("T")
+
+# 拉丁文本平均每个令牌的字符数
+CHARS_PER_TOKEN = 4
+
+
+def _is_cjk(char: str) -> bool:
+    """判断字符是否为中日韩文字或全角标点"""
+    code = ord(char)
+    return (
+        0x3000 <= code <= 0x9FFF
+        or 0xAC00 <= code <= 0xD7AF
+        or 0xF900 <= code <= 0xFAFF
+        or 0xFF00 <= code <= 0xFFEF
+    )
+
+
+def estimate_tokens(text: str) -> int:
+    """
+    估算文本的令牌数（偏保守）
+
+    Args:
+        text: 文本
+
+    Returns:
+        估算的令牌数
+    """
+    if not text:
+        return 0
+    cjk = sum(1 for char in text if _is_cjk(char))
+    return cjk + math.ceil((len(text) - cjk) / CHARS_PER_TOKEN)
+
+
+def pack_by_budget(
+    items: Iterable[T],
+    cost: Callable[[T], int],
+    budget: int,
+    max_items: int | None = None,
+) -> list[list[T]]:
+    """
+    按令牌预算把条目顺序打包成批次
+
+    单个条目超出预算时独占一个批次。
+
+    Args:
+        items: 条目
+        cost: 计算单个条目令牌数的函数
+        budget: 每批次的令牌预算
+        max_items: 每批次的最大条目数
+
+    Returns:
+        批次列表（保持原始顺序）
+    """
+    batches: list[list[T]] = []
+    current: list[T] = []
+    used = 0
+
+    for item in items:
+        item_cost = cost(item)
+        full = max_items is not None and len(current) >= max_items
+        if current and (full or used + item_cost > budget):
+            batches.append(current)
+            current, used = [], 0
+        current.append(item)
+        used += item_cost
+
+    if current:
+        batches.append(current)
+    return batches
+
+
+def truncate_to_tokens(text: str, max_tokens: int, marker: str = " …") -> str:
+    """
+    把文本截断到令牌预算以内
+
+    Args:
+        text: 文本
+        max_tokens: 令牌预算
+        marker: 截断时追加的标记
+
+    Returns:
+        未超出预算时返回原文，否则返回截断后的文本（带截断标记）
+    """
+    if estimate_tokens(text) <= max_tokens:
+        return text
+
+    # 二分查找能放进预算的最长前缀
+    budget = max(0, max_tokens - estimate_tokens(marker))
+    low, high = 0, len(text)
+    while low < high:
+        mid = (low + high + 1) // 2
+        if estimate_tokens(text[:mid]) <= budget:
+            low = mid
+        else:
+            high = mid - 1
+    return text[:low].rstrip() + marker
+
+
+def split_by_tokens(text: str, max_tokens: int) -> list[str]:
+    """
+    按令牌预算把长文本切分为若干段
+
+    优先在空行（段落）处切分，段落过长时按行切分，单行仍过长时按字符硬切分。
+    只在段落处切分时，用 "\\n\\n" 连接各段即可还原原文。
+
+    Args:
+        text: 文本
+        max_tokens: 每段的令牌预算
+
+    Returns:
+        分段列表，文本未超出预算时只有一段
+
+    Raises:
+        ValueError: 令牌预算小于 1
+    """
+    if max_tokens < 1:
+        raise ValueError("max_tokens must be at least 1")
+    if estimate_tokens(text) <= max_tokens:
+        return [text]
+
+    pieces: list[str] = []
+    for paragraph in text.split("\n\n"):
+        if estimate_tokens(paragraph) <= max_tokens:
+            pieces.append(paragraph)
+            continue
+        for batch in pack_by_budget(
+            paragraph.split("\n"), lambda line: estimate_tokens(line) + 1, max_tokens
+        ):
+            block = "\n".join(batch)
+            while estimate_tokens(block) > max_tokens:
+                head = truncate_to_tokens(block, max_tokens, marker="")
+                pieces.append(head)
+                block = block[len(head) :].lstrip()
+            if block:
+                pieces.append(block)
+
+    return [
+        "\n\n".join(group)
+        for group in pack_by_budget(
+            pieces, lambda piece: estimate_tokens(piece) + 1, max_tokens
+        )
+    ]
@@ -10,6 +10,17 @@ from typing import Any
 
 import httpx
 
+from ..core.http import get_http_client
+from ..core.resilience import (
+    NON_IDEMPOTENT_RETRY_STATUS_CODES,
+    RETRY_STATUS_CODES,
+    CircuitOpenError,
+    RetryableHTTPError,
+    call_with_retry_sync,
+    raise_for_retryable,
+)
+from ..models.config import load_config
+
 # 配置日志
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -27,14 +38,16 @@ except ImportError:
 class DidaIntegration:
     """滴答清单API集成类"""
 
-    def __init__(self, access_token: str | None = None):
+    def __init__(self, access_token: str | None = None, max_retries: int | None = None):
         """
         初始化滴答清单API客户端
 
         Args:
             access_token: 访问令牌，如果不提供会从环境变量读取
+            max_retries: 最大重试次数，如果不提供会使用 APIConfig.http_retries
         """
         self.access_token = access_token or os.getenv("DIDA_ACCESS_TOKEN")
+        self.max_retries = max_retries
         self.base_url = "https://api.dida365.com/open/v1"
         self.headers = {
             "Authorization": f"Bearer {self.access_token}",
@@ -49,6 +62,50 @@ class DidaIntegration:
         """检查API是否可用"""
         return bool(self.access_token)
 
+    def _send(self, method: str, url: str, **kwargs) -> httpx.Response:
+        """
+        经过重试和按主机熔断发送请求
+
+        Args:
+            method: HTTP方法
+            url: 请求URL
+            **kwargs: 其他请求参数
+
+        Returns:
+            HTTP响应
+
+        Raises:
+            CircuitOpenError: 滴答清单主机熔断中
+            RetryableHTTPError: 可重试状态码在重试耗尽后仍然出现
+            httpx.RequestError: 网络请求错误
+        """
+        # 非幂等请求（创建任务）只在 429 或连接失败（请求未发出）时重试，避免重复创建
+        idempotent = method.upper() in ("GET", "HEAD", "PUT", "DELETE")
+        statuses = (
+            RETRY_STATUS_CODES if idempotent else NON_IDEMPOTENT_RETRY_STATUS_CODES
+        )
+        retry_on = (
+            (httpx.TransportError, RetryableHTTPError)
+            if idempotent
+            else (httpx.ConnectError, httpx.ConnectTimeout, RetryableHTTPError)
+        )
+
+        retries = (
+            self.max_retries
+            if self.max_retries is not None
+            else load_config().api.http_retries
+        )
+
+        return call_with_retry_sync(
+            lambda: raise_for_retryable(
+                get_http_client().request(method, url, headers=self.headers, **kwargs),
+                statuses,
+            ),
+            url,
+            retries,
+            retry_on=retry_on,
+        )
+
     def _make_request(self, method: str, url: str, **kwargs) -> dict[str, Any]:
         """
         统一的HTTP请求处理
@@ -65,20 +122,23 @@ class DidaIntegration:
             return {"success": False, "error": "API未启用"}
 
         try:
-            with httpx.Client(timeout=30.0) as client:
-                response = client.request(method, url, headers=self.headers, **kwargs)
+            response = self._send(method, url, **kwargs)
 
-                if response.status_code in [200, 204]:
-                    return {
-                        "success": True,
-                        "data": response.json() if response.content else {},
-                        "status_code": response.status_code,
-                    }
-                else:
-                    error_msg = f"HTTP {response.status_code}: {response.text}"
-                    logger.error(f"API请求失败: {error_msg}")
-                    return {"success": False, "error": error_msg}
+            if response.status_code in [200, 204]:
+                return {
+                    "success": True,
+                    "data": response.json() if response.content else {},
+                    "status_code": response.status_code,
+                }
+            else:
+                error_msg = f"HTTP {response.status_code}: {response.text}"
+                logger.error(f"API请求失败: {error_msg}")
+                return {"success": False, "error": error_msg}
 
+        except (CircuitOpenError, RetryableHTTPError) as e:
+            error_msg = f"API请求失败: {e}"
+            logger.error(error_msg)
+            return {"success": False, "error": error_msg}
         except httpx.RequestError as e:
             error_msg = f"网络请求错误: {e}"
             logger.error(error_msg)
@@ -174,45 +234,46 @@ class DidaIntegration:
         logger.info(f"删除任务: {task_id} (项目: {project_id})")
 
         try:
-            with httpx.Client(timeout=30.0) as client:
-                response = client.delete(url, headers=self.headers)
-
-                # 根据官方文档，200和201都表示成功
-                if response.status_code in [200, 201]:
-                    logger.warning(
-                        f"删除API返回成功 (状态码: {response.status_code})，但可能需要手动确认删除"
-                    )
-                    logger.warning(
-                        f"请在滴答清单App中检查任务 {task_id} 是否真的被删除"
-                    )
-                    return {
-                        "success": True,
-                        "task_id": task_id,
-                        "status_code": response.status_code,
-                        "warning": "删除API可能不可靠，请手动确认删除",
-                    }
-                elif response.status_code == 404:
-                    # 任务不存在
-                    logger.info(f"任务不存在: {task_id}")
-                    return {
-                        "success": True,
-                        "task_id": task_id,
-                        "status_code": 404,
-                        "note": "任务不存在",
-                    }
-                elif response.status_code == 401:
-                    error_msg = "访问令牌无效或已过期"
-                    logger.error(f"删除任务失败: {error_msg}")
-                    return {"success": False, "error": error_msg, "task_id": task_id}
-                elif response.status_code == 403:
-                    error_msg = "没有权限删除此任务"
-                    logger.error(f"删除任务失败: {error_msg}")
-                    return {"success": False, "error": error_msg, "task_id": task_id}
-                else:
-                    error_msg = f"HTTP {response.status_code}: {response.text}"
-                    logger.error(f"删除任务失败: {error_msg}")
-                    return {"success": False, "error": error_msg, "task_id": task_id}
+            response = self._send("DELETE", url)
+
+            # 根据官方文档，200和201都表示成功
+            if response.status_code in [200, 201]:
+                logger.warning(
+                    f"删除API返回成功 (状态码: {response.status_code})，但可能需要手动确认删除"
+                )
+                logger.warning(f"请在滴答清单App中检查任务 {task_id} 是否真的被删除")
+                return {
+                    "success": True,
+                    "task_id": task_id,
+                    "status_code": response.status_code,
+                    "warning": "删除API可能不可靠，请手动确认删除",
+                }
+            elif response.status_code == 404:
+                # 任务不存在
+                logger.info(f"任务不存在: {task_id}")
+                return {
+                    "success": True,
+                    "task_id": task_id,
+                    "status_code": 404,
+                    "note": "任务不存在",
+                }
+            elif response.status_code == 401:
+                error_msg = "访问令牌无效或已过期"
+                logger.error(f"删除任务失败: {error_msg}")
+                return {"success": False, "error": error_msg, "task_id": task_id}
+            elif response.status_code == 403:
+                error_msg = "没有权限删除此任务"
+                logger.error(f"删除任务失败: {error_msg}")
+                return {"success": False, "error": error_msg, "task_id": task_id}
+            else:
+                error_msg = f"HTTP {response.status_code}: {response.text}"
+                logger.error(f"删除任务失败: {error_msg}")
+                return {"success": False, "error": error_msg, "task_id": task_id}
 
+        except (CircuitOpenError, RetryableHTTPError) as e:
+            error_msg = f"删除任务失败: {e}"
+            logger.error(error_msg)
+            return {"success": False, "error": error_msg, "task_id": task_id}
         except httpx.RequestError as e:
             error_msg = f"网络请求错误: {e}"
             logger.error(error_msg)
@@ -72,11 +72,37 @@ class APIConfig(BaseSettings):
     # 通用HTTP配置
     http_timeout: int = Field(default=30, ge=1, description="HTTP请求超时时间(秒)")
     http_retries: int = Field(default=3, ge=0, description="HTTP请求重试次数")
+    circuit_breaker_threshold: int = Field(
+        default=5, ge=1, description="同一上游连续失败多少次后熔断"
+    )
+    circuit_breaker_reset_seconds: int = Field(
+        default=60, ge=1, description="熔断后允许试探请求前的冷却时间(秒)"
+    )
     user_agent: str = Field(
         default="ArXiv-Follow/1.0.0 (Academic Research Tool)",
         description="User-Agent字符串",
     )
 
+    # 共享连接池配置
+    http_max_connections: int = Field(default=20, ge=1, description="连接池最大连接数")
+    http_max_keepalive_connections: int = Field(
+        default=10, ge=0, description="连接池最大保持连接数"
+    )
+    http_keepalive_expiry: float = Field(
+        default=30.0, ge=0, description="空闲连接保持时间(秒)"
+    )
+    http2_enabled: bool = Field(
+        default=False, description='是否启用HTTP/2（需要安装 "httpx[http2]"）'
+    )
+
+    # LLM请求配置
+    llm_timeout_seconds: float = Field(
+        default=60.0, gt=0, description="LLM请求超时时间(秒)"
+    )
+    llm_max_connections: int = Field(
+        default=10, ge=1, description="LLM客户端连接池最大连接数"
+    )
+
     class Config:
         """Pydantic配置"""
 
@@ -107,6 +133,18 @@ class IntegrationConfig(BaseModel):
     ai_analysis_enabled: bool = Field(default=False, description="是否启用AI分析")
     ai_temperature: float = Field(default=0.3, ge=0, le=2, description="AI温度参数")
     ai_max_tokens: int = Field(default=2048, ge=1, description="AI最大令牌数")
+    ai_merge_comprehensive: bool = Field(
+        default=False,
+        description="综合分析是否合并为单次结构化输出调用（否则并发执行各项分析）",
+    )
+    ai_batch_scoring: bool = Field(
+        default=False,
+        description="监控时是否把多篇论文合并到一次请求中进行重要性评分",
+    )
+    ai_structured_output: bool = Field(
+        default=False,
+        description="重要性分析是否使用 JSON Schema 约束的结构化输出",
+    )
 
     @property
     def ai_model(self) -> str:
@@ -134,11 +172,31 @@ class StorageConfig(BaseModel):
 
     # 数据库配置
     database_url: str | None = Field(None, description="数据库连接URL")
+    local_search: bool = Field(
+        default=False,
+        description="是否在论文存储上启用本地全文检索(LOCAL 搜索和混合搜索的本地阶段)",
+    )
 
     # 缓存配置
     enable_cache: bool = Field(default=True, description="是否启用缓存")
     cache_ttl_seconds: int = Field(default=3600, ge=0, description="缓存生存时间(秒)")
     max_cache_size_mb: int = Field(default=500, ge=1, description="最大缓存大小(MB)")
+    analysis_cache_ttl_seconds: int = Field(
+        default=30 * 24 * 3600, ge=0, description="AI分析结果缓存生存时间(秒)"
+    )
+    translation_cache_ttl_seconds: int = Field(
+        default=90 * 24 * 3600, ge=0, description="报告片段译文缓存生存时间(秒)"
+    )
+    content_cache_ttl_seconds: int = Field(
+        default=30 * 24 * 3600,
+        ge=0,
+        description="论文HTML和研究者表格的校验器(ETag/Last-Modified)保留时间(秒)",
+    )
+    negative_cache_ttl_seconds: int = Field(
+        default=24 * 3600,
+        ge=0,
+        description="资源不存在(如无HTML版本)结果的缓存时间(秒)",
+    )
 
 
 class MonitoringConfig(BaseModel):
@@ -161,9 +219,48 @@ class MonitoringConfig(BaseModel):
     max_papers_per_check: int = Field(
         default=100, ge=1, description="每次检查最大论文数"
     )
+    combined_author_queries: bool = Field(
+        default=False,
+        description="研究者监控是否将多位研究者合并为 OR 查询（走 arXiv API；否则逐个检索网页搜索结果）",
+    )
+    incremental_monitoring: bool = Field(
+        default=False,
+        description="是否按水位线增量监控（只处理上次运行后新出现的论文）",
+    )
+    include_updated_versions: bool = Field(
+        default=False, description="增量监控时是否重新处理已见论文的新版本"
+    )
+    analysis_concurrency: int = Field(
+        default=5, ge=1, description="监控时AI分析的最大并发数"
+    )
+    analysis_deadline_seconds: float | None = Field(
+        default=120.0,
+        gt=0,
+        description="监控时AI分析的整体截止时间(秒)，超时的论文使用默认评分",
+    )
+    prerank_enabled: bool = Field(
+        default=False,
+        description="主题监控是否先在本地按相关性预排序，只把排名靠前的论文交给AI分析",
+    )
+    prerank_top_k: int = Field(
+        default=30, ge=1, description="预排序后交给AI分析的最大论文数"
+    )
+    prerank_keywords: list[str] = Field(
+        default_factory=list, description="预排序使用的关注关键词"
+    )
+    prerank_profile_size: int = Field(
+        default=50,
+        ge=0,
+        description="构建兴趣画像时使用的历史高分论文数(0表示不使用画像)",
+    )
 
     # 过滤配置
-    min_paper_score: float = Field(default=5.0, ge=0, le=10, description="最低论文评分")
+    min_paper_score: float = Field(
+        default=5.0,
+        ge=0,
+        le=10,
+        description="最低论文评分（启用预排序时低于该评分的主题论文不进入结果）",
+    )
     exclude_categories: list[str] = Field(
         default_factory=list, description="排除的分类"
     )
@@ -206,6 +303,9 @@ class AppConfig(BaseSettings):
     max_requests_per_minute: int = Field(
         default=60, ge=1, description="每分钟最大请求数"
     )
+    rate_limit_burst: int = Field(
+        default=5, ge=1, description="限流令牌桶容量(允许的突发请求数)"
+    )
 
     class Config:
         """Pydantic设置配置"""
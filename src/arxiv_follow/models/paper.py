@@ -159,6 +159,7 @@ class PaperAnalysis(BaseModel):
     methodology: str | None = Field(None, description="方法论分析")
     contributions: list[str] = Field(default_factory=list, description="主要贡献")
     limitations: list[str] = Field(default_factory=list, description="局限性")
+    keywords: list[str] = Field(default_factory=list, description="关键词")
 
     # 分析元信息
     model_used: str = Field(..., description="使用的AI模型")
@@ -19,6 +19,7 @@ class SearchType(str, Enum):
     KEYWORD = "keyword"  # 按关键词搜索
     CATEGORY = "category"  # 按分类搜索
     HYBRID = "hybrid"  # 混合搜索
+    LOCAL = "local"  # 本地全文检索（已存储的论文）
 
 
 class SortOrder(str, Enum):
@@ -148,6 +149,10 @@ class SearchMetrics(BaseModel):
     total_returned: int = Field(default=0, description="返回的数量")
     search_time_ms: float = Field(default=0, description="搜索时间(毫秒)")
 
+    # 缓存指标
+    cache_hits: int = Field(default=0, description="缓存命中次数")
+    cache_misses: int = Field(default=0, description="缓存未命中次数")
+
     # 质量指标
     avg_relevance_score: float | None = Field(None, description="平均相关性评分")
     high_quality_count: int = Field(default=0, description="高质量论文数量")
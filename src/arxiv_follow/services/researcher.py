@@ -3,6 +3,7 @@
 研究者服务模块 - 从 Google Sheets TSV 链接获取研究者列表并检索他们发布的论文
 """
 
+import asyncio
 import csv
 import io
 import re
@@ -12,18 +13,73 @@ from urllib.parse import urlencode
 
 import httpx
 
+from ..core.collector import ArxivCollector
+from ..core.conditional import get_content_cache
+from ..core.http import create_async_client, get_http_client
+from ..core.ratelimit import get_rate_limiter
+from ..core.resilience import call_with_retry, raise_for_retryable
+from ..models.config import AppConfig, load_config
+from ..storage import split_arxiv_id
+
+# 搜索结果页解析用的预编译正则
+_RESULT_OPEN = '<li class="arxiv-result">'
+_RESULT_CLOSE = "</li>"
+_TOTAL_RE = re.compile(r"Showing 1–\d+ of ([\d,]+) results")
+_ID_RE = re.compile(
+    r'<a href="https://arxiv\.org/abs/(\d{4}\.\d{4,5})">arXiv:(\d{4}\.\d{4,5})</a>'
+)
+_TITLE_RE = re.compile(r'<p class="title is-5 mathjax"[^>]*>\s*(.*?)\s*</p>', re.DOTALL)
+_AUTHORS_RE = re.compile(
+    r'<p class="authors"[^>]*>.*?<span[^>]+>Authors:</span>(.*?)</p>', re.DOTALL
+)
+_AUTHOR_LINK_RE = re.compile(r"<a[^>]+>(.*?)</a>")
+_SUBJECT_RE = re.compile(
+    r'<span class="tag[^"]*"[^>]*data-tooltip="([^"]+)"[^>]*>([^<]+)</span>'
+)
+# (小写标记, 起始标签, 模式)：按优先级排列，标记用于快速定位和跳过不可能匹配的模式
+_ABSTRACT_PATTERNS = [
+    (
+        "abstract-full",
+        "<span",
+        re.compile(
+            r'<span[^>]*class="[^"]*abstract-full[^"]*"[^>]*[^>]*>(.*?)</span>',
+            re.DOTALL | re.IGNORECASE,
+        ),
+    ),
+    (
+        "abstract",
+        "<p",
+        re.compile(
+            r'<p[^>]*class="[^"]*abstract[^"]*"[^>]*>.*?<span[^>]+>Abstract[^<]*</span>:\s*(.*?)</p>',
+            re.DOTALL | re.IGNORECASE,
+        ),
+    ),
+    (
+        "abstract-short",
+        "<span",
+        re.compile(
+            r'<span[^>]*class="[^"]*abstract-short[^"]*"[^>]*[^>]*>(.*?)</span>',
+            re.DOTALL | re.IGNORECASE,
+        ),
+    ),
+]
+_SUBMITTED_RE = re.compile(r"<span[^>]+>Submitted</span>\s+([^;]+);")
+_COMMENTS_RE = re.compile(
+    r'<p class="comments[^"]*"[^>]*>.*?<span[^>]+>Comments:</span>\s*<span[^>]*>(.*?)</span>',
+    re.DOTALL,
+)
+_TAG_RE = re.compile(r"<[^>]+>")
+_LINK_RE = re.compile(r"<a[^>]*>.*?</a>")
+_HELLIP_RE = re.compile(r"&hellip;.*")
+
 
 class ResearcherService:
     """研究者服务类 - 提供研究者数据获取和论文检索服务"""
 
     def __init__(self):
         """初始化研究者服务"""
-        self.client = httpx.Client(follow_redirects=True, timeout=30.0)
-
-    def __del__(self):
-        """清理资源"""
-        if hasattr(self, "client"):
-            self.client.close()
+        # 复用进程级共享连接池（生命周期由 core.http 管理）
+        self.client = get_http_client()
 
     def fetch_researchers_from_tsv(self, url: str) -> list[dict[str, Any]]:
         """获取研究者数据"""
@@ -40,6 +96,8 @@ def fetch_researchers_from_tsv(url: str) -> list[dict[str, Any]]:
     """
     从 TSV URL 获取研究者数据
 
+    启用缓存时发送条件请求，表格未变化（304）时使用上次下载的内容。
+
     Args:
         url: Google Sheets TSV 导出链接
 
@@ -47,14 +105,25 @@ def fetch_researchers_from_tsv(url: str) -> list[dict[str, Any]]:
         研究者数据列表
     """
     try:
-        # 使用 httpx 获取 TSV 数据，允许重定向
-        with httpx.Client(follow_redirects=True) as client:
-            response = client.get(url)
+        # 使用共享客户端获取 TSV 数据，允许重定向
+        cache = get_content_cache()
+        if cache is not None:
+            result = cache.fetch_sync(get_http_client(), url)
+            if result["status_code"] != 200:
+                print(f"获取研究者数据失败: HTTP {result['status_code']}")
+                return []
+            tsv_content = result["text"]
+            from_cache = result["from_cache"]
+        else:
+            response = get_http_client().get(url)
             response.raise_for_status()
+            tsv_content = response.text
+            from_cache = False
 
-        # 解析 TSV 数据
-        tsv_content = response.text
-        print(f"获取到的原始数据:\n{tsv_content}\n")
+        print(
+            f"获取到研究者数据: {len(tsv_content)} 字符"
+            + ("（未变化，使用缓存）" if from_cache else "")
+        )
 
         # 使用 csv 模块解析 TSV
         csv_reader = csv.reader(io.StringIO(tsv_content), delimiter="\t")
@@ -170,10 +239,55 @@ def build_arxiv_search_url(author_name: str, date_from: str, date_to: str) -> st
     return f"{base_url}?{urlencode(params)}"
 
 
+def _iter_result_blocks(html_content: str):
+    """按顺序产出每个 <li class="arxiv-result"> 结果块的内容"""
+    pos = 0
+    while True:
+        start = html_content.find(_RESULT_OPEN, pos)
+        if start < 0:
+            return
+        start += len(_RESULT_OPEN)
+        end = html_content.find(_RESULT_CLOSE, start)
+        if end < 0:
+            return
+        yield html_content[start:end]
+        pos = end + len(_RESULT_CLOSE)
+
+
+def _clean_text(text: str) -> str:
+    """去掉HTML标签并合并空白"""
+    return " ".join(_TAG_RE.sub("", text).split())
+
+
+def _extract_abstract(block: str) -> str | None:
+    """按优先级提取摘要（完整摘要 > 摘要段落 > 短摘要）"""
+    block_lower = block.lower()
+    for marker, tag, pattern in _ABSTRACT_PATTERNS:
+        # 不包含标记的结果块不可能匹配，跳过代价较高的不区分大小写扫描
+        marker_pos = block_lower.find(marker)
+        if marker_pos < 0:
+            continue
+        # 匹配只可能从包含标记的标签开始，从该标签处开始搜索
+        start = max(block_lower.rfind(tag, 0, marker_pos), 0)
+        abstract_match = pattern.search(block, start)
+        if abstract_match:
+            abstract = abstract_match.group(1).strip()
+            # 清理HTML标签、链接和多余空白
+            abstract = _LINK_RE.sub("", abstract)  # 移除More/Less链接
+            abstract = _TAG_RE.sub("", abstract)
+            abstract = _HELLIP_RE.sub("", abstract)  # 移除省略号及后续内容
+            abstract = " ".join(abstract.split())
+            if len(abstract) > 20:  # 确保不是空的或太短的内容
+                return abstract
+    return None
+
+
 def parse_arxiv_search_results(html_content: str) -> list[dict[str, Any]]:
     """
     解析 arXiv 搜索结果页面
 
+    所有正则在模块加载时预编译，结果块用字符串查找切分，每个块只遍历一次。
+
     Args:
         html_content: HTML 内容
 
@@ -187,99 +301,55 @@ def parse_arxiv_search_results(html_content: str) -> list[dict[str, Any]]:
         return papers
 
     # 提取结果总数
-    total_pattern = r"Showing 1–\d+ of ([\d,]+) results"
-    total_match = re.search(total_pattern, html_content)
-    total_count = 0
-    if total_match:
-        total_count = int(total_match.group(1).replace(",", ""))
+    total_match = _TOTAL_RE.search(html_content)
+    total_count = int(total_match.group(1).replace(",", "")) if total_match else 0
 
-    # 查找论文条目 - 使用实际的HTML结构
-    paper_pattern = r'<li class="arxiv-result">(.*?)</li>'
-    paper_matches = re.findall(paper_pattern, html_content, re.DOTALL)
-
-    for match in paper_matches:
-        paper = {"total_results": total_count}
+    for block in _iter_result_blocks(html_content):
+        paper: dict[str, Any] = {"total_results": total_count}
 
         # 提取arXiv ID和URL
-        id_pattern = r'<a href="https://arxiv\.org/abs/(\d{4}\.\d{4,5})">arXiv:(\d{4}\.\d{4,5})</a>'
-        id_match = re.search(id_pattern, match)
+        id_match = _ID_RE.search(block)
         if id_match:
             paper["arxiv_id"] = id_match.group(1)
             paper["url"] = f"https://arxiv.org/abs/{paper['arxiv_id']}"
 
         # 提取标题
-        title_pattern = r'<p class="title is-5 mathjax"[^>]*>\s*(.*?)\s*</p>'
-        title_match = re.search(title_pattern, match, re.DOTALL)
+        title_match = _TITLE_RE.search(block)
         if title_match:
-            title = title_match.group(1).strip()
-            # 清理HTML标签
-            title = re.sub(r"<[^>]+>", "", title)
-            title = re.sub(r"\s+", " ", title).strip()
+            title = _clean_text(title_match.group(1).strip())
             if title:
                 paper["title"] = title
 
         # 提取作者
-        authors_pattern = (
-            r'<p class="authors"[^>]*>.*?<span[^>]+>Authors:</span>(.*?)</p>'
-        )
-        authors_match = re.search(authors_pattern, match, re.DOTALL)
+        authors_match = _AUTHORS_RE.search(block)
         if authors_match:
-            authors_html = authors_match.group(1)
-            # 提取所有作者链接
-            author_links = re.findall(r"<a[^>]+>(.*?)</a>", authors_html)
-            if author_links:
-                authors = [
-                    re.sub(r"<[^>]+>", "", author).strip() for author in author_links
-                ]
-                authors = [author for author in authors if author]  # 过滤空字符串
-                if authors:
-                    paper["authors"] = authors
+            authors = [
+                _TAG_RE.sub("", author).strip()
+                for author in _AUTHOR_LINK_RE.findall(authors_match.group(1))
+            ]
+            authors = [author for author in authors if author]  # 过滤空字符串
+            if authors:
+                paper["authors"] = authors
 
         # 提取学科分类
-        subjects = []
-        subject_pattern = (
-            r'<span class="tag[^"]*"[^>]*data-tooltip="([^"]+)"[^>]*>([^<]+)</span>'
-        )
-        subject_matches = re.findall(subject_pattern, match)
-        for _tooltip, subject_code in subject_matches:
-            subjects.append(subject_code.strip())
+        subjects = [code.strip() for _tooltip, code in _SUBJECT_RE.findall(block)]
         if subjects:
             paper["subjects"] = subjects
 
-        # 提取摘要 - 优先获取完整摘要
-        abstract_patterns = [
-            # 优先提取完整摘要
-            r'<span[^>]*class="[^"]*abstract-full[^"]*"[^>]*[^>]*>(.*?)</span>',
-            # 备选：普通摘要段落
-            r'<p[^>]*class="[^"]*abstract[^"]*"[^>]*>.*?<span[^>]+>Abstract[^<]*</span>:\s*(.*?)</p>',
-            # 备选：abstract-short（如果没有full版本）
-            r'<span[^>]*class="[^"]*abstract-short[^"]*"[^>]*[^>]*>(.*?)</span>',
-        ]
-
-        for pattern in abstract_patterns:
-            abstract_match = re.search(pattern, match, re.DOTALL | re.IGNORECASE)
-            if abstract_match:
-                abstract = abstract_match.group(1).strip()
-                # 清理HTML标签、链接和多余空白
-                abstract = re.sub(r"<a[^>]*>.*?</a>", "", abstract)  # 移除More/Less链接
-                abstract = re.sub(r"<[^>]+>", "", abstract)
-                abstract = re.sub(r"&hellip;.*", "", abstract)  # 移除省略号及后续内容
-                abstract = re.sub(r"\s+", " ", abstract).strip()
-                if len(abstract) > 20:  # 确保不是空的或太短的内容
-                    paper["abstract"] = abstract
-                    break
+        # 提取摘要
+        abstract = _extract_abstract(block)
+        if abstract:
+            paper["abstract"] = abstract
 
         # 提取提交日期
-        submitted_pattern = r"<span[^>]+>Submitted</span>\s+([^;]+);"
-        submitted_match = re.search(submitted_pattern, match)
+        submitted_match = _SUBMITTED_RE.search(block)
         if submitted_match:
             paper["submitted_date"] = submitted_match.group(1).strip()
 
         # 提取评论信息
-        comments_pattern = r'<p class="comments[^"]*"[^>]*>.*?<span[^>]+>Comments:</span>\s*<span[^>]*>(.*?)</span>'
-        comments_match = re.search(comments_pattern, match, re.DOTALL)
+        comments_match = _COMMENTS_RE.search(block)
         if comments_match:
-            comments = re.sub(r"<[^>]+>", "", comments_match.group(1)).strip()
+            comments = _TAG_RE.sub("", comments_match.group(1)).strip()
             if comments:
                 paper["comments"] = comments
 
@@ -309,10 +379,9 @@ def fetch_papers_for_researcher(
         search_url = build_arxiv_search_url(author_name, date_from, date_to)
         print(f"搜索 {author_name} 的论文: {search_url}")
 
-        # 获取搜索结果页面
-        with httpx.Client(follow_redirects=True, timeout=30.0) as client:
-            response = client.get(search_url)
-            response.raise_for_status()
+        # 获取搜索结果页面（复用共享连接池）
+        response = get_http_client().get(search_url)
+        response.raise_for_status()
 
         # 解析搜索结果
         papers = parse_arxiv_search_results(response.text)
@@ -328,6 +397,246 @@ def fetch_papers_for_researcher(
         return []
 
 
+async def fetch_papers_for_researcher_async(
+    client: httpx.AsyncClient,
+    author_name: str,
+    date_from: str,
+    date_to: str,
+    timeout: float | None = None,
+    config: AppConfig | None = None,
+) -> list[dict[str, Any]]:
+    """
+    异步获取特定研究者在指定日期范围内的论文
+
+    Args:
+        client: 异步HTTP客户端
+        author_name: 研究者姓名
+        date_from: 开始日期
+        date_to: 结束日期
+        timeout: 单次请求的超时时间(秒)，从获取限流令牌后开始计时
+        config: 应用配置，默认加载全局配置
+
+    Returns:
+        论文列表
+
+    Raises:
+        httpx.HTTPError: 请求失败
+        TimeoutError: 请求超时
+        CircuitOpenError: arXiv 熔断中
+    """
+    config = config or load_config()
+    search_url = build_arxiv_search_url(author_name, date_from, date_to)
+
+    async def fetch() -> httpx.Response:
+        return raise_for_retryable(
+            await asyncio.wait_for(client.get(search_url), timeout=timeout)
+        )
+
+    # 429/5xx 和网络错误按 http_retries 退避重试；排队等待令牌的时间不计入超时
+    response = await call_with_retry(
+        fetch,
+        search_url,
+        config.api.http_retries,
+        rate_limiter=get_rate_limiter(config),
+    )
+    response.raise_for_status()
+
+    papers = parse_arxiv_search_results(response.text)
+    for paper in papers:
+        paper["queried_author"] = author_name
+
+    return papers
+
+
+async def fetch_papers_for_researchers_async(
+    author_names: list[str],
+    date_from: str,
+    date_to: str,
+    concurrency: int | None = None,
+    timeout: float | None = None,
+) -> dict[str, list[dict[str, Any]]]:
+    """
+    并发获取多位研究者的论文
+
+    Args:
+        author_names: 研究者姓名列表
+        date_from: 开始日期
+        date_to: 结束日期
+        concurrency: 最大并发数，默认使用 max_concurrent_requests
+        timeout: 单个研究者每次请求的超时时间(秒)，默认使用 http_timeout
+
+    Returns:
+        按研究者分组的论文字典（顺序与输入一致，仅包含有论文的研究者）
+    """
+    config = load_config()
+    semaphore = asyncio.Semaphore(concurrency or config.max_concurrent_requests)
+    timeout = timeout or float(config.api.http_timeout)
+
+    # 去重并保持顺序
+    names = list(dict.fromkeys(author_names))
+
+    async with create_async_client(config) as client:
+
+        async def fetch_one(author_name: str) -> list[dict[str, Any]]:
+            async with semaphore:
+                try:
+                    return await fetch_papers_for_researcher_async(
+                        client,
+                        author_name,
+                        date_from,
+                        date_to,
+                        timeout=timeout,
+                        config=config,
+                    )
+                except TimeoutError:
+                    print(f"获取 {author_name} 的论文超时 ({timeout:.0f}s)")
+                except Exception as e:
+                    print(f"获取 {author_name} 的论文时出错: {e}")
+                return []
+
+        results = await asyncio.gather(*(fetch_one(name) for name in names))
+
+    return {name: papers for name, papers in zip(names, results, strict=True) if papers}
+
+
+def _to_search_result_format(paper_data: dict[str, Any]) -> dict[str, Any]:
+    """将 API 论文数据转换为与网页搜索结果一致的格式"""
+    base_id = split_arxiv_id(paper_data["arxiv_id"])[0]
+    paper: dict[str, Any] = {
+        "arxiv_id": base_id,
+        "url": f"https://arxiv.org/abs/{base_id}",
+        "title": paper_data.get("title", ""),
+        "authors": paper_data.get("authors", []),
+        "abstract": re.sub(r"\s+", " ", paper_data.get("abstract", "")).strip(),
+        "subjects": paper_data.get("categories", []),
+    }
+
+    submitted = paper_data.get("submitted_date")
+    if isinstance(submitted, datetime):
+        # 与网页搜索结果的日期格式保持一致，如 "14 January, 2025"
+        paper["submitted_date"] = f"{submitted.day} {submitted:%B, %Y}"
+
+    return paper
+
+
+async def fetch_papers_for_researchers_combined(
+    author_names: list[str], date_from: str, date_to: str
+) -> dict[str, list[dict[str, Any]]]:
+    """
+    用合并的 OR 查询获取多位研究者的论文
+
+    将研究者打包为少量 ArXiv API 查询（au:"A" OR au:"B" ...），
+    再按姓名匹配分回各研究者，请求数从 O(研究者数) 降为 O(研究者数 / 分组大小)。
+
+    Args:
+        author_names: 研究者姓名列表
+        date_from: 开始日期 (YYYY-MM-DD)
+        date_to: 结束日期 (YYYY-MM-DD)
+
+    Returns:
+        按研究者分组的论文字典（顺序与输入一致，仅包含有论文的研究者）
+    """
+    start = datetime.strptime(date_from, "%Y-%m-%d").date()
+    end = datetime.strptime(date_to, "%Y-%m-%d").date()
+
+    async with ArxivCollector(load_config()) as collector:
+        results = await collector.search_authors_combined(
+            author_names, date_from=start, date_to=end
+        )
+
+    all_papers = {}
+    for author_name, papers_data in results.items():
+        papers = [_to_search_result_format(paper) for paper in papers_data]
+        for paper in papers:
+            paper["queried_author"] = author_name
+        if papers:
+            all_papers[author_name] = papers
+
+    return all_papers
+
+
+def get_researcher_name(researcher: dict[str, Any] | str) -> str:
+    """
+    获取研究者姓名（测试数据返回空字符串）
+
+    Args:
+        researcher: 研究者数据
+
+    Returns:
+        研究者姓名
+    """
+    if isinstance(researcher, dict):
+        if "name" in researcher:
+            author_name = researcher["name"]
+        else:
+            # 取第一个非空值作为姓名
+            author_name = next((v for v in researcher.values() if v.strip()), "")
+    else:
+        author_name = str(researcher)
+
+    if not author_name or author_name.lower() in ["aaa", "test"]:  # 跳过测试数据
+        return ""
+
+    return author_name
+
+
+async def get_today_papers_for_all_researchers_async(
+    researchers: list[dict[str, Any]],
+    concurrency: int | None = None,
+    timeout: float | None = None,
+) -> dict[str, list[dict[str, Any]]]:
+    """
+    并发获取所有研究者今天发布的论文
+
+    Args:
+        researchers: 研究者列表
+        concurrency: 最大并发数
+        timeout: 单个研究者的超时时间(秒)
+
+    Returns:
+        按研究者分组的论文字典
+    """
+    date_str = datetime.now().strftime("%Y-%m-%d")
+    names = [name for name in map(get_researcher_name, researchers) if name]
+
+    print(f"\n正在并发搜索 {len(names)} 位研究者在 {date_str} 当天发布的论文...")
+    return await fetch_papers_for_researchers_async(
+        names, date_str, date_str, concurrency=concurrency, timeout=timeout
+    )
+
+
+async def get_recent_papers_for_researchers_async(
+    researchers: list[dict[str, Any]],
+    days: int = 7,
+    concurrency: int | None = None,
+    timeout: float | None = None,
+) -> dict[str, list[dict[str, Any]]]:
+    """
+    并发获取所有研究者最近几天发布的论文
+
+    Args:
+        researchers: 研究者列表
+        days: 搜索最近几天
+        concurrency: 最大并发数
+        timeout: 单个研究者的超时时间(秒)
+
+    Returns:
+        按研究者分组的论文字典
+    """
+    today = datetime.now()
+    start_date_str = (today - timedelta(days=days)).strftime("%Y-%m-%d")
+    end_date_str = today.strftime("%Y-%m-%d")
+    names = [name for name in map(get_researcher_name, researchers) if name]
+
+    print(
+        f"\n正在并发搜索 {len(names)} 位研究者在 "
+        f"{start_date_str} 到 {end_date_str} 期间发布的论文..."
+    )
+    return await fetch_papers_for_researchers_async(
+        names, start_date_str, end_date_str, concurrency=concurrency, timeout=timeout
+    )
+
+
 def get_today_papers_for_all_researchers(
     researchers: list[dict[str, Any]],
 ) -> dict[str, list[dict[str, Any]]]:
@@ -350,17 +659,8 @@ def get_today_papers_for_all_researchers(
     all_papers = {}
 
     for researcher in researchers:
-        # 获取研究者姓名
-        if isinstance(researcher, dict):
-            if "name" in researcher:
-                author_name = researcher["name"]
-            else:
-                # 取第一个非空值作为姓名
-                author_name = next((v for v in researcher.values() if v.strip()), "")
-        else:
-            author_name = str(researcher)
-
-        if not author_name or author_name.lower() in ["aaa", "test"]:  # 跳过测试数据
+        author_name = get_researcher_name(researcher)
+        if not author_name:
             continue
 
         print(f"\n正在搜索 {author_name} 的论文...")
@@ -486,17 +786,8 @@ def get_recent_papers_for_researchers(
     all_papers = {}
 
     for researcher in researchers:
-        # 获取研究者姓名
-        if isinstance(researcher, dict):
-            if "name" in researcher:
-                author_name = researcher["name"]
-            else:
-                # 取第一个非空值作为姓名
-                author_name = next((v for v in researcher.values() if v.strip()), "")
-        else:
-            author_name = str(researcher)
-
-        if not author_name or author_name.lower() in ["aaa", "test"]:  # 跳过测试数据
+        author_name = get_researcher_name(researcher)
+        if not author_name:
             continue
 
         print(f"\n正在搜索 {author_name} 的论文...")
@@ -528,8 +819,10 @@ def main():
     display_researchers(researchers)
 
     if researchers:
-        # 获取所有研究者今天发布的论文
-        all_papers = get_today_papers_for_all_researchers(researchers)
+        # 并发获取所有研究者今天发布的论文
+        all_papers = asyncio.run(
+            get_today_papers_for_all_researchers_async(researchers)
+        )
 
         # 显示论文结果
         display_papers(all_papers)
@@ -537,7 +830,9 @@ def main():
         # 如果今天没有找到论文，搜索最近一周的论文
         if not all_papers:
             print("\n💡 今天没有新论文，让我们搜索最近一周的论文...")
-            recent_papers = get_recent_papers_for_researchers(researchers, days=7)
+            recent_papers = asyncio.run(
+                get_recent_papers_for_researchers_async(researchers, days=7)
+            )
             if recent_papers:
                 print("\n📚 最近一周的论文 (注意：这些不是今天发布的):")
                 display_papers(recent_papers)
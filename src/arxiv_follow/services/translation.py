@@ -6,26 +6,67 @@ LLM翻译服务模块 - 使用OpenRouter API进行中英双语翻译
 import json
 import logging
 import os
+import re
+import threading
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 
+import openai
 from openai import OpenAI
 
-from ..config.models import get_default_model
+from ..config.models import get_default_model, get_model_context_tokens
+from ..core.jsonparse import parse_json_response
+from ..core.memo import TranslationMemory
+from ..core.ratelimit import get_rate_limiter
+from ..core.resilience import call_with_retry_sync
+from ..core.tokens import estimate_tokens, pack_by_budget, split_by_tokens
+from ..models.config import AppConfig, load_config
 
 # 配置日志
 logger = logging.getLogger(__name__)
 
+# 单次翻译请求的内容令牌上限，超出时按段落切分后并发翻译再拼接
+TRANSLATION_CHUNK_TOKENS = 1200
+# 分段翻译的最大并发数
+TRANSLATION_MAX_WORKERS = 4
+# 计入熔断器的OpenAI SDK异常（连接失败、超时、限流和服务端错误）
+OPENAI_RETRYABLE_ERRORS = (
+    openai.APIConnectionError,
+    openai.RateLimitError,
+    openai.InternalServerError,
+)
+# 片段翻译提示词模板版本（修改提示词时递增，使旧的译文缓存失效）
+SEGMENT_PROMPT_VERSION = "1"
+# 每个片段在批量请求中的额外令牌开销（JSON引号和分隔符）
+SEGMENT_OVERHEAD_TOKENS = 4
+
+# 行首的格式前缀：缩进、列表符号、标题标记、加粗标记和序号
+_SEGMENT_PREFIX_RE = re.compile(r"^\s*(?:(?:[#>*•-]+|\d+\.(?=\s))\s*)*")
+# 判断是否需要翻译时忽略的代码片段和链接
+_CODE_OR_URL_RE = re.compile(r"`[^`]*`|https?://\S+")
+_CJK_RE = re.compile(r"[\u4e00-\u9fff]")
+_LATIN_WORD_RE = re.compile(r"[A-Za-z]{2,}")
+
 
 class TranslationService:
     """LLM翻译服务类"""
 
-    def __init__(self, api_key: str | None = None, model: str | None = None):
+    def __init__(
+        self,
+        api_key: str | None = None,
+        model: str | None = None,
+        memory: TranslationMemory | None = None,
+        config: AppConfig | None = None,
+    ):
         """
         初始化翻译服务客户端
 
         Args:
             api_key: OpenRouter API密钥，如果不提供会从环境变量读取
             model: 使用的模型名称，如果不提供会使用默认模型
+            memory: 片段译文记忆，不提供时按存储配置在首次翻译时创建
+            config: 应用配置（限流和译文缓存设置），不提供时在首次使用时加载
         """
         from ..config.models import SUPPORTED_MODELS
 
@@ -40,6 +81,15 @@ class TranslationService:
                 self.model = model
         else:
             self.model = get_default_model()
+        self.context_tokens = get_model_context_tokens(self.model)
+
+        # 令牌用量统计（分段翻译时多个线程并发更新）
+        self._usage = {"calls": 0, "prompt_tokens": 0, "completion_tokens": 0}
+        self._usage_lock = threading.Lock()
+
+        self._config = config
+        self._memory = memory
+        self._memory_resolved = memory is not None
 
         # 初始化OpenAI客户端，配置为使用OpenRouter
         if self.api_key:
@@ -60,12 +110,119 @@ class TranslationService:
         """检查翻译服务是否可用"""
         return bool(self.api_key and self.client)
 
+    def usage_stats(self) -> dict[str, int]:
+        """获取令牌用量统计（调用数、输入和输出令牌数）"""
+        with self._usage_lock:
+            return dict(self._usage)
+
+    def _complete(self, prompt: str, max_tokens: int, **kwargs: Any) -> str:
+        """
+        发送一次补全请求并记录令牌用量
+
+        Args:
+            prompt: 提示词
+            max_tokens: 最大输出令牌数
+            **kwargs: 其他请求参数
+
+        Returns:
+            去除首尾空白的响应内容
+
+        Raises:
+            ValueError: 提示词超出模型上下文
+            CircuitOpenError: OpenRouter 熔断中
+        """
+        prompt_tokens = estimate_tokens(prompt)
+        if prompt_tokens + max_tokens > self.context_tokens:
+            raise ValueError(
+                f"提示词约 {prompt_tokens} 令牌，超出模型上下文 {self.context_tokens}"
+            )
+
+        # OpenAI SDK 自带退避重试（遵循 Retry-After），这里只经过熔断器：
+        # OpenRouter 降级时后续分段直接失败，不再逐个等待超时
+        response = call_with_retry_sync(
+            lambda: self.client.chat.completions.create(
+                model=self.model,
+                messages=[{"role": "user", "content": prompt}],
+                max_tokens=max_tokens,
+                **kwargs,
+            ),
+            self.base_url,
+            retries=0,
+            rate_limiter=get_rate_limiter(self.config),
+            retry_on=OPENAI_RETRYABLE_ERRORS,
+        )
+        content = (response.choices[0].message.content or "").strip()
+
+        usage = getattr(response, "usage", None)
+        tokens_in = getattr(usage, "prompt_tokens", None) or prompt_tokens
+        tokens_out = getattr(usage, "completion_tokens", None) or estimate_tokens(
+            content
+        )
+        with self._usage_lock:
+            self._usage["calls"] += 1
+            self._usage["prompt_tokens"] += tokens_in
+            self._usage["completion_tokens"] += tokens_out
+        logger.debug(f"翻译请求完成，令牌: 输入 {tokens_in} / 输出 {tokens_out}")
+        return content
+
+    def _translate_in_chunks(
+        self,
+        translate: Callable[[str, str], dict[str, Any]],
+        title: str,
+        content: str,
+    ) -> dict[str, Any]:
+        """
+        超长内容按段落切分后并发翻译，再按原顺序拼接
+
+        Args:
+            translate: 翻译单段的函数 (标题, 内容) -> 翻译结果
+            title: 标题（只随第一段翻译）
+            content: 内容
+
+        Returns:
+            合并后的翻译结果；任一段失败时返回该段的失败原因
+        """
+        chunks = split_by_tokens(content, TRANSLATION_CHUNK_TOKENS)
+        if len(chunks) == 1:
+            return translate(title, content)
+
+        logger.info(f"内容过长，切分为 {len(chunks)} 段并发翻译")
+        with ThreadPoolExecutor(
+            max_workers=min(len(chunks), TRANSLATION_MAX_WORKERS)
+        ) as executor:
+            results = list(
+                executor.map(
+                    translate,
+                    [title] + [""] * (len(chunks) - 1),
+                    chunks,
+                )
+            )
+
+        for i, result in enumerate(results):
+            if not result.get("success"):
+                return {
+                    **result,
+                    "error": f"第 {i + 1}/{len(chunks)} 段翻译失败: {result.get('error')}",
+                    "translated_title": title,
+                    "translated_content": content,
+                }
+
+        return {
+            **results[0],
+            "translated_content": "\n\n".join(
+                result["translated_content"] for result in results
+            ),
+            "chunks": len(chunks),
+        }
+
     def translate_task_content(
         self, title: str, content: str, source_lang: str = "zh", target_lang: str = "en"
     ) -> dict[str, Any]:
         """
         翻译任务内容（标题和内容）
 
+        内容超出单次请求的令牌上限时切分为多段并发翻译。
+
         Args:
             title: 任务标题
             content: 任务内容
@@ -84,6 +241,27 @@ class TranslationService:
                 "translated_content": content,
             }
 
+        return self._translate_in_chunks(
+            lambda chunk_title, chunk: self._translate_task_chunk(
+                chunk_title, chunk, source_lang, target_lang
+            ),
+            title,
+            content,
+        )
+
+    def _translate_task_chunk(
+        self, title: str, content: str, source_lang: str, target_lang: str
+    ) -> dict[str, Any]:
+        """翻译单段任务内容（一次请求）"""
+        if not self.is_enabled():
+            logger.warning("翻译服务未启用，跳过翻译")
+            return {
+                "success": False,
+                "error": "翻译服务未启用",
+                "translated_title": title,
+                "translated_content": content,
+            }
+
         try:
             # 构建翻译提示
             lang_names = {"zh": "中文", "en": "English"}
@@ -116,17 +294,14 @@ class TranslationService:
 
             # 使用OpenAI SDK发送请求
             try:
-                response = self.client.chat.completions.create(
-                    model=self.model,
-                    messages=[{"role": "user", "content": prompt}],
+                translated_text = self._complete(
+                    prompt,
                     max_tokens=2000,
                     temperature=0.3,  # 较低的温度以确保翻译一致性
                     top_p=0.9,
                     timeout=60.0,
                 )
 
-                translated_text = response.choices[0].message.content.strip()
-
                 # 新增：检查翻译结果是否为空
                 if not translated_text:
                     logger.warning("翻译API返回了空内容")
@@ -357,6 +532,8 @@ English Version:
         """
         生成中英双语版本的任务内容，智能处理包含英文论文信息的中文报告
 
+        报告按行切分为片段翻译，只有译文缓存中没有的片段才会发送给LLM。
+
         Args:
             title: 原始任务标题（中文）
             content: 原始任务内容（包含英文论文信息的中文报告）
@@ -374,7 +551,8 @@ English Version:
             }
 
         # 首先创建中文版本 - 将论文信息翻译为中文，但保持研究者名字不变
-        chinese_result = self._translate_to_chinese_with_preserved_names(title, content)
+        # 报告按行切分翻译，之前报告中出现过的论文标题和摘要直接取自译文缓存
+        chinese_result = self._translate_report(title, content, "mixed", "zh")
 
         if not chinese_result.get("success"):
             logger.warning(f"中文版本生成失败: {chinese_result.get('error')}")
@@ -385,11 +563,8 @@ English Version:
             chinese_content = chinese_result["translated_content"]
 
         # 然后创建英文版本
-        english_result = self.translate_task_content(
-            title=chinese_title,
-            content=chinese_content,
-            source_lang="zh",
-            target_lang="en",
+        english_result = self._translate_report(
+            chinese_title, chinese_content, "zh", "en"
         )
 
         if english_result.get("success"):
@@ -413,6 +588,10 @@ English Version:
                 "bilingual": {"title": bilingual_title, "content": bilingual_content},
                 "model_used": english_result.get("model_used"),
                 "translation_mode": "mixed_content",
+                "segments": {
+                    "chinese": chinese_result.get("segments"),
+                    "english": english_result.get("segments"),
+                },
             }
         else:
             logger.warning(f"英文翻译失败，返回中文版本: {english_result.get('error')}")
@@ -425,110 +604,251 @@ English Version:
                 "english_translation_error": english_result.get("error"),
             }
 
-    def _translate_to_chinese_with_preserved_names(
-        self, title: str, content: str
-    ) -> dict[str, Any]:
+    @staticmethod
+    def _split_segment(line: str) -> tuple[str, str]:
         """
-        将包含英文论文信息的中文报告翻译为完全中文版本，但保持研究者名字不变
+        把报告的一行拆分为格式前缀和待翻译片段
+
+        列表符号、标题标记和序号不参与翻译，
+        这样同一篇论文在不同报告中排在不同位置时仍能命中翻译记忆。
 
         Args:
-            title: 原始标题
-            content: 原始内容（包含英文论文信息）
+            line: 报告中的一行
 
         Returns:
-            翻译结果
+            (格式前缀, 片段文本)
         """
-        prompt = f"""请将以下论文监控报告中的英文论文信息翻译为中文，但保持以下要求：
+        prefix = _SEGMENT_PREFIX_RE.match(line).group(0)
+        return prefix, line[len(prefix) :]
 
-1. 保持研究者的姓名不变（如 Zhang Wei, Li Ming 等人名保持英文）
-2. 将论文标题翻译为中文
-3. 将论文摘要翻译为中文
-4. 将其他英文内容翻译为中文
-5. 保持原有的格式和结构
-6. 保持 emoji 表情符号不变
-7. 保持 arXiv ID、链接等技术信息不变
+    @staticmethod
+    def _needs_translation(text: str, source_lang: str) -> bool:
+        """
+        判断片段是否需要翻译
 
-请直接返回翻译后的内容，不要添加任何额外的说明。
+        去掉代码片段和链接后，中文源文本需包含汉字，
+        英文或中英混合源文本需包含英文单词；纯数字、分隔线等直接保留。
 
-标题: {title}
+        Args:
+            text: 片段文本
+            source_lang: 源语言 (zh/en/mixed)
 
-内容:
-{content}
+        Returns:
+            是否需要翻译
+        """
+        text = _CODE_OR_URL_RE.sub("", text)
+        if source_lang == "zh":
+            return bool(_CJK_RE.search(text))
+        return bool(_LATIN_WORD_RE.search(text))
+
+    @property
+    def config(self) -> AppConfig:
+        """应用配置（未提供时在首次使用时加载）"""
+        if self._config is None:
+            self._config = load_config()
+        return self._config
+
+    @property
+    def memory(self) -> TranslationMemory | None:
+        """片段译文记忆（按需创建，缓存被禁用时为 None）"""
+        if not self._memory_resolved:
+            self._memory_resolved = True
+            try:
+                self._memory = TranslationMemory.from_config(self.config.storage)
+            except Exception as e:
+                logger.warning(f"译文缓存不可用: {e}")
+        return self._memory
 
-请提供翻译后的结果，格式为JSON：
-{{
-    "translated_title": "翻译后的标题",
-    "translated_content": "翻译后的内容"
-}}"""
+    def _segment_key(self, text: str, source_lang: str, target_lang: str) -> str:
+        """构建片段的翻译记忆键"""
+        return TranslationMemory.make_key(
+            SEGMENT_PROMPT_VERSION, source_lang, target_lang, self.model, text
+        )
+
+    def _segment_prompt(
+        self, segments: list[str], source_lang: str, target_lang: str
+    ) -> str:
+        """构建批量片段翻译的提示词"""
+        lang_names = {"zh": "中文", "en": "English", "mixed": "中英混合"}
+        source_name = lang_names.get(source_lang, source_lang)
+        target_name = lang_names.get(target_lang, target_lang)
+
+        if source_lang == "mixed":
+            rules = """1. 保持研究者的姓名不变（如 Zhang Wei, Li Ming 等人名保持英文）
+2. 将论文标题、论文摘要和其他英文内容翻译为中文
+3. 已经是中文的内容保持不变"""
+        else:
+            rules = """1. 保持技术术语（如ArXiv、paper、citation等）的准确性
+2. 论文标题可以保持英文原文或提供翻译，以可读性为准
+3. 保持时间格式不变"""
+
+        return f"""请将下面JSON数组中的每个{source_name}片段翻译为{target_name}。这些片段来自ArXiv论文监控报告，每个元素是报告中的一行。
+
+要求：
+{rules}
+4. 保持emoji表情符号、Markdown格式、arXiv ID和链接不变
+5. 不要合并、拆分或省略任何片段
+
+请直接返回与输入等长、顺序一致的JSON字符串数组，不要包含代码块标记或任何其他文本。
+
+输入：
+{json.dumps(segments, ensure_ascii=False)}"""
+
+    def _translate_segment_batch(
+        self, segments: list[str], source_lang: str, target_lang: str
+    ) -> dict[str, Any]:
+        """
+        一次请求翻译一批片段
 
+        Args:
+            segments: 片段列表
+            source_lang: 源语言
+            target_lang: 目标语言
+
+        Returns:
+            包含与输入对齐的 translations 的结果
+        """
+        prompt = self._segment_prompt(segments, source_lang, target_lang)
         try:
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=[{"role": "user", "content": prompt}],
-                max_tokens=3000,
+            translated_text = self._complete(
+                prompt,
+                max_tokens=2 * estimate_tokens(json.dumps(segments)) + 256,
                 temperature=0.3,
                 timeout=60.0,
             )
+            translations = parse_json_response(translated_text, expected=list)
+        except Exception as e:
+            logger.error(f"片段翻译失败: {e}")
+            return {"success": False, "error": f"片段翻译失败: {e}"}
+
+        if len(translations) != len(segments) or not all(
+            isinstance(t, str) for t in translations
+        ):
+            logger.warning(
+                f"译文数量不匹配: 期望 {len(segments)}，实际 {len(translations)}"
+            )
+            return {"success": False, "error": "译文与原文片段数量不匹配"}
+        return {"success": True, "translations": translations}
 
-            translated_text = response.choices[0].message.content.strip()
+    def translate_segments(
+        self, segments: list[str], source_lang: str, target_lang: str
+    ) -> dict[str, Any]:
+        """
+        按片段翻译，已翻译过的片段直接取自翻译记忆
 
-            # 新增：检查翻译结果是否为空
-            if not translated_text:
-                logger.warning("翻译API返回了空内容")
-                return {"success": False, "error": "翻译API返回了空内容"}
+        新片段去重后按令牌预算打包，并发批量翻译，成功的译文写回翻译记忆。
 
-            # 尝试解析JSON结果
-            try:
-                # 清理和提取JSON部分
-                cleaned_text = translated_text.strip()
-
-                # 移除可能的代码块标记
-                if "```json" in cleaned_text:
-                    json_start = cleaned_text.find("```json") + 7
-                    json_end = cleaned_text.find("```", json_start)
-                    if json_end == -1:
-                        json_end = len(cleaned_text)
-                    json_text = cleaned_text[json_start:json_end].strip()
-                elif cleaned_text.startswith("```") and cleaned_text.endswith("```"):
-                    json_text = cleaned_text[3:-3].strip()
-                elif "{" in cleaned_text and "}" in cleaned_text:
-                    json_start = cleaned_text.find("{")
-                    json_end = cleaned_text.rfind("}") + 1
-                    json_text = cleaned_text[json_start:json_end]
-                else:
-                    json_text = cleaned_text
-
-                # 再次清理可能的前后缀
-                json_text = json_text.strip()
-                if json_text.startswith("json"):
-                    json_text = json_text[4:].strip()
-
-                logger.debug(f"准备解析的JSON文本: {json_text[:200]}...")
-                translation_result = json.loads(json_text)
-
-                if isinstance(translation_result, dict):
-                    return {
-                        "success": True,
-                        "translated_title": translation_result.get(
-                            "translated_title", title
-                        ),
-                        "translated_content": translation_result.get(
-                            "translated_content", content
+        Args:
+            segments: 片段列表
+            source_lang: 源语言 (zh/en/mixed)
+            target_lang: 目标语言 (zh/en)
+
+        Returns:
+            翻译结果，translations 与输入对齐（失败的片段保留原文），
+            cached/translated 分别为命中记忆和新翻译的片段数
+        """
+        memory = self.memory
+        resolved: dict[str, str] = {}
+        pending: list[str] = []
+        for text in dict.fromkeys(segments):
+            hit = (
+                memory.get(self._segment_key(text, source_lang, target_lang))
+                if memory is not None
+                else None
+            )
+            if hit is None:
+                pending.append(text)
+            else:
+                resolved[text] = hit
+        cached = len(resolved)
+
+        batches = pack_by_budget(
+            pending,
+            lambda text: estimate_tokens(text) + SEGMENT_OVERHEAD_TOKENS,
+            TRANSLATION_CHUNK_TOKENS,
+        )
+        results: list[dict[str, Any]] = []
+        if batches:
+            logger.info(
+                f"翻译 {len(pending)} 个新片段（{len(batches)} 次请求），"
+                f"{cached} 个片段命中译文缓存"
+            )
+            with ThreadPoolExecutor(
+                max_workers=min(len(batches), TRANSLATION_MAX_WORKERS)
+            ) as executor:
+                results = list(
+                    executor.map(
+                        lambda batch: self._translate_segment_batch(
+                            batch, source_lang, target_lang
                         ),
-                        "model": self.model,
-                    }
-                else:
-                    logger.error("翻译结果不是有效的字典格式")
-                    return {"success": False, "error": "翻译结果格式无效"}
+                        batches,
+                    )
+                )
 
-            except json.JSONDecodeError as e:
-                logger.error(f"JSON解析失败: {e}")
-                logger.error(f"响应内容: {translated_text[:500]}...")
-                return {"success": False, "error": f"JSON解析失败: {e}"}
+        errors = []
+        for batch, result in zip(batches, results, strict=True):
+            if not result.get("success"):
+                errors.append(result.get("error"))
+                continue
+            for text, translation in zip(batch, result["translations"], strict=True):
+                resolved[text] = translation
+                if memory is not None:
+                    memory.set(
+                        self._segment_key(text, source_lang, target_lang), translation
+                    )
 
-        except Exception as e:
-            logger.error(f"中文翻译过程中发生错误: {e}")
-            return {"success": False, "error": f"翻译过程错误: {e}"}
+        response: dict[str, Any] = {
+            "success": not errors,
+            "translations": [resolved.get(text, text) for text in segments],
+            "cached": cached,
+            "translated": len(resolved) - cached,
+        }
+        if errors:
+            response["error"] = "; ".join(errors)
+        return response
+
+    def _translate_report(
+        self, title: str, content: str, source_lang: str, target_lang: str
+    ) -> dict[str, Any]:
+        """
+        按行切分报告，逐片段翻译后按原格式拼接
+
+        Args:
+            title: 报告标题
+            content: 报告内容
+            source_lang: 源语言 (zh/en/mixed)
+            target_lang: 目标语言 (zh/en)
+
+        Returns:
+            翻译结果包含 translated_title、translated_content 和片段统计
+        """
+        parts = [self._split_segment(line) for line in [title, *content.split("\n")]]
+        todo = [text for _, text in parts if self._needs_translation(text, source_lang)]
+
+        result = self.translate_segments(todo, source_lang, target_lang)
+        if not result["success"]:
+            return {
+                "success": False,
+                "error": result.get("error"),
+                "translated_title": title,
+                "translated_content": content,
+            }
+
+        mapping = dict(zip(todo, result["translations"], strict=True))
+        lines = [prefix + mapping.get(text, text) for prefix, text in parts]
+        return {
+            "success": True,
+            "translated_title": lines[0],
+            "translated_content": "\n".join(lines[1:]),
+            "model_used": self.model,
+            "source_lang": source_lang,
+            "target_lang": target_lang,
+            "segments": {
+                "total": len(todo),
+                "cached": result["cached"],
+                "translated": result["translated"],
+            },
+        }
 
     def test_connection(self) -> dict[str, Any]:
         """
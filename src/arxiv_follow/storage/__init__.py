@@ -0,0 +1,49 @@
+"""
+ArXiv Follow 存储层
+
+持久化论文元数据、AI分析结果和研究者信息，避免每次运行都重新获取和分析。
+"""
+
+from pathlib import Path
+
+from ..models.config import AppConfig, StorageBackend
+from .sqlite import DEFAULT_DB_NAME, SQLitePaperStore, split_arxiv_id
+
+PaperStore = SQLitePaperStore
+
+
+def create_paper_store(config: AppConfig) -> SQLitePaperStore:
+    """
+    根据存储配置创建论文存储
+
+    LOCAL 和 SQLITE 后端都使用本地 SQLite 文件：优先使用 ``sqlite:///`` 形式的
+    ``database_url``，否则存放在 ``data_dir`` 下。
+
+    Args:
+        config: 应用配置
+
+    Returns:
+        论文存储实例
+
+    Raises:
+        ValueError: 不支持的存储后端或数据库URL
+    """
+    storage = config.storage
+    if storage.backend not in (StorageBackend.LOCAL, StorageBackend.SQLITE):
+        raise ValueError(f"不支持的存储后端: {storage.backend.value}")
+
+    if storage.database_url:
+        prefix = "sqlite:///"
+        if not storage.database_url.startswith(prefix):
+            raise ValueError(f"不支持的数据库URL: {storage.database_url}")
+        return SQLitePaperStore(storage.database_url[len(prefix) :])
+
+    return SQLitePaperStore(Path(storage.data_dir) / DEFAULT_DB_NAME)
+
+
+__all__ = [
+    "PaperStore",
+    "SQLitePaperStore",
+    "create_paper_store",
+    "split_arxiv_id",
+]
@@ -0,0 +1,183 @@
+"""
+本地全文检索查询解析
+
+把 arXiv API 风格的查询（ti:/abs:/au:/cat:/all: 字段、引号短语、AND/OR/ANDNOT、
+括号、-前缀排除以及 submittedDate:[... TO ...] 日期范围）转换为 SQLite FTS5 的
+MATCH 表达式，使同一个查询字符串既可以发给 arXiv，也可以在本地索引上执行。
+"""
+
+import re
+from datetime import date, datetime
+
+# arXiv 字段前缀 -> 全文索引列（None 表示不限定列）
+FIELD_COLUMNS = {
+    "ti": "title",
+    "abs": "abstract",
+    "au": "authors",
+    "cat": "categories",
+    "all": None,
+}
+
+# 全文索引各列的 BM25 权重（与索引表列顺序一致，arxiv_id 列不参与打分）
+COLUMN_WEIGHTS = (0.0, 3.0, 1.0, 2.0, 1.0)
+
+_OPERATORS = {"AND": "AND", "OR": "OR", "ANDNOT": "NOT"}
+
+_QUERY_TOKEN_RE = re.compile(
+    r'\s*(?:([()])|(-)?(?:([A-Za-z]+):)?("[^"]*"|\[[^\]]*\]|[^\s()]+))'
+)
+_DATE_RANGE_RE = re.compile(r"\[\s*(\S+)\s+TO\s+(\S+)\s*\]", re.IGNORECASE)
+
+
+def _parse_query_date(value: str) -> date | datetime | None:
+    """
+    解析 submittedDate 范围端点
+
+    Args:
+        value: YYYYMMDD、YYYYMMDDHHMM 或 *
+
+    Returns:
+        纯日期、日期时间或 None（不限）
+
+    Raises:
+        ValueError: 格式无效
+    """
+    if value == "*":
+        return None
+    if len(value) == 8 and value.isdigit():
+        return datetime.strptime(value, "%Y%m%d").date()
+    if len(value) == 12 and value.isdigit():
+        return datetime.strptime(value, "%Y%m%d%H%M")
+    raise ValueError(f"无效的日期: {value}")
+
+
+def _fts_term(field: str | None, value: str) -> str | None:
+    """
+    转换单个检索词为 FTS5 短语
+
+    所有检索词都加引号，避免 cs.AI、self-supervised 之类的词被当作 FTS5 语法。
+
+    Returns:
+        FTS5 短语，匹配全部（如 all:*）时返回 None
+
+    Raises:
+        ValueError: 不支持的字段
+    """
+    text = value[1:-1] if value.startswith('"') and value.endswith('"') else value
+    text = text.strip()
+    if not text or text == "*":
+        return None
+
+    if field is not None and field.lower() not in FIELD_COLUMNS:
+        raise ValueError(f"不支持的查询字段: {field}")
+    column = FIELD_COLUMNS.get(field.lower()) if field else None
+
+    phrase = '"' + text.replace('"', '""') + '"'
+    return f"{column} : {phrase}" if column else phrase
+
+
+def _close_group(group: list[str]) -> list[str]:
+    """去掉分组末尾悬空的运算符"""
+    while group and group[-1] in _OPERATORS.values():
+        group.pop()
+    return group
+
+
+def parse_local_query(
+    query: str,
+) -> tuple[str | None, str | None, date | datetime | None, date | datetime | None]:
+    """
+    把 arXiv 风格的查询转换为 FTS5 MATCH 表达式
+
+    相邻检索词之间默认为 AND；排除条件（-cat:X、ANDNOT X）有左操作数时转换为
+    FTS5 的二元 NOT，位于顶层开头时单独返回，由调用方用 NOT IN 子查询排除。
+
+    Args:
+        query: 如 (cat:cs.AI OR cat:cs.CL) AND au:"Alice Smith" AND submittedDate:[20250101 TO *]
+
+    Returns:
+        (MATCH 表达式, 排除表达式, 提交日期下界, 提交日期上界)，不存在的部分为 None
+
+    Raises:
+        ValueError: 查询语法无效
+    """
+    stack: list[list[str]] = [[]]
+    # 各层括号之前待应用的排除标记
+    negations: list[bool] = []
+    excludes: list[str] = []
+    date_from = date_to = None
+    negate_next = False
+
+    def append(operand: str, negate: bool) -> None:
+        group = stack[-1]
+        if group and group[-1] in _OPERATORS.values():
+            if negate:
+                group[-1] = "NOT"
+            group.append(operand)
+        elif group:
+            group.extend(("NOT" if negate else "AND", operand))
+        elif not negate:
+            group.append(operand)
+        elif len(stack) == 1:
+            excludes.append(operand)
+        else:
+            raise ValueError(f"排除条件缺少左操作数: {operand}")
+
+    position = 0
+    for match in _QUERY_TOKEN_RE.finditer(query):
+        if match.start() != position:
+            break
+        position = match.end()
+        paren, minus, field, value = match.groups()
+
+        if paren == "(":
+            stack.append([])
+            negations.append(negate_next)
+            negate_next = False
+            continue
+        if paren == ")":
+            if len(stack) == 1:
+                raise ValueError("查询括号不匹配")
+            group = _close_group(stack.pop())
+            if group:
+                append(f"({' '.join(group)})", negations.pop())
+            else:
+                negations.pop()
+            continue
+
+        if field is None and value in _OPERATORS:
+            operator = _OPERATORS[value]
+            group = stack[-1]
+            if group and group[-1] not in _OPERATORS.values():
+                group.append(operator)
+            elif group:
+                group[-1] = operator
+            else:
+                negate_next = operator == "NOT"
+            continue
+
+        if field and field.lower() == "submitteddate":
+            bounds = _DATE_RANGE_RE.fullmatch(value)
+            if bounds is None:
+                raise ValueError(f"无效的日期范围: {value}")
+            date_from = _parse_query_date(bounds.group(1))
+            date_to = _parse_query_date(bounds.group(2))
+            if isinstance(date_to, datetime):
+                # 分钟精度的上界包含该分钟内的全部时间
+                date_to = date_to.replace(second=59)
+            continue
+
+        term = _fts_term(field, value)
+        if term is not None:
+            append(term, negate_next or bool(minus))
+        negate_next = False
+
+    if query[position:].strip():
+        raise ValueError(f"无法解析的查询: {query[position:]}")
+    if len(stack) != 1:
+        raise ValueError("查询括号不匹配")
+
+    group = _close_group(stack[0])
+    match_expr = " ".join(group) or None
+    exclude_expr = " OR ".join(excludes) or None
+    return match_expr, exclude_expr, date_from, date_to
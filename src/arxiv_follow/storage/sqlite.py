@@ -0,0 +1,834 @@
+"""
+SQLite 论文存储
+
+以 arxiv_id（不含版本号）为主键持久化论文元数据，按 (arxiv_id, analysis_type, model_used)
+存储AI分析结果，并为分类、作者和提交日期建立索引以支持范围查询；
+SQLite 支持 FTS5 时同时维护标题、摘要、作者和分类的全文索引，用于本地 BM25 检索。
+"""
+
+import logging
+import re
+import sqlite3
+import threading
+from collections.abc import Iterable
+from datetime import UTC, date, datetime
+from pathlib import Path
+from typing import Any
+
+from ..models.paper import Paper, PaperAnalysis, PaperMetadata
+from ..models.researcher import Researcher
+from .fulltext import COLUMN_WEIGHTS, parse_local_query
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_DB_NAME = "arxiv_follow.db"
+
+_VERSION_RE = re.compile(r"v(\d+)$")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS papers (
+    arxiv_id TEXT PRIMARY KEY,
+    version INTEGER NOT NULL DEFAULT 1,
+    title TEXT NOT NULL,
+    primary_category TEXT,
+    submitted_date TEXT,
+    updated_date TEXT,
+    data TEXT NOT NULL,
+    first_seen TEXT NOT NULL,
+    last_seen TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_papers_submitted ON papers (submitted_date);
+CREATE INDEX IF NOT EXISTS idx_papers_updated ON papers (updated_date);
+
+CREATE TABLE IF NOT EXISTS paper_authors (
+    arxiv_id TEXT NOT NULL REFERENCES papers (arxiv_id) ON DELETE CASCADE,
+    position INTEGER NOT NULL,
+    author TEXT NOT NULL COLLATE NOCASE,
+    PRIMARY KEY (arxiv_id, position)
+);
+CREATE INDEX IF NOT EXISTS idx_paper_authors_author ON paper_authors (author);
+
+CREATE TABLE IF NOT EXISTS paper_categories (
+    arxiv_id TEXT NOT NULL REFERENCES papers (arxiv_id) ON DELETE CASCADE,
+    category TEXT NOT NULL,
+    PRIMARY KEY (arxiv_id, category)
+);
+CREATE INDEX IF NOT EXISTS idx_paper_categories_category
+    ON paper_categories (category, arxiv_id);
+
+CREATE TABLE IF NOT EXISTS analyses (
+    arxiv_id TEXT NOT NULL,
+    analysis_type TEXT NOT NULL,
+    model_used TEXT NOT NULL,
+    score REAL,
+    analysis_time TEXT NOT NULL,
+    data TEXT NOT NULL,
+    PRIMARY KEY (arxiv_id, analysis_type, model_used)
+);
+CREATE INDEX IF NOT EXISTS idx_analyses_score ON analyses (analysis_type, score);
+
+CREATE TABLE IF NOT EXISTS researchers (
+    researcher_id TEXT PRIMARY KEY,
+    arxiv_name TEXT NOT NULL,
+    is_monitored INTEGER NOT NULL DEFAULT 1,
+    data TEXT NOT NULL,
+    last_updated TEXT NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS watermarks (
+    query_key TEXT PRIMARY KEY,
+    updated_date TEXT NOT NULL,
+    arxiv_id TEXT NOT NULL,
+    last_run TEXT NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS seen_papers (
+    scope TEXT NOT NULL,
+    arxiv_id TEXT NOT NULL,
+    version INTEGER NOT NULL,
+    seen_at TEXT NOT NULL,
+    PRIMARY KEY (scope, arxiv_id)
+);
+"""
+
+# 全文索引（部分 SQLite 构建不包含 FTS5，单独创建）
+FULLTEXT_SCHEMA = """
+CREATE VIRTUAL TABLE IF NOT EXISTS papers_fts USING fts5(
+    arxiv_id UNINDEXED,
+    title,
+    abstract,
+    authors,
+    categories,
+    tokenize = 'unicode61 remove_diacritics 2'
+);
+"""
+
+
+def split_arxiv_id(arxiv_id: str) -> tuple[str, int]:
+    """
+    拆分ArXiv ID和版本号
+
+    Args:
+        arxiv_id: 如 "2501.12345v2" 或 "2501.12345"
+
+    Returns:
+        (不含版本号的ID, 版本号)，无版本号时版本为 1
+    """
+    match = _VERSION_RE.search(arxiv_id)
+    if match is None:
+        return arxiv_id, 1
+    return arxiv_id[: match.start()], int(match.group(1))
+
+
+def _to_db_time(value: datetime | date | str | None) -> str | None:
+    """
+    转换为可按字典序比较的UTC时间字符串
+
+    带时区的时间统一换算到UTC后去掉时区，纯日期按当天零点处理。
+    """
+    if value is None:
+        return None
+    if isinstance(value, str):
+        value = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    if not isinstance(value, datetime):
+        value = datetime(value.year, value.month, value.day)
+    if value.tzinfo is not None:
+        value = value.astimezone(UTC).replace(tzinfo=None)
+    return value.isoformat(timespec="seconds")
+
+
+def _date_clauses(
+    date_from: datetime | date | str | None, date_to: datetime | date | str | None
+) -> tuple[list[str], list[Any]]:
+    """
+    构建提交日期范围条件
+
+    Args:
+        date_from: 提交日期下界（包含）
+        date_to: 提交日期上界（包含；纯日期时包含当天全天）
+
+    Returns:
+        (条件列表, 参数列表)
+    """
+    clauses = []
+    params: list[Any] = []
+    if date_from is not None:
+        clauses.append("p.submitted_date >= ?")
+        params.append(_to_db_time(date_from))
+    if date_to is not None:
+        if isinstance(date_to, date) and not isinstance(date_to, datetime):
+            clauses.append("p.submitted_date < date(?, '+1 day')")
+            params.append(date_to.isoformat())
+        else:
+            clauses.append("p.submitted_date <= ?")
+            params.append(_to_db_time(date_to))
+    return clauses, params
+
+
+def _now() -> str:
+    """当前UTC时间字符串"""
+    return _to_db_time(datetime.now(UTC))
+
+
+class SQLitePaperStore:
+    """基于 SQLite 的论文存储（线程安全）"""
+
+    def __init__(self, db_path: str | Path):
+        """
+        初始化存储并创建表结构
+
+        Args:
+            db_path: 数据库文件路径，":memory:" 表示内存数据库
+        """
+        self.db_path = str(db_path)
+        if self.db_path != ":memory:":
+            Path(self.db_path).parent.mkdir(parents=True, exist_ok=True)
+
+        self._lock = threading.RLock()
+        self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+
+        with self._lock, self._conn:
+            if self.db_path != ":memory:":
+                self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.execute("PRAGMA foreign_keys=ON")
+            self._conn.executescript(SCHEMA)
+
+        self.fulltext = True
+        try:
+            with self._lock, self._conn:
+                self._conn.executescript(FULLTEXT_SCHEMA)
+        except sqlite3.OperationalError as e:
+            logger.warning(f"SQLite 不支持 FTS5，本地全文检索已禁用: {e}")
+            self.fulltext = False
+        else:
+            self._backfill_fulltext()
+
+    def __enter__(self):
+        """上下文管理器入口"""
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """上下文管理器出口"""
+        self.close()
+
+    def close(self) -> None:
+        """关闭数据库连接"""
+        with self._lock:
+            self._conn.close()
+
+    # ------------------------------------------------------------------
+    # 论文
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _to_metadata(paper: PaperMetadata | Paper | dict[str, Any]) -> PaperMetadata:
+        """将论文对象或采集器返回的字典转换为 PaperMetadata"""
+        if isinstance(paper, Paper):
+            return paper.metadata
+        if isinstance(paper, PaperMetadata):
+            return paper
+        fields = {
+            key: value
+            for key, value in paper.items()
+            if key in PaperMetadata.model_fields and value is not None
+        }
+        return PaperMetadata(**fields)
+
+    def _upsert_paper(self, metadata: PaperMetadata, seen_at: str) -> bool:
+        """写入单篇论文（调用方需持有锁并处于事务中）"""
+        arxiv_id, version = split_arxiv_id(metadata.arxiv_id)
+        submitted = _to_db_time(metadata.submitted_date)
+        updated = _to_db_time(metadata.updated_date)
+
+        existed = (
+            self._conn.execute(
+                "SELECT 1 FROM papers WHERE arxiv_id = ?", (arxiv_id,)
+            ).fetchone()
+            is not None
+        )
+
+        # 仅当新数据不比已存数据旧时才覆盖，避免乱序写入导致版本回退
+        cursor = self._conn.execute(
+            """
+            INSERT INTO papers (
+                arxiv_id, version, title, primary_category, submitted_date,
+                updated_date, data, first_seen, last_seen
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+            ON CONFLICT (arxiv_id) DO UPDATE SET
+                version = excluded.version,
+                title = excluded.title,
+                primary_category = excluded.primary_category,
+                submitted_date = COALESCE(excluded.submitted_date, submitted_date),
+                updated_date = COALESCE(excluded.updated_date, updated_date),
+                data = excluded.data,
+                last_seen = excluded.last_seen
+            WHERE excluded.version >= papers.version
+                AND (
+                    excluded.updated_date IS NULL
+                    OR papers.updated_date IS NULL
+                    OR excluded.updated_date >= papers.updated_date
+                )
+            """,
+            (
+                arxiv_id,
+                version,
+                metadata.title,
+                metadata.primary_category,
+                submitted,
+                updated,
+                metadata.model_dump_json(),
+                seen_at,
+                seen_at,
+            ),
+        )
+
+        if cursor.rowcount == 0:
+            # 已存更新的版本，只刷新最后出现时间
+            self._conn.execute(
+                "UPDATE papers SET last_seen = ? WHERE arxiv_id = ?",
+                (seen_at, arxiv_id),
+            )
+            return not existed
+
+        self._conn.execute("DELETE FROM paper_authors WHERE arxiv_id = ?", (arxiv_id,))
+        self._conn.executemany(
+            "INSERT INTO paper_authors (arxiv_id, position, author) VALUES (?, ?, ?)",
+            [(arxiv_id, i, author) for i, author in enumerate(metadata.authors)],
+        )
+
+        categories = dict.fromkeys(
+            [metadata.primary_category] if metadata.primary_category else []
+        )
+        categories.update(dict.fromkeys(metadata.categories))
+        self._conn.execute(
+            "DELETE FROM paper_categories WHERE arxiv_id = ?", (arxiv_id,)
+        )
+        self._conn.executemany(
+            "INSERT INTO paper_categories (arxiv_id, category) VALUES (?, ?)",
+            [(arxiv_id, category) for category in categories],
+        )
+
+        if self.fulltext:
+            self._index_paper(arxiv_id, metadata)
+
+        return not existed
+
+    def _index_paper(self, arxiv_id: str, metadata: PaperMetadata) -> None:
+        """更新单篇论文的全文索引（调用方需持有锁并处于事务中）"""
+        categories = dict.fromkeys(
+            [metadata.primary_category] if metadata.primary_category else []
+        )
+        categories.update(dict.fromkeys(metadata.categories))
+        self._conn.execute("DELETE FROM papers_fts WHERE arxiv_id = ?", (arxiv_id,))
+        self._conn.execute(
+            """
+            INSERT INTO papers_fts (arxiv_id, title, abstract, authors, categories)
+            VALUES (?, ?, ?, ?, ?)
+            """,
+            (
+                arxiv_id,
+                metadata.title,
+                metadata.abstract,
+                "; ".join(metadata.authors),
+                " ".join(categories),
+            ),
+        )
+
+    def _backfill_fulltext(self) -> None:
+        """为建立全文索引之前已存储的论文补建索引"""
+        with self._lock, self._conn:
+            rows = self._conn.execute("""
+                SELECT arxiv_id, data FROM papers
+                WHERE arxiv_id NOT IN (SELECT arxiv_id FROM papers_fts)
+                """).fetchall()
+            for row in rows:
+                self._index_paper(
+                    row["arxiv_id"], PaperMetadata.model_validate_json(row["data"])
+                )
+        if rows:
+            logger.info(f"已为 {len(rows)} 篇论文补建全文索引")
+
+    def upsert_paper(self, paper: PaperMetadata | Paper | dict[str, Any]) -> bool:
+        """
+        插入或更新论文
+
+        Args:
+            paper: 论文元数据、完整论文对象或采集器返回的论文字典
+
+        Returns:
+            是否为新论文
+        """
+        metadata = self._to_metadata(paper)
+        with self._lock, self._conn:
+            return self._upsert_paper(metadata, _now())
+
+    def upsert_papers(
+        self, papers: Iterable[PaperMetadata | Paper | dict[str, Any]]
+    ) -> int:
+        """
+        在单个事务中批量插入或更新论文
+
+        无法转换为 PaperMetadata 的条目会被跳过并记录警告。
+
+        Args:
+            papers: 论文列表
+
+        Returns:
+            新增论文数量
+        """
+        items = []
+        for paper in papers:
+            try:
+                items.append(self._to_metadata(paper))
+            except Exception as e:
+                logger.warning(f"跳过无效论文数据: {e}")
+
+        seen_at = _now()
+        with self._lock, self._conn:
+            return sum(self._upsert_paper(metadata, seen_at) for metadata in items)
+
+    def get_paper(self, arxiv_id: str) -> PaperMetadata | None:
+        """
+        获取论文元数据
+
+        Args:
+            arxiv_id: ArXiv ID（可带版本号）
+
+        Returns:
+            论文元数据，不存在时返回 None
+        """
+        base_id, _ = split_arxiv_id(arxiv_id)
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT data FROM papers WHERE arxiv_id = ?", (base_id,)
+            ).fetchone()
+        return PaperMetadata.model_validate_json(row["data"]) if row else None
+
+    def has_paper(self, arxiv_id: str) -> bool:
+        """检查论文是否已存储"""
+        base_id, _ = split_arxiv_id(arxiv_id)
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT 1 FROM papers WHERE arxiv_id = ?", (base_id,)
+            ).fetchone()
+        return row is not None
+
+    def get_versions(self, arxiv_ids: Iterable[str]) -> dict[str, int]:
+        """
+        批量获取已存论文的版本号
+
+        Args:
+            arxiv_ids: ArXiv ID 列表（可带版本号）
+
+        Returns:
+            {不含版本号的ID: 已存版本号}，未存储的论文不包含在结果中
+        """
+        base_ids = list(dict.fromkeys(split_arxiv_id(i)[0] for i in arxiv_ids))
+        versions: dict[str, int] = {}
+        # SQLite 默认最多 999 个绑定参数
+        with self._lock:
+            for i in range(0, len(base_ids), 500):
+                batch = base_ids[i : i + 500]
+                placeholders = ",".join("?" * len(batch))
+                rows = self._conn.execute(
+                    f"SELECT arxiv_id, version FROM papers WHERE arxiv_id IN ({placeholders})",
+                    batch,
+                ).fetchall()
+                versions.update({row["arxiv_id"]: row["version"] for row in rows})
+        return versions
+
+    def query_papers(
+        self,
+        category: str | None = None,
+        author: str | None = None,
+        date_from: datetime | date | str | None = None,
+        date_to: datetime | date | str | None = None,
+        limit: int | None = None,
+    ) -> list[PaperMetadata]:
+        """
+        按分类、作者和提交日期范围查询论文
+
+        Args:
+            category: 分类（匹配所有分类而非仅主分类）
+            author: 作者姓名（不区分大小写）
+            date_from: 提交日期下界（包含）
+            date_to: 提交日期上界（包含；纯日期时包含当天全天）
+            limit: 最大返回数量
+
+        Returns:
+            按提交日期倒序排列的论文元数据列表
+        """
+        clauses = []
+        params: list[Any] = []
+
+        if category:
+            clauses.append(
+                "p.arxiv_id IN (SELECT arxiv_id FROM paper_categories WHERE category = ?)"
+            )
+            params.append(category)
+        if author:
+            clauses.append(
+                "p.arxiv_id IN (SELECT arxiv_id FROM paper_authors WHERE author = ?)"
+            )
+            params.append(author)
+        date_clauses, date_params = _date_clauses(date_from, date_to)
+        clauses.extend(date_clauses)
+        params.extend(date_params)
+
+        sql = "SELECT p.data FROM papers p"
+        if clauses:
+            sql += " WHERE " + " AND ".join(clauses)
+        sql += " ORDER BY p.submitted_date DESC, p.arxiv_id DESC"
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(limit)
+
+        with self._lock:
+            rows = self._conn.execute(sql, params).fetchall()
+        return [PaperMetadata.model_validate_json(row["data"]) for row in rows]
+
+    def search_papers(
+        self,
+        query: str,
+        date_from: datetime | date | str | None = None,
+        date_to: datetime | date | str | None = None,
+        limit: int = 50,
+    ) -> list[tuple[PaperMetadata, float]]:
+        """
+        在本地全文索引上检索论文
+
+        查询使用 arXiv API 的语法（见 parse_local_query），按 BM25 排序；
+        查询只包含日期或排除条件时按提交日期倒序返回。
+
+        Args:
+            query: arXiv 风格的查询字符串
+            date_from: 提交日期下界（包含），与查询中的 submittedDate 同时生效
+            date_to: 提交日期上界（包含；纯日期时包含当天全天）
+            limit: 最大返回数量
+
+        Returns:
+            [(论文元数据, 相关性得分)]，得分越高越相关
+
+        Raises:
+            RuntimeError: SQLite 不支持 FTS5
+            ValueError: 查询语法无效
+        """
+        if not self.fulltext:
+            raise RuntimeError("SQLite 不支持 FTS5，无法进行本地全文检索")
+
+        match_expr, exclude_expr, query_from, query_to = parse_local_query(query)
+
+        clauses = []
+        params: list[Any] = []
+        for bounds in ((query_from, query_to), (date_from, date_to)):
+            date_clauses, date_params = _date_clauses(*bounds)
+            clauses.extend(date_clauses)
+            params.extend(date_params)
+        if exclude_expr:
+            clauses.append(
+                "p.arxiv_id NOT IN "
+                "(SELECT arxiv_id FROM papers_fts WHERE papers_fts MATCH ?)"
+            )
+            params.append(exclude_expr)
+
+        if match_expr:
+            weights = ", ".join(str(weight) for weight in COLUMN_WEIGHTS)
+            sql = (
+                f"SELECT p.data, -bm25(papers_fts, {weights}) AS score "
+                "FROM papers_fts JOIN papers p ON p.arxiv_id = papers_fts.arxiv_id "
+                "WHERE papers_fts MATCH ?"
+            )
+            params.insert(0, match_expr)
+            order = "score DESC, p.submitted_date DESC"
+        else:
+            sql = "SELECT p.data, 0.0 AS score FROM papers p WHERE 1"
+            order = "p.submitted_date DESC, p.arxiv_id DESC"
+
+        for clause in clauses:
+            sql += f" AND {clause}"
+        sql += f" ORDER BY {order} LIMIT ?"
+        params.append(limit)
+
+        try:
+            with self._lock:
+                rows = self._conn.execute(sql, params).fetchall()
+        except sqlite3.OperationalError as e:
+            raise ValueError(f"无效的本地查询 {query!r}: {e}") from e
+        return [
+            (PaperMetadata.model_validate_json(row["data"]), row["score"])
+            for row in rows
+        ]
+
+    # ------------------------------------------------------------------
+    # 分析结果
+    # ------------------------------------------------------------------
+
+    def upsert_analysis(self, analysis: PaperAnalysis) -> None:
+        """
+        插入或更新分析结果
+
+        同一论文、分析类型和模型只保留最新一条。
+
+        Args:
+            analysis: 分析结果
+        """
+        arxiv_id, _ = split_arxiv_id(analysis.arxiv_id)
+        analysis_type = getattr(analysis.analysis_type, "value", analysis.analysis_type)
+        with self._lock, self._conn:
+            self._conn.execute(
+                """
+                INSERT INTO analyses (
+                    arxiv_id, analysis_type, model_used, score, analysis_time, data
+                ) VALUES (?, ?, ?, ?, ?, ?)
+                ON CONFLICT (arxiv_id, analysis_type, model_used) DO UPDATE SET
+                    score = excluded.score,
+                    analysis_time = excluded.analysis_time,
+                    data = excluded.data
+                """,
+                (
+                    arxiv_id,
+                    analysis_type,
+                    analysis.model_used,
+                    analysis.score,
+                    _to_db_time(analysis.analysis_time),
+                    analysis.model_dump_json(),
+                ),
+            )
+
+    def get_analysis(
+        self, arxiv_id: str, analysis_type: str, model_used: str | None = None
+    ) -> PaperAnalysis | None:
+        """
+        获取分析结果
+
+        Args:
+            arxiv_id: ArXiv ID（可带版本号）
+            analysis_type: 分析类型
+            model_used: 模型名称，不指定时返回该类型最新的一条
+
+        Returns:
+            分析结果，不存在时返回 None
+        """
+        base_id, _ = split_arxiv_id(arxiv_id)
+        analysis_type = getattr(analysis_type, "value", analysis_type)
+        sql = "SELECT data FROM analyses WHERE arxiv_id = ? AND analysis_type = ?"
+        params: list[Any] = [base_id, analysis_type]
+        if model_used is not None:
+            sql += " AND model_used = ?"
+            params.append(model_used)
+        sql += " ORDER BY analysis_time DESC LIMIT 1"
+
+        with self._lock:
+            row = self._conn.execute(sql, params).fetchone()
+        return PaperAnalysis.model_validate_json(row["data"]) if row else None
+
+    def get_analyses(self, arxiv_id: str) -> list[PaperAnalysis]:
+        """获取论文的全部分析结果"""
+        base_id, _ = split_arxiv_id(arxiv_id)
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT data FROM analyses WHERE arxiv_id = ? ORDER BY analysis_time",
+                (base_id,),
+            ).fetchall()
+        return [PaperAnalysis.model_validate_json(row["data"]) for row in rows]
+
+    def top_scored_papers(
+        self, analysis_type: str, min_score: float, limit: int
+    ) -> list[PaperMetadata]:
+        """
+        获取某类分析中评分最高的论文
+
+        Args:
+            analysis_type: 分析类型
+            min_score: 最低评分（包含）
+            limit: 最大返回数量
+
+        Returns:
+            按评分降序、分析时间倒序排列的论文元数据列表
+        """
+        analysis_type = getattr(analysis_type, "value", analysis_type)
+        with self._lock:
+            rows = self._conn.execute(
+                """
+                SELECT p.data FROM papers p
+                JOIN (
+                    SELECT arxiv_id, MAX(score) AS score, MAX(analysis_time) AS at
+                    FROM analyses
+                    WHERE analysis_type = ? AND score >= ?
+                    GROUP BY arxiv_id
+                ) a ON a.arxiv_id = p.arxiv_id
+                ORDER BY a.score DESC, a.at DESC
+                LIMIT ?
+                """,
+                (analysis_type, min_score, limit),
+            ).fetchall()
+        return [PaperMetadata.model_validate_json(row["data"]) for row in rows]
+
+    # ------------------------------------------------------------------
+    # 研究者
+    # ------------------------------------------------------------------
+
+    def upsert_researcher(self, researcher: Researcher) -> None:
+        """插入或更新研究者"""
+        with self._lock, self._conn:
+            self._conn.execute(
+                """
+                INSERT INTO researchers (
+                    researcher_id, arxiv_name, is_monitored, data, last_updated
+                ) VALUES (?, ?, ?, ?, ?)
+                ON CONFLICT (researcher_id) DO UPDATE SET
+                    arxiv_name = excluded.arxiv_name,
+                    is_monitored = excluded.is_monitored,
+                    data = excluded.data,
+                    last_updated = excluded.last_updated
+                """,
+                (
+                    researcher.researcher_id,
+                    researcher.arxiv_name,
+                    int(researcher.is_monitored),
+                    researcher.model_dump_json(),
+                    _to_db_time(researcher.last_updated),
+                ),
+            )
+
+    def get_researcher(self, researcher_id: str) -> Researcher | None:
+        """获取研究者"""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT data FROM researchers WHERE researcher_id = ?",
+                (researcher_id,),
+            ).fetchone()
+        return Researcher.model_validate_json(row["data"]) if row else None
+
+    def list_researchers(self, monitored_only: bool = False) -> list[Researcher]:
+        """
+        列出研究者
+
+        Args:
+            monitored_only: 是否只返回被监控的研究者
+
+        Returns:
+            研究者列表
+        """
+        sql = "SELECT data FROM researchers"
+        if monitored_only:
+            sql += " WHERE is_monitored = 1"
+        sql += " ORDER BY arxiv_name"
+        with self._lock:
+            rows = self._conn.execute(sql).fetchall()
+        return [Researcher.model_validate_json(row["data"]) for row in rows]
+
+    # ------------------------------------------------------------------
+    # 增量监控水位线
+    # ------------------------------------------------------------------
+
+    def get_watermark(self, query_key: str) -> tuple[datetime, str] | None:
+        """
+        获取查询的水位线
+
+        Args:
+            query_key: 查询键，如 "daily:researcher:Alice Smith"
+
+        Returns:
+            (最后看到的更新时间(UTC，无时区), 对应的ArXiv ID)，从未运行时返回 None
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT updated_date, arxiv_id FROM watermarks WHERE query_key = ?",
+                (query_key,),
+            ).fetchone()
+        if row is None:
+            return None
+        return datetime.fromisoformat(row["updated_date"]), row["arxiv_id"]
+
+    def advance_watermark(
+        self, query_key: str, updated_date: datetime | date | str, arxiv_id: str
+    ) -> bool:
+        """
+        推进查询的水位线（只前进不后退）
+
+        Args:
+            query_key: 查询键
+            updated_date: 本次看到的最新更新时间
+            arxiv_id: 该论文的ArXiv ID
+
+        Returns:
+            水位线是否发生变化
+        """
+        with self._lock, self._conn:
+            cursor = self._conn.execute(
+                """
+                INSERT INTO watermarks (query_key, updated_date, arxiv_id, last_run)
+                VALUES (?, ?, ?, ?)
+                ON CONFLICT (query_key) DO UPDATE SET
+                    updated_date = excluded.updated_date,
+                    arxiv_id = excluded.arxiv_id,
+                    last_run = excluded.last_run
+                WHERE (excluded.updated_date, excluded.arxiv_id)
+                    > (watermarks.updated_date, watermarks.arxiv_id)
+                """,
+                (query_key, _to_db_time(updated_date), arxiv_id, _now()),
+            )
+        return cursor.rowcount > 0
+
+    def get_seen_versions(self, scope: str, arxiv_ids: Iterable[str]) -> dict[str, int]:
+        """
+        批量获取某个监控范围内已处理过的论文版本
+
+        Args:
+            scope: 监控范围，如 "daily"、"weekly"
+            arxiv_ids: ArXiv ID 列表（可带版本号）
+
+        Returns:
+            {不含版本号的ID: 已处理的版本号}
+        """
+        base_ids = list(dict.fromkeys(split_arxiv_id(i)[0] for i in arxiv_ids))
+        seen: dict[str, int] = {}
+        with self._lock:
+            for i in range(0, len(base_ids), 500):
+                batch = base_ids[i : i + 500]
+                placeholders = ",".join("?" * len(batch))
+                rows = self._conn.execute(
+                    "SELECT arxiv_id, version FROM seen_papers "
+                    f"WHERE scope = ? AND arxiv_id IN ({placeholders})",
+                    [scope, *batch],
+                ).fetchall()
+                seen.update({row["arxiv_id"]: row["version"] for row in rows})
+        return seen
+
+    def mark_seen(self, scope: str, arxiv_ids: Iterable[str]) -> None:
+        """
+        记录某个监控范围内已处理的论文版本
+
+        Args:
+            scope: 监控范围
+            arxiv_ids: ArXiv ID 列表（可带版本号）
+        """
+        seen_at = _now()
+        rows = [(scope, *split_arxiv_id(i), seen_at) for i in arxiv_ids]
+        with self._lock, self._conn:
+            self._conn.executemany(
+                """
+                INSERT INTO seen_papers (scope, arxiv_id, version, seen_at)
+                VALUES (?, ?, ?, ?)
+                ON CONFLICT (scope, arxiv_id) DO UPDATE SET
+                    version = MAX(version, excluded.version),
+                    seen_at = excluded.seen_at
+                """,
+                rows,
+            )
+
+    # ------------------------------------------------------------------
+    # 统计
+    # ------------------------------------------------------------------
+
+    def stats(self) -> dict[str, Any]:
+        """获取存储统计信息"""
+        with self._lock:
+            counts = {
+                table: self._conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+                for table in ("papers", "analyses", "researchers")
+            }
+        return {"db_path": self.db_path, "fulltext": self.fulltext, **counts}
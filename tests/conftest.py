@@ -100,6 +100,22 @@ def clean_environment():
             del os.environ[var]
 
 
+@pytest.fixture(autouse=True)
+def disable_rate_limiting(monkeypatch):
+    """测试中禁用共享限流器，避免真实等待"""
+    try:
+        from src.arxiv_follow.core.ratelimit import configure_rate_limiter
+        from src.arxiv_follow.models.config import AppConfig
+    except ImportError:
+        yield
+        return
+
+    # 测试中创建的配置默认同样禁用限流（各配置按限流设置获取共享限流器）
+    monkeypatch.setenv("ARXIV_FOLLOW_ENABLE_RATE_LIMITING", "false")
+    configure_rate_limiter(AppConfig())
+    yield
+
+
 def pytest_configure(config):
     """Pytest配置钩子"""
     # 添加自定义标记
@@ -3,18 +3,24 @@
 论文分析器测试
 """
 
+import asyncio
+import json
 import os
 import sys
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, patch
 
+import httpx
 import pytest
+import pytest_asyncio
 
 # 添加项目根目录到Python路径
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), "../../"))
 
 try:
+    from src.arxiv_follow.core import analyzer as analyzer_module
+    from src.arxiv_follow.core import resilience as resilience_module
     from src.arxiv_follow.core.analyzer import PaperAnalyzer
-    from src.arxiv_follow.models.config import APIConfig, AppConfig
+    from src.arxiv_follow.models.config import AppConfig
 except ImportError as e:
     pytest.skip(f"论文分析器模块导入失败: {e}", allow_module_level=True)
 
@@ -24,22 +30,18 @@ class TestPaperAnalyzer:
 
     @pytest.fixture
     def mock_config_with_api_key(self):
-        """创建带有API密钥的模拟配置"""
-        config = MagicMock(spec=AppConfig)
-        config.get_llm_api_key.return_value = "test_api_key"
-        config.llm = MagicMock(spec=APIConfig)
-        config.llm.api_base_url = "https://openrouter.ai/api/v1"
-        config.llm.default_model = "google/gemini-2.0-flash-001"
+        """创建带有API密钥的测试配置"""
+        config = AppConfig()
+        config.api.openrouter_api_key = "test_api_key"
+        config.storage.enable_cache = False
         return config
 
     @pytest.fixture
     def mock_config_without_api_key(self):
-        """创建没有API密钥的模拟配置"""
-        config = MagicMock(spec=AppConfig)
-        config.get_llm_api_key.return_value = None
-        config.llm = MagicMock(spec=APIConfig)
-        config.llm.api_base_url = "https://openrouter.ai/api/v1"
-        config.llm.default_model = "google/gemini-2.0-flash-001"
+        """创建没有API密钥的测试配置"""
+        config = AppConfig()
+        config.api.openrouter_api_key = None
+        config.storage.enable_cache = False
         return config
 
     @pytest.fixture
@@ -179,6 +181,85 @@ class TestPaperAnalyzer:
         assert "technical_analysis" in result
         assert "overall_score" in result
 
+    @pytest.mark.asyncio
+    async def test_comprehensive_report_runs_analyses_concurrently(
+        self, analyzer_with_key, sample_paper_data
+    ):
+        """测试综合报告中的各项分析并发执行"""
+        in_flight = 0
+        max_in_flight = 0
+
+        async def fake_call_llm(prompt, max_tokens=2000):
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(0.05)
+            in_flight -= 1
+            return "重要性评分: 7"
+
+        analyzer_with_key._call_llm = fake_call_llm
+        result = await analyzer_with_key.generate_comprehensive_report(
+            sample_paper_data
+        )
+
+        assert result["success"] is True
+        assert max_in_flight == 2
+        assert result["overall_score"] == 7.0
+
+    @pytest.mark.asyncio
+    async def test_comprehensive_report_merged(
+        self, analyzer_with_key, sample_paper_data
+    ):
+        """测试合并模式下一次调用返回两部分分析"""
+        response = (
+            "```json\n"
+            '{"significance": "意义重大", "importance_score": 8.5,'
+            ' "technical": "方法新颖"}\n'
+            "```"
+        )
+        analyzer_with_key._call_llm = AsyncMock(return_value=response)
+
+        result = await analyzer_with_key.generate_comprehensive_report(
+            sample_paper_data, merged=True
+        )
+
+        assert analyzer_with_key._call_llm.await_count == 1
+        assert result["success"] is True
+        assert result["overall_score"] == 8.5
+        assert result["significance_analysis"]["content"] == "意义重大"
+        assert result["technical_analysis"]["content"] == "方法新颖"
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("score", ["0", "12", "NaN"])
+    async def test_comprehensive_report_merged_rejects_invalid_score(
+        self, analyzer_with_key, sample_paper_data, score
+    ):
+        """测试合并结果评分越界或非有限数值时按解析失败处理"""
+        response = (
+            f'{{"significance": "意义重大", "importance_score": {score},'
+            ' "technical": "方法新颖"}'
+        )
+
+        analyzer_with_key._call_llm = AsyncMock(return_value=response)
+        result = await analyzer_with_key._analyze_merged(sample_paper_data)
+
+        assert result["success"] is False
+
+    @pytest.mark.asyncio
+    async def test_comprehensive_report_merged_falls_back(
+        self, analyzer_with_key, sample_paper_data
+    ):
+        """测试合并结果无法解析时回退为分项分析"""
+        analyzer_with_key._call_llm = AsyncMock(return_value="不是JSON")
+
+        result = await analyzer_with_key.generate_comprehensive_report(
+            sample_paper_data, merged=True
+        )
+
+        assert analyzer_with_key._call_llm.await_count == 3
+        assert result["success"] is True
+        assert result["technical_analysis"]["content"] == "不是JSON"
+
     @pytest.mark.asyncio
     async def test_analyze_multiple_papers(self, analyzer_with_key, sample_paper_data):
         """测试批量分析论文"""
@@ -196,6 +277,30 @@ class TestPaperAnalyzer:
             assert len(results) == 2
             assert mock_analyze.call_count == 2
 
+    @pytest.mark.asyncio
+    async def test_analyze_multiple_papers_deadline(
+        self, analyzer_with_key, sample_paper_data
+    ):
+        """测试超过截止时间的论文返回默认评分且保持顺序"""
+
+        async def analyze(paper_data):
+            if paper_data["arxiv_id"] == "slow":
+                await asyncio.sleep(10)
+            return {"success": True, "importance_score": 8.0}
+
+        papers = [
+            {**sample_paper_data, "arxiv_id": "slow"},
+            {**sample_paper_data, "arxiv_id": "fast"},
+        ]
+        with patch.object(analyzer_with_key, "analyze_paper_significance", analyze):
+            results = await analyzer_with_key.analyze_multiple_papers(
+                papers, mode="significance", concurrency=2, deadline=0.1
+            )
+
+        assert results[0]["timed_out"] is True
+        assert results[0]["importance_score"] == 5.0
+        assert results[1] == {"success": True, "importance_score": 8.0}
+
     def test_generate_daily_summary(self, analyzer_with_key):
         """测试生成每日总结"""
         papers_analysis = [
@@ -236,3 +341,384 @@ class TestPaperAnalyzer:
         assert analyzer is not None
         # 由于没有API密钥，这个分析器应该是禁用状态
         assert not analyzer.is_enabled()
+
+
+class TestAnalyzerHTTPClient:
+    """分析器长连接客户端和重试测试类"""
+
+    @pytest_asyncio.fixture
+    async def analyzer(self, monkeypatch):
+        """创建使用模拟传输层的分析器"""
+        config = AppConfig()
+        config.api.openrouter_api_key = "test_api_key"
+        config.api.http_retries = 2
+        monkeypatch.setattr(resilience_module, "backoff_delay", lambda attempt: 0.0)
+        resilience_module.configure_circuit_breakers(config)
+
+        async with PaperAnalyzer(config) as analyzer:
+            yield analyzer
+
+    @staticmethod
+    def install_transport(analyzer, handler):
+        """为分析器安装模拟传输层，返回请求计数列表"""
+        requests = []
+
+        def record(request):
+            requests.append(request)
+            return handler(len(requests))
+
+        analyzer._client = httpx.AsyncClient(transport=httpx.MockTransport(record))
+        analyzer._client_loop = asyncio.get_running_loop()
+        return requests
+
+    @staticmethod
+    def ok(content="分析结果"):
+        """构造成功的补全响应"""
+        return httpx.Response(
+            200, json={"choices": [{"message": {"content": content}}]}
+        )
+
+    @pytest.mark.asyncio
+    async def test_client_is_reused(self, analyzer):
+        """测试多次调用复用同一个客户端"""
+        self.install_transport(analyzer, lambda n: self.ok())
+        client = analyzer._client
+
+        assert await analyzer._call_llm("a") == "分析结果"
+        assert await analyzer._call_llm("b") == "分析结果"
+        assert analyzer._client is client
+
+        stats = analyzer.llm_stats()
+        assert stats["calls"] == 2
+        assert stats["succeeded"] == 2
+        assert stats["retries"] == 0
+
+    @pytest.mark.asyncio
+    async def test_uses_rate_limiter_for_own_config(self, analyzer, monkeypatch):
+        """测试按分析器自身的配置获取限流器"""
+        configs = []
+        get_rate_limiter = analyzer_module.get_rate_limiter
+
+        def record(config=None):
+            configs.append(config)
+            return get_rate_limiter(config)
+
+        monkeypatch.setattr(analyzer_module, "get_rate_limiter", record)
+        self.install_transport(analyzer, lambda n: self.ok())
+
+        assert await analyzer._call_llm("a") == "分析结果"
+        assert configs == [analyzer.config]
+
+    @pytest.mark.asyncio
+    async def test_retries_on_429_and_5xx(self, analyzer):
+        """测试 429/5xx 时重试"""
+        statuses = {1: 429, 2: 503}
+        requests = self.install_transport(
+            analyzer,
+            lambda n: httpx.Response(statuses[n]) if n in statuses else self.ok(),
+        )
+
+        assert await analyzer._call_llm("prompt") == "分析结果"
+        assert len(requests) == 3
+        assert analyzer.llm_stats()["retries"] == 2
+
+    @pytest.mark.asyncio
+    async def test_gives_up_after_max_retries(self, analyzer):
+        """测试超过最大重试次数后返回 None"""
+        requests = self.install_transport(analyzer, lambda n: httpx.Response(500))
+
+        assert await analyzer._call_llm("prompt") is None
+        assert len(requests) == 3
+        assert analyzer.llm_stats()["failed"] == 1
+
+    @pytest.mark.asyncio
+    async def test_honors_retry_after(self, analyzer, monkeypatch):
+        """测试按 Retry-After 等待后重试"""
+        delays = []
+
+        async def fake_sleep(delay):
+            delays.append(delay)
+
+        monkeypatch.setattr(resilience_module.asyncio, "sleep", fake_sleep)
+        self.install_transport(
+            analyzer,
+            lambda n: (
+                httpx.Response(429, headers={"Retry-After": "3"})
+                if n == 1
+                else self.ok()
+            ),
+        )
+
+        assert await analyzer._call_llm("prompt") == "分析结果"
+        assert delays == [3.0]
+
+    @pytest.mark.asyncio
+    async def test_open_circuit_fails_fast(self, analyzer):
+        """测试 OpenRouter 熔断期间不再发送请求"""
+        analyzer.config.api.circuit_breaker_threshold = 3
+        resilience_module.configure_circuit_breakers(analyzer.config)
+        requests = self.install_transport(analyzer, lambda n: httpx.Response(503))
+
+        assert await analyzer._call_llm("a") is None
+        assert await analyzer._call_llm("b") is None
+        assert len(requests) == 3
+
+    @pytest.mark.asyncio
+    async def test_client_errors_are_not_retried(self, analyzer):
+        """测试 4xx（429除外）不重试"""
+        requests = self.install_transport(analyzer, lambda n: httpx.Response(401))
+
+        assert await analyzer._call_llm("prompt") is None
+        assert len(requests) == 1
+
+    @pytest.mark.asyncio
+    async def test_records_token_usage(self, analyzer):
+        """测试记录API返回的输入/输出令牌数"""
+        self.install_transport(
+            analyzer,
+            lambda n: httpx.Response(
+                200,
+                json={
+                    "choices": [{"message": {"content": "分析结果"}}],
+                    "usage": {"prompt_tokens": 120, "completion_tokens": 30},
+                },
+            ),
+        )
+
+        await analyzer._call_llm("prompt")
+
+        stats = analyzer.llm_stats()
+        assert stats["prompt_tokens"] == 120
+        assert stats["completion_tokens"] == 30
+
+    @pytest.mark.asyncio
+    async def test_oversized_prompt_is_not_sent(self, analyzer):
+        """测试超出模型上下文的提示词不发送，输出预算按剩余上下文收缩"""
+        requests = self.install_transport(analyzer, lambda n: self.ok())
+        analyzer.context_tokens = 1000
+
+        assert await analyzer._call_llm("word " * 4000) is None
+        assert requests == []
+        assert analyzer.llm_stats()["oversized"] == 1
+
+        await analyzer._call_llm("prompt", max_tokens=2000)
+        assert json.loads(requests[0].content)["max_tokens"] < 1000
+
+    @pytest.mark.asyncio
+    async def test_close_releases_client(self, analyzer):
+        """测试关闭后释放客户端"""
+        self.install_transport(analyzer, lambda n: self.ok())
+        client = analyzer._client
+        await analyzer.close()
+
+        assert client.is_closed
+        assert analyzer._client is None
+
+
+class TestSignificanceBatch:
+    """批量重要性评分测试类"""
+
+    @pytest.fixture
+    def analyzer(self):
+        """创建禁用缓存的分析器"""
+        config = AppConfig()
+        config.api.openrouter_api_key = "test_api_key"
+        config.storage.enable_cache = False
+        return PaperAnalyzer(config)
+
+    @staticmethod
+    def papers(count):
+        """构造示例论文列表"""
+        return [
+            {
+                "arxiv_id": f"2501.{i:05d}",
+                "title": f"Paper {i}",
+                "abstract": "We study things. " * 20,
+                "categories": ["cs.AI"],
+            }
+            for i in range(count)
+        ]
+
+    def test_batches_sized_by_output_budget(self, analyzer):
+        """测试每批论文数受 ai_max_tokens 限制"""
+        analyzer.max_tokens = 400
+        batches = analyzer.plan_significance_batches(self.papers(12))
+
+        assert [len(batch) for batch in batches] == [5, 5, 2]
+        assert [i for batch in batches for i in batch] == list(range(12))
+
+    @pytest.mark.asyncio
+    async def test_one_request_per_batch(self, analyzer):
+        """测试一个批次只发送一次请求"""
+        papers = self.papers(3)
+        response = json.dumps(
+            [
+                {
+                    "arxiv_id": p["arxiv_id"],
+                    "importance_score": 6 + i,
+                    "keywords": ["a"],
+                }
+                for i, p in enumerate(papers)
+            ]
+        )
+        analyzer._call_llm = AsyncMock(return_value=f"```json\n{response}\n```")
+
+        results = await analyzer.analyze_multiple_papers(
+            papers, mode="significance_batch"
+        )
+
+        assert analyzer._call_llm.await_count == 1
+        assert [r["importance_score"] for r in results] == [6.0, 7.0, 8.0]
+        assert all(r["batched"] and r["keywords"] == ["a"] for r in results)
+
+    @pytest.mark.asyncio
+    async def test_omitted_and_malformed_entries_fall_back(self, analyzer):
+        """测试遗漏或格式错误的论文回退为逐篇分析"""
+        papers = self.papers(3)
+        batch_response = json.dumps(
+            [
+                {"arxiv_id": papers[0]["arxiv_id"], "importance_score": 9},
+                {"arxiv_id": papers[1]["arxiv_id"], "importance_score": "high"},
+            ]
+        )
+        analyzer._call_llm = AsyncMock(
+            side_effect=[batch_response, "重要性评分: 4", "重要性评分: 4"]
+        )
+
+        results = await analyzer.analyze_significance_batch(papers)
+
+        assert analyzer._call_llm.await_count == 3
+        assert results[0]["importance_score"] == 9.0
+        assert results[0]["batched"] is True
+        assert [r["importance_score"] for r in results[1:]] == [4.0, 4.0]
+        assert not any(r.get("batched") for r in results[1:])
+
+    @pytest.mark.asyncio
+    async def test_out_of_range_scores_fall_back(self, analyzer):
+        """测试超出 1-10 分范围的批量评分回退为逐篇分析"""
+        papers = self.papers(2)
+        batch_response = json.dumps(
+            [
+                {"arxiv_id": papers[0]["arxiv_id"], "importance_score": 1},
+                {"arxiv_id": papers[1]["arxiv_id"], "importance_score": 0},
+            ]
+        )
+        analyzer._call_llm = AsyncMock(side_effect=[batch_response, "重要性评分: 4"])
+
+        results = await analyzer.analyze_significance_batch(papers)
+
+        assert analyzer._call_llm.await_count == 2
+        assert results[0]["importance_score"] == 1.0
+        assert results[0]["batched"] is True
+        assert results[1]["importance_score"] == 4.0
+        assert not results[1].get("batched")
+
+    @pytest.mark.asyncio
+    async def test_cached_papers_are_not_resent(self, tmp_path):
+        """测试已缓存的论文不再进入批量请求"""
+        config = AppConfig()
+        config.api.openrouter_api_key = "test_api_key"
+        config.storage.cache_dir = str(tmp_path)
+        analyzer = PaperAnalyzer(config)
+        papers = self.papers(2)
+
+        def respond(prompt, max_tokens=2000):
+            ids = [p["arxiv_id"] for p in papers if p["arxiv_id"] in prompt]
+            return json.dumps(
+                [{"arxiv_id": i, "importance_score": 7, "keywords": []} for i in ids]
+            )
+
+        analyzer._call_llm = AsyncMock(side_effect=respond)
+        await analyzer.analyze_significance_batch(papers[:1])
+        results = await analyzer.analyze_significance_batch(papers)
+
+        assert analyzer._call_llm.await_count == 2
+        assert papers[0]["arxiv_id"] not in analyzer._call_llm.await_args.args[0]
+        assert results[0]["cached"] is True
+        assert "cached" not in results[1]
+
+
+class TestStructuredAnalysis:
+    """结构化输出分析测试类"""
+
+    @pytest.fixture
+    def analyzer(self):
+        """创建禁用缓存的分析器"""
+        config = AppConfig()
+        config.api.openrouter_api_key = "test_api_key"
+        config.storage.enable_cache = False
+        return PaperAnalyzer(config)
+
+    @staticmethod
+    def structured_response(score=8.0):
+        """构造符合 Schema 的结构化输出"""
+        return json.dumps(
+            {
+                "importance_score": score,
+                "summary": "意义重大",
+                "key_points": ["要点"],
+                "contributions": ["贡献"],
+                "limitations": ["局限"],
+                "keywords": ["深度学习"],
+            },
+            ensure_ascii=False,
+        )
+
+    def test_extract_importance_score_ignores_list_markers(self):
+        """测试评分提取不会误取列表序号"""
+        text = "1. **研究意义**：重要\n5. **重要性评分**：8/10\n\n重要性评分: 7.5"
+        assert analyzer_module.extract_importance_score(text) == 7.5
+        assert analyzer_module.extract_importance_score("## 重要性评分\n6.5") == 6.5
+        assert analyzer_module.extract_importance_score("1. 研究意义\n2. 评分") is None
+        assert analyzer_module.extract_importance_score("重要性评分: 85") is None
+        assert analyzer_module.extract_importance_score("重要性评分: 0") is None
+
+    def test_validate_importance_score(self):
+        """测试所有分析路径共用的评分范围校验"""
+        validate = analyzer_module.validate_importance_score
+        assert validate(1) == 1.0
+        assert validate(9.5) == 9.5
+        assert validate(0) is None
+        assert validate(10.5) is None
+        assert validate(float("nan")) is None
+        assert validate(True) is None
+        assert validate("8") is None
+
+    @pytest.mark.asyncio
+    async def test_structured_maps_to_paper_analysis(self, analyzer):
+        """测试结构化输出直接映射为 PaperAnalysis"""
+        analyzer._call_llm = AsyncMock(return_value=self.structured_response())
+
+        result = await analyzer.analyze_paper_structured(
+            {"arxiv_id": "2501.12345", "title": "T", "abstract": "A"}
+        )
+
+        assert result["success"] is True
+        assert result["importance_score"] == 8.0
+        assert result["analysis"]["contributions"] == ["贡献"]
+        assert result["analysis"]["keywords"] == ["深度学习"]
+        assert result["analysis"]["arxiv_id"] == "2501.12345"
+        response_format = analyzer._call_llm.await_args.kwargs["response_format"]
+        assert response_format["type"] == "json_schema"
+
+    @pytest.mark.asyncio
+    async def test_repair_pass_only_on_failure(self, analyzer):
+        """测试解析失败时发起一次修复请求"""
+        analyzer._call_llm = AsyncMock(
+            side_effect=['{"importance_score": 12}', self.structured_response(6.0)]
+        )
+
+        result = await analyzer.analyze_paper_structured({"title": "T"})
+
+        assert analyzer._call_llm.await_count == 2
+        assert result["importance_score"] == 6.0
+
+    @pytest.mark.asyncio
+    async def test_unrepairable_output_fails(self, analyzer):
+        """测试修复后仍无法解析时返回失败和默认评分"""
+        analyzer._call_llm = AsyncMock(return_value="无法解析")
+
+        result = await analyzer.analyze_paper_structured({"title": "T"})
+
+        assert result["success"] is False
+        assert result["importance_score"] == 5.0
@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""
+作者姓名匹配测试
+"""
+
+import os
+import sys
+
+import pytest
+
+# 添加项目根目录到Python路径
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "../../"))
+
+try:
+    from src.arxiv_follow.core.authors import AuthorMatcher, normalize_author_name
+    from src.arxiv_follow.core.collector import (
+        build_author_query,
+        plan_author_queries,
+    )
+except ImportError as e:
+    pytest.skip(f"作者匹配模块导入失败: {e}", allow_module_level=True)
+
+
+class TestAuthorMatching:
+    """作者姓名匹配测试类"""
+
+    def test_normalize_author_name(self):
+        """测试去重音和标点"""
+        assert normalize_author_name("José  García-López") == "jose garcia lopez"
+
+    def test_match_full_name_and_variants(self):
+        """测试完整姓名和姓名变体匹配"""
+        matcher = AuthorMatcher(
+            {"John Smith": [], "Wei Zhang": ["W. Zhang"], "Alice Brown": []}
+        )
+
+        assert matcher.match(["JOHN SMITH", "Someone Else"]) == {"John Smith"}
+        assert matcher.match(["W Zhang"]) == {"Wei Zhang"}
+        assert matcher.match(["Bob Wilson"]) == set()
+
+    def test_initial_match_requires_unique_researcher(self):
+        """测试首字母匹配在同姓研究者冲突时不采用"""
+        matcher = AuthorMatcher({"John Smith": [], "Jane Smith": []})
+
+        assert matcher.match(["J. Smith"]) == set()
+        assert matcher.match(["Jane Smith"]) == {"Jane Smith"}
+
+    def test_initial_match_only_for_abbreviated_names(self):
+        """测试只有缩写姓名才按首字母匹配"""
+        matcher = AuthorMatcher({"John Smith": [], "K. Lee": []})
+
+        assert matcher.match(["Jane Smith"]) == set()
+        assert matcher.match(["J. Smith"]) == {"John Smith"}
+        assert matcher.match(["Kevin Lee"]) == {"K. Lee"}
+
+    def test_plan_author_queries_chunks(self):
+        """测试按作者数和查询长度分组"""
+        authors = [f"Author {i}" for i in range(45)]
+
+        chunks = plan_author_queries(authors, max_authors=20)
+        assert [len(c) for c in chunks] == [20, 20, 5]
+
+        chunks = plan_author_queries(authors, max_length=100)
+        assert all(len(build_author_query(c)) <= 110 for c in chunks)
+        assert sum(len(c) for c in chunks) == 45
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+磁盘缓存测试
+"""
+
+import os
+import sys
+import time
+
+import pytest
+
+# 添加项目根目录到Python路径
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "../../"))
+
+try:
+    from src.arxiv_follow.core.cache import DiskCache, normalize_url
+except ImportError as e:
+    pytest.skip(f"缓存模块导入失败: {e}", allow_module_level=True)
+
+
+class TestDiskCache:
+    """磁盘缓存测试类"""
+
+    @pytest.fixture
+    def cache(self, tmp_path):
+        """创建缓存实例"""
+        return DiskCache(tmp_path, ttl_seconds=3600, max_size_mb=1, namespace="test")
+
+    def test_get_miss_then_hit(self, cache):
+        """测试未命中和命中计数"""
+        assert cache.get("key") is None
+
+        cache.set("key", b"value")
+        assert cache.get("key") == b"value"
+
+        stats = cache.stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+        assert stats["hit_rate"] == 0.5
+
+    def test_ttl_expiry(self, cache):
+        """测试过期条目被视为未命中并被删除"""
+        cache.set("key", b"value")
+        path = cache._path_for("key")
+        old = time.time() - 7200
+        os.utime(path, (old, old))
+
+        assert cache.get("key") is None
+        assert not path.exists()
+
+    def test_lru_eviction(self, tmp_path):
+        """测试超过大小上限时淘汰最久未访问的条目"""
+        cache = DiskCache(tmp_path, ttl_seconds=3600, max_size_mb=1)
+        chunk = b"x" * (400 * 1024)
+
+        cache.set("a", chunk)
+        cache.set("b", chunk)
+        # 访问 a，使 b 成为最久未访问的条目
+        os.utime(cache._path_for("b"), (time.time() - 100, time.time()))
+        assert cache.get("a") == chunk
+
+        cache.set("c", chunk)
+
+        assert cache.get("b") is None
+        assert cache.get("a") == chunk
+        assert cache.get("c") == chunk
+        assert cache.evictions == 1
+
+    def test_normalize_url_sorts_params(self):
+        """测试URL规范化"""
+        url1 = "HTTP://Export.arxiv.org/api/query?start=0&search_query=cat%3Acs.AI"
+        url2 = "http://export.arxiv.org/api/query?search_query=cat%3Acs.AI&start=0"
+
+        assert normalize_url(url1) == normalize_url(url2)
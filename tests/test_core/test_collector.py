@@ -0,0 +1,524 @@
+#!/usr/bin/env python3
+"""
+ArXiv收集器测试
+"""
+
+import asyncio
+import os
+import re
+import sys
+from collections.abc import Callable
+from datetime import date, timedelta
+from urllib.parse import unquote_plus
+
+import httpx
+import pytest
+import pytest_asyncio
+
+# 添加项目根目录到Python路径
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "../../"))
+
+try:
+    from src.arxiv_follow.core.atom import AtomStreamParser
+    from src.arxiv_follow.core.collector import (
+        ArxivCollector,
+        plan_date_windows,
+        plan_pages,
+    )
+    from src.arxiv_follow.core.singleflight import SingleFlight
+    from src.arxiv_follow.models.config import AppConfig, StorageConfig
+except ImportError as e:
+    pytest.skip(f"收集器模块导入失败: {e}", allow_module_level=True)
+
+
+def build_atom_feed(
+    arxiv_ids: list[str],
+    total: int | None = None,
+    published: Callable[[str], str] | None = None,
+) -> str:
+    """构建与ArXiv API格式一致的Atom响应"""
+    published = published or (lambda arxiv_id: "2025-01-14T09:00:00Z")
+
+    def entry(arxiv_id: str) -> str:
+        return f"""
+  <entry>
+    <id>http://arxiv.org/abs/{arxiv_id}v1</id>
+    <updated>2025-01-15T10:00:00Z</updated>
+    <published>{published(arxiv_id)}</published>
+    <title>Paper {arxiv_id}</title>
+    <summary>Abstract of {arxiv_id}.</summary>
+    <author><name>John Smith</name></author>
+    <author><name>Alice Brown</name></author>
+    <arxiv:doi>10.1000/{arxiv_id}</arxiv:doi>
+    <category term="cs.AI" scheme="http://arxiv.org/schemas/atom"/>
+    <category term="cs.CR" scheme="http://arxiv.org/schemas/atom"/>
+  </entry>"""
+
+    entries = "".join(entry(arxiv_id) for arxiv_id in arxiv_ids)
+    total = len(arxiv_ids) if total is None else total
+    return f"""<?xml version="1.0" encoding="UTF-8"?>
+<feed xmlns="http://www.w3.org/2005/Atom"
+      xmlns:opensearch="http://a9.com/-/spec/opensearch/1.1/"
+      xmlns:arxiv="http://arxiv.org/schemas/atom">
+  <title>ArXiv Query</title>
+  <opensearch:totalResults>{total}</opensearch:totalResults>
+  <opensearch:startIndex>0</opensearch:startIndex>{entries}
+</feed>
+"""
+
+
+def mock_transport(
+    collector: "ArxivCollector", body: str | Callable[[httpx.Request], str]
+) -> list[str]:
+    """将收集器的HTTP客户端替换为模拟传输，返回请求URL记录"""
+    requested: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requested.append(str(request.url))
+        text = body(request) if callable(body) else body
+        return httpx.Response(200, content=text.encode("utf-8"))
+
+    collector.client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return requested
+
+
+def paged_feed(total: int) -> Callable[[httpx.Request], str]:
+    """按 start/max_results 参数返回对应分页的响应"""
+
+    def body(request: httpx.Request) -> str:
+        start = int(request.url.params["start"])
+        size = int(request.url.params["max_results"])
+        ids = [f"2501.{i:05d}" for i in range(start, min(start + size, total))]
+        return build_atom_feed(ids, total=total)
+
+    return body
+
+
+def daily_feed(
+    papers_per_day: int, dense: dict[int, int] | None = None
+) -> Callable[[httpx.Request], str]:
+    """按 submittedDate 窗口和分页参数返回每天固定数量论文的响应（dense 指定个别日期的数量）"""
+
+    def body(request: httpx.Request) -> str:
+        query = request.url.params["search_query"]
+        start_day, end_day = (
+            date(int(y), int(m), int(d))
+            for y, m, d in re.findall(r"(\d{4})(\d{2})(\d{2})\d{4}", query)
+        )
+        ids = [
+            f"2501.{day.day:02d}{i:03d}"
+            for offset in range((end_day - start_day).days, -1, -1)
+            for day in [start_day + timedelta(days=offset)]
+            for i in range((dense or {}).get(day.day, papers_per_day))
+        ]
+        start = int(request.url.params["start"])
+        size = int(request.url.params["max_results"])
+        return build_atom_feed(
+            ids[start : start + size],
+            total=len(ids),
+            published=lambda arxiv_id: f"2025-01-{arxiv_id[5:7]}T09:00:00Z",
+        )
+
+    return body
+
+
+class TestArxivCollector:
+    """ArXiv收集器测试类"""
+
+    @pytest.fixture
+    def config(self, tmp_path):
+        """创建使用临时缓存目录的配置"""
+        return AppConfig(
+            storage=StorageConfig(
+                cache_dir=str(tmp_path / "cache"), data_dir=str(tmp_path / "data")
+            )
+        )
+
+    @pytest_asyncio.fixture
+    async def collector(self, config):
+        """创建收集器实例"""
+        collector = ArxivCollector(config)
+        yield collector
+        await collector.close()
+
+    @pytest.mark.asyncio
+    async def test_parse_arxiv_response(self, collector):
+        """测试解析ArXiv响应"""
+        result = collector._parse_arxiv_response(
+            build_atom_feed(["2501.00001", "2501.00002"], total=42)
+        )
+
+        assert result["total_results"] == 42
+        assert result["count"] == 2
+        paper = result["papers"][0]
+        assert paper["arxiv_id"] == "2501.00001v1"
+        assert paper["authors"] == ["John Smith", "Alice Brown"]
+        assert paper["categories"] == ["cs.AI", "cs.CR"]
+        assert paper["primary_category"] == "cs.AI"
+        assert paper["doi"] == "10.1000/2501.00001"
+
+    @pytest.mark.asyncio
+    async def test_search_by_query_uses_cache(self, collector):
+        """测试重复查询命中磁盘缓存"""
+        requested = mock_transport(collector, build_atom_feed(["2501.00001"]))
+
+        first = await collector.search_by_query("cat:cs.AI", max_results=10)
+        second = await collector.search_by_query("cat:cs.AI", max_results=10)
+
+        assert len(requested) == 1
+        assert first.metrics.cache_misses == 1
+        assert second.metrics.cache_hits == 1
+        assert second.papers[0]["arxiv_id"] == first.papers[0]["arxiv_id"]
+
+    @pytest.mark.asyncio
+    async def test_search_by_query_cache_disabled(self, tmp_path):
+        """测试禁用缓存时每次都请求网络"""
+        config = AppConfig(
+            storage=StorageConfig(cache_dir=str(tmp_path), enable_cache=False)
+        )
+        async with ArxivCollector(config) as collector:
+            requested = mock_transport(collector, build_atom_feed(["2501.00001"]))
+
+            await collector.search_by_query("cat:cs.AI")
+            await collector.search_by_query("cat:cs.AI")
+
+            assert collector.cache is None
+            assert len(requested) == 2
+
+    @pytest.mark.asyncio
+    async def test_collectors_do_not_share_flights(self, config):
+        """测试每个收集器持有独立的并发请求合并器"""
+        first, second = ArxivCollector(config), ArxivCollector(config)
+        try:
+            assert first.flights is not second.flights
+        finally:
+            await first.close()
+            await second.close()
+
+    @pytest.mark.asyncio
+    async def test_concurrent_identical_queries_are_coalesced(self, config):
+        """测试共享合并器的不同收集器的相同并发查询只请求一次"""
+        flights = SingleFlight()
+        collectors = [ArxivCollector(config), ArxivCollector(config)]
+        requested: list[str] = []
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            requested.append(str(request.url))
+            await asyncio.sleep(0.01)
+            return httpx.Response(200, text=build_atom_feed(["2501.00001"]))
+
+        for collector in collectors:
+            collector.flights = flights
+            collector.cache = None
+            collector.client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+        results = await asyncio.gather(
+            collectors[0].search_by_query("cat:cs.AI"),
+            collectors[1].search_by_query("cat:cs.AI"),
+            collectors[0].get_paper_details("2501.00001"),
+        )
+        for collector in collectors:
+            await collector.close()
+
+        assert len(requested) == 2
+        assert flights.stats()["deduplicated"] == 1
+        assert results[0].papers == results[1].papers
+        assert results[0].papers[0] is not results[1].papers[0]
+        assert results[2].metadata.title == "Paper 2501.00001"
+
+    @pytest.mark.asyncio
+    async def test_get_paper_content_revalidates_with_etag(self, collector):
+        """测试HTML内容通过ETag重新验证，304时使用缓存内容"""
+        requests: list[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            if request.headers.get("If-None-Match") == '"v1"':
+                return httpx.Response(304)
+            return httpx.Response(
+                200, text="<html>latex github</html>", headers={"ETag": '"v1"'}
+            )
+
+        collector.client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+        first = await collector.get_paper_content("2501.00001")
+        second = await collector.get_paper_content("2501.00001")
+
+        assert len(requests) == 2
+        assert "If-None-Match" not in requests[0].headers
+        assert second.html_content == first.html_content == "<html>latex github</html>"
+        assert second.has_latex and second.has_code
+        assert collector.content_cache.stats()["revalidated"] == 1
+
+    @pytest.mark.asyncio
+    async def test_get_paper_content_negative_cache(self, collector):
+        """测试没有HTML版本的论文在负缓存有效期内不再探测"""
+        requested = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requested.append(str(request.url))
+            return httpx.Response(404, text="No HTML")
+
+        collector.client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+        assert await collector.get_paper_content("2501.00002") is None
+        assert await collector.get_paper_content("2501.00002") is None
+        assert len(requested) == 1
+        assert collector.content_cache.stats()["negative_hits"] == 1
+
+        # 负缓存过期后重新探测
+        collector.content_cache.negative_ttl_seconds = 0
+        assert await collector.get_paper_content("2501.00002") is None
+        assert len(requested) == 2
+
+    @pytest.mark.asyncio
+    async def test_get_papers_by_ids_batches_and_reports_missing(self, collector):
+        """测试 id_list 批量查询保持输入顺序并报告缺失ID"""
+        requested = mock_transport(
+            collector, build_atom_feed(["2501.00002", "2501.00001"])
+        )
+
+        result = await collector.get_papers_by_ids(
+            ["2501.00001", "2501.99999", "2501.00002"]
+        )
+
+        assert list(result) == ["2501.00001", "2501.99999", "2501.00002"]
+        assert result["2501.99999"] is None
+        assert result["2501.00001"].title == "Paper 2501.00001"
+        assert len(requested) == 1
+
+        url = requested[0]
+        assert "id_list=2501.00001%2C2501.99999%2C2501.00002" in url
+        assert "search_query" not in url
+
+    @pytest.mark.asyncio
+    async def test_get_papers_by_ids_reports_failed_batches(self, collector):
+        """测试请求失败的批次单独报告，而不是当作论文不存在"""
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            ids = request.url.params["id_list"].split(",")
+            if "2501.00003" in ids:
+                return httpx.Response(400)
+            return httpx.Response(200, content=build_atom_feed(ids[:1]).encode())
+
+        collector.client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+        failed_ids: list[str] = []
+        result = await collector.get_papers_by_ids(
+            ["2501.00001", "2501.00002", "2501.00003"],
+            batch_size=2,
+            failed_ids=failed_ids,
+        )
+
+        assert result["2501.00001"] is not None
+        assert result["2501.00002"] is None
+        assert failed_ids == ["2501.00003"]
+
+    @pytest.mark.asyncio
+    async def test_collect_papers_batch_preserves_order(self, collector):
+        """测试批量收集按输入顺序返回并跳过缺失论文"""
+        mock_transport(collector, build_atom_feed(["2501.00001", "2501.00002"]))
+
+        papers = await collector.collect_papers_batch(
+            ["2501.00002", "2501.00003", "2501.00001"]
+        )
+
+        assert [p.arxiv_id for p in papers] == ["2501.00002v1", "2501.00001v1"]
+
+    def test_stream_parser_emits_entries_per_chunk(self):
+        """测试增量解析器在条目闭合后立即产出，且分块结果与整体解析一致"""
+        feed = build_atom_feed(["2501.00001", "2501.00002", "2501.00003"]).encode()
+        parser = AtomStreamParser()
+
+        emitted = []
+        for i in range(0, len(feed), 64):
+            emitted.append(parser.feed(feed[i : i + 64]))
+        emitted.append(parser.close())
+
+        papers = [paper for batch in emitted for paper in batch]
+        assert [p["arxiv_id"] for p in papers] == [
+            "2501.00001v1",
+            "2501.00002v1",
+            "2501.00003v1",
+        ]
+        # 条目分布在多个数据块中产出，而不是在结束时一次性产出
+        assert sum(1 for batch in emitted if batch) == 3
+        assert parser.total_results == 3
+
+    @pytest.mark.asyncio
+    async def test_parse_invalid_xml(self, collector):
+        """测试非法XML抛出 ValueError"""
+        with pytest.raises(ValueError):
+            collector._parse_arxiv_response("<feed><entry>")
+
+    def test_plan_pages(self):
+        """测试根据总数规划分页"""
+        assert plan_pages(230, 100) == [(0, 100), (100, 100), (200, 30)]
+        assert plan_pages(230, 100, max_total=150, start=100) == [(100, 50)]
+        assert plan_pages(0, 100) == []
+
+    def test_plan_date_windows(self):
+        """测试根据探测总数规划日期窗口"""
+        start, end = date(2025, 1, 1), date(2025, 1, 30)
+        assert plan_date_windows(start, end, 500, window_limit=1000) == [(start, end)]
+
+        # 每天100篇、上限1000：按一半余量规划为5天一个窗口，从新到旧
+        windows = plan_date_windows(start, end, 3000, window_limit=1000)
+        assert len(windows) == 6
+        assert windows[0] == (date(2025, 1, 26), end)
+        assert windows[-1] == (start, date(2025, 1, 5))
+
+        # 单日结果即超过上限时退化为逐日窗口
+        assert len(plan_date_windows(start, end, 90000, window_limit=1000)) == 30
+
+    @pytest.mark.asyncio
+    async def test_harvest_date_range_merges_windows(self, collector):
+        """测试分片采集覆盖全部窗口、去重并按日期排序"""
+        requested = mock_transport(collector, daily_feed(papers_per_day=30))
+
+        result = await collector.harvest_date_range(
+            date(2025, 1, 1),
+            date(2025, 1, 10),
+            categories=["cs.AI"],
+            window_limit=100,
+            batch_size=20,
+        )
+
+        ids = [paper["arxiv_id"] for paper in result.papers]
+        assert len(ids) == 300
+        assert len(set(ids)) == 300
+        dates = [paper["submitted_date"] for paper in result.papers]
+        assert dates == sorted(dates, reverse=True)
+        assert result.metrics.total_found == 300
+        # 探测请求只获取一条结果
+        assert "max_results=1&" in requested[0]
+        assert all("cat%3Acs.AI" in url for url in requested)
+
+    @pytest.mark.asyncio
+    async def test_harvest_date_range_splits_dense_windows(self, collector):
+        """测试窗口实际结果超过上限时继续拆分，并截断到 max_results"""
+        requested = mock_transport(collector, daily_feed(5, dense={10: 100}))
+
+        result = await collector.harvest_date_range(
+            date(2025, 1, 1), date(2025, 1, 10), window_limit=100, batch_size=50
+        )
+
+        # 按平均密度规划的3天窗口包含高峰日，拆分到单日窗口后完整获取
+        assert len({paper["arxiv_id"] for paper in result.papers}) == 145
+        queries = [unquote_plus(url) for url in requested]
+        assert any("[202501100000 TO 202501102359]" in url for url in queries)
+        assert result.papers[0]["submitted_date"].day == 10
+
+        result = await collector.harvest_date_range(
+            date(2025, 1, 1), date(2025, 1, 10), window_limit=100, max_results=20
+        )
+        assert len(result.papers) == 20
+
+    @pytest.mark.asyncio
+    async def test_harvest_date_range_stops_at_max_results(self, collector):
+        """测试采集够 max_results 篇后不再启动新窗口，窗口内只翻页到剩余配额"""
+        requested = mock_transport(collector, daily_feed(papers_per_day=30))
+        collector.config.max_concurrent_requests = 2
+
+        result = await collector.harvest_date_range(
+            date(2025, 1, 1),
+            date(2025, 1, 30),
+            window_limit=100,
+            max_results=50,
+            batch_size=20,
+        )
+
+        assert len(result.papers) == 50
+        assert {paper["submitted_date"].day for paper in result.papers} == {29, 30}
+        # 探测 1 次 + 最新的 2 个单日窗口各 2 页，其余 28 个窗口不再请求
+        assert len(requested) == 5
+
+    @pytest.mark.asyncio
+    async def test_stream_search_results_prefetch(self, collector):
+        """测试预取模式在调用方处理当前批次时已发起后续请求"""
+        requested = mock_transport(collector, paged_feed(total=25))
+
+        batches = []
+        in_flight_after_first = None
+        async for batch in collector.stream_search_results(
+            "cat:cs.AI", batch_size=10, prefetch=2
+        ):
+            if not batches:
+                # 让出事件循环，预取任务在此期间完成请求
+                for _ in range(5):
+                    await asyncio.sleep(0)
+                in_flight_after_first = len(requested)
+            batches.append(batch)
+
+        assert [len(b) for b in batches] == [10, 10, 5]
+        ids = [p["arxiv_id"] for b in batches for p in b]
+        assert ids == [f"2501.{i:05d}v1" for i in range(25)]
+        assert in_flight_after_first == 3
+        assert len(requested) == 3
+
+    @pytest.mark.asyncio
+    async def test_stream_search_results_serial_and_max_total(self, collector):
+        """测试串行模式和 max_total 截断"""
+        requested = mock_transport(collector, paged_feed(total=100))
+
+        batches = [
+            batch
+            async for batch in collector.stream_search_results(
+                "cat:cs.AI", batch_size=10, max_total=25, prefetch=0
+            )
+        ]
+
+        assert [len(b) for b in batches] == [10, 10, 5]
+        assert "max_results=5" in requested[-1]
+
+    @pytest.mark.asyncio
+    async def test_stream_search_results_early_exit_cancels_prefetch(self, collector):
+        """测试调用方提前结束时取消未完成的预取"""
+        mock_transport(collector, paged_feed(total=100))
+
+        stream = collector.stream_search_results("cat:cs.AI", batch_size=10, prefetch=3)
+        first = await anext(stream)
+        await stream.aclose()
+
+        assert len(first) == 10
+
+    @pytest.mark.asyncio
+    async def test_search_authors_combined_demultiplexes(self, collector):
+        """测试合并作者查询按姓名分回各研究者"""
+        feed = build_atom_feed(["2501.00001"]).replace(
+            "<author><name>Alice Brown</name></author>",
+            "<author><name>Alice Brown</name></author>"
+            "<author><name>José García</name></author>",
+        )
+        requested = mock_transport(collector, feed)
+
+        result = await collector.search_authors_combined(
+            ["John Smith", "Jose Garcia", "Bob Wilson"]
+        )
+
+        assert len(requested) == 1
+        assert 'au:"John Smith" OR au:"Jose Garcia" OR au:"Bob Wilson"' in unquote_plus(
+            requested[0]
+        )
+        assert list(result) == ["John Smith", "Jose Garcia", "Bob Wilson"]
+        assert [p["arxiv_id"] for p in result["John Smith"]] == ["2501.00001v1"]
+        assert [p["arxiv_id"] for p in result["Jose Garcia"]] == ["2501.00001v1"]
+        assert result["Bob Wilson"] == []
+
+    @pytest.mark.asyncio
+    async def test_search_authors_combined_splits_large_groups(self, collector):
+        """测试结果数超过上限时拆分作者分组"""
+
+        def body(request: httpx.Request) -> str:
+            query = request.url.params["search_query"]
+            # 合并查询报告大量结果，单作者查询只返回少量结果
+            total = 1000 if " OR " in query else 1
+            return build_atom_feed(["2501.00001"], total=total)
+
+        requested = mock_transport(collector, body)
+
+        await collector.search_authors_combined(
+            ["John Smith", "Alice Brown"], max_results_per_query=100
+        )
+
+        assert len(requested) == 3
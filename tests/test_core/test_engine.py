@@ -0,0 +1,209 @@
+#!/usr/bin/env python3
+"""
+搜索引擎本地检索测试
+"""
+
+import os
+import sys
+from datetime import UTC, datetime
+
+import pytest
+import pytest_asyncio
+
+# 添加项目根目录到Python路径
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "../../"))
+
+try:
+    from src.arxiv_follow.core.engine import SearchEngine
+    from src.arxiv_follow.models import (
+        SearchFilters,
+        SearchQuery,
+        SearchResult,
+        SearchType,
+    )
+    from src.arxiv_follow.models.config import AppConfig, StorageConfig
+    from src.arxiv_follow.storage import DEFAULT_DB_NAME, SQLitePaperStore
+except ImportError as e:
+    pytest.skip(f"搜索引擎模块导入失败: {e}", allow_module_level=True)
+
+
+def make_paper(arxiv_id: str, title: str, authors: list[str], day: int) -> dict:
+    """构造采集器格式的论文字典"""
+    submitted = datetime(2025, 1, day, 9, 0, tzinfo=UTC)
+    return {
+        "arxiv_id": arxiv_id,
+        "title": title,
+        "authors": authors,
+        "abstract": f"Abstract of {title}.",
+        "primary_category": "cs.AI",
+        "categories": ["cs.AI"],
+        "submitted_date": submitted,
+        "updated_date": submitted,
+    }
+
+
+class TestLocalSearch:
+    """本地检索测试类"""
+
+    @pytest.fixture
+    def store(self, tmp_path):
+        """创建已有论文的存储"""
+        with SQLitePaperStore(tmp_path / "papers.db") as store:
+            store.upsert_papers(
+                [
+                    make_paper(
+                        "2501.00001v1", "Graph Transformers", ["Alice Smith"], 1
+                    ),
+                    make_paper("2501.00002v1", "Graph Kernels", ["Bob Jones"], 2),
+                    make_paper("2501.00003v1", "Speech Models", ["Alice Smith"], 3),
+                ]
+            )
+            yield store
+
+    @pytest_asyncio.fixture
+    async def engine(self, store):
+        """创建记录 arXiv 查询的搜索引擎"""
+        engine = SearchEngine(AppConfig(), store=store)
+        engine.remote_queries = []
+        engine.remote_papers = []
+
+        async def search_by_query(query: str, max_results: int = 50) -> SearchResult:
+            engine.remote_queries.append(query)
+            return SearchResult(
+                query=SearchQuery(
+                    query_id="remote", search_type=SearchType.KEYWORD, query_text=query
+                ),
+                papers=[dict(p) for p in engine.remote_papers],
+            )
+
+        engine.collector.search_by_query = search_by_query
+        yield engine
+        await engine.close()
+
+    @staticmethod
+    def make_query(
+        search_type: SearchType,
+        query_text: str = "all:*",
+        max_results: int = 10,
+        **kwargs,
+    ):
+        """构造搜索查询"""
+        return SearchQuery(
+            query_id="test",
+            search_type=search_type,
+            query_text=query_text,
+            filters=SearchFilters(max_results=max_results),
+            **kwargs,
+        )
+
+    @pytest.mark.asyncio
+    async def test_local_search_uses_arxiv_syntax(self, engine):
+        """测试本地检索支持 arXiv 查询语法且不访问 arXiv"""
+        result = await engine.search(
+            self.make_query(SearchType.LOCAL, query_text='graph AND au:"Alice Smith"')
+        )
+
+        assert result.success
+        assert [p["arxiv_id"] for p in result.papers] == ["2501.00001v1"]
+        assert "local_score" in result.papers[0]
+        assert engine.remote_queries == []
+
+        result = await engine.search(
+            self.make_query(SearchType.LOCAL, keywords=["graph"], researchers=["Jones"])
+        )
+        assert [p["arxiv_id"] for p in result.papers] == ["2501.00002v1"]
+
+    @pytest.mark.asyncio
+    async def test_hybrid_always_queries_arxiv(self, engine):
+        """测试本地结果已满足最大结果数时混合搜索仍查询 arXiv，新论文排在前面"""
+        engine.remote_papers = [
+            make_paper("2501.00009v1", "Audio Tokenizers", ["Alice Smith"], 9),
+        ]
+
+        result = await engine.search(
+            self.make_query(
+                SearchType.HYBRID, max_results=2, researchers=["Alice Smith"]
+            )
+        )
+
+        assert len(engine.remote_queries) == 1
+        assert [p["arxiv_id"] for p in result.papers][0] == "2501.00009v1"
+        assert len(result.papers) == 2
+
+    @pytest.mark.asyncio
+    async def test_hybrid_merges_arxiv_and_local_and_ingests(self, engine, store):
+        """测试混合搜索合并去重 arXiv 和本地结果并写入本地索引"""
+        engine.remote_papers = [
+            make_paper("2501.00001v1", "Graph Transformers", ["Alice Smith"], 1),
+            make_paper("2501.00009v1", "Audio Tokenizers", ["Alice Smith"], 9),
+        ]
+
+        result = await engine.search(
+            self.make_query(SearchType.HYBRID, researchers=["Alice Smith"])
+        )
+
+        assert len(engine.remote_queries) == 1
+        assert [p["arxiv_id"] for p in result.papers] == [
+            "2501.00001v1",
+            "2501.00009v1",
+            "2501.00003v1",
+        ]
+        assert [p.arxiv_id for p, _ in store.search_papers("tokenizers")] == [
+            "2501.00009v1"
+        ]
+
+    @pytest.mark.asyncio
+    async def test_researcher_search_ingests(self, engine, store):
+        """测试研究者搜索结果同样写入本地索引"""
+        engine.remote_papers = [
+            make_paper("2501.00009v1", "Audio Tokenizers", ["Alice Smith"], 9),
+        ]
+
+        result = await engine.search(
+            self.make_query(
+                SearchType.RESEARCHER, researchers=["Alice Smith"], max_results=5
+            )
+        )
+
+        assert result.success
+        assert [p.arxiv_id for p, _ in store.search_papers("tokenizers")] == [
+            "2501.00009v1"
+        ]
+
+    @pytest.mark.asyncio
+    async def test_store_created_on_first_use(self, tmp_path):
+        """测试未提供存储时在首次使用时才创建"""
+        config = AppConfig(
+            storage=StorageConfig(data_dir=str(tmp_path), local_search=True)
+        )
+        engine = SearchEngine(config)
+
+        assert not (tmp_path / DEFAULT_DB_NAME).exists()
+        assert engine.store is not None
+        assert (tmp_path / DEFAULT_DB_NAME).exists()
+        await engine.close()
+
+    @pytest.mark.asyncio
+    async def test_default_config_creates_no_store(self, tmp_path):
+        """测试默认配置下搜索不创建论文存储"""
+        config = AppConfig(storage=StorageConfig(data_dir=str(tmp_path)))
+        engine = SearchEngine(config)
+
+        async def search_by_query(query: str, max_results: int = 50) -> SearchResult:
+            return SearchResult(
+                query=SearchQuery(
+                    query_id="remote", search_type=SearchType.KEYWORD, query_text=query
+                ),
+                papers=[make_paper("2501.00009v1", "Audio Tokenizers", ["Bob"], 9)],
+            )
+
+        engine.collector.search_by_query = search_by_query
+        for search_type in (SearchType.KEYWORD, SearchType.HYBRID):
+            result = await engine.search(
+                self.make_query(search_type, keywords=["audio"], researchers=["Bob"])
+            )
+            assert result.success
+        await engine.close()
+
+        assert engine.store is None
+        assert not (tmp_path / DEFAULT_DB_NAME).exists()
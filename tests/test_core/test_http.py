@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+共享HTTP客户端测试
+"""
+
+import os
+import sys
+
+import httpx
+import pytest
+
+# 添加项目根目录到Python路径
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "../../"))
+
+try:
+    from src.arxiv_follow.core import http as shared_http
+    from src.arxiv_follow.core.http import SharedHTTPClient
+    from src.arxiv_follow.models.config import APIConfig, AppConfig
+except ImportError as e:
+    pytest.skip(f"HTTP模块导入失败: {e}", allow_module_level=True)
+
+
+class TestSharedHTTPClient:
+    """共享HTTP客户端测试类"""
+
+    @pytest.fixture
+    def shared(self):
+        """创建使用模拟传输的共享客户端"""
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            status = 404 if request.url.path == "/missing" else 200
+            return httpx.Response(status, text="ok")
+
+        client = SharedHTTPClient(
+            AppConfig(api=APIConfig(http_max_connections=5)),
+            transport=httpx.MockTransport(handler),
+        )
+        yield client
+        client.close()
+
+    def test_pool_limits_from_config(self, shared):
+        """测试连接池上限来自配置"""
+        assert shared.limits.max_connections == 5
+        # HTTP/2 默认关闭
+        assert shared.http2 is False
+
+    def test_http2_requires_h2(self):
+        """测试启用 HTTP/2 但未安装 h2 时回退到 HTTP/1.1"""
+        client = SharedHTTPClient(AppConfig(api=APIConfig(http2_enabled=True)))
+        try:
+            assert client.http2 == shared_http._http2_available()
+        finally:
+            client.close()
+
+    def test_per_host_stats(self, shared):
+        """测试按主机统计请求和状态码"""
+        shared.client.get("https://arxiv.org/search/advanced")
+        shared.client.get("https://arxiv.org/missing")
+        shared.client.get("https://docs.google.com/spreadsheets")
+
+        stats = shared.stats()
+        assert stats["arxiv.org"]["requests"] == 2
+        assert stats["arxiv.org"]["errors"] == 1
+        assert stats["arxiv.org"]["status_codes"] == {200: 1, 404: 1}
+        assert stats["docs.google.com"]["requests"] == 1
+
+    def test_process_wide_client_lifecycle(self):
+        """测试进程级客户端复用和关闭后重建"""
+        first = shared_http.get_http_client(AppConfig())
+        assert shared_http.get_http_client() is first
+
+        shared_http.close_http_client()
+        assert first.is_closed
+
+        second = shared_http.get_http_client(AppConfig())
+        assert second is not first
+        shared_http.close_http_client()
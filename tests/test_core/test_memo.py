@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+"""
+LLM分析结果记忆测试
+"""
+
+import os
+import sys
+from unittest.mock import AsyncMock
+
+import pytest
+
+# 添加项目根目录到Python路径
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "../../"))
+
+try:
+    from src.arxiv_follow.core.analyzer import PaperAnalyzer
+    from src.arxiv_follow.core.cache import DiskCache
+    from src.arxiv_follow.core.memo import AnalysisMemo, content_hash
+    from src.arxiv_follow.models.config import AppConfig, StorageConfig
+except ImportError as e:
+    pytest.skip(f"分析记忆模块导入失败: {e}", allow_module_level=True)
+
+
+PAPER = {
+    "arxiv_id": "2501.12345",
+    "title": "Deep Learning for Cybersecurity",
+    "abstract": "We survey deep learning for intrusion detection.",
+    "authors": ["John Smith"],
+}
+
+
+class TestAnalysisMemo:
+    """分析记忆测试类"""
+
+    @pytest.fixture
+    def memo(self, tmp_path):
+        """创建分析记忆"""
+        return AnalysisMemo(
+            DiskCache(tmp_path, ttl_seconds=3600, max_size_mb=1, namespace="analysis")
+        )
+
+    def test_content_hash_ignores_whitespace(self):
+        """测试内容哈希忽略空白差异"""
+        assert content_hash("A  title", "An\nabstract ") == content_hash(
+            "A title", "An abstract"
+        )
+        assert content_hash("A title", "x") != content_hash("A title", "y")
+
+    def test_key_includes_prompt_version_model_and_temperature(self):
+        """测试记忆键包含提示词版本、模型和温度"""
+        base = AnalysisMemo.make_key("significance", "1", "m", 0.3, "t", "a")
+        assert base != AnalysisMemo.make_key("significance", "2", "m", 0.3, "t", "a")
+        assert base != AnalysisMemo.make_key("significance", "1", "n", 0.3, "t", "a")
+        assert base != AnalysisMemo.make_key("significance", "1", "m", 0.7, "t", "a")
+        assert base != AnalysisMemo.make_key("technical", "1", "m", 0.3, "t", "a")
+
+    def test_roundtrip_and_stats(self, memo):
+        """测试读写和命中统计"""
+        assert memo.get("key") is None
+        memo.set("key", {"importance_score": 8.5, "success": True})
+        assert memo.get("key") == {"importance_score": 8.5, "success": True}
+        assert memo.stats() == {"hits": 1, "misses": 1, "hit_rate": 0.5}
+
+    def test_from_config_respects_cache_switch(self, tmp_path):
+        """测试禁用缓存或TTL为0时不创建记忆"""
+        storage = StorageConfig(cache_dir=str(tmp_path))
+        assert AnalysisMemo.from_config(storage) is not None
+
+        storage.enable_cache = False
+        assert AnalysisMemo.from_config(storage) is None
+
+        storage = StorageConfig(cache_dir=str(tmp_path), analysis_cache_ttl_seconds=0)
+        assert AnalysisMemo.from_config(storage) is None
+
+
+class TestAnalyzerMemoization:
+    """分析器结果记忆测试类"""
+
+    @pytest.fixture
+    def analyzer(self, tmp_path):
+        """创建带分析记忆的分析器"""
+        config = AppConfig()
+        config.api.openrouter_api_key = "test_api_key"
+        memo = AnalysisMemo(
+            DiskCache(tmp_path, ttl_seconds=3600, max_size_mb=1, namespace="analysis")
+        )
+        analyzer = PaperAnalyzer(config, memo=memo)
+        analyzer._call_llm = AsyncMock(return_value="分析内容\n重要性评分: 8.5")
+        return analyzer
+
+    @pytest.mark.asyncio
+    async def test_repeated_significance_uses_cache(self, analyzer):
+        """测试重复分析同一论文只调用一次LLM"""
+        first = await analyzer.analyze_paper_significance(PAPER)
+        second = await analyzer.analyze_paper_significance(
+            {**PAPER, "arxiv_id": "2501.12345v2"}
+        )
+
+        assert analyzer._call_llm.await_count == 1
+        assert second["importance_score"] == first["importance_score"] == 8.5
+        assert second["cached"] is True
+        assert "cached" not in first
+        assert analyzer.memo_stats()["hits"] == 1
+
+    @pytest.mark.asyncio
+    async def test_changed_abstract_or_type_misses(self, analyzer):
+        """测试摘要变化或分析类型不同时重新调用LLM"""
+        await analyzer.analyze_paper_significance(PAPER)
+        await analyzer.analyze_paper_significance({**PAPER, "abstract": "Revised."})
+        await analyzer.analyze_paper_technical_details(PAPER)
+
+        assert analyzer._call_llm.await_count == 3
+
+    @pytest.mark.asyncio
+    async def test_failures_are_not_cached(self, analyzer):
+        """测试失败的分析结果不会被缓存"""
+        analyzer._call_llm.return_value = None
+        assert (await analyzer.analyze_paper_significance(PAPER))["success"] is False
+
+        analyzer._call_llm.return_value = "重要性评分: 7"
+        result = await analyzer.analyze_paper_significance(PAPER)
+        assert result["success"] is True
+        assert "cached" not in result
+
+    @pytest.mark.asyncio
+    async def test_merged_report_marks_sections_cached(self, analyzer):
+        """测试合并综合报告命中缓存时整体和各分项都标记为缓存结果"""
+        analyzer._call_llm.return_value = '{"significance": "意义重大", "importance_score": 8, "technical": "方法新颖"}'
+
+        first = await analyzer.generate_comprehensive_report(PAPER, merged=True)
+        second = await analyzer.generate_comprehensive_report(PAPER, merged=True)
+
+        assert analyzer._call_llm.await_count == 1
+        assert "cached" not in first
+        assert "cached" not in first["significance_analysis"]
+        assert second["cached"] is True
+        assert second["significance_analysis"]["cached"] is True
+        assert second["technical_analysis"]["cached"] is True
+        assert second["overall_score"] == 8.0
+
+    def test_daily_summary_counts_cached(self, analyzer):
+        """测试每日摘要统计复用缓存的分析数"""
+        summary = analyzer.generate_daily_summary(
+            [
+                {"success": True, "importance_score": 8.0, "cached": True},
+                {"success": True, "importance_score": 6.0},
+            ]
+        )
+        assert summary["cached_analysis"] == 1
+        assert "复用缓存分析 1 篇" in summary["summary_text"]
@@ -0,0 +1,342 @@
+#!/usr/bin/env python3
+"""
+论文监控器增量监控测试
+"""
+
+import asyncio
+import os
+import sys
+from datetime import UTC, date, datetime, timedelta
+
+import pytest
+
+# 添加项目根目录到Python路径
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "../../"))
+
+try:
+    from src.arxiv_follow.core.analyzer import PaperAnalyzer
+    from src.arxiv_follow.core.monitor import PaperMonitor
+    from src.arxiv_follow.models import SearchQuery, SearchResult
+    from src.arxiv_follow.models.config import AppConfig, StorageConfig
+    from src.arxiv_follow.storage import DEFAULT_DB_NAME, SQLitePaperStore
+except ImportError as e:
+    pytest.skip(f"监控模块导入失败: {e}", allow_module_level=True)
+
+
+def make_paper(arxiv_id: str, authors: list[str], updated: datetime) -> dict:
+    """构造采集器格式的论文字典"""
+    return {
+        "arxiv_id": arxiv_id,
+        "title": f"Paper {arxiv_id}",
+        "authors": authors,
+        "abstract": "Abstract",
+        "primary_category": "cs.AI",
+        "categories": ["cs.AI"],
+        "submitted_date": updated,
+        "updated_date": updated,
+    }
+
+
+class FakeEngine:
+    """记录查询并返回预设论文的搜索引擎"""
+
+    def __init__(self):
+        self.papers: list[dict] = []
+        self.queries: list[SearchQuery] = []
+
+    async def search(self, query: SearchQuery) -> SearchResult:
+        self.queries.append(query)
+        return SearchResult(query=query, papers=[dict(p) for p in self.papers])
+
+
+class TestIncrementalMonitoring:
+    """增量监控测试类"""
+
+    @pytest.fixture
+    def store(self, tmp_path):
+        """创建论文存储"""
+        with SQLitePaperStore(tmp_path / "papers.db") as store:
+            yield store
+
+    @pytest.fixture
+    def monitor(self, store):
+        """创建使用假搜索引擎的监控器"""
+        config = AppConfig()
+        config.integrations.ai_analysis_enabled = False
+        monitor = PaperMonitor(config, store=store)
+        monitor.engine = FakeEngine()
+        return monitor
+
+    @staticmethod
+    def stub_analyzer(monitor, analyze):
+        """创建重要性分析被替换的分析器"""
+        monitor.config.api.openrouter_api_key = "test_api_key"
+        analyzer = PaperAnalyzer(monitor.config)
+        analyzer.analyze_paper_significance = analyze
+        return analyzer
+
+    @pytest.mark.asyncio
+    async def test_store_created_only_when_enabled(self, tmp_path):
+        """测试默认配置不创建论文存储，开启增量监控后才创建"""
+        config = AppConfig(storage=StorageConfig(data_dir=str(tmp_path)))
+        config.integrations.ai_analysis_enabled = False
+
+        async with PaperMonitor(config) as monitor:
+            assert monitor.store is None
+        assert not (tmp_path / DEFAULT_DB_NAME).exists()
+
+        config.monitoring.incremental_monitoring = True
+        async with PaperMonitor(config) as monitor:
+            assert monitor.store is not None
+        assert (tmp_path / DEFAULT_DB_NAME).exists()
+
+    @pytest.mark.asyncio
+    async def test_second_run_skips_seen_papers(self, monitor, store):
+        """测试第二次运行只返回新论文并推进水位线"""
+        now = datetime.now(UTC)
+        monitor.engine.papers = [
+            make_paper("2501.00001v1", ["Alice Smith"], now - timedelta(hours=3)),
+            make_paper("2501.00002v1", ["Bob Jones"], now - timedelta(hours=2)),
+        ]
+
+        first = await monitor.daily_monitor(researchers=["Alice Smith", "Bob Jones"])
+        assert first["summary"]["researcher_papers"] == 2
+        assert first["summary"]["incremental"]["new"] == 2
+        assert store.get_watermark("daily:researcher:Bob Jones")[1] == "2501.00002v1"
+
+        monitor.engine.papers.append(
+            make_paper("2501.00003v1", ["Alice Smith"], now - timedelta(hours=1))
+        )
+        second = await monitor.daily_monitor(researchers=["Alice Smith", "Bob Jones"])
+
+        papers = second["researcher_results"].papers
+        assert [p["arxiv_id"] for p in papers] == ["2501.00003v1"]
+        assert second["summary"]["incremental"] == {
+            "new": 1,
+            "updated": 0,
+            "skipped": 2,
+        }
+        assert store.get_watermark("daily:researcher:Alice Smith")[1] == (
+            "2501.00003v1"
+        )
+
+    @pytest.mark.asyncio
+    async def test_watermark_narrows_query_window(self, monitor):
+        """测试水位线存在后查询起点收窄到水位线减去重叠时间"""
+        monitor.engine.papers = [
+            make_paper("2501.00001v1", ["Alice Smith"], datetime.now(UTC))
+        ]
+        await monitor.monitor_researchers(["Alice Smith"], days_back=7, scope="weekly")
+        assert monitor.engine.queries[-1].filters.days_back == 7
+
+        await monitor.monitor_researchers(["Alice Smith"], days_back=7, scope="weekly")
+        filters = monitor.engine.queries[-1].filters
+        assert filters.date_from is not None
+        assert filters.date_from >= date.today() - timedelta(days=2)
+
+    @pytest.mark.asyncio
+    async def test_new_versions_are_optional(self, monitor, store):
+        """测试只有启用时才重新处理已见论文的新版本"""
+        now = datetime.now(UTC)
+        monitor.engine.papers = [
+            make_paper("2501.00001v1", ["Alice Smith"], now - timedelta(hours=3))
+        ]
+        await monitor.monitor_topics(["cs.AI"], scope="daily")
+
+        monitor.engine.papers = [
+            make_paper("2501.00001v2", ["Alice Smith"], now - timedelta(hours=1))
+        ]
+        result = await monitor.monitor_topics(["cs.AI"], scope="daily")
+        assert result.papers == []
+
+        monitor.config.monitoring.include_updated_versions = True
+        result = await monitor.monitor_topics(["cs.AI"], scope="daily")
+        assert [p["arxiv_id"] for p in result.papers] == ["2501.00001v2"]
+        assert result.papers[0]["is_new_version"] is True
+        assert store.get_paper("2501.00001").arxiv_id == "2501.00001v2"
+
+    @pytest.mark.asyncio
+    async def test_scopes_are_independent(self, monitor):
+        """测试每日和每周监控分别维护已处理集合"""
+        monitor.engine.papers = [
+            make_paper("2501.00001v1", ["Alice Smith"], datetime.now(UTC))
+        ]
+        await monitor.daily_monitor(researchers=["Alice Smith"])
+
+        weekly = await monitor.weekly_monitor(researchers=["Alice Smith"])
+        assert weekly["summary"]["researcher_papers"] == 1
+
+    @pytest.mark.asyncio
+    async def test_without_scope_returns_everything(self, monitor):
+        """测试未指定监控范围时不做增量过滤"""
+        monitor.engine.papers = [
+            make_paper("2501.00001v1", ["Alice Smith"], datetime.now(UTC))
+        ]
+        for _ in range(2):
+            result = await monitor.monitor_researchers(["Alice Smith"])
+            assert len(result.papers) == 1
+
+    @pytest.mark.asyncio
+    async def test_daily_summary_reports_analysis_cache(self, monitor):
+        """测试每日摘要报告分析结果缓存命中率"""
+        calls = []
+
+        async def analyze(paper_data):
+            calls.append(paper_data["arxiv_id"])
+            return {"success": True, "importance_score": 7.0, "cached": len(calls) > 1}
+
+        monitor.analyzer = self.stub_analyzer(monitor, analyze)
+        monitor.engine.papers = [
+            make_paper("2501.00001v1", ["Alice Smith"], datetime.now(UTC))
+        ]
+
+        results = {
+            "researcher_results": await monitor.monitor_researchers(["Alice Smith"]),
+            "topic_results": await monitor.monitor_topics(["cs.AI"]),
+        }
+        results["summary"] = monitor._generate_daily_summary(results)
+
+        assert results["summary"]["analysis_cache"] == {
+            "hits": 1,
+            "misses": 1,
+            "hit_rate": 0.5,
+        }
+
+    @pytest.mark.asyncio
+    async def test_analysis_runs_concurrently_with_deadline(self, monitor):
+        """测试监控并发分析，超过截止时间的论文使用默认评分"""
+        in_flight = 0
+        peak = 0
+
+        async def analyze(paper_data):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            try:
+                if paper_data["arxiv_id"] == "2501.00003v1":
+                    await asyncio.sleep(10)
+                await asyncio.sleep(0.01)
+                return {"success": True, "importance_score": 9.0}
+            finally:
+                in_flight -= 1
+
+        monitor.analyzer = self.stub_analyzer(monitor, analyze)
+        monitor.config.monitoring.analysis_concurrency = 3
+        monitor.config.monitoring.analysis_deadline_seconds = 0.5
+        now = datetime.now(UTC)
+        monitor.engine.papers = [
+            make_paper(f"2501.0000{i}v1", ["Alice Smith"], now) for i in range(1, 4)
+        ]
+
+        result = await monitor.monitor_topics(["cs.AI"])
+
+        assert peak == 3
+        scores = {p["arxiv_id"]: p["importance_score"] for p in result.papers}
+        assert scores == {"2501.00001v1": 9.0, "2501.00002v1": 9.0, "2501.00003v1": 5.0}
+        assert result.papers[-1]["ai_analysis"]["timed_out"] is True
+
+    @pytest.mark.asyncio
+    async def test_failed_analysis_is_not_recorded(self, monitor, store):
+        """测试分析超时或失败的论文不记为已处理，水位线也不越过它"""
+        now = datetime.now(UTC)
+
+        async def analyze(paper_data):
+            if paper_data["arxiv_id"] == "2501.00001v1":
+                await asyncio.sleep(10)
+            if paper_data["arxiv_id"] == "2501.00002v1":
+                return {"success": False, "error": "boom"}
+            return {"success": True, "importance_score": 8.0}
+
+        monitor.analyzer = self.stub_analyzer(monitor, analyze)
+        monitor.config.monitoring.analysis_deadline_seconds = 0.2
+        monitor.engine.papers = [
+            make_paper("2501.00001v1", ["Alice Smith"], now - timedelta(hours=3)),
+            make_paper("2501.00002v1", ["Bob Jones"], now - timedelta(hours=2)),
+            make_paper("2501.00003v1", ["Alice Smith"], now - timedelta(hours=1)),
+        ]
+
+        await monitor.monitor_researchers(
+            ["Alice Smith", "Bob Jones"], days_back=7, scope="daily"
+        )
+
+        seen = store.get_seen_versions(
+            "daily", ["2501.00001v1", "2501.00002v1", "2501.00003v1"]
+        )
+        assert seen == {"2501.00003": 1}
+        # 较早的论文超时，Alice 的水位线停在它之前；Bob 只有失败论文，不推进
+        assert store.get_watermark("daily:researcher:Alice Smith") is None
+        assert store.get_watermark("daily:researcher:Bob Jones") is None
+
+        second = await monitor.monitor_researchers(
+            ["Alice Smith", "Bob Jones"], days_back=7, scope="daily"
+        )
+        assert sorted(p["arxiv_id"] for p in second.papers) == [
+            "2501.00001v1",
+            "2501.00002v1",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_prerank_limits_llm_calls(self, monitor, store):
+        """测试预排序只把最相关的论文交给AI分析并按最低评分过滤"""
+        analyzed = []
+
+        async def analyze(paper_data):
+            analyzed.append(paper_data["arxiv_id"])
+            score = 9.0 if paper_data["arxiv_id"] == "2501.00001v1" else 3.0
+            return {"success": True, "importance_score": score, "model": "m"}
+
+        monitor.analyzer = self.stub_analyzer(monitor, analyze)
+        monitoring = monitor.config.monitoring
+        monitoring.prerank_enabled = True
+        monitoring.prerank_top_k = 2
+        monitoring.prerank_keywords = ["malware"]
+        now = datetime.now(UTC)
+        titles = ["Malware detection", "Malware families", "Protein folding"]
+        monitor.engine.papers = [
+            {**make_paper(f"2501.0000{i}v1", ["Alice"], now), "title": title}
+            for i, title in enumerate(titles, start=1)
+        ]
+
+        results = {
+            "researcher_results": None,
+            "topic_results": await monitor.monitor_topics(["cs.AI"], scope="daily"),
+        }
+
+        assert sorted(analyzed) == ["2501.00001v1", "2501.00002v1"]
+        assert [p["arxiv_id"] for p in results["topic_results"].papers] == [
+            "2501.00001v1"
+        ]
+        assert monitor._generate_daily_summary(results)["prerank"] == {
+            "candidates": 3,
+            "forwarded": 2,
+            "gated": 1,
+        }
+        # 未进入AI分析的论文同样记为已处理，高分论文进入兴趣画像
+        assert store.get_seen_versions("daily", ["2501.00003v1"])
+        top = store.top_scored_papers("importance", 7.0, limit=5)
+        assert [p.arxiv_id for p in top] == ["2501.00001v1"]
+
+    @pytest.mark.asyncio
+    async def test_prerank_with_category_topics_only(self, monitor):
+        """测试只有分类代码主题（无关键词）时预排序仍把论文交给AI分析"""
+        analyzed = []
+
+        async def analyze(paper_data):
+            analyzed.append(paper_data["arxiv_id"])
+            return {"success": True, "importance_score": 8.0}
+
+        monitor.analyzer = self.stub_analyzer(monitor, analyze)
+        monitoring = monitor.config.monitoring
+        monitoring.prerank_enabled = True
+        monitoring.prerank_top_k = 2
+        monitoring.prerank_keywords = []
+        now = datetime.now(UTC)
+        monitor.engine.papers = [
+            make_paper(f"2501.0000{i}v1", ["Alice"], now - timedelta(hours=i))
+            for i in range(1, 4)
+        ]
+
+        result = await monitor.monitor_topics(["cs.CR"])
+
+        assert analyzed == ["2501.00001v1", "2501.00002v1"]
+        assert [p["arxiv_id"] for p in result.papers] == analyzed
@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""
+速率限制测试
+"""
+
+import asyncio
+import os
+import sys
+import time
+
+import pytest
+
+# 添加项目根目录到Python路径
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "../../"))
+
+try:
+    from src.arxiv_follow.core.ratelimit import (
+        RateLimiter,
+        TokenBucket,
+        get_rate_limiter,
+    )
+    from src.arxiv_follow.models.config import AppConfig
+except ImportError as e:
+    pytest.skip(f"限流模块导入失败: {e}", allow_module_level=True)
+
+
+class TestTokenBucket:
+    """令牌桶测试类"""
+
+    def test_burst_then_wait(self):
+        """测试突发容量耗尽后需要等待"""
+        bucket = TokenBucket(rate=10.0, capacity=3)
+
+        waits = [bucket.reserve() for _ in range(4)]
+
+        assert waits[:3] == [0.0, 0.0, 0.0]
+        assert waits[3] == pytest.approx(0.1, abs=0.01)
+
+    def test_reservations_queue_in_order(self):
+        """测试多个预占按顺序排队"""
+        bucket = TokenBucket(rate=2.0, capacity=1)
+
+        waits = [bucket.reserve() for _ in range(3)]
+
+        assert waits[0] == 0.0
+        assert waits[1] == pytest.approx(0.5, abs=0.01)
+        assert waits[2] == pytest.approx(1.0, abs=0.01)
+
+    def test_acquire_sync_sleeps(self):
+        """测试同步获取会实际等待"""
+        bucket = TokenBucket(rate=20.0, capacity=1)
+        bucket.acquire_sync()
+
+        start = time.monotonic()
+        bucket.acquire_sync()
+
+        assert time.monotonic() - start >= 0.04
+
+    @pytest.mark.asyncio
+    async def test_acquire_async_and_stats(self):
+        """测试异步获取和统计信息"""
+        bucket = TokenBucket(rate=20.0, capacity=1)
+
+        await bucket.acquire()
+        await bucket.acquire()
+
+        stats = bucket.stats()
+        assert stats["requests"] == 2
+        assert stats["total_wait_seconds"] > 0
+        assert sum(stats["wait_histogram"].values()) == 2
+
+    @pytest.mark.asyncio
+    async def test_cancelled_acquire_refunds_token(self):
+        """测试等待期间被取消时归还预占的令牌"""
+        bucket = TokenBucket(rate=1.0, capacity=1)
+        bucket.reserve()
+
+        task = asyncio.create_task(bucket.acquire())
+        await asyncio.sleep(0.01)
+        assert bucket.fill_level < -0.5
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+        assert bucket.fill_level > -0.1
+
+    def test_invalid_parameters(self):
+        """测试非法参数"""
+        with pytest.raises(ValueError):
+            TokenBucket(rate=0, capacity=1)
+        with pytest.raises(ValueError):
+            TokenBucket(rate=1, capacity=0)
+
+
+class TestRateLimiter:
+    """限流器测试类"""
+
+    def test_from_config_per_host_limits(self):
+        """测试按主机应用配置的限额"""
+        config = AppConfig(max_requests_per_minute=120, rate_limit_burst=4)
+        limiter = RateLimiter.from_config(config)
+
+        arxiv_api = limiter.bucket_for("http://export.arxiv.org/api/query?x=1")
+        assert arxiv_api.rate == pytest.approx(1 / config.api.arxiv_delay_seconds)
+        assert arxiv_api.capacity == 1
+
+        openrouter = limiter.bucket_for("https://openrouter.ai/api/v1")
+        assert openrouter.rate == pytest.approx(2.0)
+        assert openrouter.capacity == 4
+
+        # 同一主机共享同一个桶
+        assert limiter.bucket_for("openrouter.ai") is openrouter
+
+    def test_disabled_limiter_never_waits(self):
+        """测试禁用时不等待也不记录"""
+        limiter = RateLimiter.from_config(AppConfig(enable_rate_limiting=False))
+
+        for _ in range(5):
+            assert limiter.acquire_sync("http://export.arxiv.org/api/query") == 0.0
+
+        assert limiter.stats() == {}
+
+    def test_shared_limiter_keyed_by_settings(self):
+        """测试共享限流器按限流设置区分，不同设置不会被默认限流器覆盖"""
+        default = get_rate_limiter()
+        assert get_rate_limiter(AppConfig()) is default
+        assert get_rate_limiter() is default
+
+        fast = AppConfig(enable_rate_limiting=True)
+        fast.api.arxiv_delay_seconds = 0.5
+        limiter = get_rate_limiter(fast)
+
+        assert limiter is not default
+        assert limiter.enabled
+        assert limiter.bucket_for("export.arxiv.org").rate == pytest.approx(2.0)
+        assert get_rate_limiter(fast) is limiter
@@ -0,0 +1,202 @@
+#!/usr/bin/env python3
+"""
+请求容错（重试和熔断）测试
+"""
+
+import os
+import sys
+import time
+from email.utils import formatdate
+
+import httpx
+import pytest
+
+# 添加项目根目录到Python路径
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "../../"))
+
+try:
+    from src.arxiv_follow.core import resilience as resilience_module
+    from src.arxiv_follow.core.resilience import (
+        CircuitBreaker,
+        CircuitOpenError,
+        RetryableHTTPError,
+        call_with_retry,
+        call_with_retry_sync,
+        configure_circuit_breakers,
+        parse_retry_after,
+        raise_for_retryable,
+    )
+    from src.arxiv_follow.models.config import AppConfig
+except ImportError as e:
+    pytest.skip(f"请求容错模块导入失败: {e}", allow_module_level=True)
+
+
+URL = "https://export.arxiv.org/api/query"
+
+
+@pytest.fixture(autouse=True)
+def no_backoff(monkeypatch):
+    """去掉退避等待并重置熔断器"""
+    monkeypatch.setattr(resilience_module, "backoff_delay", lambda attempt: 0.0)
+    monkeypatch.setattr(resilience_module.time, "sleep", lambda delay: None)
+    config = AppConfig()
+    config.api.circuit_breaker_threshold = 3
+    configure_circuit_breakers(config)
+
+
+class TestRetry:
+    """重试测试类"""
+
+    def test_parse_retry_after(self):
+        """测试解析秒数和HTTP日期格式的 Retry-After"""
+        assert parse_retry_after("5") == 5.0
+        assert parse_retry_after(None) is None
+        assert parse_retry_after("soon") is None
+        delay = parse_retry_after(formatdate(time.time() + 30, usegmt=True))
+        assert 25 <= delay <= 31
+
+    def test_raise_for_retryable(self):
+        """测试 429/5xx 抛出可重试错误并带上 Retry-After"""
+        with pytest.raises(RetryableHTTPError) as exc_info:
+            raise_for_retryable(httpx.Response(429, headers={"Retry-After": "7"}))
+        assert exc_info.value.retry_after == 7.0
+
+        response = httpx.Response(404)
+        assert raise_for_retryable(response) is response
+
+    def test_retries_until_success(self):
+        """测试可重试失败后重试直到成功"""
+        responses = iter([503, 502, 200])
+        retries = []
+
+        result = call_with_retry_sync(
+            lambda: raise_for_retryable(httpx.Response(next(responses))),
+            URL,
+            retries=3,
+            on_retry=lambda attempt, error, delay: retries.append(attempt),
+        )
+
+        assert result.status_code == 200
+        assert retries == [0, 1]
+
+    def test_non_retryable_errors_propagate(self):
+        """测试非可重试异常直接抛出且不计入熔断"""
+        calls = []
+
+        def fail():
+            calls.append(1)
+            raise ValueError("bad response")
+
+        with pytest.raises(ValueError):
+            call_with_retry_sync(fail, URL, retries=3)
+        assert len(calls) == 1
+
+    def test_long_retry_after_gives_up(self):
+        """测试 Retry-After 超过上限时不再等待"""
+        calls = []
+
+        def throttled():
+            calls.append(1)
+            raise RetryableHTTPError(429, retry_after=3600)
+
+        with pytest.raises(RetryableHTTPError):
+            call_with_retry_sync(throttled, URL, retries=3)
+        assert len(calls) == 1
+
+    @pytest.mark.asyncio
+    async def test_async_retry_and_circuit(self):
+        """测试异步调用在连续失败后熔断"""
+        calls = []
+
+        async def fail():
+            calls.append(1)
+            raise httpx.ConnectError("connection refused")
+
+        with pytest.raises(httpx.ConnectError):
+            await call_with_retry(fail, URL, retries=5)
+        # 第3次失败时熔断，第4次尝试前直接失败
+        with pytest.raises(CircuitOpenError):
+            await call_with_retry(fail, URL, retries=5)
+        assert len(calls) == 3
+
+
+class TestCircuitBreaker:
+    """熔断器测试类"""
+
+    def test_opens_after_threshold_and_recovers(self, monkeypatch):
+        """测试连续失败达到阈值后熔断，冷却后半开，成功后关闭"""
+        now = [100.0]
+        monkeypatch.setattr(resilience_module.time, "monotonic", lambda: now[0])
+        breaker = CircuitBreaker("arxiv.org", failure_threshold=2, reset_timeout=30)
+
+        breaker.record_failure()
+        breaker.before_request()
+        breaker.record_failure()
+        assert breaker.state == "open"
+        with pytest.raises(CircuitOpenError):
+            breaker.before_request()
+
+        now[0] += 30
+        assert breaker.state == "half_open"
+        breaker.before_request()
+        breaker.record_success()
+        assert breaker.state == "closed"
+        assert breaker.stats()["rejected"] == 1
+
+    def test_half_open_failure_reopens(self, monkeypatch):
+        """测试半开状态下试探失败立即重新熔断"""
+        now = [100.0]
+        monkeypatch.setattr(resilience_module.time, "monotonic", lambda: now[0])
+        breaker = CircuitBreaker("arxiv.org", failure_threshold=1, reset_timeout=10)
+
+        breaker.record_failure()
+        now[0] += 10
+        breaker.record_failure()
+
+        assert breaker.state == "open"
+        assert breaker.stats()["opened"] == 2
+
+    def test_half_open_admits_single_probe(self, monkeypatch):
+        """测试半开状态只放行一个试探请求，试探结束前拒绝其余请求"""
+        now = [100.0]
+        monkeypatch.setattr(resilience_module.time, "monotonic", lambda: now[0])
+        breaker = CircuitBreaker("arxiv.org", failure_threshold=1, reset_timeout=10)
+
+        breaker.record_failure()
+        now[0] += 10
+        breaker.before_request()
+        with pytest.raises(CircuitOpenError):
+            breaker.before_request()
+
+        breaker.record_success()
+        breaker.before_request()
+        breaker.before_request()
+        assert breaker.state == "closed"
+        assert breaker.stats()["rejected"] == 1
+
+    def test_probe_released_on_non_retryable_error(self, monkeypatch):
+        """测试试探请求以非可重试异常结束时释放试探名额"""
+        now = [100.0]
+        monkeypatch.setattr(resilience_module.time, "monotonic", lambda: now[0])
+        breaker = configure_circuit_breakers(AppConfig()).breaker_for(URL)
+        breaker.failure_threshold = 1
+        breaker.record_failure()
+        now[0] += breaker.reset_timeout
+
+        def not_found():
+            raise ValueError("404")
+
+        with pytest.raises(ValueError):
+            call_with_retry_sync(not_found, URL, retries=0)
+
+        assert breaker.state == "half_open"
+        assert call_with_retry_sync(lambda: "ok", URL, retries=0) == "ok"
+        assert breaker.state == "closed"
+
+    def test_breakers_are_per_host(self):
+        """测试不同主机的熔断器互不影响"""
+        breakers = configure_circuit_breakers(AppConfig())
+        arxiv = breakers.breaker_for(URL)
+
+        assert breakers.breaker_for("https://export.arxiv.org/other") is arxiv
+        assert breakers.breaker_for("https://openrouter.ai/api/v1") is not arxiv
@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+并发请求合并测试
+"""
+
+import asyncio
+import os
+import sys
+
+import pytest
+
+# 添加项目根目录到Python路径
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "../../"))
+
+try:
+    from src.arxiv_follow.core.singleflight import SingleFlight
+except ImportError as e:
+    pytest.skip(f"请求合并模块导入失败: {e}", allow_module_level=True)
+
+
+class TestSingleFlight:
+    """并发请求合并测试类"""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_calls_share_one_execution(self):
+        """测试相同键的并发调用只执行一次"""
+        flights = SingleFlight()
+        executions = 0
+
+        async def fetch():
+            nonlocal executions
+            executions += 1
+            await asyncio.sleep(0.01)
+            return "result"
+
+        results = await asyncio.gather(*(flights.do("key", fetch) for _ in range(5)))
+
+        assert executions == 1
+        assert [value for value, _shared in results] == ["result"] * 5
+        assert [shared for _value, shared in results].count(False) == 1
+        assert flights.stats()["deduplicated"] == 4
+        assert flights.stats()["in_flight"] == 0
+
+    @pytest.mark.asyncio
+    async def test_sequential_and_distinct_calls_are_not_merged(self):
+        """测试不同键和先后发生的调用不会合并"""
+        flights = SingleFlight()
+
+        async def fetch():
+            return object()
+
+        first, _ = await flights.do("a", fetch)
+        second, _ = await flights.do("a", fetch)
+        other, _ = await flights.do("b", fetch)
+
+        assert first is not second and first is not other
+        assert flights.stats()["calls"] == 3
+        assert flights.stats()["deduplicated"] == 0
+
+    @pytest.mark.asyncio
+    async def test_errors_propagate_to_all_waiters(self):
+        """测试异常传递给所有等待者"""
+        flights = SingleFlight()
+
+        async def fail():
+            await asyncio.sleep(0.01)
+            raise ValueError("boom")
+
+        results = await asyncio.gather(
+            flights.do("key", fail), flights.do("key", fail), return_exceptions=True
+        )
+
+        assert all(isinstance(r, ValueError) for r in results)
+
+    @pytest.mark.asyncio
+    async def test_cancelled_waiter_does_not_cancel_others(self):
+        """测试某个等待者被取消时任务继续为其他等待者执行"""
+        flights = SingleFlight()
+        release = asyncio.Event()
+
+        async def fetch():
+            await release.wait()
+            return "done"
+
+        leader = asyncio.create_task(flights.do("key", fetch))
+        follower = asyncio.create_task(flights.do("key", fetch))
+        await asyncio.sleep(0)
+        leader.cancel()
+        await asyncio.sleep(0)
+        release.set()
+
+        assert await follower == ("done", True)
+        with pytest.raises(asyncio.CancelledError):
+            await leader
+
+    @pytest.mark.asyncio
+    async def test_task_cancelled_when_all_waiters_cancel(self):
+        """测试所有等待者都取消时取消底层任务"""
+        flights = SingleFlight()
+        cancelled = asyncio.Event()
+
+        async def fetch():
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        waiter = asyncio.create_task(flights.do("key", fetch))
+        await asyncio.sleep(0)
+        waiter.cancel()
+        await asyncio.wait_for(cancelled.wait(), 1)
+
+        assert flights.stats()["in_flight"] == 0
@@ -3,16 +3,22 @@
 研究者服务测试
 """
 
+import asyncio
 import os
 import sys
 from unittest.mock import Mock, patch
 
+import httpx
 import pytest
 
 # 添加项目根目录到Python路径
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), "../../"))
 
 try:
+    from src.arxiv_follow.core import resilience as resilience_module
+    from src.arxiv_follow.core.cache import DiskCache
+    from src.arxiv_follow.core.conditional import ConditionalCache
+    from src.arxiv_follow.models.config import AppConfig
     from src.arxiv_follow.services.researcher import (
         ResearcherService,
         fetch_papers_for_researcher,
@@ -23,6 +29,15 @@ except ImportError as e:
     pytest.skip(f"研究者服务模块导入失败: {e}", allow_module_level=True)
 
 
+@pytest.fixture(autouse=True)
+def content_cache():
+    """默认禁用条件请求缓存，避免测试之间共享缓存内容"""
+    with patch(
+        "src.arxiv_follow.services.researcher.get_content_cache", return_value=None
+    ) as mock_cache:
+        yield mock_cache
+
+
 class TestResearcherService:
     """研究者服务测试类"""
 
@@ -65,6 +80,33 @@ class TestResearcherService:
 
         assert result == []
 
+    @patch("httpx.Client.get")
+    def test_fetch_researchers_tsv_conditional_get(
+        self, mock_get, content_cache, tmp_path
+    ):
+        """测试研究者表格未变化时通过304复用上次下载的内容"""
+        content_cache.return_value = ConditionalCache(
+            DiskCache(tmp_path, ttl_seconds=3600, max_size_mb=1, namespace="content"),
+            negative_ttl_seconds=60,
+        )
+        fresh = Mock(
+            status_code=200,
+            text="John Smith\nAlice Brown",
+            headers={"Last-Modified": "Wed, 15 Jan 2025 09:00:00 GMT"},
+        )
+        not_modified = Mock(status_code=304, text="", headers={})
+        mock_get.side_effect = [fresh, not_modified]
+
+        url = "https://example.com/test.tsv"
+        first = fetch_researchers_from_tsv(url)
+        second = fetch_researchers_from_tsv(url)
+
+        assert second == first
+        assert [r["name"] for r in second] == ["John Smith", "Alice Brown"]
+        assert mock_get.call_args_list[1].kwargs["headers"] == {
+            "If-Modified-Since": "Wed, 15 Jan 2025 09:00:00 GMT"
+        }
+
     def test_parse_arxiv_search_results_empty(self):
         """测试解析空搜索结果"""
         html_content = "Sorry, your query returned no results"
@@ -222,3 +264,160 @@ class TestResearcherService:
         assert len(result) == 1
         # 检查是否提取了摘要（如果实现了的话）
         # assert 'abstract' in result[0]
+
+
+class TestAsyncResearcherFanOut:
+    """研究者并发检索测试类"""
+
+    @pytest.mark.asyncio
+    async def test_fan_out_preserves_order_and_skips_failures(self):
+        """测试并发检索保持研究者顺序并跳过失败和无结果的研究者"""
+        from src.arxiv_follow.services.researcher import (
+            fetch_papers_for_researchers_async,
+        )
+
+        paper_html = (
+            '<li class="arxiv-result"><p class="title is-5 mathjax">Paper A</p></li>'
+        )
+        html = {
+            "John Smith": paper_html,
+            "Alice Brown": "Sorry, your query returned no results",
+            "Carol White": paper_html,
+        }
+
+        async def fake_fetch(client, author_name, date_from, date_to, **kwargs):
+            if author_name == "Bob Wilson":
+                raise RuntimeError("boom")
+            # 让后面的研究者先完成，验证结果顺序与输入一致
+            await asyncio.sleep(0.01 if author_name == "John Smith" else 0)
+            papers = parse_arxiv_search_results(html.get(author_name, ""))
+            for paper in papers:
+                paper["queried_author"] = author_name
+            return papers
+
+        with patch(
+            "src.arxiv_follow.services.researcher.fetch_papers_for_researcher_async",
+            side_effect=fake_fetch,
+        ):
+            result = await fetch_papers_for_researchers_async(
+                ["John Smith", "Alice Brown", "Bob Wilson", "Carol White"],
+                "2025-01-01",
+                "2025-01-02",
+                concurrency=2,
+            )
+
+        assert list(result) == ["John Smith", "Carol White"]
+        assert result["John Smith"][0]["title"] == "Paper A"
+        assert result["Carol White"][0]["queried_author"] == "Carol White"
+
+    @pytest.mark.asyncio
+    async def test_timeout_starts_after_rate_limit_token(self):
+        """测试单次请求超时从获取限流令牌后开始计时，超时的请求单独失败"""
+        from src.arxiv_follow.services.researcher import (
+            fetch_papers_for_researchers_async,
+        )
+
+        class SlowLimiter:
+            async def acquire(self, url):
+                await asyncio.sleep(0.1)
+
+        async def handler(request):
+            if "Slow" in str(request.url):
+                await asyncio.sleep(5)
+            return httpx.Response(
+                200,
+                text='<li class="arxiv-result">'
+                '<p class="title is-5 mathjax">Paper A</p></li>',
+            )
+
+        with (
+            patch(
+                "src.arxiv_follow.services.researcher.get_rate_limiter",
+                return_value=SlowLimiter(),
+            ),
+            patch(
+                "src.arxiv_follow.services.researcher.create_async_client",
+                return_value=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+            ),
+        ):
+            result = await fetch_papers_for_researchers_async(
+                ["Slow Author", "Fast Author"],
+                "2025-01-01",
+                "2025-01-02",
+                timeout=0.05,
+            )
+
+        assert list(result) == ["Fast Author"]
+
+    @pytest.mark.asyncio
+    async def test_fetch_retries_retryable_status(self, monkeypatch):
+        """测试检索请求遇到 503 时退避重试"""
+        from src.arxiv_follow.services.researcher import (
+            fetch_papers_for_researcher_async,
+        )
+
+        monkeypatch.setattr(resilience_module, "backoff_delay", lambda attempt: 0.0)
+        config = AppConfig()
+        config.api.arxiv_delay_seconds = 0
+        resilience_module.configure_circuit_breakers(config)
+        statuses = [503, 200]
+
+        def handler(request):
+            return httpx.Response(
+                statuses.pop(0),
+                text='<li class="arxiv-result">'
+                '<p class="title is-5 mathjax">Paper A</p></li>',
+            )
+
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            papers = await fetch_papers_for_researcher_async(
+                client, "John Smith", "2025-01-01", "2025-01-02", config=config
+            )
+
+        assert not statuses
+        assert papers[0]["queried_author"] == "John Smith"
+
+    @pytest.mark.asyncio
+    async def test_daily_sync_entry_inside_running_loop(self):
+        """测试在运行中的事件循环里调用每日监控同步入口"""
+        from src.arxiv_follow.cli.daily import get_today_papers_for_all_researchers
+
+        async def fake_fetch(author_names, date_from, date_to):
+            return {name: [{"title": f"Paper by {name}"}] for name in author_names}
+
+        with (
+            patch(
+                "src.arxiv_follow.cli.daily.fetch_papers_for_researchers_async",
+                side_effect=fake_fetch,
+            ),
+            patch("src.arxiv_follow.cli.daily.load_config", return_value=None),
+        ):
+            result = get_today_papers_for_all_researchers([{"name": "John Smith"}])
+
+        assert result == {"John Smith": [{"title": "Paper by John Smith"}]}
+
+
+class TestSearchResultParserFidelity:
+    """搜索结果解析器与旧版实现的一致性测试"""
+
+    @pytest.fixture(scope="class")
+    def search_pages(self):
+        """导入基准页面生成器和旧版解析器"""
+        return pytest.importorskip("benchmarks.search_pages")
+
+    @pytest.mark.parametrize("num_results", [50, 200])
+    def test_identical_to_legacy_parser(self, search_pages, num_results):
+        """测试与旧版解析器输出完全一致"""
+        html = search_pages.build_search_page(num_results, total=1234)
+
+        expected = search_pages.legacy_parse_arxiv_search_results(html)
+        assert parse_arxiv_search_results(html) == expected
+        assert len(expected) == num_results
+
+    def test_identical_without_full_abstract(self, search_pages):
+        """测试缺少完整摘要时回退到其他摘要模式的结果一致"""
+        html = search_pages.build_search_page(20).replace("abstract-full", "hidden")
+
+        expected = search_pages.legacy_parse_arxiv_search_results(html)
+        assert parse_arxiv_search_results(html) == expected
+        assert all("abstract" in paper for paper in expected)
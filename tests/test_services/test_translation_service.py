@@ -4,8 +4,11 @@ LLM翻译服务测试脚本
 用于测试OpenRouter API连接和翻译功能
 """
 
+import json
 import os
 import sys
+from types import SimpleNamespace
+from unittest.mock import MagicMock
 
 import pytest
 
@@ -13,6 +16,10 @@ import pytest
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), "../../"))
 
 try:
+    from src.arxiv_follow.core.cache import DiskCache
+    from src.arxiv_follow.core.memo import TranslationMemory
+    from src.arxiv_follow.models.config import AppConfig
+    from src.arxiv_follow.services import translation as translation_module
     from src.arxiv_follow.services.translation import (
         TranslationService,
         test_translation_service,
@@ -96,6 +103,177 @@ class TestTranslationService:
         assert result is not None
 
 
+class TestTranslationBudget:
+    """翻译令牌预算和分段翻译测试类"""
+
+    @pytest.fixture
+    def translator(self):
+        """创建使用模拟客户端的翻译服务"""
+        translator = TranslationService(api_key="test_api_key")
+        translator.client = MagicMock()
+
+        def create(**kwargs):
+            prompt = kwargs["messages"][0]["content"]
+            marker = next(
+                line for line in prompt.splitlines() if line.startswith("段落")
+            )
+            content = json.dumps(
+                {"translated_title": "Title", "translated_content": f"EN {marker}"}
+            )
+            return SimpleNamespace(
+                choices=[SimpleNamespace(message=SimpleNamespace(content=content))],
+                usage=SimpleNamespace(prompt_tokens=100, completion_tokens=10),
+            )
+
+        translator.client.chat.completions.create.side_effect = create
+        return translator
+
+    def test_oversized_content_is_translated_in_chunks(self, translator):
+        """测试超长内容分段翻译后按顺序拼接"""
+        paragraphs = [f"段落{i}\n" + "论文摘要内容。" * 150 for i in range(4)]
+
+        result = translator.translate_task_content("标题", "\n\n".join(paragraphs))
+
+        assert result["success"] is True
+        assert result["chunks"] == 4
+        assert result["translated_title"] == "Title"
+        assert result["translated_content"].split("\n\n") == [
+            f"EN 段落{i}" for i in range(4)
+        ]
+        assert translator.usage_stats() == {
+            "calls": 4,
+            "prompt_tokens": 400,
+            "completion_tokens": 40,
+        }
+
+    def test_prompt_over_context_is_not_sent(self, translator):
+        """测试超出模型上下文的请求不会发送"""
+        translator.context_tokens = 500
+
+        result = translator.translate_task_content("标题", "段落0\n内容")
+
+        assert result["success"] is False
+        assert translator.client.chat.completions.create.call_count == 0
+
+    def test_uses_rate_limiter_for_own_config(self, translator, monkeypatch):
+        """测试按翻译服务自身的配置获取限流器"""
+        config = AppConfig()
+        translator._config = config
+        configs = []
+        get_rate_limiter = translation_module.get_rate_limiter
+
+        def record(config=None):
+            configs.append(config)
+            return get_rate_limiter(config)
+
+        monkeypatch.setattr(translation_module, "get_rate_limiter", record)
+
+        result = translator.translate_task_content("标题", "段落0\n内容")
+
+        assert result["success"] is True
+        assert configs == [config]
+
+
+class TestSegmentTranslation:
+    """按片段翻译和译文缓存测试类"""
+
+    REPORT = """📊 论文分布
+• Zhang Wei: 1 篇
+  1. **Graph Transformers**
+     📄 **arXiv:** `2501.00001`
+     📝 **摘要:** We study graph transformers.
+---"""
+
+    @pytest.fixture
+    def memory(self, tmp_path):
+        """临时目录中的译文记忆"""
+        return TranslationMemory(
+            DiskCache(
+                tmp_path, ttl_seconds=3600, max_size_mb=10, namespace="translation"
+            )
+        )
+
+    def make_translator(self, memory):
+        """创建模拟客户端的翻译服务，每个片段译为带语言方向标记的文本"""
+        translator = TranslationService(api_key="test_api_key", memory=memory)
+        translator.client = MagicMock()
+        prompts = []
+
+        def create(**kwargs):
+            prompt = kwargs["messages"][0]["content"]
+            prompts.append(prompt)
+            segments = json.loads(prompt.split("输入：\n", 1)[1])
+            tag = "ZH" if "中英混合" in prompt else "EN"
+            content = json.dumps([f"{tag}({text})" for text in segments])
+            return SimpleNamespace(
+                choices=[SimpleNamespace(message=SimpleNamespace(content=content))],
+                usage=None,
+            )
+
+        translator.client.chat.completions.create.side_effect = create
+        translator.prompts = prompts
+        return translator
+
+    def test_report_is_translated_by_segment(self, memory):
+        """测试按行翻译并保留格式前缀、跳过无需翻译的行"""
+        translator = self.make_translator(memory)
+
+        result = translator.translate_mixed_content_to_bilingual(
+            "每日报告", self.REPORT
+        )
+
+        assert result["success"] is True
+        assert result["translation_mode"] == "mixed_content"
+        chinese = result["chinese"]["content"].split("\n")
+        assert chinese[0] == "📊 论文分布"
+        assert chinese[2] == "  1. **ZH(Graph Transformers**)"
+        assert chinese[-1] == "---"
+        assert result["chinese"]["title"] == "每日报告"
+        assert result["english"]["title"] == "EN(每日报告)"
+        assert result["segments"]["chinese"] == {
+            "total": 4,
+            "cached": 0,
+            "translated": 4,
+        }
+        # 两个语言方向各一次批量请求
+        assert translator.client.chat.completions.create.call_count == 2
+
+    def test_repeated_segments_hit_memory(self, memory):
+        """测试之前翻译过的片段不再发送给LLM"""
+        self.make_translator(memory).translate_mixed_content_to_bilingual(
+            "每日报告", self.REPORT
+        )
+
+        translator = self.make_translator(memory)
+        report = self.REPORT.replace("  1. **Graph", "  2. **Graph") + (
+            "\n  3. **Sparse Attention**"
+        )
+        result = translator.translate_mixed_content_to_bilingual("每日报告", report)
+
+        assert result["success"] is True
+        assert result["segments"]["chinese"]["cached"] == 4
+        assert result["segments"]["chinese"]["translated"] == 1
+        assert "  2. **ZH(Graph Transformers**)" in result["chinese"]["content"]
+        assert '["Sparse Attention**"]' in translator.prompts[0]
+        assert memory.stats()["hits"] > 0
+
+    def test_batch_count_mismatch_fails(self, memory):
+        """测试译文数量与原文不一致时视为失败且不写入缓存"""
+        translator = TranslationService(api_key="test_api_key", memory=memory)
+        translator.client = MagicMock()
+        translator.client.chat.completions.create.return_value = SimpleNamespace(
+            choices=[SimpleNamespace(message=SimpleNamespace(content='["only one"]'))],
+            usage=None,
+        )
+
+        result = translator.translate_segments(["第一行", "第二行"], "zh", "en")
+
+        assert result["success"] is False
+        assert result["translations"] == ["第一行", "第二行"]
+        assert memory.stats()["hits"] == 0
+        assert translator.translate_segments([], "zh", "en")["success"] is True
+
+
 def test_smart_bilingual_translation():
     """测试智能双语翻译功能（包含英文论文信息）"""
     print("\n🧪 测试4: 智能双语翻译测试")
@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""
+本地全文检索查询解析测试
+"""
+
+import os
+import sys
+from datetime import date, datetime
+
+import pytest
+
+# 添加项目根目录到Python路径
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "../../"))
+
+try:
+    from src.arxiv_follow.storage.fulltext import parse_local_query
+except ImportError as e:
+    pytest.skip(f"全文检索模块导入失败: {e}", allow_module_level=True)
+
+
+class TestParseLocalQuery:
+    """查询解析测试类"""
+
+    def test_fields_and_phrases(self):
+        """测试字段前缀和引号短语转换为列过滤短语"""
+        match, exclude, date_from, date_to = parse_local_query(
+            '(cat:cs.AI OR cat:cs.CL) AND au:"Alice Smith" transformer'
+        )
+        assert match == (
+            '(categories : "cs.AI" OR categories : "cs.CL") '
+            'AND authors : "Alice Smith" AND "transformer"'
+        )
+        assert exclude is None and date_from is None and date_to is None
+
+    def test_negation(self):
+        """测试 ANDNOT 和 - 前缀转换为 NOT，开头的排除条件单独返回"""
+        assert parse_local_query("graph ANDNOT ti:survey")[0] == (
+            '"graph" NOT title : "survey"'
+        )
+        assert parse_local_query("cat:cs.AI AND -cat:cs.CV")[0] == (
+            'categories : "cs.AI" NOT categories : "cs.CV"'
+        )
+
+        match, exclude, _, _ = parse_local_query("-cat:cs.CV AND all:*")
+        assert match is None
+        assert exclude == 'categories : "cs.CV"'
+
+        match, exclude, _, _ = parse_local_query("ANDNOT (au:Smith OR au:Jones) graph")
+        assert match == '"graph"'
+        assert exclude == '(authors : "Smith" OR authors : "Jones")'
+
+    def test_submitted_date_range(self):
+        """测试提取 submittedDate 范围并去掉悬空的运算符"""
+        match, _, date_from, date_to = parse_local_query(
+            "(cat:cs.AI) AND submittedDate:[202501010000 TO 202501312359]"
+        )
+        assert match == '(categories : "cs.AI")'
+        assert date_from == datetime(2025, 1, 1, 0, 0)
+        assert date_to == datetime(2025, 1, 31, 23, 59, 59)
+
+        _, _, date_from, date_to = parse_local_query("submittedDate:[20250101 TO *]")
+        assert date_from == date(2025, 1, 1)
+        assert date_to is None
+
+    def test_invalid_queries(self):
+        """测试无效查询抛出 ValueError"""
+        for query in ("(graph", "graph)", "jr:nature", "submittedDate:[x TO y]"):
+            with pytest.raises(ValueError):
+                parse_local_query(query)
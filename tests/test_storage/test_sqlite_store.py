@@ -0,0 +1,318 @@
+#!/usr/bin/env python3
+"""
+SQLite 论文存储测试
+"""
+
+import os
+import sys
+from datetime import UTC, date, datetime
+
+import pytest
+
+# 添加项目根目录到Python路径
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "../../"))
+
+try:
+    from src.arxiv_follow.models.config import AppConfig
+    from src.arxiv_follow.models.paper import (
+        AnalysisType,
+        PaperAnalysis,
+        PaperMetadata,
+    )
+    from src.arxiv_follow.models.researcher import Researcher, ResearcherProfile
+    from src.arxiv_follow.storage import (
+        SQLitePaperStore,
+        create_paper_store,
+        split_arxiv_id,
+    )
+except ImportError as e:
+    pytest.skip(f"存储模块导入失败: {e}", allow_module_level=True)
+
+
+def make_paper(
+    arxiv_id: str = "2501.00001v1",
+    title: str = "Test Paper",
+    authors: list[str] | None = None,
+    categories: list[str] | None = None,
+    submitted: datetime | None = None,
+    updated: datetime | None = None,
+) -> dict:
+    """构造采集器格式的论文字典"""
+    categories = categories or ["cs.AI"]
+    submitted = submitted or datetime(2025, 1, 14, 9, 0, tzinfo=UTC)
+    return {
+        "arxiv_id": arxiv_id,
+        "title": title,
+        "authors": authors or ["Alice Smith", "Bob Jones"],
+        "abstract": "Abstract",
+        "primary_category": categories[0],
+        "categories": categories,
+        "submitted_date": submitted,
+        "updated_date": updated or submitted,
+        "doi": None,
+        "arxiv_url": f"http://arxiv.org/abs/{arxiv_id}",
+    }
+
+
+class TestSQLitePaperStore:
+    """SQLite 论文存储测试类"""
+
+    @pytest.fixture
+    def store(self, tmp_path):
+        """创建存储实例"""
+        with SQLitePaperStore(tmp_path / "papers.db") as store:
+            yield store
+
+    def test_split_arxiv_id(self):
+        """测试拆分版本号"""
+        assert split_arxiv_id("2501.12345v3") == ("2501.12345", 3)
+        assert split_arxiv_id("2501.12345") == ("2501.12345", 1)
+
+    def test_upsert_is_keyed_by_base_id(self, store):
+        """测试同一论文的不同版本只保留一行"""
+        assert store.upsert_paper(make_paper("2501.00001v1")) is True
+        assert (
+            store.upsert_paper(
+                make_paper(
+                    "2501.00001v2",
+                    title="Revised",
+                    updated=datetime(2025, 1, 20, tzinfo=UTC),
+                )
+            )
+            is False
+        )
+
+        paper = store.get_paper("2501.00001")
+        assert paper.title == "Revised"
+        assert paper.arxiv_id == "2501.00001v2"
+        assert store.get_versions(["2501.00001v1"]) == {"2501.00001": 2}
+        assert store.stats()["papers"] == 1
+
+    def test_older_version_does_not_overwrite(self, store):
+        """测试乱序写入旧版本不会覆盖新版本"""
+        store.upsert_paper(
+            make_paper(
+                "2501.00001v2",
+                title="Revised",
+                updated=datetime(2025, 1, 20, tzinfo=UTC),
+            )
+        )
+        store.upsert_paper(make_paper("2501.00001v1", title="Original"))
+
+        assert store.get_paper("2501.00001v1").title == "Revised"
+
+    def test_query_by_category_author_and_date(self, store):
+        """测试按分类、作者和日期范围查询"""
+        inserted = store.upsert_papers(
+            [
+                make_paper(
+                    "2501.00001",
+                    categories=["cs.AI", "cs.CR"],
+                    submitted=datetime(2025, 1, 10, tzinfo=UTC),
+                ),
+                make_paper(
+                    "2501.00002",
+                    authors=["Carol White"],
+                    categories=["cs.LG"],
+                    submitted=datetime(2025, 1, 12, 23, 0, tzinfo=UTC),
+                ),
+                make_paper(
+                    "2501.00003",
+                    categories=["cs.CR"],
+                    submitted=datetime(2025, 1, 15, tzinfo=UTC),
+                ),
+                {"arxiv_id": "invalid", "title": "Bad"},
+            ]
+        )
+        assert inserted == 3
+
+        cr = store.query_papers(category="cs.CR")
+        assert [p.arxiv_id for p in cr] == ["2501.00003", "2501.00001"]
+
+        carol = store.query_papers(author="carol white")
+        assert [p.arxiv_id for p in carol] == ["2501.00002"]
+
+        window = store.query_papers(
+            date_from=date(2025, 1, 11), date_to=date(2025, 1, 12)
+        )
+        assert [p.arxiv_id for p in window] == ["2501.00002"]
+
+        assert len(store.query_papers(limit=2)) == 2
+
+    def test_analysis_upsert_per_model(self, store):
+        """测试分析结果按 (论文, 类型, 模型) 去重"""
+        for model, score in (("model-a", 6.0), ("model-a", 8.0), ("model-b", 5.0)):
+            store.upsert_analysis(
+                PaperAnalysis(
+                    arxiv_id="2501.00001v1",
+                    analysis_type=AnalysisType.IMPORTANCE,
+                    score=score,
+                    model_used=model,
+                )
+            )
+
+        assert len(store.get_analyses("2501.00001")) == 2
+        analysis = store.get_analysis("2501.00001", "importance", "model-a")
+        assert analysis.score == 8.0
+        assert store.get_analysis("2501.00001", "technical") is None
+
+    def test_top_scored_papers(self, store):
+        """测试按评分获取历史高分论文"""
+        store.upsert_papers(
+            [make_paper(f"2501.0000{i}v1", title=f"Paper {i}") for i in range(1, 4)]
+        )
+        for arxiv_id, score in (("2501.00001", 9.0), ("2501.00002", 6.0)):
+            store.upsert_analysis(
+                PaperAnalysis(
+                    arxiv_id=arxiv_id,
+                    analysis_type=AnalysisType.IMPORTANCE,
+                    score=score,
+                    model_used="model-a",
+                )
+            )
+        store.upsert_analysis(
+            PaperAnalysis(
+                arxiv_id="2501.00003",
+                analysis_type=AnalysisType.TECHNICAL,
+                score=10.0,
+                model_used="model-a",
+            )
+        )
+
+        top = store.top_scored_papers(AnalysisType.IMPORTANCE, 5.0, limit=10)
+        assert [p.arxiv_id for p in top] == ["2501.00001v1", "2501.00002v1"]
+        assert len(store.top_scored_papers("importance", 7.0, limit=10)) == 1
+
+    def test_researcher_roundtrip(self, store):
+        """测试研究者存取"""
+        researcher = Researcher(
+            researcher_id="alice",
+            arxiv_name="Alice Smith",
+            profile=ResearcherProfile(full_name="Alice Smith"),
+        )
+        store.upsert_researcher(researcher)
+        researcher.is_monitored = False
+        store.upsert_researcher(researcher)
+
+        assert store.get_researcher("alice").arxiv_name == "Alice Smith"
+        assert store.list_researchers(monitored_only=True) == []
+        assert len(store.list_researchers()) == 1
+
+    def test_persists_across_connections(self, tmp_path):
+        """测试数据持久化到磁盘"""
+        db_path = tmp_path / "papers.db"
+        with SQLitePaperStore(db_path) as store:
+            store.upsert_paper(PaperMetadata(arxiv_id="2501.00001", title="Saved"))
+
+        with SQLitePaperStore(db_path) as store:
+            assert store.has_paper("2501.00001v1")
+
+    def test_create_paper_store_from_config(self, tmp_path):
+        """测试根据配置创建存储"""
+        config = AppConfig()
+        config.storage.data_dir = str(tmp_path / "data")
+        with create_paper_store(config) as store:
+            assert store.db_path.startswith(str(tmp_path / "data"))
+
+        config.storage.database_url = f"sqlite:///{tmp_path / 'custom.db'}"
+        with create_paper_store(config) as store:
+            assert store.db_path == str(tmp_path / "custom.db")
+
+        config.storage.database_url = "postgresql://localhost/arxiv"
+        with pytest.raises(ValueError):
+            create_paper_store(config)
+
+    def test_watermark_only_moves_forward(self, store):
+        """测试水位线只前进不后退"""
+        key = "daily:topic:cs.AI"
+        assert store.get_watermark(key) is None
+
+        t1 = datetime(2025, 1, 15, 10, 0, tzinfo=UTC)
+        assert store.advance_watermark(key, t1, "2501.00002v1") is True
+        assert store.advance_watermark(key, t1, "2501.00001v1") is False
+        assert store.advance_watermark(key, t1, "2501.00003v1") is True
+        assert store.advance_watermark(key, datetime(2025, 1, 1), "2501.9") is False
+
+        assert store.get_watermark(key) == (
+            datetime(2025, 1, 15, 10, 0),
+            "2501.00003v1",
+        )
+
+    def test_seen_versions_per_scope(self, store):
+        """测试已处理论文按监控范围隔离并记录最高版本"""
+        store.mark_seen("daily", ["2501.00001v2", "2501.00002"])
+        store.mark_seen("daily", ["2501.00001v1"])
+
+        assert store.get_seen_versions("daily", ["2501.00001v3", "2501.00003"]) == {
+            "2501.00001": 2
+        }
+        assert store.get_seen_versions("weekly", ["2501.00001"]) == {}
+
+    def test_search_papers_ranks_with_bm25(self, store):
+        """测试本地全文检索按 BM25 排序并支持字段和短语查询"""
+        store.upsert_papers(
+            [
+                {
+                    **make_paper("2501.00001v1", title="Graph Neural Networks"),
+                    "abstract": "Graph neural networks for graph classification.",
+                },
+                {
+                    **make_paper(
+                        "2501.00002v1",
+                        title="Neural Machine Translation",
+                        authors=["José García"],
+                        categories=["cs.CL"],
+                    ),
+                    "abstract": "A translation model with graph attention.",
+                },
+                make_paper("2501.00003v1", title="Reinforcement Learning"),
+                make_paper("2501.00004v1", title="Robot Control"),
+            ]
+        )
+
+        hits = store.search_papers("graph")
+        assert [paper.arxiv_id for paper, _ in hits] == [
+            "2501.00001v1",
+            "2501.00002v1",
+        ]
+        assert hits[0][1] > hits[1][1] > 0
+
+        assert [p.arxiv_id for p, _ in store.search_papers('ti:"neural networks"')] == [
+            "2501.00001v1"
+        ]
+        assert [p.arxiv_id for p, _ in store.search_papers('au:"Jose Garcia"')] == [
+            "2501.00002v1"
+        ]
+        assert [
+            p.arxiv_id for p, _ in store.search_papers("graph ANDNOT cat:cs.CL")
+        ] == ["2501.00001v1"]
+        assert len(store.search_papers("-cat:cs.CL", limit=10)) == 3
+
+        with pytest.raises(ValueError):
+            store.search_papers("(graph")
+
+    def test_search_index_updates_incrementally(self, tmp_path):
+        """测试论文更新时同步更新全文索引，已有数据库打开时补建索引"""
+        db_path = tmp_path / "papers.db"
+        with SQLitePaperStore(db_path) as store:
+            store.upsert_paper(make_paper("2501.00001v1", title="Diffusion Models"))
+            store.upsert_paper(
+                make_paper(
+                    "2501.00001v2",
+                    title="Consistency Models",
+                    updated=datetime(2025, 1, 20, tzinfo=UTC),
+                )
+            )
+            assert store.search_papers("diffusion") == []
+            assert len(store.search_papers("consistency")) == 1
+
+            # 模拟建立全文索引之前的数据库
+            store._conn.execute("DELETE FROM papers_fts")
+            store._conn.commit()
+
+        with SQLitePaperStore(db_path) as store:
+            hits = store.search_papers(
+                "ti:consistency AND submittedDate:[20250101 TO 20250131]"
+            )
+            assert [paper.arxiv_id for paper, _ in hits] == ["2501.00001v2"]
+            assert store.search_papers("consistency", date_to=date(2025, 1, 1)) == []